@@ -7,9 +7,10 @@ import math
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
+import numpy as np
 from monty.json import MSONable
 
-from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
+from pymatgen.analysis.structure_matcher import LATTICE_INVARIANT_SLACK, ElementComparator, StructureMatcher
 from pymatgen.core import get_el_sp
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
@@ -174,6 +175,13 @@ class RemoveDuplicatesFilter(AbstractStructureFilter):
         """Remove duplicate structures based on the structure matcher
         and symmetry (if symprec is given).
 
+        Accepted structures are kept in an index, together with their space group
+        number and reduced structure, which are only computed once per structure.
+        Candidates are only fitted against accepted structures with the same
+        composition hash, space group and (when the structure matcher does not
+        attempt supercells) number of sites in the reduced cell, whose lattices
+        are compatible within the length tolerance of the structure matcher.
+
         Args:
             structure_matcher (dict | StructureMatcher, optional): Provides a structure matcher to be used for
                 structure comparison.
@@ -189,6 +197,8 @@ class RemoveDuplicatesFilter(AbstractStructureFilter):
             self.structure_matcher = StructureMatcher.from_dict(structure_matcher)
         else:
             self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
+        # (composition hash, space group, reduced site count) -> [(reduced structure, lattice invariants)]
+        self._index: dict[tuple, list[tuple[Structure, tuple[np.ndarray, np.ndarray] | None]]] = defaultdict(list)
 
     def test(self, structure: Structure) -> bool:
         """
@@ -198,21 +208,35 @@ class RemoveDuplicatesFilter(AbstractStructureFilter):
         Returns:
             bool: True if structure is not in list.
         """
-        hash_comp = self.structure_matcher._comparator.get_hash(structure.composition)
-        if not self.structure_list[hash_comp]:
-            self.structure_list[hash_comp].append(structure)
-            return True
-
-        def get_spg_num(struct: Structure) -> int:
-            finder = SpacegroupAnalyzer(struct, symprec=self.symprec)  # type:ignore[arg-type]
-            return finder.get_space_group_number()
-
-        for struct in self.structure_list[hash_comp]:
-            if (self.symprec is None or get_spg_num(struct) == get_spg_num(structure)) and self.structure_matcher.fit(
-                struct, structure
-            ):
+        matcher = self.structure_matcher
+        hash_comp = matcher._comparator.get_hash(structure.composition)
+
+        spg_num = None
+        if self.symprec is not None:
+            spg_num = SpacegroupAnalyzer(structure, symprec=self.symprec).get_space_group_number()
+
+        # Reduce the structure the same way fit() would, so that accepted
+        # structures are only reduced once
+        reduced = matcher._process_species([structure])[0]
+        reduced = matcher._get_reduced_structure(reduced, matcher._primitive_cell, niggli=True)
+
+        # The site count and lattice invariants are necessary conditions for a
+        # fit only if the matcher neither attempts supercells nor subsets
+        invariants = None
+        n_sites = 0
+        if not (matcher._supercell or matcher._subset):
+            invariants = matcher._get_lattice_invariants(reduced)
+            n_sites = len(reduced)
+        max_ratio = (1 + matcher.ltol) * (1 + LATTICE_INVARIANT_SLACK)
+
+        bucket = self._index[hash_comp, spg_num, n_sites]
+        for other, other_invariants in bucket:
+            if (
+                invariants is None or np.all(other_invariants[1] <= max_ratio * invariants[0])  # type:ignore[index]
+            ) and matcher.fit(other, reduced, skip_structure_reduction=True):
                 return False
 
+        bucket.append((reduced, invariants))
         self.structure_list[hash_comp].append(structure)
         return True
 
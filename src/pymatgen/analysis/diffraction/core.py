@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import abc
+import math
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 import numpy as np
+from joblib import Parallel, delayed
 
 from pymatgen.core.spectrum import Spectrum
 from pymatgen.util.plotting import add_fig_kwargs, pretty_plot
 
 if TYPE_CHECKING:
-    from pymatgen.core import Structure
+    from collections.abc import Iterator, Sequence
+
+    from pymatgen.core import Lattice, Structure
 
 
 class DiffractionPattern(Spectrum):
@@ -52,6 +56,10 @@ class AbstractDiffractionPatternCalculator(abc.ABC):
     # absences do not cancel exactly to zero.
     SCALED_INTENSITY_TOL = 1e-3
 
+    # Maximum number of (hkl, site) terms evaluated at once when computing
+    # structure factors, which bounds the memory used for large cells.
+    MAX_BATCH_TERMS = 2**18
+
     @abc.abstractmethod
     def get_pattern(self, structure: Structure, scaled=True, two_theta_range=(0, 90)):
         """
@@ -72,6 +80,134 @@ class AbstractDiffractionPatternCalculator(abc.ABC):
         """
         raise NotImplementedError
 
+    def get_patterns(
+        self,
+        structures: Sequence[Structure],
+        scaled=True,
+        two_theta_range=(0, 90),
+        n_jobs: int = 1,
+    ) -> list[DiffractionPattern]:
+        """
+        Calculates the diffraction patterns for a list of structures.
+
+        Args:
+            structures (list[Structure]): Input structures
+            scaled (bool): Whether to return scaled intensities. The maximum
+                peak is set to a value of 100. Defaults to True.
+            two_theta_range ([float of length 2]): Tuple for range of
+                two_thetas to calculate in degrees. Defaults to (0, 90). Set to
+                None if you want all diffracted beams within the limiting
+                sphere of radius 2 / wavelength.
+            n_jobs (int): Number of worker processes (via joblib). Defaults
+                to 1, i.e. serial. -1 uses all available CPUs.
+
+        Returns:
+            list[DiffractionPattern]
+        """
+        return Parallel(n_jobs=n_jobs)(
+            delayed(self.get_pattern)(structure, scaled=scaled, two_theta_range=two_theta_range)
+            for structure in structures
+        )
+
+    def _get_recip_points(self, lattice: Lattice, two_theta_range) -> tuple[np.ndarray, np.ndarray]:
+        """Get the reciprocal lattice points within the limiting sphere.
+
+        Args:
+            lattice (Lattice): Real space lattice of the structure.
+            two_theta_range ([float of length 2]): Range of two_thetas in degrees
+                or None for all diffracted beams within the limiting sphere.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Integer Miller indices of shape (M, 3)
+                and the corresponding reciprocal vector lengths 1 / d_hkl, sorted
+                by length and then by descending Miller indices. The origin is
+                excluded.
+        """
+        # Obtained from Bragg condition. Note that reciprocal lattice
+        # vector length is 1 / d_hkl.
+        min_r, max_r = (
+            (0, 2 / self.wavelength)
+            if two_theta_range is None
+            else [2 * math.sin(math.radians(t / 2)) / self.wavelength for t in two_theta_range]
+        )
+
+        # Obtain crystallographic reciprocal lattice points within range
+        recip_lattice = lattice.reciprocal_lattice_crystallographic
+        frac, g_hkls, _, _ = recip_lattice.get_points_in_sphere([[0, 0, 0]], [0, 0, 0], max_r, zip_results=False)
+        if len(g_hkls) == 0:
+            return np.zeros((0, 3), dtype=int), np.zeros(0)
+
+        # Force miller indices to be integers
+        hkls = np.rint(frac).astype(int)
+        valid = (g_hkls != 0) & (g_hkls >= min_r)
+        hkls, g_hkls = hkls[valid], g_hkls[valid]
+        order = np.lexsort((-hkls[:, 2], -hkls[:, 1], -hkls[:, 0], g_hkls))
+        return hkls[order], g_hkls[order]
+
+    def _get_hkl_batches(self, n_hkls: int, n_terms: int) -> Iterator[slice]:
+        """Yield slices over the reciprocal lattice points such that at most
+        MAX_BATCH_TERMS (hkl, site) terms are evaluated per batch.
+        """
+        batch_size = max(1, self.MAX_BATCH_TERMS // max(1, n_terms))
+        for start in range(0, n_hkls, batch_size):
+            yield slice(start, start + batch_size)
+
+    def _get_pattern_from_peaks(
+        self,
+        two_thetas: np.ndarray,
+        intensities: np.ndarray,
+        hkls: np.ndarray,
+        g_hkls: np.ndarray,
+        *,
+        is_hex: bool,
+        scaled: bool,
+    ) -> DiffractionPattern:
+        """Merge the diffracted beams into peaks and build the pattern.
+
+        Args:
+            two_thetas (np.ndarray): Two theta of each beam, in ascending order.
+            intensities (np.ndarray): Corrected intensity of each beam.
+            hkls (np.ndarray): Miller indices of each beam.
+            g_hkls (np.ndarray): Reciprocal vector length of each beam.
+            is_hex (bool): Whether to use Miller-Bravais indices.
+            scaled (bool): Whether to scale the maximum intensity to 100.
+
+        Returns:
+            DiffractionPattern
+        """
+        # Deal with floating point precision issues. Since the beams are sorted,
+        # a beam can only merge into the last peak started before it.
+        starts = []
+        anchor = -math.inf
+        for idx, two_theta in enumerate(two_thetas.tolist()):
+            if abs(two_theta - anchor) >= self.TWO_THETA_TOL:
+                starts.append(idx)
+                anchor = two_theta
+        peak_intensities = np.add.reduceat(intensities, starts) if starts else np.zeros(0)
+
+        if is_hex:
+            # Use Miller-Bravais indices for hexagonal lattices
+            hkls = np.column_stack((hkls[:, 0], hkls[:, 1], -hkls[:, 0] - hkls[:, 1], hkls[:, 2]))
+        hkl_tuples = list(map(tuple, hkls.tolist()))
+
+        # Scale intensities so that the max intensity is 100
+        max_intensity = max(peak_intensities)
+        x = []
+        y = []
+        peak_hkls = []
+        d_hkls = []
+        for idx, (start, end) in enumerate(zip(starts, [*starts[1:], len(two_thetas)], strict=True)):
+            if peak_intensities[idx] / max_intensity * 100 > self.SCALED_INTENSITY_TOL:
+                fam = get_unique_families(hkl_tuples[start:end])
+                x.append(two_thetas[start])
+                y.append(peak_intensities[idx])
+                peak_hkls.append([{"hkl": hkl, "multiplicity": mult} for hkl, mult in fam.items()])
+                d_hkls.append(1 / g_hkls[start])
+        pattern = DiffractionPattern(x, y, peak_hkls, d_hkls)
+        if scaled:
+            pattern.normalize(mode="max", value=100)
+        return pattern
+
     def get_plot(
         self,
         structure: Structure,
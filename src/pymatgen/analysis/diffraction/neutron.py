@@ -2,18 +2,13 @@
 
 from __future__ import annotations
 
-import math
 import os
 from typing import TYPE_CHECKING
 
 import numpy as np
 import orjson
 
-from pymatgen.analysis.diffraction.core import (
-    AbstractDiffractionPatternCalculator,
-    DiffractionPattern,
-    get_unique_families,
-)
+from pymatgen.analysis.diffraction.core import AbstractDiffractionPatternCalculator
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 if TYPE_CHECKING:
@@ -91,19 +86,7 @@ class NDCalculator(AbstractDiffractionPatternCalculator):
         lattice = structure.lattice
         is_hex = lattice.is_hexagonal()
 
-        # Obtained from Bragg condition. Note that reciprocal lattice
-        # vector length is 1 / d_hkl.
-        min_r, max_r = (
-            (0, 2 / wavelength)
-            if two_theta_range is None
-            else [2 * math.sin(math.radians(t / 2)) / wavelength for t in two_theta_range]
-        )
-
-        # Obtain crystallographic reciprocal lattice points within range
-        recip_lattice = lattice.reciprocal_lattice_crystallographic
-        recip_pts = recip_lattice.get_points_in_sphere([[0, 0, 0]], [0, 0, 0], max_r)
-        if min_r:
-            recip_pts = [pt for pt in recip_pts if pt[1] >= min_r]
+        hkls, g_hkls = self._get_recip_points(lattice, two_theta_range)
 
         # Create a flattened array of coeffs, frac_coords and occus. This is
         # used to perform vectorized computation of atomic scattering factors
@@ -132,69 +115,36 @@ class NDCalculator(AbstractDiffractionPatternCalculator):
         frac_coords = np.array(_frac_coords)
         occus = np.array(_occus)
         dw_factors = np.array(_dwfactors)
-        peaks: dict[float, list[float | list[tuple[int, ...]]]] = {}
-        two_thetas: list[float] = []
-
-        for hkl, g_hkl, ind, _ in sorted(recip_pts, key=lambda i: (i[1], -i[0][0], -i[0][1], -i[0][2])):
-            # Force miller indices to be integers
-            hkl = [round(i) for i in hkl]
-            if g_hkl != 0:
-                d_hkl = 1 / g_hkl
-
-                # Bragg condition
-                theta = math.asin(wavelength * g_hkl / 2)
-
-                # s = sin(theta) / wavelength = 1 / 2d = |ghkl| / 2 (d =
-                # 1/|ghkl|)
-                s = g_hkl / 2
-
-                # Calculate Debye-Waller factor
-                dw_correction = np.exp(-dw_factors * (s**2))
-
-                # Vectorized computation of g.r for all fractional coords and
-                # hkl
-                g_dot_r = np.dot(frac_coords, np.transpose([hkl])).T[0]
-
-                # Structure factor = sum of atomic scattering factors (with
-                # position factor exp(2j * pi * g.r and occupancies).
-                # Vectorized computation.
-                f_hkl = np.sum(coeffs * occus * np.exp(2j * np.pi * g_dot_r) * dw_correction)
-
-                # Lorentz polarization correction for hkl
-                lorentz_factor = 1 / (math.sin(theta) ** 2 * math.cos(theta))
-
-                # Intensity for hkl is modulus square of structure factor
-                i_hkl = (f_hkl * f_hkl.conjugate()).real
-
-                two_theta = math.degrees(2 * theta)
-
-                if is_hex:
-                    # Use Miller-Bravais indices for hexagonal lattices
-                    hkl = (hkl[0], hkl[1], -hkl[0] - hkl[1], hkl[2])
-                # Deal with floating point precision issues
-                ind = np.where(np.abs(np.subtract(two_thetas, two_theta)) < self.TWO_THETA_TOL)
-                if len(ind[0]) > 0:
-                    peaks[two_thetas[ind[0][0]]][0] += i_hkl * lorentz_factor
-                    peaks[two_thetas[ind[0][0]]][1].append(tuple(hkl))  # type: ignore[union-attr]
-                else:
-                    peaks[two_theta] = [i_hkl * lorentz_factor, [tuple(hkl)], d_hkl]
-                    two_thetas.append(two_theta)
-
-        # Scale intensities so that the max intensity is 100
-        max_intensity = max(v[0] for v in peaks.values())
-        x = []
-        y = []
-        hkls = []
-        d_hkls = []
-        for key in sorted(peaks):
-            v = peaks[key]
-            fam = get_unique_families(v[1])
-            if v[0] / max_intensity * 100 > self.SCALED_INTENSITY_TOL:  # type: ignore[operator]
-                x.append(key)
-                y.append(v[0])
-                hkls.append([{"hkl": hkl, "multiplicity": mult} for hkl, mult in fam.items()])
-                d_hkls.append(v[2])
-        nd = DiffractionPattern(x, y, hkls, d_hkls)
-        if scaled:
-            nd.normalize(mode="max", value=100)
-        return nd
+
+        # Bragg condition
+        thetas = np.arcsin(wavelength * g_hkls / 2)
+
+        # s = sin(theta) / wavelength = 1 / 2d = |ghkl| / 2 (d =
+        # 1/|ghkl|)
+        s2 = (g_hkls / 2) ** 2
+
+        # Structure factors for all hkls, evaluated in batches of (hkl, site)
+        # terms to bound the memory for large cells.
+        f_hkls = np.empty(len(g_hkls), dtype=complex)
+        for batch in self._get_hkl_batches(len(g_hkls), len(occus)):
+            # Calculate Debye-Waller factor
+            dw_correction = np.exp(-dw_factors * s2[batch, None])
+
+            # Vectorized computation of g.r for all fractional coords and hkls
+            g_dot_r = np.dot(hkls[batch], frac_coords.T)
+
+            # Structure factor = sum of atomic scattering factors (with
+            # position factor exp(2j * pi * g.r and occupancies).
+            f_hkls[batch] = np.sum(coeffs * occus * np.exp(2j * np.pi * g_dot_r) * dw_correction, axis=1)
+
+        # Lorentz polarization correction for hkl
+        lorentz_factors = 1 / (np.sin(thetas) ** 2 * np.cos(thetas))
+
+        # Intensity for hkl is modulus square of structure factor
+        i_hkls = (f_hkls * f_hkls.conjugate()).real
+
+        two_thetas = np.degrees(2 * thetas)
+
+        return self._get_pattern_from_peaks(
+            two_thetas, i_hkls * lorentz_factors, hkls, g_hkls, is_hex=is_hex, scaled=scaled
+        )
@@ -18,6 +18,7 @@ from pymatgen.core.structure import Structure
 from pymatgen.util.due import Doi, due
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from typing import Any
 
     from typing_extensions import Self
@@ -59,6 +60,10 @@ class EwaldSummation(MSONable):
     # Converts unit of q*q/r into eV
     CONV_FACT = 1e10 * constants.e / (4 * math.pi * constants.epsilon_0)
 
+    # Maximum number of elements of the intermediate arrays of the batched
+    # reciprocal and real space sums, to bound their memory
+    CHUNK_SIZE = 2**22
+
     def __init__(
         self,
         structure,
@@ -125,6 +130,7 @@ class EwaldSummation(MSONable):
         # space terms.
         self._initialized = False
         self._recip = self._real = self._point = self._forces = None
+        self._potential = None
 
         # Compute the correction for a charged cell
         self._charged_cell_energy = (
@@ -151,35 +157,72 @@ class EwaldSummation(MSONable):
         Returns:
             Ewald sum of substructure.
         """
-        total_energy_matrix = self.total_energy_matrix.copy()
+        return self.compute_sub_structures([sub_structure], tol=tol)[0]
+
+    def compute_sub_structures(self, sub_structures: Sequence[Structure], tol: float = 1e-3) -> np.ndarray:
+        """Get total Ewald energies of many sub structures in the same lattice,
+        e.g. to rank the orderings of a disordered structure. Each energy is the
+        quadratic form of total_energy_matrix with the ratios of the new to the
+        original charges (zero for missing sites), evaluated for batches of sub
+        structures without copying the matrix.
+
+        Args:
+            sub_structures (list[Structure]): Sub structures to compute Ewald sums
+                for. Each must be a subset of the original structure, with possible
+                different charges.
+            tol (float): Tolerance for site matching in fractional coordinates.
+
+        Returns:
+            np.ndarray: Ewald sum of each sub structure.
+        """
+        matrix = self.total_energy_matrix
+        old_charges = np.array(self._oxi_states)
+        energies = np.zeros(len(sub_structures))
+        batch_size = max(1, self.CHUNK_SIZE // max(len(old_charges), 1))
+        for start in range(0, len(sub_structures), batch_size):
+            new_charges = np.array(
+                [self._get_sub_structure_charges(sub, tol) for sub in sub_structures[start : start + batch_size]]
+            ).reshape(-1, len(old_charges))
+            scaling = np.divide(new_charges, old_charges, out=np.zeros_like(new_charges), where=new_charges != 0)
+            energies[start : start + batch_size] = np.sum((scaling @ matrix) * scaling, axis=1)
+        return energies
+
+    def _get_sub_structure_charges(self, sub_structure: Structure, tol: float) -> np.ndarray:
+        """Match the sites of a sub structure to the sites of the original
+        structure with periodic boundary conditions, for all pairs of sites at once.
+
+        Args:
+            sub_structure (Structure): Sub structure in the same lattice.
+            tol (float): Tolerance for site matching in fractional coordinates.
+
+        Raises:
+            ValueError: If not all sites of the sub structure are matched.
 
-        def find_match(site):
-            for test_site in sub_structure:
-                frac_diff = abs(np.array(site.frac_coords) - np.array(test_site.frac_coords)) % 1
-                frac_diff = [abs(a) < tol or abs(a) > 1 - tol for a in frac_diff]
-                if all(frac_diff):
-                    return test_site
-            return None
-
-        matches = []
-        for idx, site in enumerate(self._struct):
-            matching_site = find_match(site)
-            if matching_site:
-                new_charge = compute_average_oxidation_state(matching_site)
-                old_charge = self._oxi_states[idx]
-                scaling_factor = new_charge / old_charge
-                matches.append(matching_site)
-            else:
-                scaling_factor = 0
-            total_energy_matrix[idx, :] *= scaling_factor
-            total_energy_matrix[:, idx] *= scaling_factor
-
-        if len(matches) != len(sub_structure):
+        Returns:
+            np.ndarray: Charge of the first matching site of the sub structure for
+                each site of the original structure, zero if there is none.
+        """
+        frac_coords = self._struct.frac_coords
+        sub_frac_coords = sub_structure.frac_coords.reshape(-1, 3)
+        # Index of the first matching site of the sub structure, -1 for no match
+        matches = np.full(len(frac_coords), -1)
+        chunk_size = max(1, self.CHUNK_SIZE // (3 * max(len(sub_frac_coords), 1)))
+        for start in range(0, len(frac_coords), chunk_size):
+            frac_diff = np.abs(frac_coords[start : start + chunk_size, None] - sub_frac_coords[None]) % 1
+            is_match = ((frac_diff < tol) | (frac_diff > 1 - tol)).all(axis=2)
+            matches[start : start + chunk_size] = np.where(is_match.any(axis=1), is_match.argmax(axis=1), -1)
+
+        is_matched = matches >= 0
+        if is_matched.sum() != len(sub_structure):
+            matched = set(matches[is_matched].tolist())
             output = ["Missing sites."]
-            output.extend(f"unmatched = {site}" for site in sub_structure if site not in matches)
+            output.extend(f"unmatched = {site}" for idx, site in enumerate(sub_structure) if idx not in matched)
             raise ValueError("\n".join(output))
 
-        return sum(sum(total_energy_matrix))
+        sub_charges = np.array([compute_average_oxidation_state(site) for site in sub_structure], dtype=float)
+        charges = np.zeros(len(frac_coords))
+        charges[is_matched] = sub_charges[matches[is_matched]]
+        return charges
 
     @property
     def reciprocal_space_energy(self):
@@ -261,6 +304,21 @@ class EwaldSummation(MSONable):
             total_energy[idx, idx] += energy
         return total_energy
 
+    @property
+    def potential_matrix(self):
+        """The total energy matrix per unit charges, i.e. total_energy_matrix[i, j]
+        is q_i * q_j * potential_matrix[i, j]. Unlike total_energy_matrix, this does
+        not depend on the charges of the sites, so that it can be used to get the
+        energies of other charge assignments (orderings) of the same sites, see
+        IncrementalEwald.
+        """
+        if self._potential is None:
+            unit_charges = np.ones(len(self._struct))
+            recip, _ = self._calc_recip(unit_charges)
+            real, point, _ = self._calc_real_and_point(unit_charges)
+            self._potential = recip + real + np.diag(point)
+        return self._potential
+
     @property
     def forces(self):
         """The forces on each site as a Nx3 matrix. Each row corresponds to a site."""
@@ -291,12 +349,13 @@ class EwaldSummation(MSONable):
 
     def _calc_ewald_terms(self):
         """Calculate and sets all Ewald terms (point, real and reciprocal)."""
-        self._recip, recip_forces = self._calc_recip()
-        self._real, self._point, real_point_forces = self._calc_real_and_point()
+        charges = np.array(self._oxi_states)
+        self._recip, recip_forces = self._calc_recip(charges, self._compute_forces)
+        self._real, self._point, real_point_forces = self._calc_real_and_point(charges, self._compute_forces)
         if self._compute_forces:
             self._forces = recip_forces + real_point_forces
 
-    def _calc_recip(self):
+    def _calc_recip(self, charges, compute_forces=False):
         """
         Perform the reciprocal space summation. Calculates the quantity
         E_recip = 1/(2PiV) sum_{G < Gmax} exp(-(G.G/4/eta))/(G.G) S(G)S(-G)
@@ -304,7 +363,11 @@ class EwaldSummation(MSONable):
         S(G) = sum_{k=1,N} q_k exp(-i G.r_k)
         S(G)S(-G) = |S(G)|**2.
 
-        This method is heavily vectorized to utilize numpy's C backend for speed.
+        The sum over G vectors is done as matrix products over chunks of G vectors.
+
+        Args:
+            charges (np.ndarray): Charges of the sites.
+            compute_forces (bool): Whether to compute the forces.
         """
         n_sites = len(self._struct)
         prefactor = 2 * math.pi / self._vol
@@ -312,89 +375,123 @@ class EwaldSummation(MSONable):
         forces = np.zeros((n_sites, 3), dtype=np.float64)
         coords = self._coords
         rcp_latt = self._struct.lattice.reciprocal_lattice
-        recip_nn = rcp_latt.get_points_in_sphere([[0, 0, 0]], [0, 0, 0], self._gmax)
-
-        frac_coords = [frac_coords for (frac_coords, dist, _idx, _img) in recip_nn if dist != 0]
+        frac_coords, dists, _, _ = rcp_latt.get_points_in_sphere([[0, 0, 0]], [0, 0, 0], self._gmax, zip_results=False)
 
-        gs = rcp_latt.get_cartesian_coords(frac_coords)
+        gs = rcp_latt.get_cartesian_coords(frac_coords[dists != 0])
         g2s = np.sum(gs**2, 1)
-        exp_vals = np.exp(-g2s / (4 * self._eta))
-        grs = np.sum(gs[:, None] * coords[None, :], 2)
-
-        oxi_states = np.array(self._oxi_states)
-
-        # create array where q_2[i,j] is qi * qj
-        qi_qj = oxi_states[None, :] * oxi_states[:, None]
-
-        # calculate the structure factor
-        s_reals = np.sum(oxi_states[None, :] * np.cos(grs), 1)
-        s_imags = np.sum(oxi_states[None, :] * np.sin(grs), 1)
-
-        for g, g2, gr, exp_val, s_real, s_imag in zip(gs, g2s, grs, exp_vals, s_reals, s_imags, strict=True):
-            # Uses the identity sin(x)+cos(x) = 2**0.5 sin(x + pi/4)
-            m = np.sin((gr[None, :] + math.pi / 4) - gr[:, None])
-            m *= exp_val / g2
-
-            e_recip += m
-
-            if self._compute_forces:
-                pref = 2 * exp_val / g2 * oxi_states
-                factor = prefactor * pref * (s_real * np.sin(gr) - s_imag * np.cos(gr))
-
-                forces += factor[:, None] * g[None, :]
+        weights = np.exp(-g2s / (4 * self._eta)) / g2s
+
+        # S(G)S(-G) = sum_ij q_i q_j cos(G.r_i - G.r_j), where the cosine of the
+        # difference is expanded in the cosines and sines of G.r_i
+        chunk_size = max(1, self.CHUNK_SIZE // n_sites)
+        for start in range(0, len(gs), chunk_size):
+            g_chunk = gs[start : start + chunk_size]
+            w_chunk = weights[start : start + chunk_size]
+            grs = np.dot(g_chunk, coords.T)
+            cos_grs, sin_grs = np.cos(grs), np.sin(grs)
+
+            e_recip += np.dot(cos_grs.T * w_chunk, cos_grs) + np.dot(sin_grs.T * w_chunk, sin_grs)
+
+            if compute_forces:
+                # Calculate the structure factor
+                s_reals = np.dot(cos_grs, charges)
+                s_imags = np.dot(sin_grs, charges)
+                factor = (
+                    2
+                    * prefactor
+                    * w_chunk[:, None]
+                    * charges[None, :]
+                    * (s_reals[:, None] * sin_grs - s_imags[:, None] * cos_grs)
+                )
+                forces += np.dot(factor.T, g_chunk)
 
         forces *= EwaldSummation.CONV_FACT
-        e_recip *= prefactor * EwaldSummation.CONV_FACT * qi_qj * 2**0.5
+        e_recip *= prefactor * EwaldSummation.CONV_FACT * charges[None, :] * charges[:, None]
         return e_recip, forces
 
-    def _calc_real_and_point(self):
-        """Determine the self energy -(eta/pi)**(1/2) * sum_{i=1}^{N} q_i**2."""
+    def _calc_real_and_point(self, charges, compute_forces=False):
+        """Determine the self energy -(eta/pi)**(1/2) * sum_{i=1}^{N} q_i**2.
+
+        The real space pairs are found for chunks of sites at once.
+
+        Args:
+            charges (np.ndarray): Charges of the sites.
+            compute_forces (bool): Whether to compute the forces.
+        """
         frac_coords = self._struct.frac_coords
         force_pf = 2 * self._sqrt_eta / math.sqrt(math.pi)
         coords = self._coords
         n_sites = len(self._struct)
-        e_real = np.empty((n_sites, n_sites), dtype=np.float64)
+        e_real = np.zeros((n_sites, n_sites), dtype=np.float64)
 
         forces = np.zeros((n_sites, 3), dtype=np.float64)
 
-        qs = np.array(self._oxi_states)
-
-        e_point = -(qs**2) * math.sqrt(self._eta / math.pi)
+        e_point = -(charges**2) * math.sqrt(self._eta / math.pi)
 
-        for idx in range(n_sites):
-            nf_coords, rij, js, _ = self._struct.lattice.get_points_in_sphere(
-                frac_coords, coords[idx], self._rmax, zip_results=False
-            )
+        # Bound the number of pairs per chunk by the expected number of neighbors
+        n_neighbors = n_sites / self._vol * 4 / 3 * math.pi * self._rmax**3 + 1
+        chunk_size = max(1, int(self.CHUNK_SIZE // n_neighbors))
+        for start in range(0, n_sites, chunk_size):
+            ii, js, images, rij = self._get_real_space_pairs(np.arange(start, min(start + chunk_size, n_sites)))
 
             # remove the rii term
             inds = rij > 1e-8
-            js = js[inds]
-            rij = rij[inds]
-            nf_coords = nf_coords[inds]
+            ii, js, images, rij = ii[inds], js[inds], images[inds], rij[inds]
 
-            qi = qs[idx]
-            qj = qs[js]
+            qi = charges[ii]
+            qj = charges[js]
 
             erfc_val = erfc(self._sqrt_eta * rij)
-            new_ereals = erfc_val * qi * qj / rij
-
-            # insert new_ereals
-            for key in range(n_sites):
-                e_real[key, idx] = np.sum(new_ereals[js == key])
+            np.add.at(e_real, (js, ii), erfc_val * qi * qj / rij)
 
-            if self._compute_forces:
-                nc_coords = self._struct.lattice.get_cartesian_coords(nf_coords)
+            if compute_forces:
+                nc_coords = self._struct.lattice.get_cartesian_coords(frac_coords[js] + images)
 
                 fijpf = qj / rij**3 * (erfc_val + force_pf * rij * np.exp(-self._eta * rij**2))
-                forces[idx] += np.sum(
-                    np.expand_dims(fijpf, 1) * (np.array([coords[idx]]) - nc_coords) * qi * EwaldSummation.CONV_FACT,
-                    axis=0,
+                np.add.at(
+                    forces,
+                    ii,
+                    fijpf[:, None] * (coords[ii] - nc_coords) * qi[:, None] * EwaldSummation.CONV_FACT,
                 )
 
         e_real *= 0.5 * EwaldSummation.CONV_FACT
         e_point *= EwaldSummation.CONV_FACT
         return e_real, e_point, forces
 
+    def _get_real_space_pairs(self, indices):
+        """Find the sites (including periodic images) within the real space
+        cutoff of a set of sites.
+
+        Args:
+            indices (np.ndarray): Indices of the center sites.
+
+        Returns:
+            tuple: (center_indices, site_indices, images, distances) arrays.
+        """
+        lattice = self._struct.lattice
+        frac_coords = self._struct.frac_coords
+        try:
+            from pymatgen.optimization.neighbors import find_points_in_spheres
+        except ImportError:
+            pairs = [(np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros((0, 3)), np.zeros(0))]
+            for idx in indices:
+                _, rij, js, images = lattice.get_points_in_sphere(
+                    frac_coords, self._coords[idx], self._rmax, zip_results=False
+                )
+                if len(js) > 0:
+                    pairs.append((np.full(len(js), idx), js.astype(int), images, rij))
+            return tuple(np.concatenate(arrays) for arrays in zip(*pairs, strict=True))
+
+        centers, js, images, rij = find_points_in_spheres(
+            all_coords=np.ascontiguousarray(lattice.get_cartesian_coords(frac_coords), dtype=float),
+            center_coords=np.ascontiguousarray(self._coords[indices], dtype=float),
+            r=float(self._rmax),
+            pbc=np.ascontiguousarray(lattice.pbc, dtype=np.int64),
+            lattice=np.ascontiguousarray(lattice.matrix, dtype=float),
+            tol=1e-8,
+        )
+        return indices[centers], js, images, rij
+
     @property
     def eta(self):
         """Eta value used in Ewald summation."""
@@ -464,6 +561,166 @@ class EwaldSummation(MSONable):
         return summation
 
 
+class IncrementalEwald:
+    """
+    Ewald energies of charge assignments (orderings) of the sites of a fixed
+    structure, e.g. for Monte Carlo sampling or the ranking of enumerated
+    orderings.
+
+    The energy of the charges q is E = q.P.q + c * sum(q)**2, where P is the
+    potential matrix of EwaldSummation and c * sum(q)**2 the charged-cell energy.
+    The site potentials V = P.q are kept up to date, so that the energy change
+    of a swap of two sites takes O(1) and applying it O(N) operations, instead
+    of O(N**2) for a new Ewald sum. As the energy is updated incrementally,
+    round-off errors accumulate slowly over many updates, and get_energy can be
+    used to recompute it.
+    """
+
+    def __init__(self, ewald: EwaldSummation, charges=None):
+        """
+        Args:
+            ewald (EwaldSummation): Ewald summation of the structure of all sites
+                that may be charged, e.g. with the average oxidation states of
+                a disordered structure.
+            charges (ArrayLike): Initial charges of the sites. Defaults to the
+                oxidation states of the structure of ewald.
+        """
+        potential = ewald.potential_matrix
+        # The incremental updates require an exactly symmetric matrix
+        self._potential = (potential + potential.T) / 2
+        self._charged_cell_factor = -EwaldSummation.CONV_FACT / 2 * np.pi / ewald._vol / ewald.eta
+
+        self._charges = np.array(ewald._oxi_states if charges is None else charges, dtype=np.float64)
+        if self._charges.shape != (len(self._potential),):
+            raise ValueError(f"Expected {len(self._potential)} charges, got shape {self._charges.shape}")
+        self._site_potentials = self._potential @ self._charges
+        self._energy = self.get_energy(self._charges)
+
+    @property
+    def charges(self) -> np.ndarray:
+        """The current charges of the sites (read-only)."""
+        charges = self._charges.view()
+        charges.flags.writeable = False
+        return charges
+
+    @property
+    def energy(self) -> float:
+        """The Ewald energy of the current charges in eV."""
+        return self._energy
+
+    @property
+    def site_potentials(self) -> np.ndarray:
+        """The potentials P.q of the current charges at the sites (read-only)."""
+        site_potentials = self._site_potentials.view()
+        site_potentials.flags.writeable = False
+        return site_potentials
+
+    def get_energy(self, charges) -> float:
+        """Get the Ewald energy of a charge assignment.
+
+        Args:
+            charges (ArrayLike): Charges of the sites.
+
+        Returns:
+            float: Energy in eV.
+        """
+        return float(self.get_energies(np.reshape(charges, (1, -1)))[0])
+
+    def get_energies(self, charges) -> np.ndarray:
+        """Get the Ewald energies of many charge assignments at once.
+
+        Args:
+            charges (ArrayLike): (M, N) array of the charges of the N sites for
+                M orderings.
+
+        Returns:
+            np.ndarray: Energies in eV of the M orderings.
+        """
+        charges = np.asarray(charges, dtype=np.float64)
+        energies = np.empty(len(charges))
+        chunk_size = max(1, EwaldSummation.CHUNK_SIZE // len(self._potential))
+        for start in range(0, len(charges), chunk_size):
+            chunk = charges[start : start + chunk_size]
+            energies[start : start + chunk_size] = (
+                np.einsum("ij,ij->i", chunk @ self._potential, chunk)
+                + self._charged_cell_factor * np.sum(chunk, axis=1) ** 2
+            )
+        return energies
+
+    def get_energy_change(self, indices, charges) -> float:
+        """Get the change of the energy from setting the charges of some sites,
+        in O(len(indices)**2) operations.
+
+        Args:
+            indices (list[int]): Indices of the sites (without duplicates).
+            charges (ArrayLike): New charges of the sites.
+
+        Returns:
+            float: Energy change in eV.
+        """
+        indices = np.asarray(indices, dtype=int)
+        delta = np.asarray(charges, dtype=np.float64) - self._charges[indices]
+        total_charge = np.sum(self._charges)
+        return float(
+            2 * np.dot(delta, self._site_potentials[indices])
+            + delta @ self._potential[np.ix_(indices, indices)] @ delta
+            + self._charged_cell_factor * ((total_charge + np.sum(delta)) ** 2 - total_charge**2)
+        )
+
+    def get_swap_energy_changes(self, indices1, indices2) -> np.ndarray:
+        """Get the changes of the energy from swapping the charges of pairs of
+        sites, in O(1) operations per swap.
+
+        Args:
+            indices1 (ArrayLike): Indices of the first site of each swap.
+            indices2 (ArrayLike): Indices of the second site of each swap.
+
+        Returns:
+            np.ndarray: Energy changes in eV of the swaps, with the shape of
+                the broadcast indices.
+        """
+        indices1, indices2 = np.broadcast_arrays(np.asarray(indices1, dtype=int), np.asarray(indices2, dtype=int))
+        delta = self._charges[indices2] - self._charges[indices1]
+        return 2 * delta * (self._site_potentials[indices1] - self._site_potentials[indices2]) + delta**2 * (
+            self._potential[indices1, indices1]
+            + self._potential[indices2, indices2]
+            - 2 * self._potential[indices1, indices2]
+        )
+
+    def set_charges(self, indices, charges) -> float:
+        """Set the charges of some sites and update the energy and site
+        potentials, in O(len(indices) * N) operations.
+
+        Args:
+            indices (list[int]): Indices of the sites (without duplicates).
+            charges (ArrayLike): New charges of the sites.
+
+        Returns:
+            float: The new energy in eV.
+        """
+        indices = np.asarray(indices, dtype=int)
+        charges = np.asarray(charges, dtype=np.float64)
+        self._energy += self.get_energy_change(indices, charges)
+        self._site_potentials += self._potential[:, indices] @ (charges - self._charges[indices])
+        self._charges[indices] = charges
+        return self._energy
+
+    def swap(self, index1: int, index2: int) -> float:
+        """Swap the charges of two sites and update the energy and site
+        potentials, in O(N) operations.
+
+        Args:
+            index1 (int): Index of the first site.
+            index2 (int): Index of the second site.
+
+        Returns:
+            float: The new energy in eV.
+        """
+        if index1 == index2:
+            return self._energy
+        return self.set_charges([index1, index2], self._charges[[index2, index1]])
+
+
 class EwaldMinimizer:
     """
     This class determines the manipulations that will minimize an Ewald matrix,
@@ -510,11 +767,7 @@ class EwaldMinimizer:
         # Setup and checking of inputs
         self._matrix = copy(matrix)
         # Make the matrix diagonally symmetric (so matrix[i,:] == matrix[:,j])
-        for ii in range(len(self._matrix)):
-            for jj in range(ii, len(self._matrix)):
-                value = (self._matrix[ii, jj] + self._matrix[jj, ii]) / 2
-                self._matrix[ii, jj] = value
-                self._matrix[jj, ii] = value
+        self._matrix[...] = (self._matrix + self._matrix.T) / 2
 
         # sort the m_list based on number of permutations
         self._m_list = sorted(m_list, key=lambda x: comb(len(x[2]), x[1]), reverse=True)
@@ -5,13 +5,17 @@ from __future__ import annotations
 import copy
 from typing import TYPE_CHECKING
 
+from joblib import Parallel, delayed
 from monty.json import MSONable
 
-from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError
+from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError, _get_fragment_hash
 from pymatgen.analysis.local_env import OpenBabelNN, metal_edge_extender
 from pymatgen.io.babel import BabelMolAdaptor
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
     from pymatgen.core.structure import Molecule
 
 __author__ = "Samuel Blau"
@@ -74,6 +78,7 @@ class Fragmenter(MSONable):
         self.assume_previous_thoroughness = assume_previous_thoroughness
         self.open_rings = open_rings
         self.opt_steps = opt_steps
+        self._fragment_hashes: dict[int, tuple[MoleculeGraph, str]] = {}
 
         if edges is None:
             self.mol_graph = MoleculeGraph.from_local_env_strategy(molecule, OpenBabelNN())
@@ -130,10 +135,7 @@ class Fragmenter(MSONable):
                     self.new_unique_frag_dict[frag_key] = copy.deepcopy(self.all_unique_frag_dict[frag_key])
                 else:
                     for fragment in self.all_unique_frag_dict[frag_key]:
-                        found = False
-                        for prev_frag in self.prev_unique_frag_dict[frag_key]:
-                            if fragment.isomorphic_to(prev_frag):
-                                found = True
+                        found = self._is_isomorphic_to_any(fragment, self.prev_unique_frag_dict[frag_key])
                         if not found:
                             if frag_key not in self.new_unique_frag_dict:
                                 self.new_unique_frag_dict[frag_key] = [fragment]
@@ -182,26 +184,24 @@ class Fragmenter(MSONable):
                     for fragment in fragments:
                         alph_formula = fragment.molecule.composition.alphabetical_formula
                         new_frag_key = f"{alph_formula} E{len(fragment.graph.edges())}"
+                        frag_hash = _get_fragment_hash(fragment.graph)
                         proceed = True
                         if (
                             self.assume_previous_thoroughness
                             and self.prev_unique_frag_dict != {}
                             and new_frag_key in self.prev_unique_frag_dict
                         ):
-                            for unique_fragment in self.prev_unique_frag_dict[new_frag_key]:
-                                if unique_fragment.isomorphic_to(fragment):
-                                    proceed = False
-                                    break
+                            proceed = not self._is_isomorphic_to_any(
+                                fragment, self.prev_unique_frag_dict[new_frag_key], frag_hash
+                            )
                         if proceed:
                             if new_frag_key not in self.all_unique_frag_dict:
                                 self.all_unique_frag_dict[new_frag_key] = [fragment]
                                 new_frag_dict[new_frag_key] = [fragment]
                             else:
-                                found = False
-                                for unique_fragment in self.all_unique_frag_dict[new_frag_key]:
-                                    if unique_fragment.isomorphic_to(fragment):
-                                        found = True
-                                        break
+                                found = self._is_isomorphic_to_any(
+                                    fragment, self.all_unique_frag_dict[new_frag_key], frag_hash
+                                )
                                 if not found:
                                     self.all_unique_frag_dict[new_frag_key].append(fragment)
                                     if new_frag_key in new_frag_dict:
@@ -210,6 +210,33 @@ class Fragmenter(MSONable):
                                         new_frag_dict[new_frag_key] = [fragment]
         return new_frag_dict
 
+    def _is_isomorphic_to_any(
+        self, fragment: MoleculeGraph, unique_fragments: list[MoleculeGraph], frag_hash: str | None = None
+    ) -> bool:
+        """Check if a fragment is isomorphic to any of the unique fragments. Only unique
+        fragments with the same Weisfeiler-Lehman hash as the fragment are compared.
+
+        Args:
+            fragment (MoleculeGraph): Fragment to check.
+            unique_fragments (list[MoleculeGraph]): Unique fragments with the same key.
+            frag_hash (str): Hash of the fragment if already computed.
+
+        Returns:
+            bool: whether an isomorphic unique fragment was found.
+        """
+        if frag_hash is None:
+            frag_hash = _get_fragment_hash(fragment.graph)
+        for unique_fragment in unique_fragments:
+            # NOTE unique fragments are kept alive in the cache, so their ids are not reused
+            if id(unique_fragment) not in self._fragment_hashes:
+                unique_hash = _get_fragment_hash(unique_fragment.graph)
+                self._fragment_hashes[id(unique_fragment)] = (unique_fragment, unique_hash)
+            if self._fragment_hashes[id(unique_fragment)][1] != frag_hash:
+                continue
+            if unique_fragment.isomorphic_to(fragment):
+                return True
+        return False
+
     def _open_all_rings(self) -> None:
         """
         Having already generated all unique fragments that did not require ring opening,
@@ -303,3 +330,33 @@ def open_ring(mol_graph: MoleculeGraph, bond: list, opt_steps: int) -> MoleculeG
     ob_mol.localopt(steps=opt_steps, forcefield="uff")
 
     return MoleculeGraph.from_local_env_strategy(ob_mol.pymatgen_mol, OpenBabelNN())
+
+
+def fragment_molecules(
+    molecules: Sequence[Molecule],
+    edges: Sequence[list | None] | None = None,
+    n_jobs: int = 1,
+    **kwargs: Any,
+) -> list[Fragmenter]:
+    """Fragment several molecules independently of each other.
+
+    Args:
+        molecules (list[Molecule]): The molecules to fragment.
+        edges (list[list | None]): Edges of each molecule, see Fragmenter. Defaults to
+            None, i.e. edges of all molecules are determined with OpenBabel.
+        n_jobs (int): Number of worker processes over which the molecules are
+            distributed (via joblib). Defaults to 1, i.e. serial. -1 uses all
+            available CPUs.
+        **kwargs: Passed to Fragmenter, e.g. depth or open_rings.
+
+    Returns:
+        list[Fragmenter]: Fragmenter of each molecule.
+    """
+    if edges is None:
+        edges = [None] * len(molecules)
+    if len(edges) != len(molecules):
+        raise ValueError(f"Got {len(edges)} edge lists for {len(molecules)} molecules")
+    return Parallel(n_jobs=n_jobs)(
+        delayed(Fragmenter)(molecule, edges=mol_edges, **kwargs)
+        for molecule, mol_edges in zip(molecules, edges, strict=True)
+    )
@@ -8,7 +8,6 @@ import os.path
 import subprocess
 import warnings
 from collections import defaultdict
-from itertools import combinations
 from operator import itemgetter
 from shutil import which
 from typing import TYPE_CHECKING, NamedTuple, cast
@@ -26,6 +25,7 @@ from scipy.stats import describe
 from pymatgen.core import Lattice, Molecule, PeriodicSite, Structure
 from pymatgen.core.structure import FunctionalGroups
 from pymatgen.util.coord import lattice_points_in_supercell
+from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash
 from pymatgen.vis.structure_vtk import EL_COLORS
 
 try:
@@ -34,7 +34,7 @@ except ImportError:
     igraph = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from typing import Any
 
     from igraph import Graph
@@ -114,6 +114,45 @@ def _isomorphic(frag1: nx.Graph, frag2: nx.Graph) -> bool:
     return nx.is_isomorphic(frag1.to_undirected(), frag2.to_undirected(), node_match=nm)
 
 
+def _get_fragment_hash(graph: nx.Graph) -> str:
+    """
+    Helper function to get the Weisfeiler-Lehman hash of a graph with species as
+    node labels, ignoring edge directions. Isomorphic graphs (as determined by
+    _isomorphic) have the same hash, so it can be used to narrow down the graphs
+    to check for isomorphism.
+    """
+    if graph.is_directed():
+        graph = graph.to_undirected(as_view=True)
+    return weisfeiler_lehman_graph_hash(graph, node_attr="specie")
+
+
+def _get_connected_node_sets(graph: nx.Graph, max_size: int) -> Iterator[list[tuple]]:
+    """
+    Helper function to enumerate the connected induced subgraphs of a graph by
+    size. The node sets of each size are grown from those of the previous size by
+    adding a neighboring node, starting from single nodes, so that disconnected
+    node sets are never visited.
+
+    Args:
+        graph (nx.Graph): Graph with sortable nodes.
+        max_size (int): Maximum number of nodes of the subgraphs.
+
+    Yields:
+        list[tuple]: Sorted nodes of the connected induced subgraphs of each size,
+            in lexicographic order (i.e. the order of itertools.combinations).
+    """
+    neighbors = {node: set(graph.neighbors(node)) for node in graph}
+    node_sets = {frozenset([node]) for node in graph}
+    for size in range(1, max_size + 1):
+        if not node_sets:
+            return
+        yield sorted(tuple(sorted(nodes)) for nodes in node_sets)
+        if size < max_size:
+            node_sets = {
+                nodes | {neighbor} for nodes in node_sets for node in nodes for neighbor in neighbors[node] - nodes
+            }
+
+
 class StructureGraph(MSONable):
     """
     This is a class for annotating a Structure with bond information, stored in the form
@@ -2118,34 +2157,22 @@ class MoleculeGraph(MSONable):
         self.set_node_attributes()
 
         graph = self.graph.to_undirected()
-
-        # find all possible fragments, aka connected induced subgraphs
-        frag_dict = {}
-        for ii in range(1, len(self.molecule)):
-            for combination in combinations(graph.nodes, ii):
-                comp = [str(self.molecule[idx].specie) for idx in combination]
-                comp = "".join(sorted(comp))
-                subgraph = nx.subgraph(graph, combination)
-                if nx.is_connected(subgraph):
-                    key = f"{comp} {len(subgraph.edges())}"
-                    if key not in frag_dict:
-                        frag_dict[key] = [copy.deepcopy(subgraph)]
-                    else:
-                        frag_dict[key].append(copy.deepcopy(subgraph))
-
-        # narrow to all unique fragments using graph isomorphism
-        unique_frag_dict = {}
-        for key, fragments in frag_dict.items():
-            unique_frags = []
-            for frag in fragments:
-                found = False
-                for fragment in unique_frags:
-                    if _isomorphic(frag, fragment):
-                        found = True
-                        break
-                if not found:
-                    unique_frags.append(frag)
-            unique_frag_dict[key] = copy.deepcopy(unique_frags)
+        species = [str(site.specie) for site in self.molecule]
+
+        # find all unique fragments, aka connected induced subgraphs, in order of size.
+        # Candidates are bucketed by composition, number of edges and WL hash, which
+        # isomorphic fragments share, before checking for isomorphism
+        unique_frag_dict: dict[str, list[nx.Graph]] = {}
+        buckets: dict[tuple[str, str], list[nx.Graph]] = defaultdict(list)
+        for node_sets in _get_connected_node_sets(graph, len(self.molecule) - 1):
+            for nodes in node_sets:
+                subgraph = nx.subgraph(graph, nodes)
+                comp = "".join(sorted(species[idx] for idx in nodes))
+                key = f"{comp} {len(subgraph.edges())}"
+                bucket = buckets[key, _get_fragment_hash(subgraph)]
+                if not any(_isomorphic(subgraph, fragment) for fragment in bucket):
+                    bucket.append(subgraph.copy())
+                    unique_frag_dict.setdefault(key, []).append(bucket[-1])
 
         # convert back to molecule graphs
         unique_mol_graph_dict = {}
@@ -2174,7 +2201,7 @@ class MoleculeGraph(MSONable):
 
             alph_formula = unique_mol_graph_list[0].molecule.composition.alphabetical_formula
             frag_key = f"{alph_formula} E{len(unique_mol_graph_list[0].graph.edges())}"
-            unique_mol_graph_dict[frag_key] = copy.deepcopy(unique_mol_graph_list)
+            unique_mol_graph_dict[frag_key] = unique_mol_graph_list
         return unique_mol_graph_dict
 
     def substitute_group(
@@ -5,11 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from joblib import Parallel, delayed
+
 from pymatgen.analysis.elasticity.strain import Deformation, Strain
 from pymatgen.analysis.interfaces.zsl import ZSLGenerator, ZSLMatch, reduce_vectors
 from pymatgen.core.surface import SlabGenerator, get_symmetrically_distinct_miller_indices
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
     from numpy.typing import ArrayLike
     from typing_extensions import Self
 
@@ -201,3 +206,64 @@ class SubstrateAnalyzer(ZSLGenerator):
                 )
 
                 yield sub_match
+
+    def calculate_substrates(
+        self,
+        film: Structure,
+        substrates: Sequence[Structure],
+        *,
+        elasticity_tensor=None,
+        film_millers: ArrayLike = None,
+        substrate_millers: ArrayLike = None,
+        ground_state_energy=0,
+        lowest=False,
+        n_jobs: int = 1,
+    ) -> list[list[SubstrateMatch]]:
+        """Find all topological matches of a film on each of many substrates,
+        see calculate.
+
+        Args:
+            film (Structure): conventional standard structure for the film
+            substrates (list[Structure]): conventional standard structures for
+                the substrates
+            elasticity_tensor (ElasticTensor): elasticity tensor for the film
+                in the IEEE orientation
+            film_millers (array): film facets to consider in search as defined by
+                miller indices
+            substrate_millers (array): substrate facets to consider in search as
+                defined by miller indices, the same for all substrates
+            ground_state_energy (float): ground state energy for the film
+            lowest (bool): only consider lowest matching area for each surface
+            n_jobs (int): Number of worker processes over which the substrates
+                are distributed (via joblib). Defaults to 1, i.e. serial. -1
+                uses all available CPUs.
+
+        Returns:
+            list[list[SubstrateMatch]]: The matches for each substrate.
+        """
+        # The film facets are shared by all substrates
+        if film_millers is None:
+            film_millers = sorted(get_symmetrically_distinct_miller_indices(film, self.film_max_miller))
+
+        kwargs = {
+            "elasticity_tensor": elasticity_tensor,
+            "film_millers": film_millers,
+            "substrate_millers": substrate_millers,
+            "ground_state_energy": ground_state_energy,
+            "lowest": lowest,
+        }
+        return Parallel(n_jobs=n_jobs)(
+            delayed(_get_substrate_matches)(self, film, substrate, kwargs) for substrate in substrates
+        )
+
+
+def _get_substrate_matches(
+    analyzer: SubstrateAnalyzer,
+    film: Structure,
+    substrate: Structure,
+    kwargs: dict[str, Any],
+) -> list[SubstrateMatch]:
+    """Find all matches of a film on a single substrate.
+    Must not be in the class so that it can be pickled.
+    """
+    return list(analyzer.calculate(film, substrate, **kwargs))
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import product
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -160,32 +159,30 @@ class ZSLGenerator(MSONable):
             substrate_vectors(array): substrate vectors to generate super
                 lattices
         """
-        for film_transformations, substrate_transformations in transformation_sets:
-            # Apply transformations and reduce using Zur reduce methodology
-            films = np.array(
-                [reduce_vectors(*v) for v in np.dot(film_transformations, film_vectors)],
-                dtype=float,
-            )
+        # The super lattices of an area multiple recur across transformation sets
+        reduced: dict[tuple[str, bytes], np.ndarray] = {}
 
-            substrates = np.array(
-                [reduce_vectors(*v) for v in np.dot(substrate_transformations, substrate_vectors)],
-                dtype=float,
-            )
+        def get_reduced(name: str, transformations, vectors) -> np.ndarray:
+            """Apply transformations and reduce using Zur reduce methodology."""
+            key = (name, np.asarray(transformations, dtype=float).tobytes())
+            if key not in reduced:
+                reduced[key] = reduce_vectors_batch(*np.transpose(np.dot(transformations, vectors), (1, 0, 2)))
+            return reduced[key]
 
-            # Check if equivalent super lattices
-            for (f_trans, s_trans), (f, s) in zip(
-                product(film_transformations, substrate_transformations),
-                product(films, substrates),
-                strict=True,
-            ):
-                if is_same_vectors(
-                    f,
-                    s,
-                    bidirectional=self.bidirectional,
-                    max_length_tol=self.max_length_tol,
-                    max_angle_tol=self.max_angle_tol,
-                ):
-                    yield [f, s, f_trans, s_trans]
+        for film_transformations, substrate_transformations in transformation_sets:
+            films = get_reduced("film", film_transformations, film_vectors)
+            substrates = get_reduced("substrate", substrate_transformations, substrate_vectors)
+
+            # Check all film/substrate super lattice pairs at once
+            is_same = is_same_vectors_batch(
+                films,
+                substrates,
+                bidirectional=self.bidirectional,
+                max_length_tol=self.max_length_tol,
+                max_angle_tol=self.max_angle_tol,
+            )
+            for f_idx, s_idx in zip(*np.nonzero(is_same), strict=True):
+                yield [films[f_idx], substrates[s_idx], film_transformations[f_idx], substrate_transformations[s_idx]]
 
     def __call__(self, film_vectors, substrate_vectors, lowest=False) -> Iterator[ZSLMatch]:
         """Runs the ZSL algorithm to generate all possible matching."""
@@ -197,7 +194,8 @@ class ZSLGenerator(MSONable):
         # and had to be re-written as a staticmethod if using numba, so was left unchanged)
         transformation_sets = self.generate_sl_transformation_sets(film_area, substrate_area)
 
-        # Optimization note: could not use njit here due to use of itertools.product
+        # Optimization note: the super lattices of each transformation set are
+        # reduced and compared as arrays, see reduce_vectors_batch
         equiv_transformations = self.get_equiv_transformations(transformation_sets, film_vectors, substrate_vectors)
 
         # Check each super-lattice pair to see if they match
@@ -310,6 +308,100 @@ def reduce_vectors(a, b):
     return (a, b)
 
 
+def reduce_vectors_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of reduce_vectors for many pairs of vectors. Each pair
+    goes through the same sequence of reduction steps as in reduce_vectors.
+
+    Args:
+        a (np.ndarray): (N, 3) array of the first vector of each pair
+        b (np.ndarray): (N, 3) array of the second vector of each pair
+
+    Returns:
+        np.ndarray: (N, 2, 3) array of the reduced vector pairs
+    """
+    a = np.array(a, dtype=np.float64).reshape(-1, 3)
+    b = np.array(b, dtype=np.float64).reshape(-1, 3)
+
+    # Pairs that may still change, one reduction step per iteration
+    active = np.arange(len(a))
+    while len(active) > 0:
+        a_act, b_act = a[active], b[active]
+        norm_b = _norms(b_act)
+
+        flip = _dots(a_act, b_act) < 0
+        swap = ~flip & (_norms(a_act) > norm_b)
+        add = ~flip & ~swap & (norm_b > _norms(b_act + a_act))
+        sub = ~flip & ~swap & ~add & (norm_b > _norms(b_act - a_act))
+
+        b[active[flip]] = -b_act[flip]
+        a[active[swap]], b[active[swap]] = b_act[swap], a_act[swap]
+        b[active[add]] = b_act[add] + a_act[add]
+        b[active[sub]] = b_act[sub] - a_act[sub]
+
+        active = active[flip | swap | add | sub]
+
+    return np.stack([a, b], axis=1)
+
+
+def is_same_vectors_batch(
+    vec_sets1: np.ndarray,
+    vec_sets2: np.ndarray,
+    bidirectional: bool = False,
+    max_length_tol: float = 0.03,
+    max_angle_tol: float = 0.01,
+) -> np.ndarray:
+    """
+    Vectorized version of is_same_vectors for all combinations of two arrays
+    of vector sets.
+
+    Args:
+        vec_sets1 (np.ndarray): (M, 2, 3) array of vector sets
+        vec_sets2 (np.ndarray): (N, 2, 3) array of vector sets
+        bidirectional (bool): Whether to also check vec_sets2 against vec_sets1.
+        max_length_tol (float): maximum relative length tolerance
+        max_angle_tol (float): maximum relative angle tolerance
+
+    Returns:
+        np.ndarray: (M, N) boolean array, True where vec_sets1[i] and
+            vec_sets2[j] are the same within the tolerances.
+    """
+    vec_sets1 = np.asarray(vec_sets1, dtype=np.float64).reshape(-1, 2, 3)
+    vec_sets2 = np.asarray(vec_sets2, dtype=np.float64).reshape(-1, 2, 3)
+    lengths1, lengths2 = _norms(vec_sets1), _norms(vec_sets2)
+    angles1, angles2 = _angles(vec_sets1), _angles(vec_sets2)
+
+    def unidirectional(lengths1, angles1, lengths2, angles2):
+        # Use negated comparisons to match _unidirectional_is_same_vectors
+        is_same = ~np.any(np.absolute(lengths2[None] / lengths1[:, None] - 1) > max_length_tol, axis=-1)
+        return is_same & (np.absolute(angles2[None] / angles1[:, None] - 1) <= max_angle_tol)
+
+    is_same = unidirectional(lengths1, angles1, lengths2, angles2)
+    if bidirectional:
+        is_same |= unidirectional(lengths2, angles2, lengths1, angles1).T
+    return is_same
+
+
+def _dots(vecs1: np.ndarray, vecs2: np.ndarray) -> np.ndarray:
+    """Dot products of two arrays of vectors along the last axis. Unlike
+    einsum, matmul gives results identical to np.dot, so that ties in
+    reduce_vectors_batch are resolved exactly as in reduce_vectors.
+    """
+    return np.matmul(vecs1[..., None, :], vecs2[..., :, None])[..., 0, 0]
+
+
+def _norms(vecs: np.ndarray) -> np.ndarray:
+    """Norms of an array of vectors along the last axis."""
+    return np.sqrt(_dots(vecs, vecs))
+
+
+def _angles(vec_sets: np.ndarray) -> np.ndarray:
+    """Angles between the two vectors of an (N, 2, 3) array of vector sets."""
+    cos_ang = _dots(vec_sets[:, 0], vec_sets[:, 1])
+    sin_ang = _norms(np.cross(vec_sets[:, 0], vec_sets[:, 1]))
+    return np.arctan2(sin_ang, cos_ang)
+
+
 @njit
 def get_factors(n):
     """Generate all factors of n."""
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import itertools
+import json
 import logging
 import math
 import os
 import re
 import warnings
 from collections import defaultdict
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
@@ -16,11 +18,12 @@ import matplotlib.pyplot as plt
 import numpy as np
 import orjson
 import plotly.graph_objects as go
+from joblib import Parallel, delayed
 from matplotlib import cm
 from matplotlib.cm import ScalarMappable
 from matplotlib.colors import LinearSegmentedColormap, Normalize
 from matplotlib.font_manager import FontProperties
-from monty.json import MontyDecoder, MSONable
+from monty.json import MontyDecoder, MontyEncoder, MSONable
 from scipy import interpolate
 from scipy.optimize import minimize
 from scipy.spatial import ConvexHull
@@ -36,13 +39,15 @@ from pymatgen.util.plotting import pretty_plot
 from pymatgen.util.string import htmlify, latexify
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterator, Sequence
+    from collections.abc import Collection, Iterator
     from io import StringIO
     from typing import Any, Literal
 
     from numpy.typing import ArrayLike
     from typing_extensions import Self
 
+    from pymatgen.util.typing import PathLike
+
 logger = logging.getLogger(__name__)
 
 with open(
@@ -286,6 +291,56 @@ class TransformedPDEntry(PDEntry):
         return cls(entry, sp_mapping)
 
 
+class _LazyEntries(Sequence):
+    """Read-only sequence of the entries of a PhaseDiagram snapshot written by
+    PhaseDiagram.to_hdf5. Each entry is decoded from its JSON on first access.
+    Views over subsets of the entries share the decoded entries.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        offsets: np.ndarray,
+        indices: np.ndarray | None = None,
+        cache: dict[int, PDEntry] | None = None,
+    ) -> None:
+        """
+        Args:
+            data (np.ndarray): uint8 array of the concatenated JSON of the entries.
+            offsets (np.ndarray): Start of the JSON of each entry in data, followed by
+                the length of data.
+            indices (np.ndarray): Indices of the entries in this sequence. Defaults to
+                all entries.
+            cache (dict[int, PDEntry]): Decoded entries by index, shared between views.
+        """
+        self._data = data
+        self._offsets = offsets
+        self._indices = np.arange(len(offsets) - 1) if indices is None else np.asarray(indices, dtype=int)
+        self._cache = {} if cache is None else cache
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        entry_idx = int(self._indices[idx])
+        if entry_idx not in self._cache:
+            blob = self._data[self._offsets[entry_idx] : self._offsets[entry_idx + 1]]
+            self._cache[entry_idx] = MontyDecoder().process_decoded(orjson.loads(blob.tobytes()))
+        return self._cache[entry_idx]
+
+    def view(self, indices: Sequence[int] | np.ndarray) -> _LazyEntries:
+        """
+        Args:
+            indices (Sequence[int]): Indices in this sequence.
+
+        Returns:
+            _LazyEntries: sequence of the entries at indices, sharing decoded entries.
+        """
+        return type(self)(self._data, self._offsets, self._indices[np.asarray(indices, dtype=int)], self._cache)
+
+
 class TransformedPDEntryError(Exception):
     """An exception class for TransformedPDEntry."""
 
@@ -375,6 +430,22 @@ class PhaseDiagram(MSONable):
 
             # Update keys to be Element objects in case they are strings in pre-computed data
             computed_data["el_refs"] = [(Element(el_str), entry) for el_str, entry in computed_data["el_refs"]]
+        self._set_computed_data(computed_data)
+
+    def _set_computed_data(
+        self,
+        computed_data: dict[str, Any],
+        qhull_spaces: Sequence[frozenset[Element]] | None = None,
+    ) -> None:
+        """Set the computed data and the attributes derived from it, for both
+        __init__ and from_hdf5.
+
+        Args:
+            computed_data (dict): The output of PhaseDiagram._compute(). The
+                qhull entries may be _LazyEntries, which are then not decoded.
+            qhull_spaces (Sequence[frozenset[Element]]): Chemical spaces of the
+                qhull entries. Defaults to the elements of each qhull entry.
+        """
         self.computed_data = computed_data
         self.facets = computed_data["facets"]
         self.simplexes = computed_data["simplexes"]
@@ -382,10 +453,20 @@ class PhaseDiagram(MSONable):
         self.qhull_data = computed_data["qhull_data"]
         self.dim = computed_data["dim"]
         self.el_refs = dict(computed_data["el_refs"])
-        self.qhull_entries = tuple(computed_data["qhull_entries"])
-        self._qhull_spaces = tuple(frozenset(e.elements) for e in self.qhull_entries)
-        self._stable_entries = tuple({self.qhull_entries[idx] for idx in set(itertools.chain(*self.facets))})
-        self._stable_spaces = tuple(frozenset(e.elements) for e in self._stable_entries)
+        if isinstance(qhull_entries := computed_data["qhull_entries"], _LazyEntries):
+            self.qhull_entries = qhull_entries
+        else:
+            self.qhull_entries = tuple(qhull_entries)
+        if qhull_spaces is None:
+            qhull_spaces = [frozenset(e.elements) for e in self.qhull_entries]
+        self._qhull_spaces = tuple(qhull_spaces)
+        if isinstance(self.qhull_entries, _LazyEntries):
+            stable_indices = np.unique(self.facets)
+            self._stable_entries = self.qhull_entries.view(stable_indices)
+            self._stable_spaces = tuple(self._qhull_spaces[idx] for idx in stable_indices)
+        else:
+            self._stable_entries = tuple({self.qhull_entries[idx] for idx in set(itertools.chain(*self.facets))})
+            self._stable_spaces = tuple(frozenset(e.elements) for e in self._stable_entries)
 
     def as_dict(self):
         """Get MSONable dict representation of PhaseDiagram."""
@@ -394,7 +475,10 @@ class PhaseDiagram(MSONable):
             "@class": type(self).__name__,
             "all_entries": [e.as_dict() for e in self.all_entries],
             "elements": [e.as_dict() for e in self.elements],
-            "computed_data": self.computed_data,
+            # Entries of phase diagrams read by from_hdf5 are decoded on access
+            "computed_data": {
+                key: list(val) if isinstance(val, _LazyEntries) else val for key, val in self.computed_data.items()
+            },
         }
 
     @classmethod
@@ -411,6 +495,114 @@ class PhaseDiagram(MSONable):
         computed_data = dct.get("computed_data")
         return cls(entries, elements, computed_data=computed_data)
 
+    def to_hdf5(self, filename: PathLike) -> None:
+        """Write a binary snapshot of the phase diagram to a HDF5 file.
+
+        Unlike as_dict, the computed data is stored as typed arrays (qhull data,
+        facets and indices of the qhull, stable and elemental reference entries)
+        and the entries as a table of JSON in one contiguous byte array. All are
+        contiguous datasets that from_hdf5 can memory-map, and entries are only
+        decoded when accessed.
+
+        Args:
+            filename (PathLike): Filename to output to.
+
+        Raises:
+            TypeError: For subclasses of PhaseDiagram, whose additional data would
+                not be stored.
+        """
+        import h5py
+
+        if type(self) is not PhaseDiagram:
+            raise TypeError(f"to_hdf5() not supported for {type(self).__name__}")
+
+        entry_idx = {id(entry): idx for idx, entry in enumerate(self.all_entries)}
+        equal_entry_idx: dict[PDEntry, int] = {}
+
+        def get_entry_indices(entries: Sequence[PDEntry]) -> list[int]:
+            # NOTE entries of phase diagrams from from_dict are equal but not identical,
+            # those are looked up by equality in a map built once
+            if not equal_entry_idx and any(id(e) not in entry_idx for e in entries):
+                for idx, entry in enumerate(self.all_entries):
+                    equal_entry_idx.setdefault(entry, idx)
+            return [entry_idx[id(e)] if id(e) in entry_idx else equal_entry_idx[e] for e in entries]
+
+        blobs = [json.dumps(entry, cls=MontyEncoder).encode() for entry in self.all_entries]
+        elements = list(self.elements)
+        qhull_spaces = [[el in space for el in elements] for space in self._qhull_spaces]
+        if any(sum(in_space) != len(space) for in_space, space in zip(qhull_spaces, self._qhull_spaces, strict=True)):
+            raise ValueError("Entries with species other than the elements of the phase diagram are not supported")
+        el_refs = self.computed_data["el_refs"]
+        facets = np.array(self.facets, dtype=np.int64).reshape(len(self.facets), -1)
+
+        with h5py.File(str(filename), mode="w") as file:
+            file.attrs["elements"] = json.dumps(elements, cls=MontyEncoder)
+            file.attrs["dim"] = self.dim
+            file.create_dataset("qhull_data", data=np.asarray(self.qhull_data, dtype=np.float64))
+            file.create_dataset("facets", data=facets)
+            file.create_dataset("qhull_entries", data=np.array(get_entry_indices(self.qhull_entries), dtype=np.int64))
+            file.create_dataset("qhull_spaces", data=np.array(qhull_spaces, dtype=bool).reshape(-1, len(elements)))
+            file.create_dataset("el_ref_elements", data=[elements.index(el) for el, _ in el_refs])
+            file.create_dataset("el_ref_entries", data=get_entry_indices([entry for _, entry in el_refs]))
+            file.create_dataset("entry_offsets", data=np.cumsum([0, *map(len, blobs)], dtype=np.int64))
+            file.create_dataset("entry_data", data=np.frombuffer(b"".join(blobs), dtype=np.uint8))
+
+    @classmethod
+    def from_hdf5(cls, filename: PathLike, mmap: bool = True) -> Self:
+        """Read a phase diagram written by to_hdf5 without recomputing the convex hull.
+
+        The entries (all_entries, qhull_entries, stable entries) are read-only
+        sequences decoding each entry on first access, so that e.g. energies above
+        hull and decompositions only decode the entries involved.
+
+        Args:
+            filename (PathLike): Filename to read from.
+            mmap (bool): Whether to memory-map the qhull data, facets and entry table
+                instead of reading them into memory, e.g. to share them read-only
+                between worker processes. Defaults to True.
+
+        Returns:
+            PhaseDiagram
+        """
+        import h5py
+
+        with h5py.File(str(filename), mode="r") as file:
+            arrays = {}
+            for key, dataset in file.items():
+                offset = dataset.id.get_offset() if mmap and dataset.size else None
+                if offset is None:
+                    arrays[key] = np.asarray(dataset)
+                else:
+                    arrays[key] = np.memmap(filename, dtype=dataset.dtype, mode="r", offset=offset, shape=dataset.shape)
+            elements = MontyDecoder().process_decoded(json.loads(file.attrs["elements"]))
+            dim = int(file.attrs["dim"])
+
+        all_entries = _LazyEntries(arrays["entry_data"], arrays["entry_offsets"])
+        el_refs = [
+            (elements[el_idx], all_entries[entry_idx])
+            for el_idx, entry_idx in zip(arrays["el_ref_elements"], arrays["el_ref_entries"], strict=True)
+        ]
+        qhull_data = arrays["qhull_data"]
+        facets = arrays["facets"]
+
+        # As in __init__, without recomputing the hull or decoding all entries
+        pd = cls.__new__(cls)
+        pd.elements = elements
+        pd.entries = all_entries
+        pd._set_computed_data(
+            {
+                "facets": facets,
+                "simplexes": [Simplex(qhull_data[facet, :-1]) for facet in facets],
+                "all_entries": all_entries,
+                "qhull_data": qhull_data,
+                "dim": dim,
+                "el_refs": el_refs,
+                "qhull_entries": all_entries.view(arrays["qhull_entries"]),
+            },
+            qhull_spaces=[frozenset(itertools.compress(elements, row)) for row in arrays["qhull_spaces"]],
+        )
+        return pd
+
     def _compute(self) -> dict[str, Any]:
         if self.elements == ():
             self.elements = sorted({els for e in self.entries for els in e.elements})
@@ -418,13 +610,16 @@ class PhaseDiagram(MSONable):
         elements = list(self.elements)
         dim = len(elements)
 
-        entries = sorted(self.entries, key=lambda e: e.composition.reduced_composition)
+        # Reduced compositions are computed once per entry for both sorting and grouping
+        reduced_entries = sorted(
+            ((e.composition.reduced_composition, e) for e in self.entries), key=lambda pair: pair[0]
+        )
 
         el_refs: dict[Element, PDEntry] = {}
         min_entries: list[PDEntry] = []
         all_entries: list[PDEntry] = []
-        for composition, group_iter in itertools.groupby(entries, key=lambda e: e.composition.reduced_composition):
-            group = list(group_iter)
+        for composition, group_iter in itertools.groupby(reduced_entries, key=lambda pair: pair[0]):
+            group = [e for _, e in group_iter]
             min_entry = min(group, key=lambda e: e.energy_per_atom)
             if composition.is_element:
                 el_refs[composition.elements[0]] = min_entry
@@ -446,7 +641,8 @@ class PhaseDiagram(MSONable):
         idx = np.where(form_e < -PhaseDiagram.formation_energy_tol)[0].tolist()
 
         # Add the elemental references
-        idx.extend([min_entries.index(el) for el in el_refs.values()])
+        min_idx = {id(e): i for i, e in enumerate(min_entries)}
+        idx.extend([min_idx[id(el)] for el in el_refs.values()])
 
         qhull_entries = [min_entries[idx] for idx in idx]
         qhull_data = data[idx][:, 1:]
@@ -713,6 +909,113 @@ class PhaseDiagram(MSONable):
         """
         return comp.num_atoms * self.get_hull_energy_per_atom(comp)
 
+    def _get_batch_fractions(self, comps: Sequence[Composition] | ArrayLike) -> np.ndarray:
+        """Atomic fractions of the elements of the phase diagram for many
+        compositions.
+
+        Args:
+            comps (Sequence[Composition] | ArrayLike): Compositions, or an
+                array of shape (n_comps, len(self.elements)) with the amounts
+                of each element of the phase diagram.
+
+        Returns:
+            np.ndarray: Atomic fractions of shape (n_comps, len(self.elements)).
+        """
+        if len(comps) > 0 and isinstance(comps[0], Composition):  # type:ignore[index,arg-type]
+            elements = set(self.elements)
+            for comp in comps:  # type:ignore[union-attr]
+                if set(comp.elements) - elements:
+                    raise ValueError(
+                        f"{comp} has elements not in the phase diagram {', '.join(map(str, self.elements))}"
+                    )
+            amounts = np.array([[comp[el] for el in self.elements] for comp in comps])  # type:ignore[union-attr]
+        else:
+            amounts = np.asarray(comps, dtype=float).reshape(-1, len(self.elements))
+        return amounts / amounts.sum(axis=1, keepdims=True)
+
+    def get_hull_energy_per_atom_batch(
+        self,
+        comps: Sequence[Composition] | ArrayLike,
+        return_decomp: bool = False,
+        batch_size: int = 4096,
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized get_hull_energy_per_atom for many compositions. The
+        facet containing each composition is located with a barycentric test
+        against all facets at once, in batches of compositions.
+
+        Args:
+            comps (Sequence[Composition] | ArrayLike): Compositions, or an
+                array of shape (n_comps, len(self.elements)) with the amounts
+                of each element of the phase diagram.
+            return_decomp (bool): Whether to also return the decompositions.
+            batch_size (int): Number of compositions tested at once. Memory use
+                scales with batch_size * len(self.facets) * self.dim.
+
+        Returns:
+            np.ndarray: Hull energies per atom of shape (n_comps,). If
+                return_decomp, also returns the decompositions in compact form as
+                an int array of shape (n_comps, self.dim) with indices in
+                self.qhull_entries of the facet containing each composition, and
+                a float array of the same shape with the fractional amount of each
+                of these entries (zero for entries that are not part of the
+                decomposition).
+        """
+        fractions = self._get_batch_fractions(comps)
+        n_comps = len(fractions)
+        # Barycentric coordinates are [pd_coords, 1] @ aug_inv for each facet
+        points = np.concatenate([fractions[:, 1:], np.ones((n_comps, 1))], axis=1)
+        aug_invs = np.array([simplex._aug_inv for simplex in self.simplexes])
+        facets = np.array(self.facets, dtype=int).reshape(len(aug_invs), -1)
+
+        facet_idx = np.zeros(n_comps, dtype=int)
+        amounts = np.zeros((n_comps, facets.shape[1]))
+        for start in range(0, n_comps, batch_size):
+            bary = np.einsum("nd,fde->nfe", points[start : start + batch_size], aug_invs)
+            in_facet = (bary >= -PhaseDiagram.numerical_tol / 10).all(axis=2)
+            # Same as _get_facet_and_simplex, take the first facet containing the point
+            first = in_facet.argmax(axis=1)
+            if not in_facet[np.arange(len(first)), first].all():
+                missing = start + np.flatnonzero(~in_facet.any(axis=1))[0]
+                raise RuntimeError(f"No facet found for comp = {comps[missing]}")  # type:ignore[index]
+            facet_idx[start : start + batch_size] = first
+            amounts[start : start + batch_size] = bary[np.arange(len(first)), first]
+
+        amounts[np.abs(amounts) <= PhaseDiagram.numerical_tol] = 0
+        hull_energies = np.einsum("nd,nd->n", amounts, self.qhull_data[facets[facet_idx], -1])
+        if return_decomp:
+            return hull_energies, facets[facet_idx], amounts
+        return hull_energies
+
+    def get_e_above_hull_batch(
+        self,
+        comps: Sequence[Composition] | ArrayLike,
+        energies_per_atom: ArrayLike,
+        return_decomp: bool = False,
+        batch_size: int = 4096,
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized energy above hull for many compositions and energies, e.g.
+        to screen hypothetical compounds against a fixed hull. Unlike
+        get_e_above_hull, negative values (below the hull) are returned as is.
+
+        Args:
+            comps (Sequence[Composition] | ArrayLike): Compositions, or an
+                array of shape (n_comps, len(self.elements)) with the amounts
+                of each element of the phase diagram.
+            energies_per_atom (ArrayLike): Energies per atom of shape (n_comps,).
+            return_decomp (bool): Whether to also return the decompositions.
+            batch_size (int): Number of compositions tested at once.
+
+        Returns:
+            np.ndarray: Energies above hull per atom of shape (n_comps,). If
+                return_decomp, also returns the decompositions in the compact
+                form described in get_hull_energy_per_atom_batch.
+        """
+        hull_energies, *decomp = self.get_hull_energy_per_atom_batch(comps, return_decomp=True, batch_size=batch_size)
+        e_above_hull = np.asarray(energies_per_atom, dtype=float) - hull_energies
+        if return_decomp:
+            return e_above_hull, *decomp
+        return e_above_hull
+
     def get_decomp_and_e_above_hull(
         self,
         entry: PDEntry,
@@ -1583,6 +1886,48 @@ class CompoundPhaseDiagram(PhaseDiagram):
         return cls(entries, terminal_compositions, dct["normalize_terminal_compositions"])
 
 
+class _PatchDict(dict):
+    """Dict of the PhaseDiagram patches of a PatchedPhaseDiagram by chemical space.
+    It counts the changes made to it, so that the patch index of the
+    PatchedPhaseDiagram is rebuilt only after patches are added or removed.
+    """
+
+    n_changes = 0
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.n_changes += 1
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.n_changes += 1
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self.n_changes += 1
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.n_changes += 1
+
+    def pop(self, *args):
+        self.n_changes += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.n_changes += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.n_changes += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.n_changes += 1
+
+
 class PatchedPhaseDiagram(PhaseDiagram):
     """
     Computing the Convex Hull of a large set of data in multiple dimensions is
@@ -1613,6 +1958,7 @@ class PatchedPhaseDiagram(PhaseDiagram):
         elements: Sequence[Element] | None = None,
         keep_all_spaces: bool = False,
         verbose: bool = False,
+        n_jobs: int = 1,
     ) -> None:
         """
         Args:
@@ -1626,19 +1972,24 @@ class PatchedPhaseDiagram(PhaseDiagram):
             keep_all_spaces (bool): Pass True to keep chemical spaces that are subspaces
                 of other spaces.
             verbose (bool): Whether to show progress bar during convex hull construction.
+            n_jobs (int): Number of worker processes over which the convex hulls of the
+                patches are distributed (via joblib). Defaults to 1, i.e. serial. -1 uses
+                all available CPUs.
         """
         if elements is None:
             elements = sorted({els for entry in entries for els in entry.elements})
 
         self.dim = len(elements)
 
-        entries = sorted(entries, key=lambda e: e.composition.reduced_composition)
+        reduced_entries = sorted(
+            ((entry.composition.reduced_composition, entry) for entry in entries), key=lambda pair: pair[0]
+        )
 
         el_refs: dict[Element, PDEntry] = {}
         min_entries = []
         all_entries: list[PDEntry] = []
-        for composition, group_iter in itertools.groupby(entries, key=lambda e: e.composition.reduced_composition):
-            group = list(group_iter)
+        for composition, group_iter in itertools.groupby(reduced_entries, key=lambda pair: pair[0]):
+            group = [entry for _, entry in group_iter]
             min_entry = min(group, key=lambda e: e.energy_per_atom)
             if composition.is_element:
                 el_refs[composition.elements[0]] = min_entry
@@ -1668,7 +2019,8 @@ class PatchedPhaseDiagram(PhaseDiagram):
         inds = np.where(form_e < -PhaseDiagram.formation_energy_tol)[0].tolist()
 
         # Add the elemental references
-        inds.extend([min_entries.index(el) for el in el_refs.values()])
+        min_inds = {id(entry): idx for idx, entry in enumerate(min_entries)}
+        inds.extend([min_inds[id(el)] for el in el_refs.values()])
 
         qhull_entries = tuple(min_entries[idx] for idx in inds)
         # make qhull spaces frozensets since they become keys to self.pds dict and frozensets are hashable
@@ -1685,10 +2037,23 @@ class PatchedPhaseDiagram(PhaseDiagram):
         self.spaces = sorted(spaces, key=len, reverse=True)  # Calculate pds for smaller dimension spaces last
         self.qhull_entries = qhull_entries
         self._qhull_spaces = qhull_spaces
-        self.pds = dict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
+        if n_jobs == 1:
+            self.pds = _PatchDict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
+        else:
+            patch_entries = [self._get_entries_in_space(space) for space in self.spaces]
+            patch_data = Parallel(n_jobs=n_jobs)(
+                delayed(_get_pd_patch_data)(space_entries) for space_entries in tqdm(patch_entries, disable=not verbose)
+            )
+            self.pds = _PatchDict()
+            for space, space_entries, data in zip(self.spaces, patch_entries, patch_data, strict=True):
+                data["all_entries"] = [space_entries[idx] for idx in data["all_entries"]]
+                data["qhull_entries"] = [space_entries[idx] for idx in data["qhull_entries"]]
+                data["el_refs"] = [(el, space_entries[idx]) for el, idx in data["el_refs"]]
+                self.pds[space] = PhaseDiagram(space_entries, sorted(space), computed_data=data)
         self.all_entries = all_entries
         self.el_refs = el_refs
         self.elements = elements
+        self._index_patches()
 
         # Add terminal elements as we may not have PD patches including them
         # NOTE add el_refs in case no multielement entries are present for el
@@ -1773,9 +2138,11 @@ class PatchedPhaseDiagram(PhaseDiagram):
         # Sort spaces by size in descending order and pre-compute lengths
         sorted_spaces = sorted(spaces, key=len, reverse=True)
 
-        result = []
-        for idx, space_i in enumerate(sorted_spaces):
-            if not any(space_i.issubset(larger_space) for larger_space in sorted_spaces[:idx]):
+        # NOTE a subspace of a redundant space is also a subspace of the space that
+        # made it redundant, so it suffices to compare against the retained spaces
+        result: list[frozenset[Element]] = []
+        for space_i in sorted_spaces:
+            if not any(space_i.issubset(larger_space) for larger_space in result):
                 result.append(space_i)
 
         return result
@@ -1791,7 +2158,8 @@ class PatchedPhaseDiagram(PhaseDiagram):
     # get_e_above_hull(),
     # get_decomp_and_e_above_hull(),
     # get_decomp_and_phase_separation_energy(),
-    # get_phase_separation_energy()
+    # get_phase_separation_energy(),
+    # get_e_above_hull_batch()
 
     def get_pd_for_entry(self, entry: Entry | Composition) -> PhaseDiagram:
         """Get the possible phase diagrams for an entry.
@@ -1805,16 +2173,10 @@ class PatchedPhaseDiagram(PhaseDiagram):
         Raises:
             ValueError: If no suitable PhaseDiagram is found for the entry.
         """
-        entry_space = frozenset(entry.elements)
-
-        try:
-            return self.pds[entry_space]
-        except KeyError:
-            for space, pd in self.pds.items():
-                if space.issuperset(entry_space):
-                    return pd
-
-        raise ValueError(f"No suitable PhaseDiagrams found for {entry}.")
+        space = self._get_patch_space(frozenset(entry.elements))
+        if space is None:
+            raise ValueError(f"No suitable PhaseDiagrams found for {entry}.")
+        return self.pds[space]
 
     def get_decomposition(self, comp: Composition) -> dict[PDEntry, float]:
         """See PhaseDiagram.
@@ -1868,6 +2230,101 @@ class PatchedPhaseDiagram(PhaseDiagram):
             on_error=on_error,
         )
 
+    def get_hull_energy_per_atom_batch(
+        self,
+        comps: Sequence[Composition] | ArrayLike,
+        return_decomp: bool = False,
+        batch_size: int = 4096,
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """See PhaseDiagram. Compositions are grouped by the patch containing their
+        chemical space and each group is evaluated in batches on that patch.
+
+        Args:
+            comps (Sequence[Composition] | ArrayLike): Compositions, or an
+                array of shape (n_comps, len(self.elements)) with the amounts
+                of each element of the phase diagram.
+            return_decomp (bool): Whether to also return the decompositions.
+            batch_size (int): Number of compositions tested at once per patch.
+
+        Raises:
+            ValueError: If no patch contains the chemical space of a composition.
+
+        Returns:
+            np.ndarray: Hull energies per atom of shape (n_comps,). If
+                return_decomp, also returns the decompositions in the compact form
+                described in PhaseDiagram.get_hull_energy_per_atom_batch, with
+                indices in self.qhull_entries. As patches differ in dimension, the
+                arrays have as many columns as the largest patch and the unused
+                columns have index -1 and amount 0.
+        """
+        fractions = self._get_batch_fractions(comps)
+        present = fractions > 0
+        # Group the compositions by chemical space, then the spaces by patch
+        spaces, inverse = np.unique(present, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        patch_comps: dict[frozenset[Element], list[np.ndarray]] = defaultdict(list)
+        for space_idx, space_mask in enumerate(spaces):
+            rows = np.flatnonzero(inverse == space_idx)
+            space = frozenset(el for el, is_present in zip(self.elements, space_mask, strict=True) if is_present)
+            patch_space = self._get_patch_space(space)
+            if patch_space is None:
+                comp = Composition(dict(zip(self.elements, fractions[rows[0]], strict=True)))
+                raise ValueError(f"No suitable PhaseDiagrams found for {comp}.")
+            patch_comps[patch_space].append(rows)
+
+        el_idx = {el: idx for idx, el in enumerate(self.elements)}
+        qhull_idx = {id(entry): idx for idx, entry in enumerate(self.qhull_entries)}
+        width = max((pd.dim for pd in self.pds.values()), default=1)
+        hull_energies = np.zeros(len(fractions))
+        facets = np.full((len(fractions), width), -1)
+        amounts = np.zeros((len(fractions), width))
+        for patch_space, rows_list in patch_comps.items():
+            pd = self.pds[patch_space]
+            rows = np.concatenate(rows_list)
+            patch_fractions = fractions[np.ix_(rows, [el_idx[el] for el in pd.elements])]
+            energies, patch_facets, patch_amounts = pd.get_hull_energy_per_atom_batch(
+                patch_fractions, return_decomp=True, batch_size=batch_size
+            )
+            hull_energies[rows] = energies
+            if return_decomp:
+                to_qhull_idx = np.array([qhull_idx[id(entry)] for entry in pd.qhull_entries])
+                facets[rows, : pd.dim] = to_qhull_idx[patch_facets]
+                amounts[rows, : pd.dim] = patch_amounts
+
+        if return_decomp:
+            return hull_energies, facets, amounts
+        return hull_energies
+
+    def _get_entries_in_space(self, space: frozenset[Element]) -> list[PDEntry]:
+        """
+        Args:
+            space (frozenset[Element]): chemical space of the form A-B-X.
+
+        Returns:
+            list[PDEntry]: qhull entries in the chemical space, in the order of
+                self.qhull_entries.
+        """
+        if "_qhull_space_indices" not in self.__dict__:
+            indices: dict[frozenset[Element], list[int]] = defaultdict(list)
+            for idx, entry_space in enumerate(self._qhull_spaces):
+                indices[entry_space].append(idx)
+            self._qhull_space_indices = dict(indices)
+
+        # Look up the subspaces of the space rather than testing every qhull entry,
+        # unless there are fewer distinct spaces of qhull entries than subspaces
+        if 2 ** len(space) < len(self._qhull_space_indices):
+            subspaces = (
+                frozenset(subspace)
+                for n_elements in range(1, len(space) + 1)
+                for subspace in itertools.combinations(space, n_elements)
+            )
+        else:
+            subspaces = (subspace for subspace in self._qhull_space_indices if space.issuperset(subspace))
+        space_indices = sorted(
+            itertools.chain.from_iterable(self._qhull_space_indices.get(subspace, ()) for subspace in subspaces)
+        )
+        return [self.qhull_entries[idx] for idx in space_indices]
+
     def _get_pd_patch_for_space(self, space: frozenset[Element]) -> tuple[frozenset[Element], PhaseDiagram]:
         """
         Args:
@@ -1876,9 +2333,50 @@ class PatchedPhaseDiagram(PhaseDiagram):
         Returns:
             space, PhaseDiagram for the given chemical space
         """
-        space_entries = [e for e, s in zip(self.qhull_entries, self._qhull_spaces, strict=True) if space.issuperset(s)]
+        return space, PhaseDiagram(self._get_entries_in_space(space))
+
+    def _index_patches(self) -> None:
+        """Index the patches by element to look up the first patch (in the order of
+        self.pds) containing a chemical space without scanning all patches.
+        """
+        self._indexed_pds, self._indexed_changes = self.pds, self.pds.n_changes
+        self._patch_spaces = list(self.pds)
+        self._element_patches: dict[Element, set[int]] = defaultdict(set)
+        for idx, space in enumerate(self._patch_spaces):
+            for el in space:
+                self._element_patches[el].add(idx)
+        self._patch_lookup: dict[frozenset[Element], frozenset[Element] | None] = {}
+
+    def _get_patch_space(self, space: frozenset[Element]) -> frozenset[Element] | None:
+        """
+        Args:
+            space (frozenset[Element]): chemical space of the form A-B-X.
+
+        Returns:
+            frozenset[Element] | None: chemical space of the first patch containing
+                the given space, or None if no patch contains it.
+        """
+        # Reindex if patches were added to or removed from self.pds since they
+        # were indexed, or if self.pds was replaced, e.g. by a plain dict or
+        # when unpickled from an older version
+        if not isinstance(self.pds, _PatchDict):
+            self.pds = _PatchDict(self.pds)
+        if self.__dict__.get("_indexed_pds") is not self.pds or self._indexed_changes != self.pds.n_changes:
+            self._index_patches()
+        try:
+            return self._patch_lookup[space]
+        except KeyError:
+            pass
 
-        return space, PhaseDiagram(space_entries)
+        if space in self.pds:
+            patch_space: frozenset[Element] | None = space
+        else:
+            candidates = set(range(len(self._patch_spaces)))
+            for el in space:
+                candidates &= self._element_patches.get(el, set())
+            patch_space = self._patch_spaces[min(candidates)] if candidates else None
+        self._patch_lookup[space] = patch_space
+        return patch_space
 
     # NOTE the following functions are not implemented for PatchedPhaseDiagram
 
@@ -2083,6 +2581,26 @@ class PhaseDiagramError(Exception):
     """An exception class for Phase Diagram generation."""
 
 
+def _get_pd_patch_data(entries: list[PDEntry]) -> dict[str, Any]:
+    """Compute the convex hull of a patch of a PatchedPhaseDiagram. Entries in the
+    computed data are replaced by their indices in entries, so that the patch can be
+    rebuilt around the entry objects of the parent process, which are shared between
+    overlapping patches. Must not be in the class so that it can be pickled.
+
+    Args:
+        entries (list[PDEntry]): Entries of the patch.
+
+    Returns:
+        dict[str, Any]: PhaseDiagram.computed_data with entries as indices.
+    """
+    data = dict(PhaseDiagram(entries).computed_data)
+    entry_idx = {id(entry): idx for idx, entry in enumerate(entries)}
+    data["all_entries"] = [entry_idx[id(entry)] for entry in data["all_entries"]]
+    data["qhull_entries"] = [entry_idx[id(entry)] for entry in data["qhull_entries"]]
+    data["el_refs"] = [(el, entry_idx[id(entry)]) for el, entry in data["el_refs"]]
+    return data
+
+
 def get_facets(qhull_data: ArrayLike, joggle: bool = False) -> ConvexHull:
     """Get the simplex facets for the Convex hull.
 
@@ -9,6 +9,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
+from joblib import Parallel, delayed
 from monty.json import MSONable
 from scipy.optimize import linear_sum_assignment
 
@@ -33,6 +34,9 @@ __status__ = "Production"
 __date__ = "Dec 3, 2012"
 LRU_CACHE_SIZE = SETTINGS.get("STRUCTURE_MATCHER_CACHE_SIZE", 300)
 
+# Relative slack on the lattice invariant bounds to absorb floating point noise
+LATTICE_INVARIANT_SLACK = 1e-6
+
 
 def get_linear_assignment_solution(cost_matrix: np.ndarray):
     """Wrapper for SciPy's linear_sum_assignment.
@@ -74,10 +78,15 @@ class SiteOrderedIStructure(IStructure):
 
     def __eq__(self, other: object) -> bool:
         """Check for IStructure equality and same site order."""
-        if not super().__eq__(other):
-            return False
+        needed_attrs = ("lattice", "sites", "properties")
+        if not all(hasattr(other, attr) for attr in needed_attrs):
+            return NotImplemented
         other = cast("SiteOrderedIStructure", other)  # make mypy happy
 
+        # Equal sites in the same order imply IStructure equality, so the
+        # (quadratic) unordered comparison of the sites can be skipped
+        if len(self) != len(other) or self.lattice != other.lattice or self.properties != other.properties:
+            return False
         return list(self.sites) == list(other.sites)
 
     def __hash__(self) -> int:
@@ -829,14 +838,23 @@ class StructureMatcher(MSONable):
 
         return None
 
-    def group_structures(self, s_list, anonymous=False):
+    def group_structures(self, s_list, anonymous=False, n_jobs: int = 1):
         """
         Given a list of structures, use fit to group
         them by structural equality.
 
+        Structures are first bucketed by composition hash (and by the number
+        of sites in the reduced cell when supercells are not attempted), and
+        candidate pairs within a bucket are pruned with lattice invariants
+        that are necessary conditions for a fit before the exact match is
+        performed. The grouping is identical to a plain pairwise greedy fit.
+
         Args:
             s_list ([Structure]): List of structures to be grouped
             anonymous (bool): Whether to use anonymous mode.
+            n_jobs (int): Number of worker processes over which the buckets
+                are distributed (via joblib). Defaults to 1, i.e. serial. -1
+                uses all available CPUs.
 
         Returns:
             A list of lists of matched structures
@@ -860,34 +878,62 @@ class StructureMatcher(MSONable):
         else:
             c_hash = self._comparator.get_hash
 
-        def s_hash(s):
-            return c_hash(s[1].composition)
+        # Without supercells, structures with different numbers of sites can never match
+        def s_hash(idx):
+            return c_hash(s_list[idx].composition), 0 if self._supercell else len(s_list[idx])
 
-        sorted_s_list = sorted(enumerate(s_list), key=s_hash)
-        all_groups = []
+        buckets = [list(g) for _, g in itertools.groupby(sorted(range(len(s_list)), key=s_hash), key=s_hash)]
 
         # For each pre-grouped list of structures, perform actual matching.
-        for _, g in itertools.groupby(sorted_s_list, key=s_hash):
-            unmatched = list(g)
-            while len(unmatched) > 0:
-                i, refs = unmatched.pop(0)
-                matches = [i]
-                if anonymous:
-                    inds = filter(
-                        lambda i: self.fit_anonymous(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                else:
-                    inds = filter(
-                        lambda i: self.fit(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                inds = list(inds)
-                matches.extend([unmatched[i][0] for i in inds])
-                unmatched = [unmatched[i] for i in range(len(unmatched)) if i not in inds]
-                all_groups.append([original_s_list[i] for i in matches])
-
-        return all_groups
+        # Largest buckets are dispatched first to balance the worker load.
+        order = sorted(range(len(buckets)), key=lambda idx: -len(buckets[idx]))
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_group_bucket)(self, [s_list[i] for i in buckets[idx]], anonymous) for idx in order
+        )
+
+        all_groups = []
+        for idx, local_groups in zip(order, results, strict=True):
+            all_groups.extend([buckets[idx][i] for i in group] for group in local_groups)
+
+        # Restore the order of the pairwise greedy grouping: by composition
+        # hash, then by the index of the first structure in each group.
+        all_groups.sort(key=lambda group: (s_hash(group[0])[0], group[0]))
+
+        return [[original_s_list[i] for i in group] for group in all_groups]
+
+    def _get_lattice_invariants(self, struct: Structure) -> tuple[np.ndarray, np.ndarray]:
+        """Get the sorted lattice lengths and the successive minima of the
+        lattice of a reduced structure, normalized by the cube root of the
+        volume if structures are scaled before matching.
+
+        For fit(struct1, struct2) to succeed without a supercell, the lattice
+        of struct1 must contain a basis whose lengths are each within a factor
+        of (1 + ltol) of the lengths of struct2, so the k-th successive minimum
+        of struct1 must be smaller than (1 + ltol) times the k-th sorted length
+        of struct2.
+        """
+        lattice = struct.lattice
+        lengths = np.sort(lattice.abc)
+        frac, dists, _, _ = lattice.get_points_in_sphere(
+            [[0, 0, 0]], [0, 0, 0], lengths[-1] * (1 + 1e-6), zip_results=False
+        )
+        cart = lattice.get_cartesian_coords(frac)
+
+        minima: list[float] = []
+        basis: list[np.ndarray] = []
+        for idx in np.argsort(dists):
+            if dists[idx] < 1e-8:
+                continue
+            if np.linalg.matrix_rank([*basis, cart[idx]], tol=1e-8 * lengths[-1]) > len(basis):
+                basis.append(cart[idx])
+                minima.append(dists[idx])
+                if len(minima) == 3:
+                    break
+        # Pad with zeros (i.e. no pruning) in the unlikely event of a degenerate search
+        minima += [0] * (3 - len(minima))
+
+        norm = lattice.volume ** (1 / 3) if self._scale else 1
+        return lengths / norm, np.array(minima) / norm
 
     def as_dict(self):
         """MSONable dict."""
@@ -1267,3 +1313,43 @@ class StructureMatcher(MSONable):
             return None
 
         return match[4]
+
+
+def _group_bucket(matcher: StructureMatcher, structures: list[Structure], anonymous: bool) -> list[list[int]]:
+    """Greedily group a bucket of reduced structures sharing a composition hash.
+    Must not be in the class so that it can be pickled.
+
+    Args:
+        matcher (StructureMatcher): Matcher used to fit the structures.
+        structures (list[Structure]): Reduced structures of a single bucket.
+        anonymous (bool): Whether to use anonymous mode.
+
+    Returns:
+        list[list[int]]: Groups of indices into structures.
+    """
+    fit = matcher.fit_anonymous if anonymous else matcher.fit
+
+    # The lattice invariants are only necessary conditions without supercells
+    lengths = np.zeros((len(structures), 3))
+    minima = np.zeros((len(structures), 3))
+    if not matcher._supercell:
+        for idx, struct in enumerate(structures):
+            lengths[idx], minima[idx] = matcher._get_lattice_invariants(struct)
+    max_ratio = (1 + matcher.ltol) * (1 + LATTICE_INVARIANT_SLACK)
+
+    groups = []
+    unmatched = np.arange(len(structures))
+    while len(unmatched) > 0:
+        ref, unmatched = unmatched[0], unmatched[1:]
+        candidates = np.all(minima[ref] <= max_ratio * lengths[unmatched], axis=1)
+        matched = np.array(
+            [
+                is_candidate and fit(structures[ref], structures[idx], skip_structure_reduction=True)
+                for is_candidate, idx in zip(candidates, unmatched, strict=True)
+            ],
+            dtype=bool,
+        )
+        groups.append([int(ref), *unmatched[matched].tolist()])
+        unmatched = unmatched[~matched]
+
+    return groups
@@ -5,9 +5,12 @@ data using Python's multiprocessing.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+from contextlib import nullcontext
+from functools import partial
 from multiprocessing import Manager, Pool
 from typing import TYPE_CHECKING
 
@@ -15,6 +18,8 @@ from monty.io import zopen
 from monty.json import MontyDecoder, MontyEncoder
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pymatgen.apps.borg.hive import AbstractDrone
     from pymatgen.util.typing import PathLike
 
@@ -91,6 +96,77 @@ class BorgQueen:
         for json_str in data:
             self._data.append(json.loads(json_str, cls=MontyDecoder))
 
+    def incremental_assimilate(
+        self,
+        rootpath: PathLike,
+        manifest: PathLike,
+        filename: PathLike | None = None,
+        chunksize: int = 64,
+    ) -> int:
+        """Assimilate only the paths in rootpath that are new or have changed
+        since the last call with the same manifest.
+
+        The manifest records the mtime, size and drone version of every
+        assimilated path, so re-scanning a large tree only assimilates new or
+        modified paths, or all of them if the drone settings change. Paths
+        whose assimilation failed are recorded too, and are only retried
+        once they change.
+
+        Args:
+            rootpath (PathLike): The root directory to start assimilation.
+            manifest (PathLike): JSON-lines file with the state of the paths
+                assimilated so far. Created if it does not exist.
+            filename (PathLike): JSON-lines file to which results are appended
+                as they complete, one {"path": ..., "data": ...} record per
+                line. Records for re-assimilated paths supersede older ones,
+                see load_data. If None, results are added to the data of the
+                BorgQueen instead.
+            chunksize (int): Number of paths sent to a drone at once when
+                running in parallel, to reduce inter-process communication.
+
+        Returns:
+            int: Number of paths assimilated.
+        """
+        logger.info("Scanning for valid paths...")
+        previous = {record.pop("path"): record for record in _iter_records(manifest)}
+        version = _get_drone_version(self._drone)
+        records: dict[str, dict] = {}
+        todo = []
+        for parent, subdirs, files in os.walk(rootpath):
+            for path in self._drone.get_valid_paths((parent, subdirs, files)):
+                records[path] = {**_get_path_stats(path), "drone": version}
+                if previous.get(path) != records[path]:
+                    todo.append(path)
+        total = len(todo)
+        logger.info(f"{total} new or changed paths out of {len(records)} valid paths found.")
+
+        assimilate = partial(_assimilate_path, self._drone)
+        with (
+            Pool(self._num_drones) if self._num_drones > 1 else nullcontext() as pool,
+            zopen(manifest, mode="at", encoding="utf-8") as manifest_file,
+            zopen(filename, mode="at", encoding="utf-8") if filename else nullcontext() as file,
+        ):
+            results = pool.imap_unordered(assimilate, todo, chunksize=chunksize) if pool else map(assimilate, todo)
+            for idx, (path, json_str) in enumerate(results, start=1):
+                if json_str is not None:
+                    if file:
+                        file.write(f'{{"path": {json.dumps(path)}, "data": {json_str}}}\n')
+                    else:
+                        self._data.append(json.loads(json_str, cls=MontyDecoder))
+                # Record progress as results arrive so that an interrupted run
+                # can be resumed
+                manifest_file.write(json.dumps({"path": path, **records[path]}) + "\n")
+                logger.info(f"{idx}/{total} ({idx / total:.1%}) done")
+
+        # Compact the manifest, dropping paths that no longer exist
+        parent, name = os.path.split(manifest)
+        tmp_manifest = os.path.join(parent, f".tmp.{name}")
+        with zopen(tmp_manifest, mode="wt", encoding="utf-8") as manifest_file:
+            for path, record in records.items():
+                manifest_file.write(json.dumps({"path": path, **record}) + "\n")
+        os.replace(tmp_manifest, manifest)
+        return total
+
     def get_data(self) -> list:
         """Get an list of assimilated objects."""
         return self._data
@@ -107,7 +183,14 @@ class BorgQueen:
             json.dump(list(self._data), file, cls=MontyEncoder)  # type:ignore[arg-type]
 
     def load_data(self, filename: PathLike) -> None:
-        """Load assimilated data from a file."""
+        """Load assimilated data from a file. JSON-lines files written by
+        incremental_assimilate (.jsonl extension) are also supported, in which
+        case only the latest record of each path is kept.
+        """
+        if ".jsonl" in os.path.basename(filename):
+            data = {record["path"]: record["data"] for record in _iter_records(filename)}
+            self._data = MontyDecoder().process_decoded(list(data.values()))
+            return
         with zopen(filename, mode="rt", encoding="utf-8") as file:
             self._data = json.load(file, cls=MontyDecoder)
 
@@ -121,3 +204,54 @@ def order_assimilation(args: tuple) -> None:
     count = status["count"]
     total = status["total"]
     logger.info(f"{count}/{total} ({count / total:.2%}) done")
+
+
+def _assimilate_path(drone: AbstractDrone, path: str) -> tuple[str, str | None]:
+    """Internal helper for BorgQueen.incremental_assimilate, returning the
+    path with its assimilated data as a JSON string.
+    """
+    if new_data := drone.assimilate(path):
+        return path, json.dumps(new_data, cls=MontyEncoder)
+    return path, None
+
+
+def _get_drone_version(drone: AbstractDrone) -> str:
+    """Identifier of a drone class and its settings."""
+    settings = json.dumps(
+        drone.as_dict(),
+        sort_keys=True,
+        default=lambda obj: sorted(obj) if isinstance(obj, set) else str(obj),
+    )
+    return f"{type(drone).__module__}.{type(drone).__name__}:{hashlib.sha256(settings.encode()).hexdigest()[:16]}"
+
+
+def _get_path_stats(path: str) -> dict[str, float]:
+    """Latest mtime and total size of a file, or of all files in a directory
+    tree, used to detect changes between assimilations.
+    """
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        return {"mtime": stat.st_mtime, "size": stat.st_size}
+    mtime = os.stat(path).st_mtime
+    size = 0
+    for parent, _subdirs, files in os.walk(path):
+        for name in files:
+            stat = os.stat(os.path.join(parent, name))
+            mtime = max(mtime, stat.st_mtime)
+            size += stat.st_size
+    return {"mtime": mtime, "size": size}
+
+
+def _iter_records(filename: PathLike) -> Iterator[dict]:
+    """Iterate over the records of a JSON-lines file, if it exists. Lines
+    truncated by an interrupted run are skipped.
+    """
+    if not os.path.isfile(filename):
+        return
+    with zopen(filename, mode="rt", encoding="utf-8") as file:
+        for line in file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                if line.strip():
+                    logger.warning(f"Skipping malformed record in {filename}")
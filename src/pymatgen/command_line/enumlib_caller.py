@@ -1,8 +1,10 @@
 """This module implements an interface to enumlib, Gus Hart's excellent Fortran
 code for enumerating derivative structures.
 
-This module depends on a compiled enumlib with the executables enum.x and
-makestr.x available in the path. Please download the library at
+This module depends on a compiled enumlib with the executable enum.x available
+in the path. The enumerated structures are decoded from enumlib's struct_enum.out
+file directly, falling back on makestr.x if it is available in the path and the
+output cannot be decoded. Please download the library at
 https://github.com/msg-byu/enumlib and follow the instructions in the README to
 compile these two executables accordingly.
 
@@ -36,18 +38,21 @@ from shutil import which
 from typing import TYPE_CHECKING
 
 import numpy as np
+from joblib import Parallel, delayed
 from monty.dev import requires
 from monty.fractions import lcm
 from monty.tempfile import ScratchDir
 
-from pymatgen.core import DummySpecies, PeriodicSite, Structure
+from pymatgen.core import DummySpecies, Lattice, PeriodicSite, Structure
 from pymatgen.io.vasp.inputs import Poscar
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
     from typing import ClassVar
 
     from pymatgen.core.structure import IStructure
+    from pymatgen.util.typing import PathLike, SpeciesLike
 
 logger = logging.getLogger(__name__)
 
@@ -58,11 +63,11 @@ MAKESTR_CMD = which("makestr.x") or which("makeStr.x") or which("makeStr.py")
 
 
 @requires(
-    ENUM_CMD and MAKESTR_CMD,  # type: ignore[arg-type]
-    "EnumlibAdaptor requires the executables 'enum.x' or 'multienum.x' "
-    "and 'makestr.x' or 'makeStr.py' to be in the path. Please download the "
-    "library at https://github.com/msg-byu/enumlib and follow the instructions "
-    "in the README to compile these two executables accordingly.",
+    ENUM_CMD,  # type: ignore[arg-type]
+    "EnumlibAdaptor requires the executable 'enum.x' or 'multienum.x' "
+    "to be in the path. Please download the library at "
+    "https://github.com/msg-byu/enumlib and follow the instructions "
+    "in the README to compile it accordingly.",
 )
 class EnumlibAdaptor:
     """An adaptor for enumlib.
@@ -83,6 +88,8 @@ class EnumlibAdaptor:
         refine_structure: bool = False,
         check_ordered_symmetry: bool = True,
         timeout: float | None = None,
+        *,
+        n_jobs: int = 1,
     ) -> None:
         """Initialize the adapter with a structure and some parameters.
 
@@ -115,6 +122,9 @@ class EnumlibAdaptor:
                 time in minutes. This can be useful for gracefully handling
                 enumerations in a high-throughput context, for some enumerations
                 which will not terminate in a realistic length of time.
+            n_jobs (int): Number of worker processes over which the decoding of
+                the enumerated structures is distributed (via joblib). Defaults
+                to 1, i.e. serial. -1 uses all available CPUs.
         """
         if refine_structure:
             finder = SpacegroupAnalyzer(structure, symm_prec)
@@ -128,6 +138,7 @@ class EnumlibAdaptor:
         self.enum_precision_parameter = enum_precision_parameter
         self.check_ordered_symmetry = check_ordered_symmetry
         self.timeout = timeout
+        self.n_jobs = n_jobs
 
     def run(self) -> None:
         """Run the enumeration."""
@@ -312,12 +323,15 @@ class EnumlibAdaptor:
         logger.debug(f"Enumeration resulted in {count} structures")
         return count
 
-    def _get_structures(self, num_structs: int) -> list[Structure]:
+    def _run_makestr(self, num_structs: int) -> list[Structure]:
+        """Convert the enumerated structures with makestr.
+
+        Returns:
+            list[Structure]: enumerated structures, including vacancies.
+        """
         if MAKESTR_CMD is None:
             raise RuntimeError("makestr.x is not available")
 
-        structs: list[Structure] = []
-
         if ".py" in MAKESTR_CMD:
             options: tuple[str, ...] = ("-input", "struct_enum.out", str(1), str(num_structs))
         else:
@@ -334,6 +348,21 @@ class EnumlibAdaptor:
         if stderr:
             logger.warning(stderr.decode())
 
+        structs: list[Structure] = []
+        # In the order of struct_enum.out, i.e. of the number suffixes of the files
+        for file in sorted(glob("vasp.*"), key=lambda name: (len(name), name)):
+            with open(file, encoding="utf-8") as _file:
+                data = _file.read()
+                data = re.sub(r"scale factor", "1", data)
+                data = re.sub(r"(\d+)-(\d+)", r"\1 -\2", data)
+                poscar = Poscar.from_str(data, self.index_species)  # type: ignore[arg-type]
+                structs.append(poscar.structure)
+        return structs
+
+    def _get_structures(self, num_structs: int) -> list[Structure]:
+        """Read the enumerated structures from struct_enum.out, using makestr
+        as a fallback if the file cannot be decoded.
+        """
         # Sites retrieved from enumlib will lack site properties
         # to ensure consistency, we keep track of what site properties
         # are missing and set them to None
@@ -365,48 +394,220 @@ class EnumlibAdaptor:
             ordered_structure = None  # type: ignore[assignment]
             inv_org_latt = None  # type: ignore[assignment]
 
-        for file in glob("vasp.*"):
-            with open(file, encoding="utf-8") as _file:
-                data = _file.read()
-                data = re.sub(r"scale factor", "1", data)
-                data = re.sub(r"(\d+)-(\d+)", r"\1 -\2", data)
-                poscar = Poscar.from_str(data, self.index_species)  # type: ignore[arg-type]
-                sub_structure = poscar.structure
-                # Enumeration may have resulted in a super lattice. We need to
-                # find the mapping from the new lattice to the old lattice, and
-                # perform supercell construction if necessary.
-                new_latt = sub_structure.lattice
+        # Orderings in the same supercell share the ordered sites
+        supercell_sites: dict[tuple, list[PeriodicSite]] = {}
 
-                sites = []
+        def get_structure(sub_structure: Structure) -> Structure:
+            # Enumeration may have resulted in a super lattice. We need to
+            # find the mapping from the new lattice to the old lattice, and
+            # perform supercell construction if necessary.
+            new_latt = sub_structure.lattice
 
-                if len(self.ordered_sites) > 0:
-                    transformation = np.dot(new_latt.matrix, inv_org_latt)  # type:ignore[arg-type]
-                    transformation = [[round(cell) for cell in row] for row in transformation]
+            sites = []
+
+            if len(self.ordered_sites) > 0:
+                transformation = np.dot(new_latt.matrix, inv_org_latt)  # type:ignore[arg-type]
+                transformation = tuple(tuple(round(cell) for cell in row) for row in transformation)
+                if transformation not in supercell_sites:
                     logger.debug(f"Supercell matrix: {transformation}")
                     struct = ordered_structure * transformation
-                    sites.extend([site.to_unit_cell() for site in struct])
-                    super_latt = sites[-1].lattice
-                else:
-                    super_latt = new_latt
-
-                for site in sub_structure:
-                    if site.specie.symbol != "X":  # We exclude vacancies.
-                        sites.append(
-                            PeriodicSite(
-                                site.species,
-                                site.frac_coords,
-                                super_latt,
-                                to_unit_cell=True,
-                                properties=disordered_site_properties,
-                            )
+                    supercell_sites[transformation] = [site.to_unit_cell() for site in struct]
+                sites.extend(supercell_sites[transformation])
+                super_latt = sites[-1].lattice
+            else:
+                super_latt = new_latt
+
+            for site in sub_structure:
+                if site.specie.symbol != "X":  # We exclude vacancies.
+                    sites.append(
+                        PeriodicSite(
+                            site.species,
+                            site.frac_coords,
+                            super_latt,
+                            to_unit_cell=True,
+                            properties=disordered_site_properties,
                         )
-                    else:
-                        logger.debug("Skipping sites that include species X.")
-                structs.append(Structure.from_sites(sorted(sites)))  # type:ignore[arg-type]
-
-        logger.debug(f"Read in a total of {num_structs} structures.")
+                    )
+                else:
+                    logger.debug("Skipping sites that include species X.")
+            return Structure.from_sites(sorted(sites))  # type:ignore[arg-type]
+
+        try:
+            structs = [
+                get_structure(sub_structure)
+                for sub_structure in read_struct_enum_out("struct_enum.out", self.index_species, n_jobs=self.n_jobs)
+            ]
+        except ValueError as exc:
+            if MAKESTR_CMD is None:
+                raise
+            logger.warning(f"Unable to decode struct_enum.out ({exc}), falling back on makestr.")
+            structs = [get_structure(sub_structure) for sub_structure in self._run_makestr(num_structs)]
+
+        logger.debug(f"Read in a total of {len(structs)} of {num_structs} structures.")
         return structs
 
 
+def read_struct_enum_out(
+    filename: PathLike,
+    species: Sequence[SpeciesLike],
+    n_jobs: int = 1,
+    chunk_size: int = 1000,
+) -> Iterator[Structure]:
+    """Lazily decode the structures enumerated by enumlib from a struct_enum.out
+    file, without writing them to disk with makestr.
+
+    The superlattice and atomic positions of every labeling are reconstructed
+    from its Hermite normal form (HNF) and the left transform of its Smith normal
+    form, as in makestr. Labelings sharing the same HNF reuse the same supercell,
+    whose basis is LLL reduced.
+
+    Args:
+        filename (PathLike): Path to struct_enum.out.
+        species (Sequence[SpeciesLike]): Species for each label of the enumeration.
+        n_jobs (int): Number of worker processes over which the decoding is
+            distributed (via joblib). Defaults to 1, i.e. serial. -1 uses all
+            available CPUs.
+        chunk_size (int): Number of labelings decoded per batch. Defaults to 1000.
+
+    Yields:
+        Structure: enumerated structures in the order of struct_enum.out. Sites
+            are grouped by label.
+    """
+    with open(filename, encoding="utf-8") as file:
+        parent_lattice, d_vectors = _read_struct_enum_out_header(file)
+        chunks = iter(lambda: list(itertools.islice(file, chunk_size)), [])
+        if n_jobs == 1:
+            for chunk in chunks:
+                yield from _decode_struct_enum_out_lines(chunk, parent_lattice, d_vectors, species)
+        else:
+            decoded = Parallel(n_jobs=n_jobs, return_as="generator")(
+                delayed(_decode_struct_enum_out_lines)(chunk, parent_lattice, d_vectors, species) for chunk in chunks
+            )
+            for structures in decoded:
+                yield from structures
+
+
+def _read_struct_enum_out_header(file: Iterator[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Read the parent lattice and the d-vectors of the multilattice from the header
+    of struct_enum.out, up to and including the line starting the labelings.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: parent lattice vectors as rows and
+            Cartesian coordinates of the d-vectors.
+    """
+    try:
+        lines = [next(file) for _ in range(6)]
+        parent_lattice = np.array([line.split()[:3] for line in lines[2:5]], dtype=float)
+        n_points = int(lines[5].split()[0])
+        d_vectors = np.array([next(file).split()[:3] for _ in range(n_points)], dtype=float)
+        while not next(file).lstrip().startswith("start"):
+            pass
+    except (StopIteration, IndexError) as exc:
+        raise ValueError("Invalid struct_enum.out header") from exc
+    return parent_lattice, d_vectors.reshape(n_points, 3)
+
+
+def _decode_struct_enum_out_lines(
+    lines: list[str],
+    parent_lattice: np.ndarray,
+    d_vectors: np.ndarray,
+    species: Sequence[SpeciesLike],
+) -> list[Structure]:
+    """Decode labelings of struct_enum.out into structures. Kept at module
+    level so that it can be pickled.
+
+    Args:
+        lines (list[str]): Labeling lines of struct_enum.out.
+        parent_lattice (np.ndarray): Parent lattice vectors as rows.
+        d_vectors (np.ndarray): Cartesian coordinates of the d-vectors.
+        species (Sequence[SpeciesLike]): Species for each label.
+
+    Returns:
+        list[Structure]: Decoded structures.
+    """
+    supercells: dict[tuple[int, ...], tuple[Lattice, np.ndarray, np.ndarray]] = {}
+    structures = []
+    for line in lines:
+        # Columns: #tot, HNF, Hdegn, labdegn, Totl, #size, idx, pg, SNF (3), HNF (6),
+        # left transform (9), labeling and, for newer enumlib versions, arrows
+        tokens = line.split()
+        if not tokens:
+            continue
+        if len(tokens) < 27:
+            raise ValueError(f"Invalid struct_enum.out labeling line {line!r}")
+        key = tuple(int(token) for token in tokens[8:26])
+        if key not in supercells:
+            supercells[key] = _get_struct_enum_supercell(parent_lattice, d_vectors, key)
+        lattice, frac_coords, label_indices = supercells[key]
+
+        labeling = tokens[26]
+        if len(labeling) != len(frac_coords):
+            raise ValueError(f"Labeling {labeling} does not match a supercell with {len(frac_coords)} sites")
+        labels = (np.frombuffer(labeling.encode(), dtype=np.uint8) - ord("0"))[label_indices]
+        order = np.argsort(labels, kind="stable")
+        structures.append(
+            Structure(
+                lattice,
+                [species[label] for label in labels[order]],
+                frac_coords[order],
+                to_unit_cell=True,
+            )
+        )
+    return structures
+
+
+def _get_struct_enum_supercell(
+    parent_lattice: np.ndarray,
+    d_vectors: np.ndarray,
+    key: tuple[int, ...],
+) -> tuple[Lattice, np.ndarray, np.ndarray]:
+    """Get the superlattice of an enumlib labeling and the positions of its sites.
+
+    Args:
+        parent_lattice (np.ndarray): Parent lattice vectors as rows.
+        d_vectors (np.ndarray): Cartesian coordinates of the d-vectors.
+        key (tuple[int, ...]): Diagonal of the Smith normal form, the lower
+            triangle of the HNF and the left transform of the labeling.
+
+    Returns:
+        tuple[Lattice, np.ndarray, np.ndarray]: LLL-reduced superlattice,
+            fractional coordinates of the sites and index in the labeling of
+            each site.
+    """
+    snf = np.array(key[:3])
+    a, b, c, d, e, f = key[3:9]
+    left = np.reshape(key[9:18], (3, 3))
+
+    # One parent lattice point per coset of the superlattice, in makestr order
+    points = np.array(
+        [
+            (z1, z2, z3)
+            for z1 in range(a)
+            for z2 in range(b * z1 // a, b * z1 // a + c)
+            for z3 in range(
+                z1 * (d - e * b // c) // a + e * z2 // c,
+                z1 * (d - e * b // c) // a + e * z2 // c + f,
+            )
+        ]
+    )
+
+    # Superlattice vectors are the columns of the HNF in the parent basis
+    hnf = np.array([[a, 0, 0], [b, c, 0], [d, e, f]])
+    super_matrix = hnf.T @ parent_lattice
+    reduced_matrix = Lattice(super_matrix).lll_matrix
+    if np.linalg.det(reduced_matrix) * np.linalg.det(super_matrix) < 0:
+        reduced_matrix = -reduced_matrix
+    lattice = Lattice(reduced_matrix)
+
+    cart_coords = d_vectors[:, None, :] + (points @ parent_lattice)[None, :, :]
+    frac_coords = lattice.get_fractional_coords(cart_coords.reshape(-1, 3))
+
+    # Map each lattice point onto the group Z_S1 x Z_S2 x Z_S3 indexing the labeling
+    group = (points @ left.T) % snf
+    label_indices = group @ np.array([snf[1] * snf[2], snf[2], 1])
+    label_indices = (np.arange(len(d_vectors))[:, None] * np.prod(snf) + label_indices[None, :]).ravel()
+    return lattice, frac_coords, label_indices
+
+
 class EnumError(BaseException):
     """Error subclass for enumeration errors."""
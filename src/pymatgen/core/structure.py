@@ -20,6 +20,7 @@ import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from fnmatch import fnmatch
+from operator import is_
 from typing import TYPE_CHECKING, Literal, cast, get_args, overload
 
 import numpy as np
@@ -259,6 +260,49 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _get_site_species(species: Sequence[CompositionLike]) -> list[Composition]:
+        """Convert the species of each site to a Composition, parsing every
+        distinct hashable input (e.g. "Fe2+", 26, Element("O")) only once. The
+        resulting Compositions are shared between sites, which is safe as
+        Compositions are immutable.
+
+        Args:
+            species: Sequence of species on each site, in any form accepted
+                by PeriodicSite.
+
+        Raises:
+            ValueError: If the occupancies of a site sum to more than 1.
+
+        Returns:
+            list[Composition]: species and occupancies of each site.
+        """
+        parsed: dict[tuple[type, Any], Composition] = {}
+        site_species = []
+        for specie in species:
+            if isinstance(specie, Composition):
+                comp = specie
+            else:
+                try:
+                    key = (type(specie), specie)
+                    comp = parsed.get(key)  # type: ignore[assignment]
+                except TypeError:  # unhashable, e.g. a dict of occupancies
+                    key = None
+                    comp = None
+                if comp is None:
+                    try:
+                        comp = Composition({get_el_sp(specie): 1})  # type: ignore[arg-type]
+                    except TypeError:
+                        comp = Composition(specie)
+                    if key is not None:
+                        parsed[key] = comp
+            site_species.append(comp)
+
+        for comp in {id(comp): comp for comp in site_species}.values():
+            if comp.num_atoms > 1 + Composition.amount_tolerance:
+                raise ValueError("Species occupancies sum to more than 1!")
+        return site_species
+
     @abstractmethod
     def get_distance(self, i: int, j: int) -> float:
         """Get distance between sites at index i and j.
@@ -1072,8 +1116,17 @@ class IStructure(SiteCollection, MSONable):
 
         self._lattice = lattice if isinstance(lattice, Lattice) else Lattice(lattice)
 
+        # Convert all coordinates in one go. Each site then holds a row of this
+        # private array as its frac_coords, rather than its own small array.
+        frac_coords = np.array(coords, dtype=np.float64).reshape(len(species), 3)
+        if coords_are_cartesian:
+            frac_coords = self._lattice.get_fractional_coords(frac_coords)
+        if to_unit_cell:
+            pbc = np.array(self._lattice.pbc)
+            frac_coords[:, pbc] = np.mod(frac_coords[:, pbc], 1)
+
         sites = []
-        for idx, specie in enumerate(species):
+        for idx, specie in enumerate(self._get_site_species(species)):
             prop = None
             if site_properties:
                 prop = {key: val[idx] for key, val in site_properties.items() if val is not None}
@@ -1082,12 +1135,11 @@ class IStructure(SiteCollection, MSONable):
 
             site = PeriodicSite(
                 specie,
-                np.array(coords[idx]),
+                frac_coords[idx],
                 self._lattice,
-                to_unit_cell,
-                coords_are_cartesian=coords_are_cartesian,
                 properties=prop,
                 label=label,
+                skip_checks=True,
             )
             sites.append(site)
         self._sites: tuple[PeriodicSite, ...] = tuple(sites)
@@ -1121,6 +1173,12 @@ class IStructure(SiteCollection, MSONable):
         """Use the composition hash for now."""
         return hash(self.composition)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Leave the neighbor list cache out of pickles and deep copies."""
+        state = self.__dict__.copy()
+        state.pop("_neighbor_list_cache", None)
+        return state
+
     def __mul__(self, scaling_matrix: int | Sequence[int] | Sequence[Sequence[int]]) -> Structure:
         """Make a supercell. Allow sites outside the unit cell.
 
@@ -1153,24 +1211,27 @@ class IStructure(SiteCollection, MSONable):
 
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
+        n_images = len(cart_lattice)
 
-        new_sites = []
-        for site in self:
-            for vec in cart_lattice:
-                periodic_site = PeriodicSite(
-                    site.species,
-                    site.coords + vec,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                    skip_checks=True,
-                    label=site.label,
-                )
-                new_sites.append(periodic_site)
+        # Images of each site are contiguous, i.e. site-major ordering
+        cart_coords = np.reshape(self.cart_coords, (-1, 1, 3)) + cart_lattice[None, :, :]
+        site_properties = {}
+        for key, vals in self.site_properties.items():
+            if any(val is None for val in vals):
+                warnings.warn(f"Not all sites have property {key}. Missing values are set to None.", stacklevel=2)
+            site_properties[key] = [val for val in vals for _ in range(n_images)]
 
         new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge, to_unit_cell=True)
+        return Structure(
+            new_lattice,
+            [site.species for site in self for _ in range(n_images)],
+            cart_coords.reshape(-1, 3),
+            charge=new_charge,
+            to_unit_cell=True,
+            coords_are_cartesian=True,
+            site_properties=site_properties,
+            labels=[site.label for site in self for _ in range(n_images)],
+        )
 
     def __rmul__(self, scaling_matrix):
         """Similar to __mul__ to preserve commutativeness."""
@@ -1796,6 +1857,13 @@ class IStructure(SiteCollection, MSONable):
         translated by `offset_vectors[i]` lattice vectors, and the distance is
         `distances[i]`.
 
+        With the cython extension, the neighbor list of all sites is cached on
+        the structure, so that repeated queries for the sites of the structure
+        (e.g. from NearNeighbors) only search for neighbors once. The cache is
+        reused for smaller cutoffs and invalidated when the structure changes.
+        Queries for some sites only use a cache that already covers r, and
+        otherwise only search for the neighbors of those sites.
+
         Args:
             r (float): Radius of sphere
             sites (list of Sites or None): sites for getting all neighbors,
@@ -1821,20 +1889,30 @@ class IStructure(SiteCollection, MSONable):
             return self._get_neighbor_list_py(r, list(sites), exclude_self=exclude_self)
 
         else:
+            # Neighbors of the sites of the structure come from the cached neighbor
+            # list, which a query for some sites never computes
+            cache = site_indices = None
             if sites is None:
-                sites = self.sites
-            site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
-            cart_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
-            lattice_matrix = np.ascontiguousarray(self.lattice.matrix, dtype=float)
-            pbc = np.ascontiguousarray(self.pbc, dtype=np.int64)
-            center_indices, points_indices, images, distances = find_points_in_spheres(
-                cart_coords,
-                site_coords,
-                r=r,
-                pbc=pbc,
-                lattice=lattice_matrix,
-                tol=numerical_tol,
-            )
+                cache = self._get_neighbor_list_cache(r, numerical_tol)
+            elif (cached := getattr(self, "_neighbor_list_cache", None)) is not None and cached["r"] >= r:
+                site_indices = [cached["indices"].get(id(site)) for site in sites]
+                if None not in site_indices:
+                    cache = self._get_neighbor_list_cache(r, numerical_tol, compute=False)
+
+            if cache is not None:
+                center_indices, points_indices, images, distances = self._get_cached_neighbor_list(
+                    cache, r, numerical_tol, site_indices
+                )
+            else:
+                site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)  # type:ignore[union-attr]
+                center_indices, points_indices, images, distances = find_points_in_spheres(
+                    np.ascontiguousarray(self.cart_coords, dtype=float),
+                    site_coords,
+                    r=r,
+                    pbc=np.ascontiguousarray(self.pbc, dtype=np.int64),
+                    lattice=np.ascontiguousarray(self.lattice.matrix, dtype=float),
+                    tol=numerical_tol,
+                )
             cond = np.array([True] * len(center_indices))
             if exclude_self:
                 self_pair = (center_indices == points_indices) & (distances <= numerical_tol)
@@ -1846,6 +1924,111 @@ class IStructure(SiteCollection, MSONable):
                 distances[cond],
             )
 
+    def _get_neighbor_list_cache(self, r: float, numerical_tol: float, compute: bool = True) -> dict[str, Any] | None:
+        """Get the cached neighbor list of all sites (including self pairs),
+        computing it if there is none with a cutoff of at least r, or if the
+        sites, their fractional coordinates, the lattice or its periodic
+        boundary conditions have changed since it was computed, e.g. after
+        modifying a Structure or editing a coordinate array in place.
+
+        Args:
+            r (float): Radius of sphere.
+            numerical_tol (float): Numerical tolerance for distances.
+            compute (bool): Whether to compute the neighbor list if the cache
+                is missing or stale. Defaults to True.
+
+        Returns:
+            dict | None: The cutoff "r", "numerical_tol", "neighbor_list" as
+                returned by find_points_in_spheres, the "indices" of the sites
+                by id, and the "sites", "frac_coords", "lattice" and "pbc" it was
+                computed for. None if there is no valid cache and not compute.
+        """
+        from pymatgen.optimization.neighbors import find_points_in_spheres
+
+        lattice = np.ascontiguousarray(self.lattice.matrix, dtype=float)
+        pbc = tuple(self.pbc)
+
+        # The coordinates are only gathered once the cheaper checks pass
+        cache = getattr(self, "_neighbor_list_cache", None)
+        if (
+            cache is not None
+            and cache["r"] >= r
+            and cache["numerical_tol"] == numerical_tol
+            and cache["pbc"] == pbc
+            and cache["lattice"] == lattice.tobytes()
+            and len(cache["sites"]) == len(self._sites)
+            and all(map(is_, cache["sites"], self._sites))
+            and np.array_equal(cache["frac_coords"], np.reshape(self.frac_coords, (-1, 3)))
+        ):
+            return cache
+        if not compute:
+            return None
+
+        frac_coords = np.reshape(self.frac_coords, (-1, 3))
+
+        # Cartesian coordinates follow from the fractional ones, as the cached
+        # Cartesian coordinates of a site are stale after an in-place edit
+        cart_coords = np.ascontiguousarray(np.dot(frac_coords, lattice), dtype=float)
+        self._neighbor_list_cache = {
+            "r": r,
+            "numerical_tol": numerical_tol,
+            "neighbor_list": find_points_in_spheres(
+                cart_coords,
+                cart_coords,
+                r=r,
+                pbc=np.ascontiguousarray(pbc, dtype=np.int64),
+                lattice=lattice,
+                tol=numerical_tol,
+            ),
+            "indices": {id(site): idx for idx, site in enumerate(self._sites)},
+            "sites": tuple(self._sites),
+            "frac_coords": frac_coords,
+            "lattice": lattice.tobytes(),
+            "pbc": pbc,
+        }
+        return self._neighbor_list_cache
+
+    @staticmethod
+    def _get_cached_neighbor_list(
+        cache: dict[str, Any],
+        r: float,
+        numerical_tol: float,
+        site_indices: list[int] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get the neighbor list of all sites, or of the sites at site_indices,
+        from a neighbor list cache with a cutoff of at least r.
+
+        Args:
+            cache (dict): Neighbor list cache, see _get_neighbor_list_cache.
+            r (float): Radius of sphere.
+            numerical_tol (float): Numerical tolerance for distances.
+            site_indices (list[int] | None): Indices of the center sites. None
+                means all sites.
+
+        Returns:
+            tuple: (center_indices, points_indices, offset_vectors, distances)
+        """
+        center_indices, points_indices, images, distances = cache["neighbor_list"]
+        if cache["r"] > r:
+            # Same criterion as find_points_in_spheres, which below 1 Angstrom
+            # also filters a larger neighbor list by distance
+            mask = distances <= r if r < 1 else distances**2 < r**2 + numerical_tol
+            center_indices, points_indices, images, distances = (
+                center_indices[mask],
+                points_indices[mask],
+                images[mask],
+                distances[mask],
+            )
+        if site_indices is not None:
+            # The neighbor list is sorted by center index
+            starts = np.searchsorted(center_indices, site_indices, side="left")
+            ends = np.searchsorted(center_indices, site_indices, side="right")
+            counts = ends - starts
+            rows = np.arange(counts.sum()) + np.repeat(starts + counts - np.cumsum(counts), counts)
+            center_indices = np.repeat(np.arange(len(site_indices)), counts)
+            points_indices, images, distances = points_indices[rows], images[rows], distances[rows]
+        return center_indices, points_indices, images, distances
+
     def get_symmetric_neighbor_list(
         self,
         r: float,
@@ -2369,13 +2552,15 @@ class IStructure(SiteCollection, MSONable):
         if properties:
             props.update(properties)
         if not sanitize:
+            # Only carry over explicitly set labels. Unset ones default to the
+            # species string, which is slow to format for every site.
             return type(self)(
                 self._lattice,
                 self.species_and_occu,
                 self.frac_coords,
                 charge=self._charge,
                 site_properties=new_site_props,
-                labels=self.labels,
+                labels=[site._label for site in self],
                 properties=props,
             )
         reduced_latt = self._lattice.get_lll_reduced_lattice()
@@ -3497,13 +3682,19 @@ class IMolecule(SiteCollection, MSONable):
 
         self._charge_spin_check = charge_spin_check
 
+        if isinstance(species, dict) or isinstance(coords, dict):
+            # Sites are looked up by index, e.g. in node attributes of a MoleculeGraph
+            species = [species[idx] for idx in range(len(species))]  # type:ignore[index]
+            coords = [coords[idx] for idx in range(len(coords))]  # type:ignore[index,arg-type]
+
+        cart_coords = np.array(coords, dtype=np.float64).reshape(len(species), 3)  # type:ignore[arg-type]
         sites: list[Site] = []
-        for idx in range(len(species)):
+        for idx, specie in enumerate(self._get_site_species(species)):
             prop = None
             if site_properties:
                 prop = {k: v[idx] for k, v in site_properties.items()}
             label = labels[idx] if labels else None
-            sites.append(Site(species[idx], coords[idx], properties=prop, label=label))  # type:ignore[index]
+            sites.append(Site(specie, cart_coords[idx], properties=prop, label=label, skip_checks=True))
 
         self._sites = tuple(sites)  # type:ignore[arg-type]
         if validate_proximity and not self.is_valid():
@@ -4306,8 +4497,9 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(lattice, Lattice):
             lattice = Lattice(lattice)
         self._lattice = lattice
-        for site in self:
-            site.lattice = lattice
+        for site, coords in zip(self, lattice.get_cartesian_coords(np.reshape(self.frac_coords, (-1, 3))), strict=True):
+            site._lattice = lattice
+            site._coords = coords
 
     def append(  # type:ignore[override]
         self,
@@ -4810,8 +5002,13 @@ class Structure(IStructure, collections.abc.MutableSequence):
         struct: Self = self if in_place else self.copy()
         supercell = struct * scaling_matrix
         if to_unit_cell:
-            for site in supercell:
-                site.to_unit_cell(in_place=True)
+            # Sites are already wrapped by __mul__, so only those with a
+            # coordinate rounded up to exactly 1 need to be moved
+            frac_coords = supercell.frac_coords
+            pbc = np.array(supercell.lattice.pbc)
+            folded = np.where(pbc, np.mod(frac_coords, 1), frac_coords)
+            for idx in np.flatnonzero(np.any(folded != frac_coords, axis=1)):
+                supercell[idx].to_unit_cell(in_place=True)
         struct.sites = supercell.sites
         struct.lattice = supercell.lattice
 
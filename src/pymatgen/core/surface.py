@@ -25,6 +25,7 @@ from typing import TYPE_CHECKING, cast
 
 import numpy as np
 import orjson
+from joblib import Parallel, delayed
 from monty.fractions import lcm
 from scipy.cluster.hierarchy import fcluster, linkage
 from scipy.spatial.distance import squareform
@@ -866,6 +867,17 @@ def get_slab_regions(
     return [(sorted_sites[0].frac_coords[2], sorted_sites[-1].frac_coords[2])]
 
 
+def _add_bulk_site_types(structure: Structure | IStructure) -> None:
+    """Add Wyckoff symbols and equivalent sites to a bulk structure in place."""
+    if "bulk_wyckoff" not in structure.site_properties or "bulk_equivalent" not in structure.site_properties:
+        spg_analyzer = SpacegroupAnalyzer(structure)
+        structure.add_site_property("bulk_wyckoff", spg_analyzer.get_symmetry_dataset().wyckoffs)  # type:ignore[union-attr]
+        structure.add_site_property(  # type:ignore[union-attr]
+            "bulk_equivalent",
+            spg_analyzer.get_symmetry_dataset().equivalent_atoms.tolist(),
+        )
+
+
 class SlabGenerator:
     """Generate different slabs using shift values determined by where
     a unique termination can be found, along with other criteria such as where a
@@ -948,19 +960,6 @@ class SlabGenerator:
             divisor = abs(reduce(math.gcd, vector))  # type: ignore[arg-type]
             return cast("tuple[int, int, int]", tuple(int(idx / divisor) for idx in vector))
 
-        def add_site_types() -> None:
-            """Add Wyckoff symbols and equivalent sites to the initial structure."""
-            if (
-                "bulk_wyckoff" not in initial_structure.site_properties
-                or "bulk_equivalent" not in initial_structure.site_properties
-            ):
-                spg_analyzer = SpacegroupAnalyzer(initial_structure)
-                initial_structure.add_site_property("bulk_wyckoff", spg_analyzer.get_symmetry_dataset().wyckoffs)
-                initial_structure.add_site_property(
-                    "bulk_equivalent",
-                    spg_analyzer.get_symmetry_dataset().equivalent_atoms.tolist(),
-                )
-
         def calculate_surface_normal() -> np.ndarray:
             """Calculate the unit surface normal vector using the reciprocal
             lattice vector.
@@ -1042,7 +1041,7 @@ class SlabGenerator:
 
         # Add Wyckoff symbols and equivalent sites to the initial structure,
         # to help identify types of sites in the generated slab
-        add_site_types()
+        _add_bulk_site_types(initial_structure)
 
         # Calculate the surface normal
         lattice = initial_structure.lattice
@@ -1074,6 +1073,11 @@ class SlabGenerator:
         _a, _b, c = self.oriented_unit_cell.lattice.matrix
         self._proj_height = abs(np.dot(normal, c))
 
+        # Quantities of the OUC shared by all terminations, see
+        # _get_reduced_oriented_unit_cell and repair_broken_bonds
+        self._reduced_ouc_cache: dict[tuple[float, ...], Structure] = {}
+        self._bulk_cn_cache: dict[tuple, dict[Any, list[int]]] = {}
+
     def get_slab(
         self,
         shift: float = 0,
@@ -1162,22 +1166,7 @@ class SlabGenerator:
                 energy *= prim_slab.volume / struct.volume
 
         # Reorient the lattice to get the correctly reduced cell
-        ouc = self.oriented_unit_cell.copy()
-        if self.primitive:
-            # Find a reduced OUC
-            slab_l = struct.lattice
-            ouc = ouc.get_primitive_structure(
-                constrain_latt={
-                    "a": slab_l.a,
-                    "b": slab_l.b,
-                    "alpha": slab_l.alpha,
-                    "beta": slab_l.beta,
-                    "gamma": slab_l.gamma,
-                }
-            )
-
-            # Ensure lattice a and b are consistent between the OUC and the Slab
-            ouc = ouc if (slab_l.a == ouc.lattice.a and slab_l.b == ouc.lattice.b) else self.oriented_unit_cell
+        ouc = self._get_reduced_oriented_unit_cell(struct.lattice) if self.primitive else self.oriented_unit_cell.copy()
 
         return Slab(
             struct.lattice,
@@ -1192,6 +1181,32 @@ class SlabGenerator:
             energy=energy,
         )
 
+    def _get_reduced_oriented_unit_cell(self, slab_lattice: Lattice) -> Structure:
+        """Find the OUC reduced to a primitive cell constrained to the
+        in-plane lattice parameters of a Slab.
+
+        The reduction only depends on the lattice of the Slab, which is
+        usually the same for all terminations, so it is cached.
+
+        Args:
+            slab_lattice (Lattice): The lattice of the (primitive) Slab.
+
+        Returns:
+            Structure: A copy of the reduced OUC.
+        """
+        key = (slab_lattice.a, slab_lattice.b, slab_lattice.alpha, slab_lattice.beta, slab_lattice.gamma)
+        if key not in self._reduced_ouc_cache:
+            ouc = self.oriented_unit_cell.get_primitive_structure(
+                constrain_latt=dict(zip(("a", "b", "alpha", "beta", "gamma"), key, strict=True))
+            )
+
+            # Ensure lattice a and b are consistent between the OUC and the Slab
+            if not (slab_lattice.a == ouc.lattice.a and slab_lattice.b == ouc.lattice.b):
+                ouc = self.oriented_unit_cell
+            self._reduced_ouc_cache[key] = ouc
+
+        return self._reduced_ouc_cache[key].copy()
+
     def get_slabs(
         self,
         bonds: dict[tuple[Species | Element, Species | Element], float] | None = None,
@@ -1250,13 +1265,8 @@ class SlabGenerator:
 
             # Compute a Cartesian z-coordinate distance matrix
             # TODO (@DanielYang59): account for periodic boundary condition
-            dist_matrix: NDArray = np.zeros((n_atoms, n_atoms))
-            for i, j in itertools.combinations(list(range(n_atoms)), 2):
-                if i != j:
-                    z_dist = frac_coords[i][2] - frac_coords[j][2]
-                    z_dist = abs(z_dist - round(z_dist)) * self._proj_height
-                    dist_matrix[i, j] = z_dist
-                    dist_matrix[j, i] = z_dist
+            z_dist: NDArray = frac_coords[:, 2, None] - frac_coords[None, :, 2]
+            dist_matrix: NDArray = np.abs(z_dist - np.round(z_dist)) * self._proj_height
 
             # Cluster the sites by z coordinates
             z_matrix = linkage(squareform(dist_matrix))
@@ -1287,8 +1297,8 @@ class SlabGenerator:
         def get_z_ranges(
             bonds: dict[tuple[Species | Element, Species | Element], float],
             ztol: float,
-        ) -> list[tuple[float, float]]:
-            """Collect occupied z ranges where each range is a (lower_z, upper_z) tuple.
+        ) -> NDArray:
+            """Collect occupied z ranges where each range is a (lower_z, upper_z) row.
 
             This method examines all sites in the oriented unit cell (OUC)
             and considers all neighboring sites within the specified bond distance
@@ -1302,40 +1312,60 @@ class SlabGenerator:
             # Sanitize species in dict keys
             bonds = {(get_el_sp(s1), get_el_sp(s2)): dist for (s1, s2), dist in bonds.items()}
 
-            z_ranges = []
+            frac_z = self.oriented_unit_cell.frac_coords[:, 2]
+            z_ranges = [np.zeros((0, 2))]
             for (sp1, sp2), bond_dist in bonds.items():
-                for site in self.oriented_unit_cell:
-                    if sp1 in site.species:
-                        for nn in self.oriented_unit_cell.get_neighbors(site, bond_dist):
-                            if sp2 in nn.species:
-                                z_range = tuple(sorted([site.frac_coords[2], nn.frac_coords[2]]))
-
-                                # Handle cases when z coordinate of site goes
-                                # beyond the upper boundary
-                                if z_range[1] > 1:
-                                    z_ranges.extend([(z_range[0], 1), (0, z_range[1] - 1)])
+                has_sp1 = np.array([sp1 in site.species for site in self.oriented_unit_cell], dtype=bool)
+                has_sp2 = np.array([sp2 in site.species for site in self.oriented_unit_cell], dtype=bool)
+                centers, points, images, _ = self.oriented_unit_cell.get_neighbor_list(bond_dist)
+                is_bond = has_sp1[centers] & has_sp2[points]
+                z_pairs = np.sort(
+                    [frac_z[centers[is_bond]], frac_z[points[is_bond]] + images[is_bond, 2]],
+                    axis=0,
+                ).T
+                lower, upper = z_pairs.T
+
+                # Handle cases when z coordinate of site goes
+                # beyond the upper boundary
+                above = upper > 1
+                z_ranges.extend(
+                    [
+                        np.column_stack([lower[above], np.ones(above.sum())]),
+                        np.column_stack([np.zeros(above.sum()), upper[above] - 1]),
+                    ]
+                )
 
-                                # When z coordinate is below the lower boundary
-                                elif z_range[0] < 0:
-                                    z_ranges.extend([(0, z_range[1]), (z_range[0] + 1, 1)])
+                # When z coordinate is below the lower boundary
+                below = ~above & (lower < 0)
+                z_ranges.extend(
+                    [
+                        np.column_stack([np.zeros(below.sum()), upper[below]]),
+                        np.column_stack([lower[below] + 1, np.ones(below.sum())]),
+                    ]
+                )
 
-                                # Neglect overlapping positions
-                                elif not math.isclose(z_range[0], z_range[1], abs_tol=ztol):
-                                    z_ranges.append(z_range)  # type:ignore[arg-type]
+                # Neglect overlapping positions (as math.isclose with abs_tol=ztol)
+                is_close = np.abs(upper - lower) <= np.maximum(1e-9 * np.maximum(np.abs(lower), np.abs(upper)), ztol)
+                z_ranges.append(z_pairs[~above & ~below & ~is_close])
 
-            return z_ranges
+            return np.concatenate(z_ranges)
 
         # Get occupied z_ranges
-        z_ranges = [] if bonds is None else get_z_ranges(bonds, ztol)
+        z_ranges = np.zeros((0, 2)) if bonds is None else get_z_ranges(bonds, ztol)
+
+        # Calculate total number of bonds broken (how often the
+        # termination fall within the z_range occupied by a bond)
+        terminations = np.array(gen_possible_terminations(ftol=ftol))
+        n_bonds_broken = np.sum(
+            (z_ranges[:, 0] <= terminations[:, None]) & (terminations[:, None] <= z_ranges[:, 1]),
+            axis=1,
+        )
 
         slabs = []
-        for termination in gen_possible_terminations(ftol=ftol):
-            # Calculate total number of bonds broken (how often the
-            # termination fall within the z_range occupied by a bond)
-            bonds_broken = 0
-            for z_range in z_ranges:
-                if z_range[0] <= termination <= z_range[1]:
-                    bonds_broken += 1
+        for termination, bonds_broken in zip(terminations.tolist(), n_bonds_broken.tolist(), strict=True):
+            # Only build the Slabs that are kept or repaired
+            if bonds_broken > max_broken_bonds and not (repair and bonds is not None):
+                continue
 
             # DEBUG(@DanielYang59): number of bonds broken passed to energy
             # As per the docstring this is to sort final Slabs by number
@@ -1347,8 +1377,8 @@ class SlabGenerator:
                 slabs.append(slab)
 
             # If the number of broken bonds is exceeded, repair the broken bonds
-            elif repair and bonds is not None:
-                slabs.append(self.repair_broken_bonds(slab=slab, bonds=bonds))
+            else:
+                slabs.append(self.repair_broken_bonds(slab=slab, bonds=bonds))  # type:ignore[arg-type]
 
         # Filter out surfaces that might be the same
         if filter_out_sym_slabs:
@@ -1400,19 +1430,23 @@ class SlabGenerator:
         for species_pair, bond_dist in bonds.items():
             # Determine which element should be the reference (center)
             # element for determining broken bonds, e.g. P for PO4 bond.
-            cn_dict = {}
-            for idx, ele in enumerate(species_pair):
-                cn_list = []
-                for site in self.oriented_unit_cell:
-                    # Find integer coordination numbers for element pairs
-                    ref_cn = 0
-                    if site.species_string == ele:
-                        for nn in self.oriented_unit_cell.get_neighbors(site, bond_dist):
-                            if nn[0].species_string == species_pair[idx - 1]:
-                                ref_cn += 1
-
-                    cn_list.append(ref_cn)
-                cn_dict[ele] = cn_list
+            # This only depends on the OUC, so it is shared by all Slabs.
+            if (species_pair, bond_dist) not in self._bulk_cn_cache:
+                cn_dict = {}
+                for idx, ele in enumerate(species_pair):
+                    cn_list = []
+                    for site in self.oriented_unit_cell:
+                        # Find integer coordination numbers for element pairs
+                        ref_cn = 0
+                        if site.species_string == ele:
+                            for nn in self.oriented_unit_cell.get_neighbors(site, bond_dist):
+                                if nn[0].species_string == species_pair[idx - 1]:
+                                    ref_cn += 1
+
+                        cn_list.append(ref_cn)
+                    cn_dict[ele] = cn_list
+                self._bulk_cn_cache[species_pair, bond_dist] = cn_dict
+            cn_dict = self._bulk_cn_cache[species_pair, bond_dist]
 
             # Make the element with higher coordination the reference
             if max(cn_dict[species_pair[0]]) > max(cn_dict[species_pair[1]]):
@@ -1488,10 +1522,11 @@ class SlabGenerator:
         frac_dist: float = n_layers_slab / n_layers
 
         # Separate selected sites into top and bottom
+        center_z: float = init_slab.center_of_mass[2]
         top_site_index: list[int] = []
         bottom_site_index: list[int] = []
         for idx in index_of_sites:
-            if init_slab[idx].frac_coords[2] >= init_slab.center_of_mass[2]:
+            if init_slab[idx].frac_coords[2] >= center_z:
                 top_site_index.append(idx)
             else:
                 bottom_site_index.append(idx)
@@ -1584,6 +1619,8 @@ def generate_all_slabs(
     repair: bool = False,
     include_reconstructions: bool = False,
     in_unit_planes: bool = False,
+    *,
+    n_jobs: int = 1,
 ) -> list[Slab]:
     """Find all unique Slabs up to a given Miller index.
 
@@ -1644,30 +1681,44 @@ def generate_all_slabs(
             Fe(100) will have more layers. The slab thickness
             will be in min_slab_size/math.ceil(self._proj_height/dhkl)
             multiples of oriented unit cells.
+        n_jobs (int): Number of worker processes over which the Miller
+            indices are distributed (via joblib). Defaults to 1, i.e. serial.
+            -1 uses all available CPUs. The Slabs are identical to (and in
+            the same order as) the serial ones.
     """
     all_slabs: list[Slab] = []
 
-    for miller in get_symmetrically_distinct_miller_indices(structure, max_index):
-        gen = SlabGenerator(
-            structure,
-            miller,
-            min_slab_size,
-            min_vacuum_size,
-            lll_reduce=lll_reduce,
-            center_slab=center_slab,
-            primitive=primitive,
-            max_normal_search=max_normal_search,
-            in_unit_planes=in_unit_planes,
-        )
-        slabs = gen.get_slabs(
-            bonds=bonds,
-            tol=tol,
-            ftol=ftol,
-            symmetrize=symmetrize,
-            max_broken_bonds=max_broken_bonds,
-            repair=repair,
-        )
+    millers = get_symmetrically_distinct_miller_indices(structure, max_index)
+
+    # Label the bulk sites once instead of in every worker
+    _add_bulk_site_types(structure)
+
+    slab_gen_kwargs = {
+        "min_slab_size": min_slab_size,
+        "min_vacuum_size": min_vacuum_size,
+        "lll_reduce": lll_reduce,
+        "center_slab": center_slab,
+        "primitive": primitive,
+        "max_normal_search": max_normal_search,
+        "in_unit_planes": in_unit_planes,
+    }
+    get_slabs_kwargs = {
+        "bonds": bonds,
+        "tol": tol,
+        "ftol": ftol,
+        "symmetrize": symmetrize,
+        "max_broken_bonds": max_broken_bonds,
+        "repair": repair,
+    }
+    # Dispatch the highest (usually most expensive) Miller indices first
+    order = sorted(range(len(millers)), key=lambda idx: -sum(map(abs, millers[idx])))
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_get_miller_slabs)(structure, millers[idx], slab_gen_kwargs, get_slabs_kwargs) for idx in order
+    )
+    slabs_by_miller = dict(zip(order, results, strict=True))
 
+    for idx, miller in enumerate(millers):
+        slabs = slabs_by_miller[idx]
         if len(slabs) > 0:
             logger.debug(f"{miller} has {len(slabs)} slabs... ")
             all_slabs.extend(slabs)
@@ -2171,3 +2222,24 @@ def miller_index_from_sites(
         round_dp=round_dp,
         verbose=verbose,
     )
+
+
+def _get_miller_slabs(
+    structure: Structure | IStructure,
+    miller_index: tuple[int, ...],
+    slab_gen_kwargs: dict[str, Any],
+    get_slabs_kwargs: dict[str, Any],
+) -> list[Slab]:
+    """Generate the Slabs of a single Miller index for generate_all_slabs.
+    Must not be in generate_all_slabs so that it can be pickled.
+
+    Args:
+        structure (Structure): The bulk structure.
+        miller_index (tuple[int, ...]): Miller index of the surface.
+        slab_gen_kwargs (dict): Keyword arguments for SlabGenerator.
+        get_slabs_kwargs (dict): Keyword arguments for SlabGenerator.get_slabs.
+
+    Returns:
+        list[Slab]: The Slabs of the Miller index.
+    """
+    return SlabGenerator(structure, miller_index, **slab_gen_kwargs).get_slabs(**get_slabs_kwargs)
@@ -5,6 +5,8 @@ either relaxation or molecular dynamics.
 from __future__ import annotations
 
 import itertools
+import json
+import os
 import warnings
 from fnmatch import fnmatch
 from pathlib import Path
@@ -13,7 +15,7 @@ from typing import TYPE_CHECKING, TypeAlias, cast
 
 import numpy as np
 from monty.io import zopen
-from monty.json import MSONable
+from monty.json import MontyDecoder, MontyEncoder, MSONable
 
 from pymatgen.core.structure import Composition, DummySpecies, Element, Lattice, Molecule, Species, Structure
 from pymatgen.io.ase import NO_ASE_ERR, AseAtomsAdaptor
@@ -28,6 +30,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
     from typing import Any
 
+    import h5py
     from typing_extensions import Self
 
     from pymatgen.util.typing import PathLike, SitePropsType
@@ -246,6 +249,9 @@ class Trajectory(MSONable):
             if isinstance(frames, slice):
                 start, stop, step = frames.indices(len(self))
                 selected = list(range(start, stop, step))
+                # Slicing gives views rather than copies of the coordinates,
+                # e.g. of a memory-mapped array to stride through a long trajectory
+                index: slice | list[int] = frames
             else:
                 # Get rid of frames that exceed trajectory length
                 selected = [idx for idx in frames if idx < len(self)]
@@ -253,8 +259,9 @@ class Trajectory(MSONable):
                 if len(selected) < len(frames):
                     bad_frames = [idx for idx in frames if idx > len(self)]
                     raise IndexError(f"index={bad_frames} out of range, trajectory only has {len(self)} frames")
+                index = selected
 
-            coords = self.coords[selected]
+            coords = self.coords[index]
             frame_properties = (
                 None if self.frame_properties is None else [self.frame_properties[idx] for idx in selected]
             )
@@ -272,7 +279,7 @@ class Trajectory(MSONable):
                     base_positions=self.base_positions,
                 )
 
-            lattice = self.lattice if self.constant_lattice else self.lattice[selected]
+            lattice = self.lattice if self.constant_lattice else self.lattice[index]
 
             return type(self)(  # type:ignore[return-value]
                 species=self.species,
@@ -475,6 +482,113 @@ class Trajectory(MSONable):
         with zopen(filename, mode="wt", encoding="utf-8") as file:
             file.write(xdatcar_str)  # type:ignore[arg-type]
 
+    def to_hdf5(
+        self,
+        filename: PathLike,
+        append: bool = False,
+        chunk_size: int = 100,
+        compression: str | None = "gzip",
+    ) -> None:
+        """Write the trajectory to a chunked, compressed HDF5 file.
+
+        The species and other per-trajectory attributes are stored once, while
+        the per-frame data are stored as typed arrays with the frames along the
+        first (resizable) axis. The mapping of the Trajectory to this file
+        format is as follows:
+
+        Trajectory.coords -> f["coords"]: shape (M, N, 3)
+        Trajectory.lattice -> f["lattice"]: shape (3, 3) if the lattice is
+            constant, else (M, 3, 3). Absent for Molecule-based trajectories.
+        Trajectory.frame_properties -> f["frame_properties"][key]: shape (M, ...)
+        Trajectory.site_properties -> f["site_properties"][key]: shape (M, N, ...)
+            for per-frame site properties, or f.attrs["site_properties"]
+            (JSON string) for site properties common to all frames.
+        species, charge, spin_multiplicity, time_step -> f.attrs["metadata"]:
+            JSON string
+
+        Property values that cannot be stored as a numeric array (e.g. strings,
+        dicts or ragged lists) are stored as one JSON string per frame.
+
+        Args:
+            filename (PathLike): File to write to.
+            append (bool): Whether to append the frames to an existing file
+                written by to_hdf5, e.g. periodically during a simulation. The
+                metadata and property keys of the trajectory must match those
+                in the file. If the file does not exist, it is created.
+                Defaults to False.
+            chunk_size (int): Number of frames per chunk of the arrays.
+                Defaults to 100.
+            compression (str | None): Compression filter of the arrays, e.g.
+                "gzip" or "lzf". None for no compression. Defaults to "gzip".
+        """
+        import h5py
+
+        # Ensure trajectory is in position form
+        self.to_positions()
+
+        metadata = json.dumps(
+            {
+                "species": self.species,
+                "charge": self.charge,
+                "spin_multiplicity": self.spin_multiplicity,
+                "time_step": self.time_step,
+            },
+            cls=MontyEncoder,
+        )
+        frame_props = self._get_prop_arrays(self.frame_properties)
+        site_props = None if isinstance(self.site_properties, dict) else self._get_prop_arrays(self.site_properties)
+        const_site_props = None
+        if isinstance(self.site_properties, dict):
+            const_site_props = json.dumps(self.site_properties, cls=MontyEncoder)
+
+        if append and os.path.isfile(filename):
+            with h5py.File(str(filename), mode="a") as file:
+                if (
+                    file.attrs["metadata"] != metadata
+                    or file.attrs.get("site_properties") != const_site_props
+                    or ("lattice" in file) != (self.lattice is not None)
+                ):
+                    raise ValueError(f"Cannot append to {filename}: the trajectory attributes do not match.")
+                for name, arrays in (("frame_properties", frame_props), ("site_properties", site_props)):
+                    if set(file.get(name, ())) != set(arrays or ()):
+                        raise ValueError(f"Cannot append to {filename}: the {name} keys do not match.")
+
+                n_frames = len(file["coords"])
+                self._append_frame_dataset(file["coords"], self.coords)
+                for name, arrays in (("frame_properties", frame_props), ("site_properties", site_props)):
+                    for key, array in (arrays or {}).items():
+                        self._append_frame_dataset(file[name][key], array)
+
+                if self.lattice is not None:
+                    lattice = file["lattice"]
+                    if lattice.ndim == 2 and (not self.constant_lattice or not np.allclose(lattice, self.lattice)):
+                        # The lattice is no longer constant, store one per frame
+                        matrix = lattice[()]
+                        del file["lattice"]
+                        lattice = self._create_frame_dataset(
+                            file, "lattice", np.tile(matrix, (n_frames, 1, 1)), chunk_size, compression
+                        )
+                    if lattice.ndim == 3:
+                        lattices = self.lattice if self.lattice.ndim == 3 else np.tile(self.lattice, (len(self), 1, 1))
+                        self._append_frame_dataset(lattice, lattices)
+            return
+
+        with h5py.File(str(filename), mode="w") as file:
+            file.attrs["metadata"] = metadata
+            self._create_frame_dataset(file, "coords", self.coords, chunk_size, compression)
+            if self.lattice is not None:
+                if self.lattice.ndim == 2:
+                    file.create_dataset("lattice", data=self.lattice)
+                else:
+                    self._create_frame_dataset(file, "lattice", self.lattice, chunk_size, compression)
+            if const_site_props is not None:
+                file.attrs["site_properties"] = const_site_props
+            for name, arrays in (("frame_properties", frame_props), ("site_properties", site_props)):
+                if arrays is not None:
+                    grp = file.create_group(name)
+                    for key, array in arrays.items():
+                        self._create_frame_dataset(grp, key, array, chunk_size, compression)
+
     def as_dict(self) -> dict:
         """Return the trajectory as a MSONable dict."""
         lat = self.lattice.tolist() if self.lattice is not None else None
@@ -556,7 +670,8 @@ class Trajectory(MSONable):
 
     @classmethod
     def from_file(cls, filename: str | Path, constant_lattice: bool = True, **kwargs) -> Self:
-        """Create trajectory from XDATCAR, vasprun.xml file, or ASE trajectory (.traj) file.
+        """Create trajectory from XDATCAR, vasprun.xml file, ASE trajectory (.traj) file,
+        or HDF5 file written by to_hdf5 (.h5).
 
         Args:
             filename (str | Path): Path to the file to read from.
@@ -571,9 +686,19 @@ class Trajectory(MSONable):
         structures = []
 
         if fnmatch(filename, "*XDATCAR*"):
-            from pymatgen.io.vasp.outputs import Xdatcar
-
-            structures = Xdatcar(filename).structures
+            from pymatgen.io.vasp.outputs import Xdatcar, XdatcarFrames
+
+            frames = Xdatcar(filename, lazy=True).structures
+            if isinstance(frames, XdatcarFrames):
+                # Take the coordinates and lattices without creating any Structure
+                return cls(
+                    species=frames.species,  # type: ignore[arg-type]
+                    coords=frames.get_frac_coords(),
+                    lattice=frames.lattices[0] if constant_lattice else frames.lattices,
+                    constant_lattice=constant_lattice,
+                    **kwargs,
+                )
+            structures = frames
 
         elif fnmatch(filename, "vasprun*.xml*"):
             from pymatgen.io.vasp.outputs import Vasprun
@@ -595,12 +720,75 @@ class Trajectory(MSONable):
 
             return loadfn(filename, **kwargs)
 
+        elif fnmatch(filename, "*.h5") or fnmatch(filename, "*.hdf5"):
+            return cls.from_hdf5(filename, constant_lattice=constant_lattice, **kwargs)
+
         else:
-            supported_file_types = ("XDATCAR", "vasprun.xml", "*.traj", ".json")
+            supported_file_types = ("XDATCAR", "vasprun.xml", "*.traj", ".json", "*.h5")
             raise ValueError(f"Expect file to be one of {supported_file_types}; got {filename}.")
 
         return cls.from_structures(structures, constant_lattice=constant_lattice, **kwargs)
 
+    @classmethod
+    def from_hdf5(
+        cls,
+        filename: PathLike,
+        frames: slice | None = None,
+        constant_lattice: bool | None = None,
+        **kwargs,
+    ) -> Self:
+        """Read a trajectory written by to_hdf5.
+
+        Only the requested frames are read from the file, and the coordinates
+        and lattices are read directly into arrays.
+
+        Args:
+            filename (PathLike): File to read from.
+            frames (slice | None): Range of frames to read, e.g. slice(1000, None, 10)
+                for every 10th frame after the first 1000. Defaults to None,
+                i.e. all frames.
+            constant_lattice (bool | None): Whether the lattice changes during the
+                simulation. If True, the lattice of the first frame read is used for
+                all frames. Defaults to None, i.e. as written to the file.
+            **kwargs: Additional kwargs passed to Trajectory constructor, overriding
+                the metadata stored in the file.
+
+        Returns:
+            Trajectory: with the requested frames.
+        """
+        import h5py
+
+        frames = frames or slice(None)
+        with h5py.File(str(filename), mode="r") as file:
+            metadata = json.loads(file.attrs["metadata"], cls=MontyDecoder)
+            coords = cls._read_frame_dataset(file["coords"], frames)
+
+            lattice = None
+            if "lattice" in file:
+                stored_constant = file["lattice"].ndim == 2
+                if constant_lattice is None:
+                    constant_lattice = stored_constant
+                if stored_constant:
+                    lattice = file["lattice"][()]
+                    if not constant_lattice:
+                        lattice = np.tile(lattice, (len(coords), 1, 1))
+                else:
+                    lattice = cls._read_frame_dataset(file["lattice"], frames)
+                    if constant_lattice:
+                        lattice = lattice[0]
+            else:
+                constant_lattice = None
+
+            props: dict[str, Any] = {"frame_properties": None, "site_properties": None}
+            for name in props:
+                if name in file:
+                    arrays = {key: cls._read_frame_dataset(ds, frames) for key, ds in file[name].items()}
+                    props[name] = cls._get_prop_dicts(arrays, len(coords))
+            if "site_properties" in file.attrs:
+                props["site_properties"] = json.loads(file.attrs["site_properties"], cls=MontyDecoder)
+
+        return cls(coords=coords, lattice=lattice, constant_lattice=constant_lattice, **(props | metadata | kwargs))
+
     @staticmethod
     def _combine_lattice(
         lat1: np.ndarray,
@@ -678,6 +866,88 @@ class Trajectory(MSONable):
             return list(prop1) + [None] * len2
         return list(prop1) + list(prop2)
 
+    @staticmethod
+    def _get_prop_arrays(props: list[dict] | None) -> dict[str, np.ndarray] | None:
+        """Convert per-frame property dicts to one array per key, with the frames
+        along the first axis. Values that cannot be stored as a numeric array
+        are converted to JSON strings, with null for frames missing the key.
+        """
+        if props is None:
+            return None
+
+        props = [dct or {} for dct in props]
+        arrays = {}
+        for key in dict.fromkeys(key for dct in props for key in dct):
+            values = [dct.get(key) for dct in props]
+            try:
+                array = np.asarray(values)
+            except ValueError:  # ragged values
+                array = np.asarray(None)
+            if array.dtype.kind not in "biufc":
+                array = np.array([json.dumps(val, cls=MontyEncoder) for val in values], dtype=object)
+            arrays[key] = array
+        return arrays
+
+    @staticmethod
+    def _get_prop_dicts(arrays: dict[str, np.ndarray], n_frames: int) -> list[dict]:
+        """Inverse of _get_prop_arrays."""
+        props: list[dict] = [{} for _ in range(n_frames)]
+        for key, array in arrays.items():
+            if array.dtype == object:  # JSON strings
+                for dct, val in zip(props, array, strict=True):
+                    if (val := json.loads(val, cls=MontyDecoder)) is not None:
+                        dct[key] = val
+            else:
+                # Scalars as the Python types they were saved from, not numpy scalars
+                for dct, val in zip(props, array, strict=True):
+                    dct[key] = val.item() if val.ndim == 0 else val
+        return props
+
+    @staticmethod
+    def _create_frame_dataset(
+        group: h5py.Group,
+        name: str,
+        array: np.ndarray,
+        chunk_size: int,
+        compression: str | None,
+    ) -> h5py.Dataset:
+        """Create a dataset that is chunked and resizable along the frame axis."""
+        import h5py
+
+        return group.create_dataset(
+            name,
+            data=array,
+            dtype=h5py.string_dtype() if array.dtype == object else array.dtype,
+            maxshape=(None, *array.shape[1:]),
+            chunks=(chunk_size, *array.shape[1:]),
+            compression=compression,
+        )
+
+    @staticmethod
+    def _append_frame_dataset(dataset: h5py.Dataset, array: np.ndarray) -> None:
+        """Append frames to a dataset created by _create_frame_dataset."""
+        if dataset.shape[1:] != array.shape[1:]:
+            raise ValueError(f"Cannot append frames of shape {array.shape[1:]} to {dataset.name}.")
+        n_frames = len(dataset)
+        dataset.resize(n_frames + len(array), axis=0)
+        dataset[n_frames:] = array
+
+    @staticmethod
+    def _read_frame_dataset(dataset: h5py.Dataset, frames: slice) -> np.ndarray:
+        """Read a range of frames from a dataset created by _create_frame_dataset."""
+        import h5py
+
+        if h5py.check_string_dtype(dataset.dtype):
+            dataset = dataset.asstr()
+        start, stop, step = frames.indices(len(dataset))
+        indices = range(start, stop, step)
+        if not indices:
+            return dataset[0:0]
+        if step > 0:
+            return dataset[start : indices[-1] + 1 : step]
+        # h5py only supports increasing indices
+        return dataset[indices[-1] : start + 1 : -step][::-1]
+
     def _check_site_props(self, site_props: SitePropsType | None) -> None:
         """Check data shape of site properties.
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import functools
+import json
 import logging
 import warnings
 from typing import TYPE_CHECKING, NamedTuple, cast
@@ -24,17 +24,25 @@ if np.lib.NumpyVersion(np.__version__) < "2.0.0":
     np.trapezoid = np.trapz  # type:ignore[assignment] # noqa: NPY201
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
     from typing import Any, Literal
 
     from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.core.sites import PeriodicSite
-    from pymatgen.util.typing import SpeciesLike
+    from pymatgen.util.typing import PathLike, SpeciesLike
 
 logger = logging.getLogger(__name__)
 
+_t2g_eg_orbitals: dict[Orbital, Literal["e_g", "t2g"]] = {
+    Orbital.dxy: "t2g",
+    Orbital.dxz: "t2g",
+    Orbital.dyz: "t2g",
+    Orbital.dx2: "e_g",
+    Orbital.dz2: "e_g",
+}
+
 
 class DOS(Spectrum):
     """(Work in progress) Replacement of basic DOS object.
@@ -649,6 +657,10 @@ class CompleteDos(Dos):
     Mainly used by pymatgen.io.vasp.Vasprun to create a complete DOS from
     a vasprun.xml file. You are unlikely to generate this object manually.
 
+    The PDOS are stored as a dense (n_sites, n_orbitals, n_spins, n_energies)
+    array, so that the site, element and orbital projections are reductions
+    over this array. The pdos dict is a view of it.
+
     Attributes:
         structure (Structure): Structure associated with the CompleteDos.
         pdos (dict[PeriodicSite, dict[Orbital, dict[Spin, NDArray]]]): PDOS.
@@ -683,6 +695,144 @@ class CompleteDos(Dos):
     def __str__(self) -> str:
         return f"Complete DOS for {self.structure}"
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The PDOS array is rebuilt from the dict view, so that they share memory again
+        return {key: val for key, val in self.__dict__.items() if not key.startswith("_pdos_")}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state = dict(state)
+        pdos = state.pop("_pdos")
+        self.__dict__.update(state)
+        self.pdos = pdos
+
+    @property
+    def pdos(self) -> dict[PeriodicSite, dict[Orbital, dict[Spin, NDArray]]]:
+        """The PDOS as {Site: {Orbital: {Spin: Densities}}}.
+
+        The densities are views of the dense PDOS array, so in-place changes
+        of them are reflected in all projections. Assign a new dict to replace
+        the PDOS.
+        """
+        return self._pdos
+
+    @pdos.setter
+    def pdos(self, pdoss: Mapping[PeriodicSite, Mapping[Orbital, Mapping[Spin, ArrayLike]]]) -> None:
+        self._pdos_sites = list(pdoss)
+        self._pdos_orbitals = list(dict.fromkeys(orb for site_pdos in pdoss.values() for orb in site_pdos))
+        self._pdos_spins = list(
+            dict.fromkeys(spin for site_pdos in pdoss.values() for dens in site_pdos.values() for spin in dens)
+        )
+
+        orb_indices = {orb: idx for idx, orb in enumerate(self._pdos_orbitals)}
+        spin_indices = {spin: idx for idx, spin in enumerate(self._pdos_spins)}
+        shape = (len(self._pdos_sites), len(self._pdos_orbitals), len(self._pdos_spins), len(self.energies))
+        self._pdos_array = np.zeros(shape)
+        # Whether an orbital is present for a site, as opposed to zero-filled
+        self._pdos_mask = np.zeros(shape[:2], dtype=bool)
+
+        self._pdos: dict[PeriodicSite, dict[Orbital, dict[Spin, NDArray]]] = {}
+        for site_idx, (site, site_pdos) in enumerate(pdoss.items()):
+            site_view = {}
+            for orb, dens in site_pdos.items():
+                orb_idx = orb_indices[orb]
+                self._pdos_mask[site_idx, orb_idx] = True
+                for spin, spin_dens in dens.items():
+                    self._pdos_array[site_idx, orb_idx, spin_indices[spin]] = spin_dens
+                site_view[orb] = {spin: self._pdos_array[site_idx, orb_idx, spin_indices[spin]] for spin in dens}
+            self._pdos[site] = site_view
+
+        # Sites only hash by their species, so a dict keyed by sites is slow
+        # to build for large structures. Index them by their PDOS dict instead.
+        self._pdos_site_indices = {id(site_view): idx for idx, site_view in enumerate(self._pdos.values())}
+
+    @staticmethod
+    def _get_orbital_type(orb: Orbital) -> OrbitalType | None:
+        """Get the OrbitalType an orbital is summed into by get_spd_dos."""
+        return _get_orb_type(orb)
+
+    def _get_site_index(self, site: PeriodicSite) -> int:
+        """Get the index of a site in the PDOS array."""
+        return self._pdos_site_indices[id(self._pdos[site])]
+
+    def _get_site_weights(self, sites: Iterable[PeriodicSite]) -> NDArray:
+        """Get the weight of each site in the PDOS array, i.e. how often it is in sites."""
+        weights = np.zeros(len(self._pdos_sites))
+        for site in sites:
+            weights[self._get_site_index(site)] += 1
+        return weights
+
+    def _get_element_weights(self, el: SpeciesLike) -> NDArray:
+        """Get the weight of each site in the PDOS array, i.e. 1 for sites of an element."""
+        el = get_el_sp(el)
+        return np.array([site.specie == el for site in self._pdos_sites], dtype=float)
+
+    def _get_summed_pdos(
+        self,
+        site_weights: NDArray | None = None,
+        get_orbital_type: Callable[[Any], Any] | None = None,
+    ) -> dict[Any, dict[Spin, NDArray]]:
+        """Sum the PDOS over sites and group the orbitals.
+
+        Args:
+            site_weights (NDArray): Weight of each site in the sum. Defaults to
+                None for all sites with a weight of 1.
+            get_orbital_type (Callable): Map of an orbital to the key it is summed
+                into. Orbitals mapped to None are ignored. Defaults to None for
+                _get_orbital_type.
+
+        Returns:
+            dict[Any, dict[Spin, NDArray]]: Summed densities of each key of
+                the orbitals present for any of the sites.
+        """
+        get_orbital_type = get_orbital_type or self._get_orbital_type
+        if site_weights is None:
+            site_weights = np.ones(len(self._pdos_sites))
+
+        present = self._pdos_mask[site_weights != 0].any(axis=0)
+        orb_groups: dict[Any, list[int]] = {}
+        for orb_idx, orb in enumerate(self._pdos_orbitals):
+            if present[orb_idx] and (orb_type := get_orbital_type(orb)) is not None:
+                orb_groups.setdefault(orb_type, []).append(orb_idx)
+
+        # Shape (n_orbitals, n_spins, n_energies)
+        densities = np.tensordot(site_weights, self._pdos_array, axes=1)
+        return {
+            orb_type: dict(zip(self._pdos_spins, densities[orb_indices].sum(axis=0), strict=True))
+            for orb_type, orb_indices in orb_groups.items()
+        }
+
+    def _get_band_dos(
+        self,
+        band: OrbitalType,
+        elements: list[SpeciesLike] | None = None,
+        sites: list[PeriodicSite] | None = None,
+    ) -> Dos:
+        """Get the orbital-projected DOS of a band, summed over elements or sites.
+
+        "elements" and "sites" cannot be used together.
+
+        Raises:
+            KeyError: If the band is not present for one of the elements or sites.
+        """
+        if elements and sites:
+            raise ValueError("Both element and site cannot be specified.")
+
+        if elements:
+            groups = [self._get_element_weights(el) for el in elements]
+        elif sites:
+            groups = [self._get_site_weights([site]) for site in sites]
+        else:
+            groups = [np.ones(len(self._pdos_sites))]
+
+        in_band = np.array([self._get_orbital_type(orb) == band for orb in self._pdos_orbitals], dtype=bool)
+        site_weights = np.zeros(len(self._pdos_sites))
+        for weights in groups:
+            if not self._pdos_mask[weights != 0][:, in_band].any():
+                raise KeyError(band)
+            site_weights += weights
+
+        return Dos(self.efermi, self.energies, self._get_summed_pdos(site_weights)[band])
+
     def get_normalized(self) -> Self:
         """Get normalized CompleteDos."""
         if self.norm_vol is not None:
@@ -716,8 +866,8 @@ class CompleteDos(Dos):
         Returns:
             Dos: Total DOS for a site with all orbitals.
         """
-        site_dos = functools.reduce(add_densities, self.pdos[site].values())
-        return Dos(self.efermi, self.energies, site_dos)
+        site_dos = self._pdos_array[self._get_site_index(site)].sum(axis=0)
+        return Dos(self.efermi, self.energies, dict(zip(self._pdos_spins, site_dos, strict=True)))
 
     def get_site_spd_dos(self, site: PeriodicSite) -> dict[OrbitalType, Dos]:
         """Get orbital projected DOS of a particular site.
@@ -728,13 +878,7 @@ class CompleteDos(Dos):
         Returns:
             dict[OrbitalType, Dos]
         """
-        spd_dos: dict[OrbitalType, dict[Spin, np.ndarray]] = {}
-        for orb, pdos in self.pdos[site].items():
-            orbital_type = _get_orb_type(orb)
-            if orbital_type in spd_dos:
-                spd_dos[orbital_type] = add_densities(spd_dos[orbital_type], pdos)
-            else:
-                spd_dos[orbital_type] = pdos  # type: ignore[assignment]
+        spd_dos = self._get_summed_pdos(self._get_site_weights([site]), _get_orb_type)
         return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in spd_dos.items()}
 
     def get_site_t2g_eg_resolved_dos(
@@ -749,18 +893,13 @@ class CompleteDos(Dos):
         Returns:
             dict[Literal["e_g", "t2g"], Dos]: Summed e_g and t2g DOS for the site.
         """
-        t2g_dos = []
-        eg_dos = []
-        for s, atom_dos in self.pdos.items():
-            if s == site:
-                for orb, pdos in atom_dos.items():
-                    if orb in (Orbital.dxy, Orbital.dxz, Orbital.dyz):
-                        t2g_dos.append(pdos)
-                    elif orb in (Orbital.dx2, Orbital.dz2):
-                        eg_dos.append(pdos)
+        t2g_eg_dos = self._get_summed_pdos(
+            self._get_site_weights([site]),
+            _t2g_eg_orbitals.get,
+        )
         return {
-            "t2g": Dos(self.efermi, self.energies, functools.reduce(add_densities, t2g_dos)),
-            "e_g": Dos(self.efermi, self.energies, functools.reduce(add_densities, eg_dos)),
+            "t2g": Dos(self.efermi, self.energies, t2g_eg_dos["t2g"]),
+            "e_g": Dos(self.efermi, self.energies, t2g_eg_dos["e_g"]),
         }
 
     def get_spd_dos(self) -> dict[OrbitalType, Dos]:
@@ -769,14 +908,7 @@ class CompleteDos(Dos):
         Returns:
             dict[OrbitalType, Dos]
         """
-        spd_dos = {}
-        for atom_dos in self.pdos.values():
-            for orb, pdos in atom_dos.items():
-                orbital_type = _get_orb_type(orb)
-                if orbital_type not in spd_dos:
-                    spd_dos[orbital_type] = pdos
-                else:
-                    spd_dos[orbital_type] = add_densities(spd_dos[orbital_type], pdos)
+        spd_dos = self._get_summed_pdos()
         return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in spd_dos.items()}
 
     def get_element_dos(self) -> dict[SpeciesLike, Dos]:
@@ -785,13 +917,21 @@ class CompleteDos(Dos):
         Returns:
             dict[Element, Dos]
         """
-        el_dos: dict[SpeciesLike, dict[Spin, ArrayLike]] = {}
-        for site, atom_dos in self.pdos.items():
-            el = site.specie
-            for pdos in atom_dos.values():
-                el_dos[el] = add_densities(el_dos[el], pdos) if el in el_dos else pdos  # type: ignore[assignment]
+        # Sites without any PDOS do not contribute
+        site_indices = np.flatnonzero(self._pdos_mask.any(axis=1))
+        species = [self._pdos_sites[idx].specie for idx in site_indices]
+        elements = list(dict.fromkeys(species))
+        el_indices = {el: idx for idx, el in enumerate(elements)}
 
-        return {el: Dos(self.efermi, self.energies, densities) for el, densities in el_dos.items()}
+        # Shape (n_elements, n_sites) matrix of the element of each site
+        el_matrix = np.zeros((len(elements), len(self._pdos_sites)))
+        el_matrix[[el_indices[el] for el in species], site_indices] = 1
+        el_dos = np.tensordot(el_matrix, self._pdos_array.sum(axis=1), axes=1)
+
+        return {
+            el: Dos(self.efermi, self.energies, dict(zip(self._pdos_spins, densities, strict=True)))
+            for el, densities in zip(elements, el_dos, strict=True)
+        }
 
     def get_element_spd_dos(self, el: SpeciesLike) -> dict[OrbitalType, Dos]:
         """Get element and orbital (spd) projected DOS.
@@ -802,17 +942,7 @@ class CompleteDos(Dos):
         Returns:
             dict[OrbitalType, Dos]
         """
-        el = get_el_sp(el)
-        el_dos = {}
-        for site, atom_dos in self.pdos.items():
-            if site.specie == el:
-                for orb, pdos in atom_dos.items():
-                    orbital_type = _get_orb_type(orb)
-                    if orbital_type not in el_dos:
-                        el_dos[orbital_type] = pdos
-                    else:
-                        el_dos[orbital_type] = add_densities(el_dos[orbital_type], pdos)
-
+        el_dos = self._get_summed_pdos(self._get_element_weights(el))
         return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in el_dos.items()}
 
     @property
@@ -864,24 +994,7 @@ class CompleteDos(Dos):
             float: Band filling in eV, often denoted f_d for the d-band.
         """
         # Get the projected DOS
-        if elements and sites:
-            raise ValueError("Both element and site cannot be specified.")
-
-        densities: dict[Spin, NDArray] = {}
-        if elements:
-            for idx, el in enumerate(elements):
-                spd_dos = self.get_element_spd_dos(el)[band]
-                densities = spd_dos.densities if idx == 0 else add_densities(densities, spd_dos.densities)
-            dos = Dos(self.efermi, self.energies, densities)
-
-        elif sites:
-            for idx, site in enumerate(sites):
-                spd_dos = self.get_site_spd_dos(site)[band]
-                densities = spd_dos.densities if idx == 0 else add_densities(densities, spd_dos.densities)
-            dos = Dos(self.efermi, self.energies, densities)
-
-        else:
-            dos = self.get_spd_dos()[band]
+        dos = self._get_band_dos(band, elements=elements, sites=sites)
 
         energies = dos.energies - dos.efermi
         dos_densities = dos.get_densities(spin=spin)
@@ -1060,24 +1173,7 @@ class CompleteDos(Dos):
             Orbital-projected nth moment in eV
         """
         # Get the projected DOS
-        if elements and sites:
-            raise ValueError("Both element and site cannot be specified.")
-
-        densities: dict[Spin, NDArray] = {}
-        if elements:
-            for idx, el in enumerate(elements):
-                spd_dos = self.get_element_spd_dos(el)[band]
-                densities = spd_dos.densities if idx == 0 else add_densities(densities, spd_dos.densities)
-            dos = Dos(self.efermi, self.energies, densities)
-
-        elif sites:
-            for idx, site in enumerate(sites):
-                spd_dos = self.get_site_spd_dos(site)[band]
-                densities = spd_dos.densities if idx == 0 else add_densities(densities, spd_dos.densities)
-            dos = Dos(self.efermi, self.energies, densities)
-
-        else:
-            dos = self.get_spd_dos()[band]
+        dos = self._get_band_dos(band, elements=elements, sites=sites)
 
         energies = dos.energies - dos.efermi
         dos_densities = dos.get_densities(spin=spin)
@@ -1119,24 +1215,7 @@ class CompleteDos(Dos):
             Dos: Hilbert transformation of the projected DOS.
         """
         # Get the projected DOS
-        if elements and sites:
-            raise ValueError("Both element and site cannot be specified.")
-
-        densities: dict[Spin, NDArray] = {}
-        if elements:
-            for idx, el in enumerate(elements):
-                spd_dos = self.get_element_spd_dos(el)[band]
-                densities = spd_dos.densities if idx == 0 else add_densities(densities, spd_dos.densities)
-            dos = Dos(self.efermi, self.energies, densities)
-
-        elif sites:
-            for idx, site in enumerate(sites):
-                spd_dos = self.get_site_spd_dos(site)[band]
-                densities = spd_dos.densities if idx == 0 else add_densities(densities, spd_dos.densities)
-            dos = Dos(self.efermi, self.energies, densities)
-
-        else:
-            dos = self.get_spd_dos()[band]
+        dos = self._get_band_dos(band, elements=elements, sites=sites)
 
         # Get Hilbert-transformed densities
         densities_transformed = {Spin.up: np.imag(hilbert(dos.get_densities(spin=Spin.up)))}
@@ -1261,11 +1340,10 @@ class CompleteDos(Dos):
                 n_bins = len(energies)
                 bin_width = np.diff(energies)[0]
 
-            dos_rebin = np.zeros(ener.shape)
-
-            for ii, e1, e2 in zip(range(len(ener)), ener_bounds[:-1], ener_bounds[1:], strict=False):
-                inds = np.where((energies >= e1) & (energies < e2))
-                dos_rebin[ii] = np.sum(densities[inds])
+            # Sum the densities with e1 <= energy < e2 for each bin [e1, e2)
+            bin_inds = np.searchsorted(ener_bounds, energies, side="right") - 1
+            in_bins = (bin_inds >= 0) & (bin_inds < len(ener_bounds) - 1)
+            dos_rebin = np.bincount(bin_inds[in_bins], weights=densities[in_bins], minlength=len(ener))
 
             # Scale DOS bins to make area under histogram equal 1
             if normalize:
@@ -1385,7 +1463,7 @@ class CompleteDos(Dos):
             for at in self.structure:
                 dd = {}
                 for orb, pdos in self.pdos[at].items():
-                    dd[str(orb)] = {"densities": {str(int(spin)): list(dens) for spin, dens in pdos.items()}}  # type:ignore[arg-type]
+                    dd[str(orb)] = {"densities": {str(int(spin)): dens.tolist() for spin, dens in pdos.items()}}
                 dct["pdos"].append(dd)
             dct["atom_dos"] = {str(at): dos.as_dict() for at, dos in self.get_element_dos().items()}
             dct["spd_dos"] = {str(orb): dos.as_dict() for orb, dos in self.get_spd_dos().items()}
@@ -1449,66 +1527,27 @@ class LobsterCompleteDos(CompleteDos):
         """
         warnings.warn("Are the orbitals correctly oriented? Are you sure?", stacklevel=2)
 
-        t2g_dos = []
-        eg_dos = []
-        for s, atom_dos in self.pdos.items():
-            if s == site:
-                for orb, pdos in atom_dos.items():
-                    orbital = _get_orb_lobster(str(orb))
-                    if orbital is None:
-                        raise ValueError("orbital is None")
-
-                    if orbital in (Orbital.dxy, Orbital.dxz, Orbital.dyz):
-                        t2g_dos.append(pdos)
-                    elif orbital in (Orbital.dx2, Orbital.dz2):
-                        eg_dos.append(pdos)
+        orbitals = {orb: _get_orb_lobster(str(orb)) for orb in self.pdos[site]}
+        if None in orbitals.values():
+            raise ValueError("orbital is None")
+
+        t2g_eg_dos = self._get_summed_pdos(
+            self._get_site_weights([site]),
+            lambda orb: _t2g_eg_orbitals.get(orbitals[orb]),  # type: ignore[arg-type]
+        )
         return {
-            "t2g": Dos(self.efermi, self.energies, functools.reduce(add_densities, t2g_dos)),
-            "e_g": Dos(self.efermi, self.energies, functools.reduce(add_densities, eg_dos)),
+            "t2g": Dos(self.efermi, self.energies, t2g_eg_dos["t2g"]),
+            "e_g": Dos(self.efermi, self.energies, t2g_eg_dos["e_g"]),
         }
 
-    def get_spd_dos(self) -> dict[str, Dos]:
-        """Get orbital projected DOS.
+    @staticmethod
+    def _get_orbital_type(orb: str) -> OrbitalType | None:  # type: ignore[override]
+        """Get the OrbitalType an orbital is summed into by get_spd_dos.
 
         For example, if 3s and 4s are included in the basis of some element,
         they will be both summed in the orbital projected DOS.
-
-        Returns:
-            {orbital: Dos}
-        """
-        spd_dos = {}
-        orb = None
-        for atom_dos in self.pdos.values():
-            for orb, pdos in atom_dos.items():
-                orbital_type = _get_orb_type_lobster(str(orb))
-                if orbital_type not in spd_dos:
-                    spd_dos[orbital_type] = pdos
-                else:
-                    spd_dos[orbital_type] = add_densities(spd_dos[orbital_type], pdos)
-
-        return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in spd_dos.items()}  # type: ignore[misc]
-
-    def get_element_spd_dos(self, el: SpeciesLike) -> dict[str, Dos]:
-        """Get element and s/p/d projected DOS.
-
-        Args:
-            el (SpeciesLike): Element associated with LobsterCompleteDos.
-
-        Returns:
-            dict of {OrbitalType.s: Dos, OrbitalType.p: Dos, OrbitalType.d: Dos}
         """
-        el = get_el_sp(el)
-        el_dos = {}
-        for site, atom_dos in self.pdos.items():
-            if site.specie == el:
-                for orb, pdos in atom_dos.items():
-                    orbital_type = _get_orb_type_lobster(str(orb))
-                    if orbital_type not in el_dos:
-                        el_dos[orbital_type] = pdos
-                    else:
-                        el_dos[orbital_type] = add_densities(el_dos[orbital_type], pdos)
-
-        return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in el_dos.items()}  # type: ignore[misc]
+        return _get_orb_type_lobster(str(orb))
 
     @classmethod
     def from_dict(cls, dct: dict) -> Self:
@@ -1524,6 +1563,274 @@ class LobsterCompleteDos(CompleteDos):
         return cls(struct, tdos, pdos)
 
 
+class DosFingerprintStore:
+    """Store of DOS fingerprints for similarity search among many DOS.
+
+    The densities of the fingerprints are the rows of a contiguous float32
+    matrix, so that the similarities of query fingerprints to all stored ones
+    are matrix products. These are evaluated in chunks of rows to bound the
+    memory usage, which allows searching a store that is memory-mapped from
+    a file written by to_hdf5.
+
+    The similarities are those of CompleteDos.get_dos_fp_similarity (with
+    col=1 and pt="All"), up to float32 precision.
+
+    Attributes:
+        densities (NDArray): Shape (n_fingerprints, n_bins) float32 densities of
+            the stored fingerprints.
+        keys (list): Key of each fingerprint, e.g. a material ID.
+        fp_kwargs (dict): Keyword arguments of CompleteDos.get_dos_fp used to
+            generate the fingerprints, which are also used for CompleteDos queries.
+    """
+
+    def __init__(
+        self,
+        densities: ArrayLike,
+        keys: Sequence | None = None,
+        fp_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Args:
+            densities (ArrayLike): Shape (n_fingerprints, n_bins) densities of the
+                fingerprints. Kept as is if a float32 array (e.g. memory-mapped).
+            keys (Sequence): Key of each fingerprint. Defaults to None for their indices.
+            fp_kwargs (dict): Keyword arguments of CompleteDos.get_dos_fp used to
+                generate the fingerprints. Defaults to None for the defaults of
+                get_dos_fp.
+        """
+        if not (isinstance(densities, np.ndarray) and densities.dtype == np.float32):
+            densities = np.asarray(densities, dtype=np.float32)
+        self.densities = densities
+        if self.densities.ndim != 2:
+            raise ValueError(f"densities must have shape (n_fingerprints, n_bins), got {self.densities.shape}")
+        self.keys = list(range(len(self.densities))) if keys is None else list(keys)
+        if len(self.keys) != len(self.densities):
+            raise ValueError(f"Got {len(self.keys)} keys for {len(self.densities)} fingerprints")
+        self.fp_kwargs = fp_kwargs or {}
+
+    def __len__(self) -> int:
+        return len(self.densities)
+
+    @classmethod
+    def from_fingerprints(cls, fingerprints: Iterable[DosFingerprint], keys: Sequence | None = None) -> Self:
+        """Create a store from DOS fingerprints.
+
+        Args:
+            fingerprints (Iterable[DosFingerprint]): Fingerprints of the same type and binning.
+            keys (Sequence): Key of each fingerprint. Defaults to None for their indices.
+
+        Returns:
+            DosFingerprintStore
+        """
+        fingerprints = list(fingerprints)
+        if len({(fp.fp_type, fp.n_bins) for fp in fingerprints}) > 1:
+            raise ValueError("All fingerprints must have the same fp_type and n_bins.")
+
+        fp_kwargs = {"fp_type": fingerprints[0].fp_type, "n_bins": fingerprints[0].n_bins} if fingerprints else {}
+        return cls(cls._stack_densities(fp.densities for fp in fingerprints), keys=keys, fp_kwargs=fp_kwargs)
+
+    @classmethod
+    def from_doses(cls, doses: Iterable[CompleteDos], keys: Sequence | None = None, **fp_kwargs) -> Self:
+        """Create a store by fingerprinting DOS.
+
+        The fingerprints are only comparable if they share the same energy bins,
+        so min_e and max_e should be specified.
+
+        Args:
+            doses (Iterable[CompleteDos]): DOS to fingerprint. Only one at a time is
+                needed if this is an iterator.
+            keys (Sequence): Key of each DOS. Defaults to None for their indices.
+            **fp_kwargs: Keyword arguments passed to CompleteDos.get_dos_fp.
+
+        Returns:
+            DosFingerprintStore
+        """
+        return cls(cls._stack_densities(dos.get_dos_fp(**fp_kwargs).densities for dos in doses), keys, fp_kwargs)
+
+    @staticmethod
+    def _stack_densities(densities: Iterable[NDArray]) -> NDArray[np.float32]:
+        """Stack fingerprint densities as the rows of a float32 matrix."""
+        rows = [np.asarray(dens, dtype=np.float32).ravel() for dens in densities]
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError(
+                "All fingerprints must have the same number of bins, e.g. by fingerprinting with the same "
+                "min_e, max_e and n_bins."
+            )
+        return np.array(rows, dtype=np.float32) if rows else np.empty((0, 0), dtype=np.float32)
+
+    def get_query_densities(
+        self,
+        query: DosFingerprint | CompleteDos | Sequence[DosFingerprint | CompleteDos],
+    ) -> NDArray[np.float32]:
+        """Get the densities of query fingerprints, fingerprinting DOS with fp_kwargs.
+
+        Args:
+            query: Fingerprint(s) or DOS to get the densities of.
+
+        Returns:
+            NDArray: Shape (n_queries, n_bins) float32 densities.
+        """
+        queries = [query] if isinstance(query, DosFingerprint | CompleteDos) else query
+        densities = self._stack_densities(
+            fp.get_dos_fp(**self.fp_kwargs).densities if isinstance(fp, CompleteDos) else fp.densities for fp in queries
+        )
+        if densities.shape[1] != self.densities.shape[1]:
+            raise ValueError(f"Query fingerprints have {densities.shape[1]} bins, expected {self.densities.shape[1]}")
+        return densities
+
+    def iter_similarities(
+        self,
+        query: DosFingerprint | CompleteDos | Sequence[DosFingerprint | CompleteDos],
+        metric: Literal["tanimoto", "cosine-sim"] = "tanimoto",
+        normalize: bool = False,
+        chunk_size: int = 2**16,
+    ) -> Iterator[tuple[int, NDArray[np.float32]]]:
+        """Iterate over the similarities of query fingerprints to chunks of the stored ones.
+
+        Args:
+            query: Fingerprint(s) or DOS to compare.
+            metric (Literal): Metric used to compute similarity. Default is "tanimoto".
+            normalize (bool): If True normalize the scalar product to 1 (default is False).
+                Only for the "cosine-sim" metric.
+            chunk_size (int): Number of stored fingerprints per chunk.
+
+        Raises:
+            ValueError: If metric other than tanimoto and "cosine-sim" is requested.
+            ValueError: If normalize is set to True along with the tanimoto metric.
+
+        Yields:
+            tuple[int, NDArray]: Index of the first stored fingerprint in the
+                chunk, and shape (n_queries, n_chunk) similarities.
+        """
+        valid_metrics = ("tanimoto", "cosine-sim")
+        if metric not in valid_metrics:
+            raise ValueError(f"Invalid {metric=}, choose from {valid_metrics}.")
+        if normalize and metric != "cosine-sim":
+            raise ValueError("Cannot compute similarity index. When normalize=True, then please set metric=cosine-sim")
+
+        queries = self.get_query_densities(query)
+        query_norms = np.einsum("ij,ij->i", queries, queries)[:, None]
+        for start in range(0, len(self), chunk_size):
+            chunk = np.asarray(self.densities[start : start + chunk_size])
+            sims = queries @ chunk.T
+            if metric == "tanimoto":
+                sims /= query_norms + np.einsum("ij,ij->i", chunk, chunk) - sims
+            elif normalize:
+                sims /= np.sqrt(query_norms * np.einsum("ij,ij->i", chunk, chunk))
+            yield start, sims
+
+    def get_similarities(
+        self,
+        query: DosFingerprint | CompleteDos | Sequence[DosFingerprint | CompleteDos],
+        metric: Literal["tanimoto", "cosine-sim"] = "tanimoto",
+        normalize: bool = False,
+        chunk_size: int = 2**16,
+    ) -> NDArray[np.float32]:
+        """Get the similarities of query fingerprints to all stored ones.
+
+        Args:
+            query: Fingerprint(s) or DOS to compare.
+            metric (Literal): Metric used to compute similarity. Default is "tanimoto".
+            normalize (bool): If True normalize the scalar product to 1 (default is False).
+                Only for the "cosine-sim" metric.
+            chunk_size (int): Number of stored fingerprints per chunk.
+
+        Returns:
+            NDArray: Shape (n_queries, n_fingerprints) similarities.
+        """
+        chunks = self.iter_similarities(query, metric=metric, normalize=normalize, chunk_size=chunk_size)
+        sims = [chunk for _start, chunk in chunks]
+        return np.concatenate(sims, axis=1) if sims else np.empty((len(self.get_query_densities(query)), 0))
+
+    def get_most_similar(
+        self,
+        query: DosFingerprint | CompleteDos | Sequence[DosFingerprint | CompleteDos],
+        k: int = 10,
+        metric: Literal["tanimoto", "cosine-sim"] = "tanimoto",
+        normalize: bool = False,
+        chunk_size: int = 2**16,
+    ) -> list[list[tuple[Any, float]]]:
+        """Get the k most similar stored fingerprints of query fingerprints.
+
+        Only the k best similarities of each query are kept between chunks.
+
+        Args:
+            query: Fingerprint(s) or DOS to compare.
+            k (int): Number of most similar fingerprints to get.
+            metric (Literal): Metric used to compute similarity. Default is "tanimoto".
+            normalize (bool): If True normalize the scalar product to 1 (default is False).
+                Only for the "cosine-sim" metric.
+            chunk_size (int): Number of stored fingerprints per chunk.
+
+        Returns:
+            list[list[tuple[Any, float]]]: For each query, the (key, similarity)
+                of the k most similar fingerprints, in decreasing similarity.
+        """
+        best_inds: NDArray = np.empty((0, 0), dtype=int)
+        best_sims: NDArray = np.empty((0, 0), dtype=np.float32)
+        for start, sims in self.iter_similarities(query, metric=metric, normalize=normalize, chunk_size=chunk_size):
+            inds = np.broadcast_to(np.arange(start, start + sims.shape[1]), sims.shape)
+            if best_sims.size:
+                sims = np.concatenate((best_sims, sims), axis=1)
+                inds = np.concatenate((best_inds, inds), axis=1)
+            # NaN similarities (e.g. of all-zero fingerprints) are ranked last
+            sims = np.nan_to_num(sims, nan=-np.inf)
+            if sims.shape[1] > k:
+                top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+                sims = np.take_along_axis(sims, top, axis=1)
+                inds = np.take_along_axis(inds, top, axis=1)
+            best_sims, best_inds = sims, inds
+
+        order = np.argsort(-best_sims, axis=1, kind="stable")
+        best_sims = np.take_along_axis(best_sims, order, axis=1)
+        best_inds = np.take_along_axis(best_inds, order, axis=1)
+        return [
+            [(self.keys[idx], float(sim)) for idx, sim in zip(inds, sims, strict=True)]
+            for inds, sims in zip(best_inds, best_sims, strict=True)
+        ]
+
+    def to_hdf5(self, filename: PathLike) -> None:
+        """Write the store to a HDF5 file.
+
+        The densities are stored as a contiguous float32 dataset so that they
+        can be memory-mapped by from_hdf5. The keys are stored as strings.
+
+        Args:
+            filename (PathLike): Filename to output to.
+        """
+        import h5py
+
+        with h5py.File(str(filename), mode="w") as file:
+            file.create_dataset("densities", data=self.densities, dtype=np.float32)
+            file.create_dataset("keys", data=[str(key) for key in self.keys], dtype=h5py.string_dtype())
+            file.attrs["fp_kwargs"] = json.dumps(self.fp_kwargs)
+
+    @classmethod
+    def from_hdf5(cls, filename: PathLike, mmap: bool = True) -> Self:
+        """Read a store written by to_hdf5.
+
+        Args:
+            filename (PathLike): Filename to read from.
+            mmap (bool): Whether to memory-map the densities instead of reading
+                them into memory. Defaults to True.
+
+        Returns:
+            DosFingerprintStore
+        """
+        import h5py
+
+        with h5py.File(str(filename), mode="r") as file:
+            dataset = file["densities"]
+            offset = dataset.id.get_offset() if mmap else None
+            if offset is None:
+                densities = np.asarray(dataset)
+            else:
+                densities = np.memmap(filename, dtype=dataset.dtype, mode="r", offset=offset, shape=dataset.shape)
+            keys = list(file["keys"].asstr()[...])
+            fp_kwargs = json.loads(file.attrs["fp_kwargs"])
+        return cls(densities, keys=keys, fp_kwargs=fp_kwargs)
+
+
 def add_densities(
     density1: Mapping[Spin, ArrayLike],
     density2: Mapping[Spin, ArrayLike],
@@ -6,13 +6,15 @@ from __future__ import annotations
 
 import abc
 import copy
+import logging
 import os
+import time
 import warnings
 from collections import defaultdict
 from typing import TYPE_CHECKING, TypeAlias, cast
 
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from monty.design_patterns import cached_class
 from monty.dev import deprecated
 from monty.json import MSONable
@@ -48,6 +50,8 @@ __maintainer__ = "Shyue Ping Ong"
 __email__ = "shyuep@gmail.com"
 __date__ = "April 2020"
 
+logger = logging.getLogger(__name__)
+
 MODULE_DIR: str = os.path.dirname(os.path.abspath(__file__))
 MU_H2O: float = -2.4583  # Free energy of formation of water, eV/H2O, used by MaterialsProjectAqueousCompatibility
 MP2020_COMPAT_CONFIG = loadfn(f"{MODULE_DIR}/MP2020Compatibility.yaml")
@@ -619,22 +623,91 @@ class Compatibility(MSONable, abc.ABC):
         Returns:
             tuple[AnyComputedEntry, ignore_entry (bool)] if entry is compatible, else None.
         """
-        ignore_entry: bool = False
+        adjustments = self._get_entry_adjustments(entry, clean, on_error)
+        if adjustments is None:
+            return None
+
+        return entry, self._apply_adjustments(entry, adjustments)
+
+    def _get_entry_adjustments(
+        self,
+        entry: AnyComputedEntry,
+        clean: bool = True,
+        on_error: Literal["ignore", "warn", "raise"] = "ignore",
+    ) -> list[EnergyAdjustment] | None:
+        """Get the energy adjustments for an entry without applying them.
+
+        Args:
+            entry (AnyComputedEntry): An AnyComputedEntry object.
+            clean (bool): Whether to remove any previously-applied energy adjustments
+                before computing the new ones. Defaults to True.
+            on_error ("ignore" | "warn" | "raise"): What to do when get_adjustments(entry)
+                raises CompatibilityError. Defaults to "ignore".
+
+        Returns:
+            list[EnergyAdjustment] if entry is compatible, else None.
+        """
         # If clean, remove all previous adjustments from the entry
         if clean:
             entry.energy_adjustments = []
 
         # Get the energy adjustments
         try:
-            adjustments: list[EnergyAdjustment] = self.get_adjustments(entry)
+            return self.get_adjustments(entry)
 
         except CompatibilityError as exc:
             if on_error == "raise":
                 raise
             if on_error == "warn":
-                warnings.warn(str(exc), stacklevel=2)
+                warnings.warn(str(exc), stacklevel=3)
             return None
 
+    def _get_adjustments_batch(
+        self,
+        entries: Sequence[AnyComputedEntry],
+        clean: bool = True,
+        on_error: Literal["ignore", "warn", "raise"] = "ignore",
+    ) -> list[tuple[list[EnergyAdjustment], dict[str, Any]] | None]:
+        """Get the energy adjustments for a batch of entries, e.g. in a worker process.
+
+        Besides the adjustments, the items of entry.data added by get_adjustments()
+        (such as guessed oxidation states) are returned, so that the caller can apply
+        both to its own copies of the entries.
+
+        Args:
+            entries (Sequence[AnyComputedEntry]): Entries to process.
+            clean (bool): Whether to remove any previously-applied energy adjustments
+                before computing the new ones. Defaults to True.
+            on_error ("ignore" | "warn" | "raise"): What to do when get_adjustments(entry)
+                raises CompatibilityError. Defaults to "ignore".
+
+        Returns:
+            list[tuple[list[EnergyAdjustment], dict] | None]: The adjustments and new
+                data items of each entry, or None for incompatible entries.
+        """
+        results: list[tuple[list[EnergyAdjustment], dict[str, Any]] | None] = []
+        for entry in entries:
+            data_keys = set(entry.data)
+            adjustments = self._get_entry_adjustments(entry, clean, on_error)
+            if adjustments is None:
+                results.append(None)
+            else:
+                results.append((adjustments, {key: val for key, val in entry.data.items() if key not in data_keys}))
+        return results
+
+    @staticmethod
+    def _apply_adjustments(entry: AnyComputedEntry, adjustments: list[EnergyAdjustment]) -> bool:
+        """Add energy adjustments to an entry, skipping those already applied.
+
+        Args:
+            entry (AnyComputedEntry): The entry to adjust in place.
+            adjustments (list[EnergyAdjustment]): Adjustments from get_adjustments().
+
+        Returns:
+            bool: Whether the entry should be discarded, because it already has an
+                adjustment of the same name but a different value.
+        """
+        ignore_entry: bool = False
         for e_adj in adjustments:
             # Check if this correction already been applied
             if (e_adj.name, e_adj.cls, e_adj.value) in [
@@ -651,14 +724,14 @@ class Compatibility(MSONable, abc.ABC):
                     f"Entry {entry.entry_id} already has an energy adjustment called {e_adj.name}, but its "
                     f"value differs from the value of {e_adj.value:.3f} calculated here. This "
                     "Entry will be discarded.",
-                    stacklevel=2,
+                    stacklevel=3,
                 )
 
             else:
                 # Add the correction to the energy_adjustments list
                 entry.energy_adjustments.append(e_adj)
 
-        return entry, ignore_entry
+        return ignore_entry
 
     def process_entries(
         self,
@@ -674,6 +747,11 @@ class Compatibility(MSONable, abc.ABC):
         Warning: This method changes entries in place! All changes can be undone and original entries
         restored by setting entry.energy_adjustments = [].
 
+        With n_workers != 1, entries are grouped by chemical system and run type and
+        dispatched to the workers in chunks. Workers only send back the energy adjustments,
+        which are then applied to the entries in this process, so that parallel processing
+        works with inplace=True as well. The throughput is logged at INFO level.
+
         Args:
             entries (AnyComputedEntry | list[AnyComputedEntry]): A sequence of
                 Computed(Structure)Entry objects.
@@ -696,6 +774,7 @@ class Compatibility(MSONable, abc.ABC):
             entries = [entries]
 
         processed_entry_list: list[AnyComputedEntry] = []
+        start_time = time.perf_counter()
 
         # if inplace = False, process entries on a copy
         if not inplace:
@@ -709,23 +788,49 @@ class Compatibility(MSONable, abc.ABC):
                 entry, ignore_entry = result
                 if not ignore_entry:
                     processed_entry_list.append(entry)
-        elif not inplace:
+        elif entries:
+            # Entries of the same chemical system share compositions, so grouping them
+            # keeps the per-composition caches of each worker warm
+            order = sorted(
+                range(len(entries)),
+                key=lambda idx: (
+                    entries[idx].composition.chemical_system,
+                    str(entries[idx].parameters.get("run_type")),
+                ),
+            )
+            n_chunks = min(len(entries), 4 * effective_n_jobs(n_workers))
+            chunks = [chunk.tolist() for chunk in np.array_split(order, n_chunks)]
+
             # set python warnings to ignore otherwise warnings will be printed multiple times
             with (
-                tqdm_joblib(tqdm(total=len(entries), disable=not verbose)),
+                tqdm_joblib(tqdm(total=len(chunks), disable=not verbose)),
                 set_python_warnings("ignore"),
             ):
-                results = Parallel(n_jobs=n_workers)(
-                    delayed(self._process_entry_inplace)(entry, clean, on_error) for entry in entries
+                chunk_results = Parallel(n_jobs=n_workers)(
+                    delayed(self._get_adjustments_batch)([entries[idx] for idx in chunk], clean, on_error)
+                    for chunk in chunks
                 )
-            for result in results:
+
+            results: list[tuple[list[EnergyAdjustment], dict[str, Any]] | None] = [None] * len(entries)
+            for chunk, chunk_result in zip(chunks, chunk_results, strict=True):
+                for idx, result in zip(chunk, chunk_result, strict=True):
+                    results[idx] = result
+
+            for entry, result in zip(entries, results, strict=True):
+                # As in serial processing, incompatible entries are cleaned too
+                if clean:
+                    entry.energy_adjustments = []
                 if result is None:
                     continue
-                entry, ignore_entry = result
-                if not ignore_entry:
+                adjustments, data = result
+                entry.data.update(data)
+                if not self._apply_adjustments(entry, adjustments):
                     processed_entry_list.append(entry)
-        else:
-            raise ValueError("Parallel processing is not possible with for 'inplace=True'")
+
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"Processed {len(entries)} entries in {elapsed:.2f} s ({len(entries) / max(elapsed, 1e-9):.0f} entries/s)"
+        )
 
         return processed_entry_list
 
@@ -1061,6 +1166,32 @@ class MaterialsProject2020Compatibility(Compatibility):
             self.u_corrections = {}
             self.u_errors = {}
 
+        # most likely oxidation states, keyed by composition
+        self._oxi_state_cache: dict[frozenset, dict[str, float]] = {}
+
+    def _get_oxi_state_guess(self, comp: Composition) -> dict[str, float]:
+        """Get the most likely oxidation states of a composition, or an empty dict
+        if they cannot be guessed. Results are cached per composition, since guessing
+        oxidation states dominates the cost of get_adjustments().
+
+        Args:
+            comp (Composition): The composition of an entry.
+
+        Returns:
+            dict[str, float]: e.g. {'Fe': 3.0, 'O': -2.0} for Fe2O3.
+        """
+        key = frozenset(comp.items())
+        if key not in self._oxi_state_cache:
+            # try to guess the oxidation states from composition
+            # for performance reasons, fail if the composition is too large
+            try:
+                oxi_states = comp.oxi_state_guesses(max_sites=-20)
+            except ValueError:
+                oxi_states = ({},)
+
+            self._oxi_state_cache[key] = (oxi_states or ({},))[0]
+        return dict(self._oxi_state_cache[key])
+
     def get_adjustments(self, entry: AnyComputedEntry) -> list[CompositionEnergyAdjustment]:
         """Get the energy adjustments for a ComputedEntry or ComputedStructureEntry.
 
@@ -1097,7 +1228,6 @@ class MaterialsProject2020Compatibility(Compatibility):
         adjustments: list[CompositionEnergyAdjustment] = []
 
         comp = entry.composition
-        rform = comp.reduced_formula
         # sorted list of elements, ordered by electronegativity
         sorted_elements = sorted((el for el in comp.elements if comp[el] > 0), key=lambda el: el.X)
 
@@ -1147,6 +1277,7 @@ class MaterialsProject2020Compatibility(Compatibility):
                     common_superoxides = "LiO2 NaO2 KO2 RbO2 CsO2".split()
                     ozonides = "LiO3 NaO3 KO3 NaO5".split()
 
+                    rform = comp.reduced_formula
                     if rform in common_peroxides:
                         ox_type = "peroxide"
                     elif rform in common_superoxides:
@@ -1177,14 +1308,7 @@ class MaterialsProject2020Compatibility(Compatibility):
         # the key is expected to comprise a dict corresponding to the first element output by
         # Composition.oxi_state_guesses(), e.g. {'Al': 3.0, 'S': 2.0, 'O': -2.0} for 'Al2SO4'
         if "oxidation_states" not in entry.data:
-            # try to guess the oxidation states from composition
-            # for performance reasons, fail if the composition is too large
-            try:
-                oxi_states = entry.composition.oxi_state_guesses(max_sites=-20)
-            except ValueError:
-                oxi_states = ({},)
-
-            entry.data["oxidation_states"] = (oxi_states or ({},))[0]
+            entry.data["oxidation_states"] = self._get_oxi_state_guess(entry.composition)
 
         if entry.data["oxidation_states"] == {}:
             warnings.warn(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import math
 import os
 import re
@@ -16,6 +17,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Literal, cast
 
 import numpy as np
+from joblib import Parallel, delayed
 from monty.dev import deprecated
 from monty.io import zopen
 from monty.serialization import loadfn
@@ -27,10 +29,9 @@ from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, SpacegroupOperations
 from pymatgen.symmetry.groups import SYMM_DATA, SpaceGroup
 from pymatgen.symmetry.maggroups import MagneticSpaceGroup
 from pymatgen.symmetry.structure import SymmetrizedStructure
-from pymatgen.util.coord import find_in_coord_list_pbc, in_coord_list_pbc
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from typing import Any
 
     from numpy.typing import NDArray
@@ -304,6 +305,41 @@ class CifFile:
         with zopen(filename, mode="rt", errors="replace", encoding="utf-8") as file:
             return cls.from_str(file.read())  # type:ignore[arg-type]
 
+    @classmethod
+    def iter_blocks(cls, filename: PathLike | Iterable[str]) -> Iterator[CifBlock]:
+        """Lazily read the CifBlocks of a .cif file, one data block at a time,
+        so that files with many data blocks never have to be held in memory.
+        Unlike from_str, blocks with equal headers are all yielded.
+
+        Args:
+            filename: Filename, or an open text file or other iterable of lines.
+
+        Yields:
+            CifBlock
+        """
+        if isinstance(filename, (str | Path)):
+            with zopen(filename, mode="rt", errors="replace", encoding="utf-8") as file:
+                yield from cls.iter_blocks(file)  # type:ignore[arg-type]
+            return
+
+        lines: list[str] = []
+        for line in filename:
+            if line.lstrip().startswith("data_"):
+                if lines:
+                    yield from cls._block_from_lines(lines)
+                lines = [line.lstrip()]
+            # Anything before the first data block is ignored
+            elif lines:
+                lines.append(line)
+        if lines:
+            yield from cls._block_from_lines(lines)
+
+    @staticmethod
+    def _block_from_lines(lines: list[str]) -> Iterator[CifBlock]:
+        """Parse the lines of a data block, skipping powder diffraction data as in from_str."""
+        if "powder_pattern" not in lines[0]:
+            yield CifBlock.from_str("".join(lines))
+
 
 class CifParser:
     """
@@ -384,10 +420,30 @@ class CifParser:
         Returns:
             CifParser
         """
+        return cls._from_cif_file(
+            CifFile.from_str(cif_string),
+            occupancy_tolerance=occupancy_tolerance,
+            site_tolerance=site_tolerance,
+            frac_tolerance=frac_tolerance,
+            check_cif=check_cif,
+            comp_tol=comp_tol,
+        )
 
+    @classmethod
+    def _from_cif_file(
+        cls,
+        cif_file: CifFile,
+        *,
+        occupancy_tolerance: float = 1.0,
+        site_tolerance: float = 1e-4,
+        frac_tolerance: float = 1e-4,
+        check_cif: bool = True,
+        comp_tol: float = 0.01,
+    ) -> Self:
+        """Create a CifParser from already tokenized CifBlocks, see from_str."""
         self = cls.__new__(cls)
 
-        self._cif = CifFile.from_str(cif_string)
+        self._cif = cif_file
 
         # Take tolerances
         self._occupancy_tolerance = occupancy_tolerance
@@ -636,50 +692,79 @@ class CifParser:
     ) -> tuple[list[NDArray], list[Magmom], list[str]]:
         """Generate unique coordinates using coordinates and symmetry
         positions, and their corresponding magnetic moments if supplied.
+
+        All symmetry operations are applied to all coordinates at once. An image
+        is kept unless it lies within the site tolerance of an image kept before
+        it, images being ordered by coordinate and then by symmetry operation.
         """
-        coords_out: list[NDArray] = []
-        labels_out: list[str] = []
         labels = labels or {}
+        n_ops = len(self.symmetry_operations)
+
+        images = _apply_symmetry_operations(self.symmetry_operations, coords).reshape(-1, 3)
+        images -= np.floor(images)
+        kept = np.flatnonzero(_get_unique_coords_mask(images, self._site_tolerance))
+
+        coords_out: list[NDArray] = list(images[kept])
+        labels_out: list[str] = [labels.get(coords[idx // n_ops], "no_label") for idx in kept]
 
         if magmoms:
             if len(magmoms) != len(coords):
                 raise ValueError("Length of magmoms and coords don't match.")
 
             magmoms_out: list[Magmom] = []
-            for tmp_coord, tmp_magmom in zip(coords, magmoms, strict=True):
-                for op in self.symmetry_operations:
-                    coord = op.operate(tmp_coord)
-                    coord = np.array([i - math.floor(i) for i in coord])
-                    if isinstance(op, MagSymmOp):
-                        # Up to this point, magmoms have been defined relative
-                        # to crystal axis. Now convert to Cartesian and into
-                        # a Magmom object.
-                        if lattice is None:
-                            raise ValueError("Lattice cannot be None.")
-                        magmom = Magmom.from_moment_relative_to_crystal_axes(
-                            op.operate_magmom(tmp_magmom), lattice=lattice
-                        )
-                    else:
-                        magmom = Magmom(tmp_magmom)
-
-                    if not in_coord_list_pbc(coords_out, coord, atol=self._site_tolerance):
-                        coords_out.append(coord)
-                        magmoms_out.append(magmom)
-                        labels_out.append(labels.get(tmp_coord, "no_label"))
+            for idx in kept:
+                op, tmp_magmom = self.symmetry_operations[idx % n_ops], magmoms[idx // n_ops]
+                if isinstance(op, MagSymmOp):
+                    # Up to this point, magmoms have been defined relative
+                    # to crystal axis. Now convert to Cartesian and into
+                    # a Magmom object.
+                    if lattice is None:
+                        raise ValueError("Lattice cannot be None.")
+                    magmom = Magmom.from_moment_relative_to_crystal_axes(op.operate_magmom(tmp_magmom), lattice=lattice)
+                else:
+                    magmom = Magmom(tmp_magmom)
+                magmoms_out.append(magmom)
 
             return coords_out, magmoms_out, labels_out
 
-        for tmp_coord in coords:
-            for op in self.symmetry_operations:
-                coord = op.operate(tmp_coord)
-                coord = np.array([i - math.floor(i) for i in coord])
-                if not in_coord_list_pbc(coords_out, coord, atol=self._site_tolerance):
-                    coords_out.append(coord)
-                    labels_out.append(labels.get(tmp_coord, "no_label"))
-
         dummy_magmoms = [Magmom(0)] * len(coords_out)
         return coords_out, dummy_magmoms, labels_out
 
+    def _get_matching_sites(self, coords: list[tuple[float, float, float]]) -> list[int | None]:
+        """Match each site of the asymmetric unit to an earlier, unmatched site
+        onto which a symmetry operation maps it, if any. When there are several,
+        the one matched by the first symmetry operation, and then the first site,
+        is taken.
+
+        Args:
+            coords (list[tuple[float, float, float]]): Fractional coordinates of the sites.
+
+        Returns:
+            list[int | None]: Index of the matching site of each site, None if unmatched.
+        """
+        n_ops = len(self.symmetry_operations)
+        images = _apply_symmetry_operations(self.symmetry_operations, coords).reshape(-1, 3)
+        image_idx, site_j = _find_pbc_matches(
+            images, np.reshape(np.asarray(coords, dtype=float), (-1, 3)), self._site_tolerance
+        )
+        site_i, op_idx = np.divmod(image_idx, n_ops)
+        is_earlier = site_j < site_i
+        site_i, op_idx, site_j = site_i[is_earlier], op_idx[is_earlier], site_j[is_earlier]
+        order = np.lexsort((site_j, op_idx, site_i))
+        site_i, site_j = site_i[order], site_j[order]
+
+        # A site is matched once all the earlier sites it could match are settled
+        matches = np.full(len(coords), -2)  # -2: undecided, -1: unmatched, otherwise matching site
+        while (undecided := matches == -2).any():
+            match_status = matches[site_j]
+            settled = undecided & (np.bincount(site_i[match_status == -2], minlength=len(coords)) == 0)
+            matches[settled] = -1
+            is_candidate = settled[site_i] & (match_status == -1)
+            # Candidates are sorted by symmetry operation and then site
+            matched, first = np.unique(site_i[is_candidate], return_index=True)
+            matches[matched] = site_j[is_candidate][first]
+        return [None if match == -1 else int(match) for match in matches]
+
     def get_lattice(
         self,
         data: CifBlock,
@@ -1022,19 +1107,6 @@ class CifParser:
             num_h = {"Wat": 2, "wat": 2, "O-H": 1}
             return num_h.get(symbol[:3], 0)
 
-        def get_matching_coord(
-            coord_to_species: dict[tuple[float, float, float], Composition],
-            coord: tuple[float, float, float],
-        ) -> tuple[float, float, float] | Literal[False]:
-            """Find site by coordinate."""
-            coords: list[tuple[float, float, float]] = list(coord_to_species)
-            for op in self.symmetry_operations:
-                frac_coord = op.operate(coord)
-                indices: NDArray = find_in_coord_list_pbc(coords, frac_coord, atol=self._site_tolerance)
-                if len(indices) > 0:
-                    return coords[indices[0]]
-            return False
-
         lattice = self.get_lattice(data)
 
         # Check minimal lattice thickness
@@ -1064,6 +1136,9 @@ class CifParser:
         coord_to_magmoms: dict[tuple[float, float, float], NDArray] = {}
         labels: dict[tuple[float, float, float], str] = {}
 
+        site_coords: list[tuple[float, float, float]] = []
+        site_comps: list[Composition] = []
+        site_labels: list[str] = []
         for idx, label in enumerate(data["_atom_site_label"]):
             # If site type symbol exists, use it. Otherwise use the label
             try:
@@ -1114,20 +1189,25 @@ class CifParser:
                         "Structure has implicit hydrogens defined, parsed structure unlikely to be "
                         "suitable for use in calculations unless hydrogens added."
                     )
-                comp = Composition(comp_dict)
+                site_coords.append(coord)
+                site_comps.append(Composition(comp_dict))
+                site_labels.append(label)
 
-                # Find matching site by coordinate
-                match: tuple[float, float, float] | Literal[False] = get_matching_coord(coord_to_species, coord)
-                if match is False:
-                    coord_to_species[coord] = comp
-                    coord_to_magmoms[coord] = magmoms.get(label, np.array([0, 0, 0]))
-                    labels[coord] = label
+        # Find matching sites by coordinate
+        for coord, comp, label, match in zip(
+            site_coords, site_comps, site_labels, self._get_matching_sites(site_coords), strict=True
+        ):
+            if match is None:
+                coord_to_species[coord] = comp
+                coord_to_magmoms[coord] = magmoms.get(label, np.array([0, 0, 0]))
+                labels[coord] = label
 
-                else:
-                    coord_to_species[match] += comp
-                    # Disordered magnetic currently not supported
-                    coord_to_magmoms[match] = None  # type:ignore[assignment]
-                    labels[match] = label
+            else:
+                match_coord = site_coords[match]
+                coord_to_species[match_coord] += comp
+                # Disordered magnetic currently not supported
+                coord_to_magmoms[match_coord] = None  # type:ignore[assignment]
+                labels[match_coord] = label
 
         # Check occupancy
         _sum_occupancies: list[float] = [
@@ -1358,6 +1438,80 @@ class CifParser:
             raise ValueError("Invalid CIF file with no structures!")
         return structures
 
+    @classmethod
+    def iter_structures(
+        cls,
+        filename: PathLike | Iterable[str],
+        *,
+        block_filter: Callable[[CifBlock], bool] | None = None,
+        primitive: bool = False,
+        symmetrized: bool = False,
+        check_occu: bool = True,
+        on_error: Literal["ignore", "warn", "raise"] = "warn",
+        n_jobs: int = 1,
+        **kwargs,
+    ) -> Iterator[Structure]:
+        """Lazily parse the structures of a CIF file with many data blocks, e.g. a
+        COD or ICSD dump. Blocks are read one at a time, so neither the file nor
+        its tokens are held in memory as a whole.
+
+        Args:
+            filename: CIF file, gzipped or bzipped CIF files are fine too, or an
+                open text file or other iterable of lines.
+            block_filter (Callable[[CifBlock], bool]): Structures are only parsed
+                for the CifBlocks for which this returns True. It is called on the
+                raw tokenized block, before any structure construction, so it
+                should only look at cheap header fields, e.g.
+                block.data.get("_chemical_formula_sum") or
+                CifParser.get_lattice_no_exception(block). Defaults to None,
+                i.e. all blocks are parsed.
+            primitive (bool): Whether to return primitive unit cells. Defaults to False.
+            symmetrized (bool): Whether to return SymmetrizedStructures, see
+                parse_structures.
+            check_occu (bool): Whether to check site for unphysical occupancy > 1.
+                Defaults to True.
+            on_error ("ignore" | "warn" | "raise"): What to do in case of KeyError
+                or ValueError while parsing a block. Defaults to "warn".
+            n_jobs (int): Number of worker processes over which the structure
+                construction is distributed (via joblib). Defaults to 1, i.e.
+                serial. -1 uses all available CPUs.
+            **kwargs: Passed to CifParser.from_str, e.g. occupancy_tolerance.
+
+        Yields:
+            Structure: Structures in the order of the data blocks.
+        """
+        if primitive and symmetrized:
+            raise ValueError(
+                "Using both 'primitive' and 'symmetrized' arguments is not currently supported "
+                "since unexpected behavior might result."
+            )
+
+        blocks = CifFile.iter_blocks(filename)
+        if block_filter is not None:
+            blocks = filter(block_filter, blocks)
+        args = (primitive, symmetrized, check_occu, kwargs)
+        if n_jobs == 1:
+            results: Iterable = (_parse_cif_block(block, *args) for block in blocks)
+        else:
+            results = Parallel(n_jobs=n_jobs, return_as="generator")(
+                delayed(_parse_cif_block)(block, *args) for block in blocks
+            )
+
+        for struct, exc, parser_warnings, caught_warnings in results:
+            # Warnings of the workers are lost otherwise, so re-emit them here
+            for message, category in caught_warnings:
+                warnings.warn(message, category, stacklevel=2)
+            if exc is not None:
+                msg = f"No structure parsed for section {exc[0]} in CIF.\n{exc[1]}"
+                if on_error == "raise":
+                    raise ValueError(msg)
+                if on_error == "warn":
+                    warnings.warn(msg, stacklevel=2)
+            if parser_warnings and on_error == "warn":
+                warnings.warn("Issues encountered while parsing CIF: " + "\n".join(parser_warnings), stacklevel=2)
+            if struct:
+                yield struct
+
     @deprecated(
         parse_structures,
         message="The only difference is that primitive defaults to False in the new parse_structures method."
@@ -1541,6 +1695,121 @@ class CifParser:
         return failure_reason
 
 
+def _parse_cif_block(
+    block: CifBlock,
+    primitive: bool,
+    symmetrized: bool,
+    check_occu: bool,
+    parser_kwargs: dict[str, Any],
+) -> tuple[Structure | None, tuple[str, str] | None, list[str], list[tuple[str, type[Warning]]]]:
+    """Parse the structure of a single CifBlock for CifParser.iter_structures.
+    Must not be in the class so that it can be pickled.
+
+    Returns:
+        tuple: Structure (None if not parsed), (block header, error message) if
+            parsing failed, the parser warnings and the (message, category) of
+            the warnings raised while parsing, to be re-emitted by the caller.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        parser = CifParser._from_cif_file(CifFile({block.header: block}), **parser_kwargs)
+        try:
+            struct = parser._get_structure(
+                parser._cif.data[block.header], primitive, symmetrized, check_occu=check_occu
+            )
+        except (KeyError, ValueError) as exc:
+            struct, error = None, (block.header, str(exc))
+        else:
+            error = None
+    return struct, error, parser.warnings, [(str(warning.message), warning.category) for warning in caught]
+
+
+def _apply_symmetry_operations(ops: Sequence[SymmOp], coords: Sequence[Sequence[float]]) -> NDArray:
+    """Apply all symmetry operations to all fractional coordinates at once.
+
+    Returns:
+        NDArray: images of shape (len(coords), len(ops), 3).
+    """
+    affine = np.array([op.affine_matrix for op in ops])
+    coords = np.reshape(np.asarray(coords, dtype=float), (-1, 3))
+    return np.einsum("oij,nj->noi", affine[:, :3, :3], coords) + affine[None, :, :3, 3]
+
+
+def _find_pbc_matches(coords: NDArray, targets: NDArray, atol: float) -> tuple[NDArray, NDArray]:
+    """Find all pairs of fractional coordinates that are equal within atol under
+    periodic boundary conditions, as find_in_coord_list_pbc does for a single
+    coordinate. Candidates are only compared within neighboring cells of a grid
+    whose spacing is at least atol.
+
+    Args:
+        coords (NDArray): Fractional coordinates to match.
+        targets (NDArray): Fractional coordinates to match against.
+        atol (float): Absolute tolerance on each fractional coordinate.
+
+    Returns:
+        tuple[NDArray, NDArray]: Indices i into coords and j into targets of
+            all matching pairs, sorted by i and then j.
+    """
+    empty = np.array([], dtype=np.int_)
+    if atol <= 0 or len(coords) == 0 or len(targets) == 0:
+        return empty, empty
+
+    # Cap the number of cells so that the cell keys fit in int64
+    n_cells = min(max(int(1 / atol), 1), 2**20)
+
+    def get_cells(frac_coords: NDArray) -> NDArray:
+        return np.floor((frac_coords - np.floor(frac_coords)) * n_cells).astype(np.int64) % n_cells
+
+    def get_keys(cells: NDArray) -> NDArray:
+        return (cells[:, 0] * n_cells + cells[:, 1]) * n_cells + cells[:, 2]
+
+    target_keys = get_keys(get_cells(targets))
+    order = np.argsort(target_keys, kind="stable")
+    sorted_keys = target_keys[order]
+    coord_cells = get_cells(coords)
+
+    all_i, all_j = [], []
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        keys = get_keys((coord_cells + offset) % n_cells)
+        start = np.searchsorted(sorted_keys, keys, side="left")
+        counts = np.searchsorted(sorted_keys, keys, side="right") - start
+        i = np.repeat(np.arange(len(coords)), counts)
+        offsets_in_cell = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+        all_i.append(i)
+        all_j.append(order[np.repeat(start, counts) + offsets_in_cell])
+    i, j = np.concatenate(all_i), np.concatenate(all_j)
+
+    frac_dist = coords[i] - targets[j]
+    frac_dist -= np.round(frac_dist)
+    is_match = np.all(np.abs(frac_dist) < atol, axis=1)
+    # Neighboring cells coincide on grids with fewer than 3 cells
+    pairs = np.unique(np.stack([i[is_match], j[is_match]], axis=1), axis=0).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _get_unique_coords_mask(coords: NDArray, atol: float) -> NDArray:
+    """Get which fractional coordinates are kept when they are added one by one
+    to a list, skipping those already in it within atol under periodic boundary
+    conditions.
+
+    Returns:
+        NDArray: Boolean mask of the kept coordinates.
+    """
+    i, j = _find_pbc_matches(coords, coords, atol)
+    i, j = i[j < i], j[j < i]
+
+    # A coordinate is kept if none of the earlier coordinates it matches is kept,
+    # which is settled once all of these are settled
+    status = np.full(len(coords), -1)  # -1: undecided, 0: skipped, 1: kept
+    while (undecided := status == -1).any():
+        match_status = status[j]
+        has_kept_match = np.bincount(i[match_status == 1], minlength=len(coords)) > 0
+        has_undecided_match = np.bincount(i[match_status == -1], minlength=len(coords)) > 0
+        status[undecided & has_kept_match] = 0
+        status[undecided & ~has_kept_match & ~has_undecided_match] = 1
+    return status == 1
+
+
 def str2float(text: str) -> float:
     """Remove uncertainty brackets from strings and return the float."""
     try:
@@ -309,6 +309,7 @@ class VolumetricData(MSONable):
         to this file format is as follows:
 
         VolumetricData.data -> f["vdata"]
+        VolumetricData.data_aug -> f["vdata_aug"]
         VolumetricData.structure ->
             f["Z"]: Sequence of atomic numbers
             f["fcoords"]: Fractional coords
@@ -316,6 +317,9 @@ class VolumetricData(MSONable):
                 format
             f.attrs["structure_json"]: String of JSON representation
 
+        The volumetric data are stored as contiguous datasets so that they can
+        be memory-mapped by from_hdf5.
+
         Args:
             filename (str): Filename to output to.
         """
@@ -335,27 +339,46 @@ class VolumetricData(MSONable):
             for k in self.data:
                 ds = grp.create_dataset(k, self.data[k].shape, dtype="float")
                 ds[...] = self.data[k]
+            grp = file.create_group("vdata_aug")
+            for k, lines in self.data_aug.items():
+                # Augmentation data are stored as the raw lines of the source file
+                if lines is not None and all(isinstance(line, str) for line in lines):
+                    grp.create_dataset(k, data=list(lines), dtype=dt)
             file.attrs["name"] = self.name
             file.attrs["structure_json"] = orjson.dumps(self.structure.as_dict()).decode()
 
     @classmethod
-    def from_hdf5(cls, filename: PathLike, **kwargs) -> Self:
+    def from_hdf5(cls, filename: PathLike, mmap: bool = False, **kwargs) -> Self:
         """
         Reads VolumetricData from HDF5 file.
 
         Args:
             filename: Filename
+            mmap (bool): Whether to memory-map the volumetric data instead of
+                reading it into memory. The arrays are copy-on-write, i.e.
+                modifications are never written back to the file. Only
+                contiguous (uncompressed, unchunked) datasets such as those
+                written by to_hdf5 can be mapped; others are read as usual.
+                Defaults to False.
 
         Returns:
             VolumetricData
         """
         import h5py
 
+        def read_dataset(ds):
+            if h5py.check_string_dtype(ds.dtype):
+                return list(ds.asstr()[...])
+            offset = ds.id.get_offset() if mmap else None
+            if offset is None:
+                return np.asarray(ds)
+            return np.memmap(filename, dtype=ds.dtype, mode="c", offset=offset, shape=ds.shape)
+
         with h5py.File(str(filename), mode="r") as file:
-            data = {k: np.asarray(v) for k, v in file["vdata"].items()}
+            data = {k: read_dataset(v) for k, v in file["vdata"].items()}
             data_aug = None
             if "vdata_aug" in file:
-                data_aug = {k: np.asarray(v) for k, v in file["vdata_aug"].items()}
+                data_aug = {k: read_dataset(v) for k, v in file["vdata_aug"].items()}
             structure = Structure.from_dict(orjson.loads(file.attrs["structure_json"]))
             return cls(structure, data=data, data_aug=data_aug, **kwargs)  # type:ignore[arg-type]
 
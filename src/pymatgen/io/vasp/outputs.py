@@ -9,13 +9,14 @@ import math
 import os
 import re
 import warnings
-from collections import defaultdict
-from collections.abc import Iterable
+from collections import defaultdict, deque
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from functools import wraps
 from glob import glob
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, cast, overload
 from xml.etree import ElementTree as ET
 
 import numpy as np
@@ -42,7 +43,7 @@ from pymatgen.io.common import VolumetricData as BaseVolumetricData
 from pymatgen.io.core import ParseError
 from pymatgen.io.vasp.inputs import Incar, Kpoints, KpointsSupportedModes, Poscar, Potcar
 from pymatgen.io.wannier90 import Unk
-from pymatgen.util.io_utils import clean_lines, micro_pyawk
+from pymatgen.util.io_utils import clean_lines
 from pymatgen.util.num import make_symmetric_matrix_from_upper_tri
 
 try:
@@ -51,8 +52,8 @@ except ImportError:
     h5py = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
-    from typing import Literal, TypeAlias
+    from collections.abc import Callable, Collection, Generator, Iterator
+    from typing import ClassVar, Literal, TextIO, TypeAlias
 
     # Avoid name conflict with pymatgen.core.Element
     from xml.etree.ElementTree import Element as XML_Element
@@ -60,8 +61,13 @@ if TYPE_CHECKING:
     from numpy.typing import NDArray
     from typing_extensions import Self
 
+    from pymatgen.core import Species
     from pymatgen.util.typing import Kpoint, PathLike
 
+    # Generators sent the lines of an OUTCAR, see Outcar.read_sections
+    _LineConsumer: TypeAlias = Generator[None, str, Any]
+    _SectionReader: TypeAlias = "Generator[tuple[_LineConsumer | _ReverseGrep, ...], tuple[Any, ...], Any]"
+
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +155,435 @@ def _parse_vasp_array(elem) -> list[list[bool]] | NDArray[np.float64]:
         return np.array([list(map(_vasprun_float, e.text.split())) for e in elem])
 
 
+# Blocks of a vasprun.xml <calculation> holding the bulk of the data
+VASPRUN_HEAVY_TAGS = ("dos", "eigenvalues", "projected", "eigenvalues_kpoints_opt", "projected_kpoints_opt")
+
+
+def _get_vasprun_calculation_offsets(filename: PathLike, chunk_size: int = 2**24) -> list[tuple[int, int]]:
+    """Get the byte offsets of the complete <calculation> blocks of a
+    vasprun.xml by scanning the raw (decompressed) bytes, without parsing XML.
+
+    Args:
+        filename (PathLike): Path to vasprun.xml.
+        chunk_size (int): Number of bytes scanned at once.
+
+    Returns:
+        list[tuple[int, int]]: (start, end) byte offsets of each block.
+    """
+    pattern = re.compile(rb"<calculation>|</calculation>")
+    offsets: list[tuple[int, int]] = []
+    start: int | None = None
+    pos = 0
+    buffer = b""
+    with zopen(filename, mode="rb") as file:
+        while chunk := file.read(chunk_size):
+            buffer += chunk
+            last_end = 0
+            for match in pattern.finditer(buffer):
+                if match.group() == b"<calculation>":
+                    start = pos + match.start()
+                elif start is not None:
+                    offsets.append((start, pos + match.end()))
+                    start = None
+                last_end = match.end()
+            # Keep enough of the buffer to match a tag split across chunks
+            keep = max(last_end, len(buffer) - len(b"</calculation>") + 1)
+            pos += keep
+            buffer = buffer[keep:]
+    return offsets
+
+
+def _remove_vasprun_blocks(content: bytes, tags: Collection[str]) -> tuple[bytes, list[tuple[str, bytes]]]:
+    """Remove outermost heavy data blocks (see VASPRUN_HEAVY_TAGS) from the raw
+    bytes of a vasprun.xml fragment so that they are never parsed as XML.
+
+    Args:
+        content (bytes): Raw XML.
+        tags (Collection[str]): Tags of the blocks to remove. Blocks nested in
+            another heavy block are only removed along with their parent.
+
+    Returns:
+        tuple[bytes, list[tuple[str, bytes]]]: The content without the
+            blocks, and the (tag, raw XML) of the removed blocks.
+    """
+    pattern = re.compile(rb"<(/?)(" + "|".join(VASPRUN_HEAVY_TAGS).encode() + rb")[\s>]")
+    parts = []
+    removed = []
+    depth = last = block_start = 0
+    block_tag = ""
+    for match in pattern.finditer(content):
+        if not match[1]:
+            if depth == 0:
+                block_start, block_tag = match.start(), match[2].decode()
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0 and block_tag in tags:
+            parts.append(content[last:block_start])
+            removed.append((block_tag, content[block_start : match.end()]))
+            last = match.end()
+    parts.append(content[last:])
+    return b"".join(parts), removed
+
+
+def _get_outcar_section_offsets(
+    filename: PathLike,
+    anchors: dict[str, Sequence[str]],
+    chunk_size: int = 2**20,
+) -> dict[str, int | None]:
+    """Get the byte offsets of sections of an OUTCAR by scanning the raw
+    (decompressed) bytes once for the first occurrence of their anchors.
+
+    A section starts at the beginning of the line preceding its earliest
+    anchor, as some table headers begin one line before the anchor text.
+
+    Args:
+        filename (PathLike): Path to OUTCAR.
+        anchors (dict[str, Sequence[str]]): Literal anchor strings of each section.
+        chunk_size (int): Number of bytes scanned at once.
+
+    Returns:
+        dict[str, int | None]: Start offset of each section, None if not found.
+    """
+    sections_of: dict[bytes, list[str]] = defaultdict(list)
+    for section, section_anchors in anchors.items():
+        for anchor in section_anchors:
+            sections_of[anchor.encode()].append(section)
+
+    offsets: dict[str, int | None] = dict.fromkeys(anchors)
+    pending = set(sections_of)
+    pos = 0
+    buffer = b""
+    with zopen(filename, mode="rb") as file:
+        while pending and (chunk := file.read(chunk_size)):
+            buffer += chunk
+            for anchor in list(pending):
+                if (idx := buffer.find(anchor)) == -1:
+                    continue
+                pending.remove(anchor)
+                line_end = buffer.rfind(b"\n", 0, idx)
+                start = pos + buffer.rfind(b"\n", 0, max(line_end, 0)) + 1
+                for section in sections_of[anchor]:
+                    if offsets[section] is None or start < offsets[section]:  # type:ignore[operator]
+                        offsets[section] = start
+            # Keep the last two lines, so that both an anchor split across
+            # chunks and the line preceding it are in the next buffer
+            last_newline = buffer.rfind(b"\n")
+            keep = buffer.rfind(b"\n", 0, max(last_newline, 0)) + 1
+            pos += keep
+            buffer = buffer[keep:]
+    return offsets
+
+
+@dataclass(frozen=True)
+class _ReverseGrep:
+    """Stand-in for the line consumer of a reverse search that stops once
+    each pattern matched, see _grep_lines. Outcar._run_readers runs it on the
+    file read backwards instead of sending it lines, so that the final values
+    of a long OUTCAR are found without reading all of it.
+    """
+
+    patterns: dict[str, str]
+    postprocess: Callable
+
+    def run(self, filename: PathLike) -> dict[str, list[list]]:
+        """
+        Args:
+            filename (PathLike): Path to OUTCAR.
+
+        Returns:
+            dict[str, list[list]]: The processed groups of each match of each key.
+        """
+        matches = regrep(
+            filename=filename,
+            patterns=self.patterns,
+            reverse=True,
+            terminate_on_match=True,
+            postprocess=self.postprocess,
+        )
+        return {key: [match[0] for match in matches.get(key, [])] for key in self.patterns}
+
+
+def _grep_lines(
+    patterns: dict[str, str],
+    reverse: bool = False,
+    terminate_on_match: bool = False,
+    postprocess: Callable = str,
+) -> _LineConsumer | _ReverseGrep:
+    r"""Line consumer matching patterns like monty's regrep.
+
+    Only the groups of matching lines are kept. With reverse, they are
+    collected while reading forward and then taken in reverse order, which
+    gives the same result as reading the file backwards. With reverse and
+    terminate_on_match, the file is read backwards instead, see _ReverseGrep.
+
+    Args:
+        patterns (dict[str, str]): Patterns, e.g.
+            {"energy": r"energy\\(sigma->0\\)\\s+=\\s+([\\d\\-.]+)"}.
+        reverse (bool): Whether to return the matches as for a file read in reverse.
+        terminate_on_match (bool): Whether to stop once there is at least one
+            match for each key in patterns.
+        postprocess (Callable): A post processing function to convert all matches.
+
+    Returns:
+        dict[str, list[list]]: The processed groups of each match of each key.
+    """
+    if reverse and terminate_on_match:
+        return _ReverseGrep(patterns, postprocess)
+    return _grep_line_consumer(patterns, reverse, terminate_on_match, postprocess)
+
+
+def _grep_line_consumer(
+    patterns: dict[str, str],
+    reverse: bool,
+    terminate_on_match: bool,
+    postprocess: Callable,
+) -> _LineConsumer:
+    """The line consumer of _grep_lines."""
+    compiled = [(key, re.compile(pattern)) for key, pattern in patterns.items()]
+    line_matches: list[list[tuple[str, tuple]]] = []
+    pending = set(patterns)
+    while line := (yield):
+        if found := [(key, match.groups()) for key, regex in compiled if (match := regex.search(line))]:
+            line_matches.append(found)
+            if terminate_on_match:
+                pending.difference_update(key for key, _groups in found)
+                if not pending:
+                    break
+
+    matches: dict[str, list[list]] = {key: [] for key in patterns}
+    for found in reversed(line_matches) if reverse else line_matches:
+        for key, groups in found:
+            matches[key].append([postprocess(group) for group in groups])
+    return matches
+
+
+def _pyawk_lines(search: list, results: Any) -> _LineConsumer:
+    """Line consumer running a micro_pyawk search program.
+
+    Args:
+        search (list): The [(regex, test, run), ...] program, see micro_pyawk.
+        results (Any): The object passed to test and run.
+
+    Returns:
+        Any: The updated results.
+    """
+    searches = [(re.compile(regex), test, run) for regex, test, run in search]
+    while line := (yield):
+        for regex, test, run in searches:
+            if (match := regex.search(line)) is not None and (test is None or test(results, line)):
+                run(results, match)
+    return results
+
+
+def _read_tables(
+    header_pattern: str,
+    row_pattern: str,
+    footer_pattern: str,
+    *,
+    postprocess: Callable = str,
+    last_one_only: bool = True,
+    first_one_only: bool = False,
+    anchors: Sequence[str] = (),
+    context: int = 3,
+) -> _LineConsumer:
+    """Line consumer parsing tables, see Outcar.read_table_pattern.
+
+    With anchors, which must appear in every table header, only the lines
+    from an anchor (and the context lines before it) on are buffered, so a
+    table whose header has no anchor is only found if it starts at most
+    context lines before the next anchor. The
+    buffer is matched whenever a line arrives that can end a table, i.e. one
+    that is neither a row nor blank. Tables found are removed from the
+    buffer, and so is the text that can no longer start a table. Without
+    anchors, the tables are matched once all lines are read.
+
+    Args:
+        header_pattern (str): The table header pattern.
+        row_pattern (str): The pattern of a single table row.
+        footer_pattern (str): The table footer pattern.
+        postprocess (Callable): A post processing function to convert all matches.
+        last_one_only (bool): Whether to only return the last table.
+        first_one_only (bool): Whether to stop after the first table, and only return it.
+        anchors (Sequence[str]): Literal text found in every table header.
+        context (int): Number of lines before an anchor that may be part of
+            the table header.
+
+    Returns:
+        list: The tables, or a single table if last_one_only/first_one_only is True.
+    """
+    table_pattern = re.compile(
+        header_pattern + r"\s*^(?P<table_body>(?:\s+" + row_pattern + r")+)\s+" + footer_pattern,
+        re.MULTILINE | re.DOTALL,
+    )
+    rp = re.compile(row_pattern)
+
+    TableData: TypeAlias = list[list[Any] | dict[str, Any]]
+    tables: list[TableData] = []
+
+    def add_tables(text: str) -> int:
+        """Parse the tables in text, return the end of the last one."""
+        end = 0
+        for mt in table_pattern.finditer(text):
+            table_contents: TableData = []
+            for line in mt.group("table_body").split("\n"):
+                ml = rp.search(line)
+                # Skip empty lines
+                if not ml:
+                    continue
+                d = ml.groupdict()
+                if len(d) > 0:
+                    processed_line: list[Any] | dict[str, Any] = {k: postprocess(v) for k, v in d.items()}
+                else:
+                    processed_line = [postprocess(v) for v in ml.groups()]
+                table_contents.append(processed_line)
+            if last_one_only:
+                tables.clear()
+            tables.append(table_contents)
+            end = mt.end()
+            if first_one_only:
+                break
+        return end
+
+    if not anchors:
+        lines = []
+        while line := (yield):
+            lines.append(line)
+        add_tables("".join(lines))
+
+    else:
+        header_regex = re.compile(header_pattern, re.MULTILINE | re.DOTALL)
+        body_regex = re.compile(r"\s*^(?:\s+" + row_pattern + r")+", re.MULTILINE | re.DOTALL)
+        recent: deque[str] = deque(maxlen=context)
+        buffer: list[str] = []
+        while line := (yield):
+            if not buffer:
+                if not any(anchor in line for anchor in anchors):
+                    recent.append(line)
+                    continue
+                buffer.extend(recent)
+            buffer.append(line)
+            if line.isspace() or rp.search(line):
+                continue
+
+            text = "".join(buffer)
+            text = text[add_tables(text) :]
+            if first_one_only and tables:
+                break
+
+            # Keep the text from the start of the last table that may still be
+            # completed, i.e. a header followed by nothing but rows, or else
+            # from the context of the last anchor after that header
+            headers = list(header_regex.finditer(text))
+            header = headers[-1] if headers else None
+            start = None
+            if header is not None:
+                body = body_regex.match(text, header.end())
+                if not text[body.end() if body else header.end() :].strip():
+                    start = header.start()
+            if start is None:
+                anchor_pos = max(text.rfind(anchor) for anchor in anchors)
+                if anchor_pos != -1 and (header is None or anchor_pos > header.start()):
+                    start = anchor_pos
+                    for _ in range(context + 1):
+                        start = text.rfind("\n", 0, start) if start > 0 else -1
+                    start += 1
+            if start is None:
+                recent.extend(text.splitlines(keepends=True))
+                buffer = []
+            else:
+                buffer = [text[start:]]
+        else:
+            if buffer:
+                add_tables("".join(buffer))
+
+    if last_one_only or first_one_only:
+        return tables[-1]
+    return tables
+
+
+def _section_reader(method: Callable[..., _SectionReader]) -> Callable[..., Any]:
+    """Decorate an Outcar section reader, i.e. a generator method yielding
+    line consumers (see Outcar.read_sections), so that calling it runs the
+    reader on its own in a single pass over the file.
+    """
+
+    @wraps(method)
+    def read(self: Outcar, *args, **kwargs) -> Any:
+        return self._run_readers([method(self, *args, **kwargs)])[0]
+
+    return read
+
+
+def _get_xdatcar_frame_offsets(
+    filename: PathLike,
+    chunk_size: int = 2**24,
+) -> tuple[list[str], int, list[tuple[int, int]], dict[int, list[str]]]:
+    """Get the byte offsets of the coordinates of each frame of a VASP 5+
+    XDATCAR by scanning the raw (decompressed) bytes for the
+    "Direct configuration=" headers, without parsing the coordinates.
+
+    Args:
+        filename (PathLike): Path to XDATCAR.
+        chunk_size (int): Number of bytes scanned at once.
+
+    Returns:
+        tuple: The lines before the first header, the number of sites, the
+            (start, end) byte offsets of the block following each header, and
+            the non-empty lines after the coordinates of a block (i.e. the
+            preamble of a variable cell XDATCAR), keyed by the index of the
+            next frame.
+    """
+    header = b"Direct configuration="
+    preamble: list[str] = []
+    n_sites = 0
+    starts: list[int] = []
+    ends: list[int] = []
+    extra_lines: dict[int, list[str]] = {}
+    frame_start: int | None = None
+    search_from = pos = 0
+    buffer = b""
+    with zopen(filename, mode="rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            buffer += chunk
+            # Only look at complete lines, unless the end of file is reached
+            limit = len(buffer) if not chunk else buffer.rfind(b"\n") + 1
+            while (idx := buffer.find(header, search_from, limit)) != -1:
+                line_start = buffer.rfind(b"\n", 0, idx) + 1
+                line_end = buffer.find(b"\n", idx, limit) + 1 or limit
+                if frame_start is None:
+                    preamble = buffer[:line_start].decode("utf-8").strip().splitlines()
+                    # The number of atoms of each species are the integer lines after the lattice
+                    n_sites = sum(
+                        sum(map(int, line.split()))
+                        for line in preamble[5:]
+                        if line.split() and all(tok.isdigit() for tok in line.split())
+                    )
+                else:
+                    block = buffer[frame_start:line_start]
+                    if block.count(b"\n") > n_sites:
+                        lines = block.decode("utf-8").split("\n")[n_sites:]
+                        if lines := [line.strip() for line in lines if line.strip()]:
+                            extra_lines[len(ends) + 1] = lines
+                    ends.append(pos + line_start)
+                starts.append(pos + line_end)
+                frame_start = search_from = line_end
+
+            if not chunk:
+                if frame_start is not None:
+                    ends.append(pos + len(buffer))
+                break
+            # Keep the coordinates of the last (possibly incomplete) frame
+            keep = 0 if frame_start is None else frame_start
+            pos += keep
+            buffer = buffer[keep:]
+            search_from = limit - keep
+            if frame_start is not None:
+                frame_start = 0
+    return preamble, n_sites, list(zip(starts, ends, strict=True)), extra_lines
+
+
 def _parse_from_incar(filename: PathLike, key: str) -> Any:
     """Helper function to parse a parameter from the INCAR."""
     dirname = os.path.dirname(filename)
@@ -216,6 +651,65 @@ class KpointOptProps:
         self.projected_magnetization = value
 
 
+class VasprunIonicSteps(Sequence):
+    """Lazily-materialized sequence of the ionic steps of a vasprun.xml, backed
+    by the byte offsets of its <calculation> blocks. A step is parsed from the
+    file only when it is accessed, and is not kept in memory afterwards unless
+    it was cached at construction. Used by Vasprun with lazy_ionic_steps=True.
+    """
+
+    def __init__(
+        self,
+        filename: PathLike,
+        offsets: list[tuple[int, int]],
+        parse_step: Callable[[XML_Element], dict[str, Any]],
+        cache: dict[tuple[int, int], dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Args:
+            filename (PathLike): Path to vasprun.xml.
+            offsets (list[tuple[int, int]]): (start, end) byte offsets of the
+                <calculation> block of each ionic step.
+            parse_step (Callable): Function parsing an ionic step from its
+                <calculation> element, e.g. Vasprun._parse_ionic_step.
+            cache (dict): Already parsed steps, keyed by their offsets.
+        """
+        self.filename = filename
+        self.offsets = offsets
+        self._parse_step = parse_step
+        self._cache = cache if cache is not None else {}
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @overload
+    def __getitem__(self, idx: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> VasprunIonicSteps: ...
+
+    def __getitem__(self, idx: int | slice) -> dict[str, Any] | VasprunIonicSteps:
+        if isinstance(idx, slice):
+            return type(self)(self.filename, self.offsets[idx], self._parse_step, cache=self._cache)
+        with zopen(self.filename, mode="rb") as file:
+            return self._load(file, self.offsets[idx])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        # Read the steps in order through a single file handle, which is
+        # important for compressed files that can only be seeked forward.
+        with zopen(self.filename, mode="rb") as file:
+            for offsets in self.offsets:
+                yield self._load(file, offsets)
+
+    def _load(self, file, offsets: tuple[int, int]) -> dict[str, Any]:
+        if offsets in self._cache:
+            return self._cache[offsets]
+        start, end = offsets
+        file.seek(start)
+        content, _ = _remove_vasprun_blocks(file.read(end - start), VASPRUN_HEAVY_TAGS)
+        return self._parse_step(ET.fromstring(content))
+
+
 @dataclass
 class BandgapProps(MSONable):
     vbm: float | None = None
@@ -301,6 +795,7 @@ class Vasprun(MSONable):
         occu_tol: float = 1e-8,
         separate_spins: bool = False,
         exception_on_bad_xml: bool = True,
+        lazy_ionic_steps: bool = False,
     ) -> None:
         """
         Args:
@@ -349,6 +844,14 @@ class Vasprun(MSONable):
                 proper vasprun.xml are parsed. You can set to False if you want
                 partial results (e.g., if you are monitoring a calculation during a
                 run), but use the results with care. A warning is issued.
+            lazy_ionic_steps (bool): Whether to only parse the final ionic step
+                up front. If True, ionic_steps is a VasprunIonicSteps sequence
+                that reads each step from the file on access, and the DOS,
+                eigenvalue and projection blocks not requested by the parse_*
+                arguments are skipped without being parsed as XML. This keeps
+                memory flat for long MD/relaxation runs. Random access to the
+                steps is only efficient for uncompressed files. Runs with
+                LCHIMAG or ML_LMLFF are always parsed eagerly. Defaults to False.
         """
         self.filename = filename
         self.ionic_step_skip = ionic_step_skip
@@ -358,7 +861,13 @@ class Vasprun(MSONable):
         self.exception_on_bad_xml = exception_on_bad_xml
 
         with zopen(filename, mode="rt", encoding="utf-8") as file:
-            if ionic_step_skip or ionic_step_offset:
+            if lazy_ionic_steps and self._parse_lazily(
+                parse_dos=parse_dos,
+                parse_eigen=parse_eigen,
+                parse_projected_eigen=parse_projected_eigen,
+            ):
+                pass
+            elif ionic_step_skip or ionic_step_offset:
                 # Remove parts of the xml file and parse the string
                 content: str = file.read()  # type:ignore[assignment]
                 steps: list[str] = content.split("<calculation>")
@@ -616,6 +1125,57 @@ class Vasprun(MSONable):
         self.md_data = md_data
         self.vasp_version = self.generator["version"]
 
+    def _parse_lazily(
+        self,
+        parse_dos: bool,
+        parse_eigen: bool,
+        parse_projected_eigen: bool,
+    ) -> bool:
+        """Parse the header, the final selected ionic step and the tail of the
+        vasprun.xml, and set ionic_steps to a VasprunIonicSteps sequence that
+        reads the other steps on access.
+
+        Returns:
+            bool: False if the file cannot be parsed lazily, in which case no
+                attribute has been set.
+        """
+        offsets = _get_vasprun_calculation_offsets(self.filename)
+        selected = offsets[self.ionic_step_offset :: int(self.ionic_step_skip or 1)]
+        if not selected:
+            return False
+
+        with zopen(self.filename, mode="rb") as file:
+            preamble = file.read(offsets[0][0])
+            if re.search(rb'name="(LCHIMAG|ML_LMLFF)">\s*T', preamble):
+                return False
+            file.seek(selected[-1][0])
+            last_step = file.read(selected[-1][1] - selected[-1][0])
+            file.seek(offsets[-1][1])
+            tail = file.read()
+
+        # Blocks nested in <projected> are also read as plain eigenvalues
+        skip_tags = {"dos"} if not parse_dos else set()
+        if not parse_eigen:
+            skip_tags.add("eigenvalues")
+        if not (parse_eigen or parse_projected_eigen):
+            skip_tags |= {"projected", "projected_kpoints_opt"}
+        last_step, _ = _remove_vasprun_blocks(last_step, skip_tags)
+
+        self._parse(
+            BytesIO(preamble + last_step + tail),
+            parse_dos=parse_dos,
+            parse_eigen=parse_eigen,
+            parse_projected_eigen=parse_projected_eigen,
+        )
+        self.nionic_steps = len(offsets)
+        self.ionic_steps = VasprunIonicSteps(  # type:ignore[assignment]
+            self.filename,
+            selected,
+            self._parse_ionic_step,
+            cache={selected[-1]: self.ionic_steps[-1]},
+        )
+        return True
+
     @property
     def structures(self) -> list[Structure]:
         """List of Structures for each ionic step."""
@@ -1428,7 +1988,7 @@ class Vasprun(MSONable):
 
         try:
             vout = {
-                "ionic_steps": self.ionic_steps,
+                "ionic_steps": list(self.ionic_steps),
                 "final_energy": self.final_energy,
                 "final_energy_per_atom": self.final_energy / n_sites,
                 "crystal": self.final_structure.as_dict(),
@@ -1436,7 +1996,7 @@ class Vasprun(MSONable):
             }
         except (ArithmeticError, TypeError):
             vout = {
-                "ionic_steps": self.ionic_steps,
+                "ionic_steps": list(self.ionic_steps),
                 "final_energy": self.final_energy,
                 "final_energy_per_atom": None,
                 "crystal": self.final_structure.as_dict(),
@@ -2035,6 +2595,11 @@ class Outcar:
         - read_pseudo_zval
         - read_table_pattern
 
+    Several of these readers can be run together with read_sections, which
+    locates their sections (see SECTION_ANCHORS) in a single scan of the file,
+    optionally stored in a sidecar index, rather than reading the whole file
+    again in every reader.
+
     Attributes:
         magnetization (tuple[dict[str, float]]): Magnetization on each ion, e.g.
             ({"d": 0.0, "p": 0.003, "s": 0.002, "tot": 0.005}, ... ).
@@ -2080,6 +2645,55 @@ class Outcar:
     Authors: Rickard Armiento, Shyue Ping Ong
     """
 
+    # Literal text marking the sections parsed by each read_<section> method.
+    # read_sections only sends a reader the lines from the line before the
+    # earliest anchor of its section on, so every pattern of the reader must
+    # only match after that anchor. This holds since the anchors are literal
+    # parts of the text the patterns match, e.g. "the norm of the test charge
+    # is" for read_avg_core_poten. A pattern that can also match without its
+    # anchor, e.g. with other spacing, misses the matches before the anchor.
+    SECTION_ANCHORS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "avg_core_poten": ("the norm of the test charge is",),
+        "chemical_shielding": ("CSA tensor (J. Mason",),
+        "core_state_eigen": ("NIONS =", "the core state eigen"),
+        "corrections": ("dipol+quadrupol energy correction",),
+        "cs_core_contribution": ("Core NMR properties",),
+        "cs_g0_contribution": ("G=0 CONTRIBUTION TO CHEMICAL SHIFT",),
+        "cs_raw_symmetrized_tensors": ("Absolute Chemical Shift tensors",),
+        "elastic_tensor": ("TOTAL ELASTIC MODULI (kBar)",),
+        "electrostatic_potential": (
+            "dimension x,y,z NGXF=",
+            "the test charge radii are",
+            "the norm of the test charge is",
+        ),
+        "fermi_contact_shift": (
+            "Fermi contact (isotropic) hyperfine",
+            "Dipolar hyperfine coupling parameters",
+            "Total hyperfine coupling parameters",
+        ),
+        "freq_dielectric": ("plasma frequency squared", "IMAGINARY DIELECTRIC FUNCTION"),
+        "igpar": ("e<r>_ev=", "e<r>_bp=", "p[elc]=", "p[ion]="),
+        "internal_strain_tensor": ("INTERNAL STRAIN TENSOR FOR ION",),
+        "lcalcpol": ("p[elc]=", "p[sp1]=", "p[sp2]=", "Ionic dipole moment:"),
+        "lepsilon": (
+            "MACROSCOPIC STATIC DIELECTRIC TENSOR (",
+            "PIEZOELECTRIC TENSOR  for field in x, y, z",
+            "BORN EFFECTIVE CHARGES ",
+        ),
+        "lepsilon_ionic": (
+            "MACROSCOPIC STATIC DIELECTRIC TENSOR IONIC",
+            "PIEZOELECTRIC TENSOR IONIC CONTR  for field in x, y, z",
+        ),
+        "neb": ("energy(sigma->0)", "NEB: projections on to tangent", "tangential force (eV/A)"),
+        "nmr_efg": ("NMR quadrupolar parameters",),
+        "nmr_efg_tensor": ("Electric field gradients (V/A^2)",),
+        "onsite_density_matrices": ("spin component  1", "spin component  2"),
+        "piezo_tensor": ("PIEZOELECTRIC TENSOR  for field in x, y, z",),
+        "pseudo_zval": ("VRHFIN =", "ZVAL"),
+    }
+
+    _section_offsets: tuple[dict[str, Any], dict[str, int | None]] | None = None
+
     def __init__(self, filename: PathLike) -> None:
         """
         Args:
@@ -2278,6 +2892,7 @@ class Outcar:
                 ),
                 last_one_only=False,
                 first_one_only=True,
+                anchors=("-" * 104,),
             )
         ]
         self.data["nplwvs_at_kpoints"] = [None for n in nplwvs_at_kpoints]
@@ -2287,20 +2902,48 @@ class Outcar:
             except ValueError:
                 pass
 
-        # Read the drift
-        self.read_pattern(
-            {"drift": r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)"},
-            postprocess=float,
+        # Read the drift, the run type flags and the contributions to the
+        # final total energy in a single pass
+        energy_contrib_keys = (
+            "PSCENC",
+            "TEWEN",
+            "DENC",
+            "EXHF",
+            "XCENC",
+            "PAW double counting",
+            "EENTRO",
+            "EBANDS",
+            "EATOM",
+            "Ediel_sol",
         )
-        self.drift = self.data.get("drift", [])
+        patterns = {
+            "drift": r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)",
+            "spin": r"ISPIN\s*=\s*2",
+            "noncollinear": r"LNONCOLLINEAR\s*=\s*T",
+            "epsilon": r"LEPSILON\s*=\s*T",
+            "calcpol": r"LCALCPOL\s*=\s*T",
+            "electrostatic": r"average \(electrostatic\) potential at core",
+            "nmr_cs": r"LCHIMAG\s*=\s*(T)",
+            "nmr_efg": r"NMR quadrupolar parameters",
+        }
+        for key in energy_contrib_keys:
+            if key == "PAW double counting":
+                patterns[key] = rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)"
+            else:
+                patterns[key] = rf"{key}\s+=\s+([\d\-\.]+)"
+        self.read_pattern(patterns)
+
+        self.data["drift"] = [[float(val) for val in drift] for drift in self.data["drift"]]
+        self.drift = self.data["drift"]
 
         # Check if calculation is spin polarized
-        self.read_pattern({"spin": r"ISPIN\s*=\s*2"})
-        self.spin = bool(self.data.get("spin", False))
+        self.spin = bool(self.data["spin"])
 
         # Check if calculation is non-collinear
-        self.read_pattern({"noncollinear": r"LNONCOLLINEAR\s*=\s*T"})
-        self.noncollinear = bool(self.data.get("noncollinear", False))
+        self.noncollinear = bool(self.data["noncollinear"])
+
+        # The sections of the run type specific data are read together
+        sections: list[str] = []
 
         # Check if the calculation type is DFPT
         self.read_pattern(
@@ -2310,27 +2953,24 @@ class Outcar:
         )
         if self.data.get("ibrion", [[0]])[0][0] > 6:
             self.dfpt = True
-            self.read_internal_strain_tensor()
+            sections.append("internal_strain_tensor")
         else:
             self.dfpt = False
 
         # Check if LEPSILON is True and read piezo data if so
-        self.read_pattern({"epsilon": r"LEPSILON\s*=\s*T"})
-        if self.data.get("epsilon", False):
+        if self.data["epsilon"]:
             self.lepsilon = True
-            self.read_lepsilon()
+            sections.append("lepsilon")
             # Only read ionic contribution if DFPT is turned on
             if self.dfpt:
-                self.read_lepsilon_ionic()
+                sections.append("lepsilon_ionic")
         else:
             self.lepsilon = False
 
         # Check if LCALCPOL is True and read polarization data if so
-        self.read_pattern({"calcpol": r"LCALCPOL\s*=\s*T"})
-        if self.data.get("calcpol", False):
+        if self.data["calcpol"]:
             self.lcalcpol = True
-            self.read_lcalcpol()
-            self.read_pseudo_zval()
+            sections.extend(("lcalcpol", "pseudo_zval"))
         else:
             self.lcalcpol = False
 
@@ -2338,25 +2978,25 @@ class Outcar:
         self.electrostatic_potential: list[float] | None = None
         self.ngf: list[int] | None = None
         self.sampling_radii: list[float] | None = None
-        self.read_pattern({"electrostatic": r"average \(electrostatic\) potential at core"})
-        if self.data.get("electrostatic", False):
-            self.read_electrostatic_potential()
+        if self.data["electrostatic"]:
+            sections.append("electrostatic_potential")
 
-        self.read_pattern({"nmr_cs": r"LCHIMAG\s*=\s*(T)"})
-        if self.data.get("nmr_cs"):
+        if self.data["nmr_cs"]:
             self.nmr_cs: bool = True
-            self.read_chemical_shielding()
-            self.read_cs_g0_contribution()
-            self.read_cs_core_contribution()
-            self.read_cs_raw_symmetrized_tensors()
+            sections.extend(
+                (
+                    "chemical_shielding",
+                    "cs_g0_contribution",
+                    "cs_core_contribution",
+                    "cs_raw_symmetrized_tensors",
+                )
+            )
         else:
             self.nmr_cs = False
 
-        self.read_pattern({"nmr_efg": r"NMR quadrupolar parameters"})
-        if self.data.get("nmr_efg"):
+        if self.data["nmr_efg"]:
             self.nmr_efg: bool = True
-            self.read_nmr_efg()
-            self.read_nmr_efg_tensor()
+            sections.extend(("nmr_efg", "nmr_efg_tensor"))
         else:
             self.nmr_efg = False
 
@@ -2366,28 +3006,15 @@ class Outcar:
         )
         if "has_onsite_density_matrices" in self.data:
             self.has_onsite_density_matrices: bool = True
-            self.read_onsite_density_matrices()
+            sections.append("onsite_density_matrices")
         else:
             self.has_onsite_density_matrices = False
 
+        self.read_sections(sections)
+
         # Store the individual contributions to the final total energy
         final_energy_contribs = {}
-        for key in (
-            "PSCENC",
-            "TEWEN",
-            "DENC",
-            "EXHF",
-            "XCENC",
-            "PAW double counting",
-            "EENTRO",
-            "EBANDS",
-            "EATOM",
-            "Ediel_sol",
-        ):
-            if key == "PAW double counting":
-                self.read_pattern({key: rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)"})
-            else:
-                self.read_pattern({key: rf"{key}\s+=\s+([\d\-\.]+)"})
+        for key in energy_contrib_keys:
             if not self.data[key]:
                 continue
             final_energy_contribs[key] = sum(map(float, self.data[key][-1]))
@@ -2477,6 +3104,189 @@ class Outcar:
 
         return dct
 
+    def _get_section_offsets(self, index: bool | PathLike = False) -> dict[str, int | None]:
+        """Get the byte offsets of all sections in SECTION_ANCHORS, from the
+        sidecar index when it matches the current file, otherwise by scanning it.
+
+        Args:
+            index (bool | PathLike): Path of the sidecar index, True for
+                "<filename>.sections.json", or False to not use one.
+
+        Returns:
+            dict[str, int | None]: Start offset of each section, None if absent.
+        """
+        stat = os.stat(self.filename)
+        key = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "anchors": {section: list(anchors) for section, anchors in self.SECTION_ANCHORS.items()},
+        }
+        index_path = f"{self.filename}.sections.json" if index is True else index
+        offsets = None
+        if index_path and os.path.isfile(index_path):
+            with open(index_path, mode="rb") as file:
+                try:
+                    cached = orjson.loads(file.read())
+                except orjson.JSONDecodeError:
+                    cached = {}
+            if isinstance(cached, dict) and {field: cached.get(field) for field in key} == key:
+                offsets = cached["offsets"]
+
+        if offsets is None:
+            if self._section_offsets is not None and self._section_offsets[0] == key:
+                offsets = self._section_offsets[1]
+            else:
+                offsets = _get_outcar_section_offsets(self.filename, self.SECTION_ANCHORS)
+            if index_path:
+                with open(index_path, mode="wb") as file:
+                    file.write(orjson.dumps({**key, "offsets": offsets}))
+
+        self._section_offsets = (key, offsets)
+        return offsets
+
+    def read_sections(self, sections: Iterable[str], index: bool | PathLike = False) -> dict[str, Any]:
+        """Run the read_<section> methods of several sections at once.
+
+        The start of every section in SECTION_ANCHORS is located in a single
+        scan of the file (or taken from the sidecar index). The file is then
+        streamed once, line by line, from the earliest requested section on,
+        and each line is passed to the patterns of every reader whose section
+        has started, instead of every reader going through the whole file.
+        Only the lines around the tables being matched are kept in memory.
+        Matches before the earliest anchor of a section are therefore not
+        found, which is why the anchors must be literal parts of the text the
+        patterns of its reader match (see SECTION_ANCHORS).
+
+        Args:
+            sections (Iterable[str]): Sections to read, e.g. ["lepsilon",
+                "piezo_tensor"] to call read_lepsilon and read_piezo_tensor.
+            index (bool | PathLike): Whether to store the section offsets in a
+                sidecar JSON file, which is reused as long as the OUTCAR is
+                unchanged. True for "<filename>.sections.json", or the path of
+                the file. Defaults to False.
+
+        Returns:
+            dict[str, Any]: The return value of each reader, e.g. the core
+                potentials for "avg_core_poten".
+        """
+        sections = list(sections)
+        if unknown := [section for section in sections if section not in self.SECTION_ANCHORS]:
+            raise ValueError(f"Unknown OUTCAR sections {unknown}, supported are {sorted(self.SECTION_ANCHORS)}")
+        if not sections:
+            return {}
+
+        offsets = self._get_section_offsets(index)
+        readers = [getattr(type(self), f"read_{section}").__wrapped__(self) for section in sections]
+        values = self._run_readers(readers, [offsets[section] for section in sections])
+        return dict(zip(sections, values, strict=True))
+
+    def _run_readers(
+        self,
+        readers: Sequence[_SectionReader],
+        offsets: Sequence[int | None] | None = None,
+    ) -> list[Any]:
+        """Run section readers together in a single pass over the lines of the file.
+
+        A reader is a generator yielding a tuple of line consumers, which is
+        sent back their results once the file is read, and returns its own
+        result. The consumers of a reader are sent the lines from the offset
+        of its section on, followed by "" for the end of the file, and return
+        their results, possibly before the end. Reverse searches stopping at
+        their first matches (_ReverseGrep) read the file backwards instead,
+        and the lines are only read as far as the remaining consumers need
+        them. An exception raised by a consumer is raised in its reader instead.
+
+        Args:
+            readers (Sequence[Generator]): The section readers.
+            offsets (Sequence[int | None]): Byte offset of the section of each
+                reader, None if it is absent. Defaults to the start of the file.
+
+        Returns:
+            list: The result of each reader.
+        """
+        if offsets is None:
+            offsets = [0] * len(readers)
+        consumers = [next(reader) for reader in readers]
+        results: list[list[Any]] = [[None] * len(reader_consumers) for reader_consumers in consumers]
+        errors: list[BaseException | None] = [None] * len(readers)
+
+        def send(idx: int, jdx: int, line: str) -> bool:
+            """Send a line to a consumer, return whether it is done."""
+            try:
+                consumers[idx][jdx].send(line)  # type:ignore[union-attr]
+            except StopIteration as stop:
+                results[idx][jdx] = stop.value
+                return True
+            except Exception as exc:
+                errors[idx] = exc
+                return True
+            return False
+
+        # The line consumers of each reader
+        line_consumers: list[list[int]] = [[] for _ in readers]
+        for idx, reader_consumers in enumerate(consumers):
+            for jdx, consumer in enumerate(reader_consumers):
+                if not isinstance(consumer, _ReverseGrep):
+                    next(consumer)
+                    line_consumers[idx].append(jdx)
+                elif offsets[idx] is None:
+                    # An absent section has no matches
+                    results[idx][jdx] = {key: [] for key in consumer.patterns}
+                else:
+                    try:
+                        results[idx][jdx] = consumer.run(self.filename)
+                    except Exception as exc:
+                        errors[idx] = exc
+
+        # Readers waiting for their section, the earliest last
+        pending = sorted(
+            (
+                (offset, idx)
+                for idx, offset in enumerate(offsets)
+                if offset is not None and line_consumers[idx] and errors[idx] is None
+            ),
+            reverse=True,
+        )
+        started: set[int] = set()
+        live: list[tuple[int, int]] = []
+        if pending:
+            pos = pending[-1][0]
+            with zopen(self.filename, mode="rb") as file:
+                file.seek(pos)
+                for raw in file:
+                    while pending and pending[-1][0] <= pos:
+                        idx = pending.pop()[1]
+                        started.add(idx)
+                        live.extend((idx, jdx) for jdx in line_consumers[idx])
+                    pos += len(raw)
+                    line = raw.decode("utf-8")
+                    if line.endswith("\r\n"):
+                        line = f"{line[:-2]}\n"
+                    live = [(idx, jdx) for idx, jdx in live if errors[idx] is None and not send(idx, jdx, line)]
+                    if not live and not pending:
+                        break
+
+        # The end of the file, also for the consumers of absent sections
+        # and of the sections starting at the end of the file
+        live_set = set(live)
+        for idx, jdxs in enumerate(line_consumers):
+            for jdx in jdxs:
+                if errors[idx] is None and ((idx, jdx) in live_set or idx not in started):
+                    send(idx, jdx, "")
+
+        values = []
+        for idx, reader in enumerate(readers):
+            try:
+                if (error := errors[idx]) is not None:
+                    reader.throw(error)
+                else:
+                    reader.send(tuple(results[idx]))
+            except StopIteration as stop:
+                values.append(stop.value)
+            else:
+                raise RuntimeError(f"Section reader {reader.__name__} yielded more than once")
+        return values
+
     def read_pattern(
         self,
         patterns: dict[str, str],
@@ -2516,6 +3326,7 @@ class Outcar:
         for key in patterns:
             self.data[key] = [i[0] for i in matches.get(key, [])]
 
+    @_section_reader
     def read_table_pattern(
         self,
         header_pattern: str,
@@ -2525,7 +3336,9 @@ class Outcar:
         attribute_name: str | None = None,
         last_one_only: bool = True,
         first_one_only: bool = False,
-    ) -> list:
+        *,
+        anchors: Sequence[str] = (),
+    ) -> _SectionReader:
         r"""Parse table-like data. A table composes of three parts: header,
         main body, footer. All the data matches "row pattern" in the main body
         will be returned.
@@ -2555,6 +3368,10 @@ class Outcar:
                 parsed and the parsing procedure will stop. The enclosing list
                 will be removed. i.e. Only a single table will be returned.
                 Incompatible with last_one_only.
+            anchors (Sequence[str]): Literal text found in every table header,
+                on its first line or up to three lines after it. If given, only
+                the text around the anchors is kept in memory while reading,
+                and tables whose header does not contain an anchor are missed.
 
         Returns:
             List of tables or a single table if last_one_only/first_one_only is True.
@@ -2565,37 +3382,23 @@ class Outcar:
         if last_one_only and first_one_only:
             raise ValueError("last_one_only and first_one_only options are incompatible")
 
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            text: str = file.read()  # type:ignore[assignment]
-        table_pattern_text = header_pattern + r"\s*^(?P<table_body>(?:\s+" + row_pattern + r")+)\s+" + footer_pattern
-        table_pattern = re.compile(table_pattern_text, re.MULTILINE | re.DOTALL)
-        rp = re.compile(row_pattern)
-
-        TableData: TypeAlias = list[list[Any] | dict[str, Any]]
-        tables: list[TableData] = []
-        for mt in table_pattern.finditer(text):
-            table_body_text = mt.group("table_body")
-            table_contents: TableData = []
-            for line in table_body_text.split("\n"):
-                ml = rp.search(line)
-                # Skip empty lines
-                if not ml:
-                    continue
-                d = ml.groupdict()
-                if len(d) > 0:
-                    processed_line: list[Any] | dict[str, Any] = {k: postprocess(v) for k, v in d.items()}
-                else:
-                    processed_line = [postprocess(v) for v in ml.groups()]
-                table_contents.append(processed_line)
-            tables.append(table_contents)
-            if first_one_only:
-                break
-        retained_data: list[TableData] | TableData = tables[-1] if last_one_only or first_one_only else tables
+        (retained_data,) = yield (
+            _read_tables(
+                header_pattern,
+                row_pattern,
+                footer_pattern,
+                postprocess=postprocess,
+                last_one_only=last_one_only,
+                first_one_only=first_one_only,
+                anchors=anchors,
+            ),
+        )
         if attribute_name is not None:
             self.data[attribute_name] = retained_data
         return retained_data
 
-    def read_electrostatic_potential(self) -> None:
+    @_section_reader
+    def read_electrostatic_potential(self) -> _SectionReader:
         """Parse the eletrostatic potential for the last ionic step.
 
         Renders accessible as attributes:
@@ -2603,25 +3406,31 @@ class Outcar:
             sampling_radii (list[float, float, float]): Test charge radii.
             electrostatic_potential (list[float]): The eletrostatic potential.
         """
-        pattern = {"ngf": r"\s+dimension x,y,z NGXF=\s+([\.\-\d]+)\sNGYF=\s+([\.\-\d]+)\sNGZF=\s+([\.\-\d]+)"}
-        self.read_pattern(pattern, postprocess=int)
-        self.ngf = self.data.get("ngf", [[]])[0]
-
-        pattern = {"radii": r"the test charge radii are((?:\s+[\.\-\d]+)+)"}
-        self.read_pattern(pattern, reverse=True, terminate_on_match=True, postprocess=str)
-        self.sampling_radii = [*map(float, self.data["radii"][0][0].split())]
+        ngf_pattern = {"ngf": r"\s+dimension x,y,z NGXF=\s+([\.\-\d]+)\sNGYF=\s+([\.\-\d]+)\sNGZF=\s+([\.\-\d]+)"}
+        radii_pattern = {"radii": r"the test charge radii are((?:\s+[\.\-\d]+)+)"}
 
         header_pattern = r"\(the norm of the test charge is\s+[\.\-\d]+\)"
         table_pattern = r"((?:\s+\d+\s*[\.\-\d]+)+)"
         footer_pattern = r"\s+E-fermi :"
 
-        pot_patterns: list = self.read_table_pattern(header_pattern, table_pattern, footer_pattern)
+        ngf, radii, pot_patterns = yield (
+            _grep_lines(ngf_pattern, postprocess=int),
+            _grep_lines(radii_pattern, reverse=True, terminate_on_match=True, postprocess=str),
+            _read_tables(header_pattern, table_pattern, footer_pattern, anchors=("the norm of the test charge is",)),
+        )
+        self.data.update(ngf)
+        self.ngf = self.data.get("ngf", [[]])[0]
+
+        self.data.update(radii)
+        self.sampling_radii = [*map(float, self.data["radii"][0][0].split())]
+
         pot_patterns_str: str = "".join(itertools.chain.from_iterable(pot_patterns))
         pots: list = re.findall(r"\s+\d+\s*([\.\-\d]+)+", pot_patterns_str)
 
         self.electrostatic_potential = [*map(float, pots)]
 
-    def read_freq_dielectric(self) -> None:
+    @_section_reader
+    def read_freq_dielectric(self) -> _SectionReader:
         """
         Parse the frequency dependent dielectric function (obtained with LOPTICS).
 
@@ -2637,17 +3446,17 @@ class Outcar:
             r"DIELECTRIC FUNCTION \(independent particle, "
             r"no local field effects\)(\sdensity-density)*$"
         )
-        row_pattern = r"\s+".join([r"([\.\-\d]+)"] * 3)
-        plasma_frequencies = defaultdict(list)
-        read_plasma: str | bool = False
-        read_dielectric = False
-        energies = []
-        data: dict[str, Any] = {"REAL": [], "IMAGINARY": []}
-        count = 0
-        component = "IMAGINARY"
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            line: str
-            for line in file:  # type:ignore[assignment]
+
+        def parse_lines() -> _LineConsumer:
+            row_pattern = r"\s+".join([r"([\.\-\d]+)"] * 3)
+            plasma_frequencies = defaultdict(list)
+            read_plasma: str | bool = False
+            read_dielectric = False
+            energies = []
+            data: dict[str, Any] = {"REAL": [], "IMAGINARY": []}
+            count = 0
+            component = "IMAGINARY"
+            while line := (yield):
                 line = line.strip()
                 if re.match(plasma_pattern, line):
                     read_plasma = "intraband" if "intraband" in line else "interband"
@@ -2680,6 +3489,9 @@ class Outcar:
                         component = "REAL"
                     elif count == 3:
                         break
+            return plasma_frequencies, energies, data
+
+        ((plasma_frequencies, energies, data),) = yield (parse_lines(),)
 
         self.plasma_frequencies: dict[Any, NDArray[np.float64]] = {
             k: np.array(v[:3]) for k, v in plasma_frequencies.items()
@@ -2689,7 +3501,8 @@ class Outcar:
             data["IMAGINARY"]
         )
 
-    def read_chemical_shielding(self) -> None:
+    @_section_reader
+    def read_chemical_shielding(self) -> _SectionReader:
         """Parse the NMR chemical shieldings data. Only the second part "absolute, valence and core"
         will be parsed. And only the three right most field (ISO_SHIELDING, SPAN, SKEW) will be retrieved.
 
@@ -2711,12 +3524,13 @@ class Outcar:
         row_pattern = r"\d+(?:\s+[-]?\d+\.\d+){3}\s+" + r"\s+".join([r"([-]?\d+\.\d+)"] * 3)
         footer_pattern = r"-{50,}\s*$"
         h1 = header_pattern + first_part_pattern
-        cs_valence_only: list[list[float]] = self.read_table_pattern(
-            h1, row_pattern, footer_pattern, postprocess=float, last_one_only=True
-        )
         h2 = header_pattern + swallon_valence_body_pattern
-        cs_valence_and_core: list[list[float]] = self.read_table_pattern(
-            h2, row_pattern, footer_pattern, postprocess=float, last_one_only=True
+        anchors = ("CSA tensor (J. Mason",)
+        cs_valence_only: list[list[float]]
+        cs_valence_and_core: list[list[float]]
+        cs_valence_only, cs_valence_and_core = yield (
+            _read_tables(h1, row_pattern, footer_pattern, postprocess=float, last_one_only=True, anchors=anchors),
+            _read_tables(h2, row_pattern, footer_pattern, postprocess=float, last_one_only=True, anchors=anchors),
         )
         chemical_shielding: dict[Literal["valence_only", "valence_and_core"], list[list[float]]] = {
             "valence_only": cs_valence_only,
@@ -2724,7 +3538,8 @@ class Outcar:
         }
         self.data["chemical_shielding"] = chemical_shielding
 
-    def read_cs_g0_contribution(self) -> None:
+    @_section_reader
+    def read_cs_g0_contribution(self) -> _SectionReader:
         """Parse the G0 contribution of NMR chemical shielding.
 
         Renders accessible from self.data:
@@ -2738,16 +3553,19 @@ class Outcar:
         )
         row_pattern = r"(?:\d+)\s+" + r"\s+".join([r"([-]?\d+\.\d+)"] * 3)
         footer_pattern = r"\s+-{50,}\s*$"
-        self.read_table_pattern(
-            header_pattern,
-            row_pattern,
-            footer_pattern,
-            postprocess=float,
-            last_one_only=True,
-            attribute_name="cs_g0_contribution",
+        (self.data["cs_g0_contribution"],) = yield (
+            _read_tables(
+                header_pattern,
+                row_pattern,
+                footer_pattern,
+                postprocess=float,
+                last_one_only=True,
+                anchors=("G=0 CONTRIBUTION TO CHEMICAL SHIFT",),
+            ),
         )
 
-    def read_cs_core_contribution(self) -> None:
+    @_section_reader
+    def read_cs_core_contribution(self) -> _SectionReader:
         """Parse the core contribution of NMR chemical shielding.
 
         Renders accessible from self.data:
@@ -2756,18 +3574,21 @@ class Outcar:
         header_pattern = r"^\s+Core NMR properties\s*$\n\n^\s+typ\s+El\s+Core shift \(ppm\)\s*$\n^\s+-{20,}$\n"
         row_pattern = r"\d+\s+(?P<element>[A-Z][a-z]?\w?)\s+(?P<shift>[-]?\d+\.\d+)"
         footer_pattern = r"\s+-{20,}\s*$"
-        self.read_table_pattern(
-            header_pattern,
-            row_pattern,
-            footer_pattern,
-            postprocess=str,
-            last_one_only=True,
-            attribute_name="cs_core_contribution",
+        (self.data["cs_core_contribution"],) = yield (
+            _read_tables(
+                header_pattern,
+                row_pattern,
+                footer_pattern,
+                postprocess=str,
+                last_one_only=True,
+                anchors=("Core NMR properties",),
+            ),
         )
         core_contrib: dict[str, float] = {d["element"]: float(d["shift"]) for d in self.data["cs_core_contribution"]}
         self.data["cs_core_contribution"] = core_contrib
 
-    def read_cs_raw_symmetrized_tensors(self) -> None:
+    @_section_reader
+    def read_cs_raw_symmetrized_tensors(self) -> _SectionReader:
         """Parse the matrix form of NMR tensor before corrected to table.
 
         Renders accessible from self.data:
@@ -2778,18 +3599,15 @@ class Outcar:
         row_pattern = r"\s+".join([r"([-]?\d+\.\d+)"] * 3)
         unsym_footer_pattern = r"^\s+SYMMETRIZED TENSORS\s+$"
 
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            text: str = file.read()  # type:ignore[assignment]
-        unsym_table_pattern_text = header_pattern + first_part_pattern + r"(?P<table_body>.+)" + unsym_footer_pattern
-        table_pattern = re.compile(unsym_table_pattern_text, re.MULTILINE | re.DOTALL)
+        header = re.compile(header_pattern + first_part_pattern, re.MULTILINE | re.DOTALL)
+        footer = re.compile(unsym_footer_pattern)
         row_pat = re.compile(row_pattern)
+        micro_header_pattern = r"ion\s+\d+"
+        micro_table_pattern_text = micro_header_pattern + r"\s*^(?P<table_body>(?:\s*" + row_pattern + r")+)\s+"
+        micro_table_pattern = re.compile(micro_table_pattern_text, re.MULTILINE | re.DOTALL)
 
-        if match := table_pattern.search(text):
-            table_text = match["table_body"]
-            micro_header_pattern = r"ion\s+\d+"
-            micro_table_pattern_text = micro_header_pattern + r"\s*^(?P<table_body>(?:\s*" + row_pattern + r")+)\s+"
-            micro_table_pattern = re.compile(micro_table_pattern_text, re.MULTILINE | re.DOTALL)
-            unsym_tensors: list[list[list[float]]] = []
+        def parse_tensors(table_text: str) -> list[list[list[float]]]:
+            tensors: list[list[list[float]]] = []
             for mt in micro_table_pattern.finditer(table_text):
                 table_body_text = mt.group("table_body")
                 tensor_matrix: list[list[float]] = []
@@ -2799,12 +3617,45 @@ class Outcar:
                         raise RuntimeError(f"failure to find pattern, {ml=}")
                     processed_line: list[float] = [float(v) for v in ml.groups()]
                     tensor_matrix.append(processed_line)
-                unsym_tensors.append(tensor_matrix)
-            self.data["unsym_cs_tensor"] = unsym_tensors
-        else:
+                tensors.append(tensor_matrix)
+            return tensors
+
+        def parse_lines() -> _LineConsumer:
+            """Parse the tables from the first header up to the last footer
+            line, which is where the greedy table body ends. A table can only
+            start on a line which is neither a row nor blank, so the lines
+            before such a line are parsed and dropped.
+            """
+            recent: deque[str] = deque(maxlen=5)
+            while line := (yield):
+                recent.append(line)
+                if "UNSYMMETRIZED TENSORS" in line and header.search("".join(recent)):
+                    break
+            else:
+                return None
+
+            unsym_tensors: list[list[list[float]]] | None = None
+            tensors: list[list[list[float]]] = []
+            table_lines: list[str] = []
+            while line := (yield):
+                is_footer = footer.match(line) is not None
+                if is_footer or not (line.isspace() or row_pat.search(line)):
+                    tensors += parse_tensors("".join(table_lines))
+                    table_lines = []
+                if is_footer:
+                    unsym_tensors = [*(unsym_tensors or []), *tensors]
+                    tensors = []
+                else:
+                    table_lines.append(line)
+            return unsym_tensors
+
+        (unsym_tensors,) = yield (parse_lines(),)
+        if unsym_tensors is None:
             raise ValueError("NMR UNSYMMETRIZED TENSORS is not found")
+        self.data["unsym_cs_tensor"] = unsym_tensors
 
-    def read_nmr_efg_tensor(self) -> list[NDArray[np.float64]]:
+    @_section_reader
+    def read_nmr_efg_tensor(self) -> _SectionReader:
         """Parses the NMR Electric Field Gradient Raw Tensors.
 
         Returns:
@@ -2821,12 +3672,21 @@ class Outcar:
         row_pattern = r"\d+\s+([-\d\.]+)\s+([-\d\.]+)\s+([-\d\.]+)\s+([-\d\.]+)\s+([-\d\.]+)\s+([-\d\.]+)"
         footer_pattern = r"-*\n"
 
-        data = self.read_table_pattern(header_pattern, row_pattern, footer_pattern, postprocess=float)
+        (data,) = yield (
+            _read_tables(
+                header_pattern,
+                row_pattern,
+                footer_pattern,
+                postprocess=float,
+                anchors=("Electric field gradients (V/A^2)",),
+            ),
+        )
         tensors: list[NDArray[np.float64]] = [make_symmetric_matrix_from_upper_tri(d) for d in data]
         self.data["unsym_efg_tensor"] = tensors
         return tensors
 
-    def read_nmr_efg(self) -> None:
+    @_section_reader
+    def read_nmr_efg(self) -> _SectionReader:
         """Parse the NMR Electric Field Gradient interpreted values.
 
         Renders accessible from self.data:
@@ -2847,16 +3707,19 @@ class Outcar:
             r"\d+\s+(?P<cq>[-]?\d+\.\d+)\s+(?P<eta>[-]?\d+\.\d+)\s+(?P<nuclear_quadrupole_moment>[-]?\d+\.\d+)"
         )
         footer_pattern = r"-{50,}\s*$"
-        self.read_table_pattern(
-            header_pattern,
-            row_pattern,
-            footer_pattern,
-            postprocess=float,
-            last_one_only=True,
-            attribute_name="efg",
+        (self.data["efg"],) = yield (
+            _read_tables(
+                header_pattern,
+                row_pattern,
+                footer_pattern,
+                postprocess=float,
+                last_one_only=True,
+                anchors=("NMR quadrupolar parameters",),
+            ),
         )
 
-    def read_elastic_tensor(self) -> None:
+    @_section_reader
+    def read_elastic_tensor(self) -> _SectionReader:
         """
         Parse the elastic tensor data.
 
@@ -2866,12 +3729,20 @@ class Outcar:
         header_pattern = r"TOTAL ELASTIC MODULI \(kBar\)\s+Direction\s+([X-Z][X-Z]\s+)+\-+"
         row_pattern = r"[X-Z][X-Z]\s+" + r"\s+".join([r"(\-*[\.\d]+)"] * 6)
         footer_pattern = r"\-+"
-        et_table: list[list[float]] = self.read_table_pattern(
-            header_pattern, row_pattern, footer_pattern, postprocess=float
+        et_table: list[list[float]]
+        (et_table,) = yield (
+            _read_tables(
+                header_pattern,
+                row_pattern,
+                footer_pattern,
+                postprocess=float,
+                anchors=("TOTAL ELASTIC MODULI (kBar)",),
+            ),
         )
         self.data["elastic_tensor"] = et_table
 
-    def read_piezo_tensor(self) -> None:
+    @_section_reader
+    def read_piezo_tensor(self) -> _SectionReader:
         """Parse the piezo tensor data.
 
         Renders accessible from self.data:
@@ -2880,12 +3751,20 @@ class Outcar:
         header_pattern = r"PIEZOELECTRIC TENSOR  for field in x, y, z\s+\(C/m\^2\)\s+([X-Z][X-Z]\s+)+\-+"
         row_pattern = r"[x-z]\s+" + r"\s+".join([r"(\-*[\.\d]+)"] * 6)
         footer_pattern = r"BORN EFFECTIVE"
-        piezo_tensor: list[list[float]] = self.read_table_pattern(
-            header_pattern, row_pattern, footer_pattern, postprocess=float
+        piezo_tensor: list[list[float]]
+        (piezo_tensor,) = yield (
+            _read_tables(
+                header_pattern,
+                row_pattern,
+                footer_pattern,
+                postprocess=float,
+                anchors=("PIEZOELECTRIC TENSOR  for field in x, y, z",),
+            ),
         )
         self.data["piezo_tensor"] = piezo_tensor
 
-    def read_onsite_density_matrices(self) -> None:
+    @_section_reader
+    def read_onsite_density_matrices(self) -> _SectionReader:
         """Parse the onsite density matrices.
 
         Renders accessible from self.data:
@@ -2894,32 +3773,36 @@ class Outcar:
         """
         # Matrix size will vary depending on if d or f orbitals are present.
         # Therefore regex assumes f, but filter out None values if d.
-        header_pattern = r"spin component  1\n"
-        row_pattern = r"[^\S\r\n]*(?:(-?[\d.]+))" + r"(?:[^\S\r\n]*(-?[\d.]+)[^\S\r\n]*)?" * 6 + r".*?"
-        footer_pattern = r"\nspin component  2"
-        spin1_component = self.read_table_pattern(
-            header_pattern,
-            row_pattern,
-            footer_pattern,
-            postprocess=lambda x: float(x) if x else None,
-            last_one_only=False,
-        )
-
-        # Filter out None
-        spin1_component = [[[e for e in row if e is not None] for row in matrix] for matrix in spin1_component]
+        header_pattern1 = r"spin component  1\n"
+        row_pattern1 = r"[^\S\r\n]*(?:(-?[\d.]+))" + r"(?:[^\S\r\n]*(-?[\d.]+)[^\S\r\n]*)?" * 6 + r".*?"
+        footer_pattern1 = r"\nspin component  2"
 
         # And repeat for Spin.down
-        header_pattern = r"spin component  2\n"
-        row_pattern = r"[^\S\r\n]*(?:([\d.-]+))" + r"(?:[^\S\r\n]*(-?[\d.]+)[^\S\r\n]*)?" * 6 + r".*?"
-        footer_pattern = r"\n occupancies and eigenvectors"
-        spin2_component = self.read_table_pattern(
-            header_pattern,
-            row_pattern,
-            footer_pattern,
-            postprocess=lambda x: float(x) if x else None,
-            last_one_only=False,
+        header_pattern2 = r"spin component  2\n"
+        row_pattern2 = r"[^\S\r\n]*(?:([\d.-]+))" + r"(?:[^\S\r\n]*(-?[\d.]+)[^\S\r\n]*)?" * 6 + r".*?"
+        footer_pattern2 = r"\n occupancies and eigenvectors"
+
+        spin1_component, spin2_component = yield (
+            _read_tables(
+                header_pattern1,
+                row_pattern1,
+                footer_pattern1,
+                postprocess=lambda x: float(x) if x else None,
+                last_one_only=False,
+                anchors=("spin component  1",),
+            ),
+            _read_tables(
+                header_pattern2,
+                row_pattern2,
+                footer_pattern2,
+                postprocess=lambda x: float(x) if x else None,
+                last_one_only=False,
+                anchors=("spin component  2",),
+            ),
         )
 
+        # Filter out None
+        spin1_component = [[[e for e in row if e is not None] for row in matrix] for matrix in spin1_component]
         spin2_component = [[[e for e in row if e is not None] for row in matrix] for matrix in spin2_component]
 
         onsite_density_matrices: list[dict[Spin, list[list[float]]]] = [
@@ -2927,11 +3810,12 @@ class Outcar:
         ]
         self.data["onsite_density_matrices"] = onsite_density_matrices
 
+    @_section_reader
     def read_corrections(
         self,
         reverse: bool = True,
         terminate_on_match: bool = True,
-    ) -> None:
+    ) -> _SectionReader:
         """Read the dipol qudropol correction.
 
         Args:
@@ -2942,20 +3826,24 @@ class Outcar:
             dipol_quadrupol_correction (float): Dipol qudropol correction.
         """
         patterns = {"dipol_quadrupol_correction": r"dipol\+quadrupol energy correction\s+([\d\-\.]+)"}
-        self.read_pattern(
-            patterns,
-            reverse=reverse,
-            terminate_on_match=terminate_on_match,
-            postprocess=float,
+        (matches,) = yield (
+            _grep_lines(
+                patterns,
+                reverse=reverse,
+                terminate_on_match=terminate_on_match,
+                postprocess=float,
+            ),
         )
+        self.data.update(matches)
         dipol_quadrupol_correction: float = self.data["dipol_quadrupol_correction"][0][0]
         self.data["dipol_quadrupol_correction"] = dipol_quadrupol_correction
 
+    @_section_reader
     def read_neb(
         self,
         reverse: bool = True,
         terminate_on_match: bool = True,
-    ) -> None:
+    ) -> _SectionReader:
         """
         Read NEB data. This only works with OUTCARs from both normal
         VASP NEB calculations or from the CI NEB method implemented by
@@ -2978,17 +3866,21 @@ class Outcar:
             "tangent_force": r"(NEB: projections on to tangent \(spring, REAL\)\s+\S+|tangential force \(eV/A\))\s+"
             r"([\d\-\.]+)",
         }
-        self.read_pattern(
-            patterns,
-            reverse=reverse,
-            terminate_on_match=terminate_on_match,
-            postprocess=str,
+        (matches,) = yield (
+            _grep_lines(
+                patterns,
+                reverse=reverse,
+                terminate_on_match=terminate_on_match,
+                postprocess=str,
+            ),
         )
+        self.data.update(matches)
         self.data["energy"] = float(self.data["energy"][0][0])
         if self.data.get("tangent_force"):
             self.data["tangent_force"] = float(self.data["tangent_force"][0][1])
 
-    def read_igpar(self) -> None:
+    @_section_reader
+    def read_igpar(self) -> _SectionReader:
         """Read IGPAR.
 
         See VASP sections "LBERRY, IGPAR, NPPSTR, DIPOL" for info on
@@ -3088,7 +3980,7 @@ class Outcar:
             self.er_ev = {Spin.up: None, Spin.down: None}  # type:ignore[dict-item]
             self.er_bp = {Spin.up: None, Spin.down: None}  # type:ignore[dict-item]
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            yield (_pyawk_lines(search, self),)
 
             if self.er_ev[Spin.up] is not None and self.er_ev[Spin.down] is not None:
                 self.er_ev_tot = self.er_ev[Spin.up] + self.er_ev[Spin.down]  # type: ignore[operator,assignment]
@@ -3099,7 +3991,8 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("IGPAR OUTCAR could not be parsed.") from exc
 
-    def read_internal_strain_tensor(self) -> None:
+    @_section_reader
+    def read_internal_strain_tensor(self) -> _SectionReader:
         """Read the internal strain tensor.
 
         Renders accessible as attributes:
@@ -3144,9 +4037,10 @@ class Outcar:
 
         self.internal_strain_ion = None
         self.internal_strain_tensor: list[NDArray[np.float64]] = []
-        micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+        yield (_pyawk_lines(search, self),)
 
-    def read_lepsilon(self) -> None:
+    @_section_reader
+    def read_lepsilon(self) -> _SectionReader:
         """Read a LEPSILON run.
 
         Renders accessible as attributes:
@@ -3294,7 +4188,7 @@ class Outcar:
             self.born_ion = None
             self.born: list | NDArray = []
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            yield (_pyawk_lines(search, self),)
 
             self.born = np.array(self.born)
 
@@ -3304,7 +4198,8 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("LEPSILON OUTCAR could not be parsed.") from exc
 
-    def read_lepsilon_ionic(self) -> None:
+    @_section_reader
+    def read_lepsilon_ionic(self) -> _SectionReader:
         """Read the ionic component of a LEPSILON run.
 
         Renders accessible as attributes:
@@ -3424,7 +4319,7 @@ class Outcar:
             self.piezo_ionic_index = None
             self.piezo_ionic_tensor = np.zeros((3, 6))
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            yield (_pyawk_lines(search, self),)
 
             self.dielectric_ionic_tensor = self.dielectric_ionic_tensor.tolist()  # type:ignore[assignment]
             self.piezo_ionic_tensor = self.piezo_ionic_tensor.tolist()  # type:ignore[assignment]
@@ -3432,7 +4327,8 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("ionic part of LEPSILON OUTCAR could not be parsed.") from exc
 
-    def read_lcalcpol(self) -> None:
+    @_section_reader
+    def read_lcalcpol(self) -> _SectionReader:
         """Read the LCALCPOL.
 
         Renders accessible as attributes:
@@ -3524,12 +4420,10 @@ class Outcar:
                 ]
             )
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
-
             # Fix polarization units in new versions of VASP
             regex = r"^.*Ionic dipole moment: .*"
-            search = [[regex, None, lambda x, y: x.append(y.group(0))]]
-            results = micro_pyawk(self.filename, search, [])  # type:ignore[arg-type]
+            units_search = [[regex, None, lambda x, y: x.append(y.group(0))]]
+            _, results = yield (_pyawk_lines(search, self), _pyawk_lines(units_search, []))
 
             if "|e|" in results[0]:
                 self.p_elec *= -1  # type: ignore[operator]
@@ -3541,7 +4435,8 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("LCALCPOL OUTCAR could not be parsed.") from exc
 
-    def read_pseudo_zval(self) -> None:
+    @_section_reader
+    def read_pseudo_zval(self) -> _SectionReader:
         """Create a pseudopotential valence electron number (ZVAL) dictionary.
 
         Renders accessible as attributes:
@@ -3567,7 +4462,7 @@ class Outcar:
                 )
             )
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            yield (_pyawk_lines(search, self),)
 
             self.zval_dict: dict[str, float] = dict(zip(self.atom_symbols, self.zvals, strict=True))  # type: ignore[attr-defined]
 
@@ -3578,7 +4473,8 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("ZVAL dict could not be parsed.") from exc
 
-    def read_core_state_eigen(self) -> list[dict[str, list[float]]]:
+    @_section_reader
+    def read_core_state_eigen(self) -> _SectionReader:
         """Read the core state eigenenergies at each ionic step.
 
         Returns:
@@ -3589,12 +4485,13 @@ class Outcar:
             The core state eigenenergie of the 2s AO of the 6th atom of the
             structure at the last ionic step is [5]["2s"][-1].
         """
-        with zopen(self.filename, mode="rt", encoding="utf-8") as foutcar:
-            line: str = foutcar.readline()  # type:ignore[assignment]
+
+        def parse_lines() -> _LineConsumer:
+            line: str = yield
             core_state_eigs: list[dict[str, list[float]]] = []
 
             while line != "":
-                line = foutcar.readline()  # type:ignore[assignment]
+                line = yield
 
                 if "NIONS =" in line:
                     natom = int(line.split("NIONS =")[1])
@@ -3603,7 +4500,7 @@ class Outcar:
                 if "the core state eigen" in line:
                     iat = -1
                     while line != "":
-                        line = foutcar.readline()  # type:ignore[assignment]
+                        line = yield
                         # don't know number of lines to parse without knowing
                         # specific species, so stop parsing when we reach
                         # "E-fermi" instead
@@ -3618,9 +4515,13 @@ class Outcar:
                             data = data[1:]  # remove element with ion number
                         for i in range(0, len(data), 2):
                             core_state_eigs[iat][data[i]].append(float(data[i + 1]))
+            return core_state_eigs
+
+        (core_state_eigs,) = yield (parse_lines(),)
         return core_state_eigs
 
-    def read_avg_core_poten(self) -> list[list[float]]:
+    @_section_reader
+    def read_avg_core_poten(self) -> _SectionReader:
         """Read the core potential at each ionic step.
 
         Returns:
@@ -3631,15 +4532,16 @@ class Outcar:
             The average core potential of the 2nd atom of the structure at the
             last ionic step is: [-1][1].
         """
-        with zopen(self.filename, mode="rt", encoding="utf-8") as foutcar:
-            line = foutcar.readline()
+
+        def parse_lines() -> _LineConsumer:
+            line: str = yield
             avg_core_pots: list[list[float]] = []
             while line != "":
-                line = foutcar.readline()
+                line = yield
                 if "the norm of the test charge is" in line:
                     avg_pot: list[float] = []
                     while line != "":
-                        line = foutcar.readline()
+                        line = yield
                         # don't know number of lines to parse without knowing
                         # specific species, so stop parsing when we reach
                         # "E-fermi" instead
@@ -3655,10 +4557,13 @@ class Outcar:
                         for i in range(npots):
                             start = i * 17
                             avg_pot.append(float(line[start + 8 : start + 17]))
+            return avg_core_pots
 
+        (avg_core_pots,) = yield (parse_lines(),)
         return avg_core_pots
 
-    def read_fermi_contact_shift(self) -> None:
+    @_section_reader
+    def read_fermi_contact_shift(self) -> _SectionReader:
         """Read Fermi contact (isotropic) hyperfine coupling parameter.
 
         Output example:
@@ -3688,13 +4593,6 @@ class Outcar:
         )
         row_pattern1 = r"(?:\d+)\s+" + r"\s+".join([r"([-]?\d+\.\d+)"] * 5)
         footer_pattern = r"\-+"
-        fch_table: list[list[float]] = self.read_table_pattern(
-            header_pattern1,
-            row_pattern1,
-            footer_pattern,
-            postprocess=float,
-            last_one_only=True,
-        )
 
         # Dipolar hyperfine coupling parameters (MHz)
         header_pattern2 = (
@@ -3704,13 +4602,6 @@ class Outcar:
             r"\s*\-+"
         )
         row_pattern2 = r"(?:\d+)\s+" + r"\s+".join([r"([-]?\d+\.\d+)"] * 6)
-        dh_table: list[list[float]] = self.read_table_pattern(
-            header_pattern2,
-            row_pattern2,
-            footer_pattern,
-            postprocess=float,
-            last_one_only=True,
-        )
 
         # Total hyperfine coupling parameters after diagonalization (MHz)
         header_pattern3 = (
@@ -3721,12 +4612,35 @@ class Outcar:
             r"\s*\-+"
         )
         row_pattern3 = r"(?:\d+)\s+" + r"\s+".join([r"([-]?\d+\.\d+)"] * 4)
-        th_table: list[list[float]] = self.read_table_pattern(
-            header_pattern3,
-            row_pattern3,
-            footer_pattern,
-            postprocess=float,
-            last_one_only=True,
+
+        fch_table: list[list[float]]
+        dh_table: list[list[float]]
+        th_table: list[list[float]]
+        fch_table, dh_table, th_table = yield (
+            _read_tables(
+                header_pattern1,
+                row_pattern1,
+                footer_pattern,
+                postprocess=float,
+                last_one_only=True,
+                anchors=("Fermi contact (isotropic) hyperfine",),
+            ),
+            _read_tables(
+                header_pattern2,
+                row_pattern2,
+                footer_pattern,
+                postprocess=float,
+                last_one_only=True,
+                anchors=("Dipolar hyperfine coupling parameters",),
+            ),
+            _read_tables(
+                header_pattern3,
+                row_pattern3,
+                footer_pattern,
+                postprocess=float,
+                last_one_only=True,
+                anchors=("Total hyperfine coupling parameters",),
+            ),
         )
 
         fc_shift_table: dict[Literal["fch", "dh", "th"], list[list[float]]] = {
@@ -3744,67 +4658,48 @@ class VolumetricData(BaseVolumetricData):
     """
 
     @staticmethod
-    def parse_file(filename: PathLike) -> tuple[Poscar, dict, dict]:
+    def parse_file(filename: PathLike, total_only: bool = False) -> tuple[Poscar, dict, dict]:
         """
         Parse a generic volumetric data file in the VASP like format.
         Used by subclasses for parsing files.
 
         Args:
             filename (PathLike): Path of file to parse.
+            total_only (bool): Whether to only read the first (total) data
+                block and its augmentation lines, skipping the spin and
+                magnetization blocks. Defaults to False.
 
         Returns:
             tuple[Poscar, dict, dict]: Poscar object, data dict, data_aug dict
         """
         poscar_read = False
         poscar_string: list[str] = []
-        dataset: NDArray = np.zeros((1, 1, 1))
         all_dataset: list[NDArray] = []
         # for holding any strings in input that are not Poscar
         # or VolumetricData (typically augmentation charges)
         all_dataset_aug: dict[int, list[str]] = {}
         dim: list[int] = []
         dimline = ""
-        read_dataset = False
-        ngrid_pts = 0
-        data_count = 0
         poscar = None
         with zopen(filename, mode="rt", encoding="utf-8") as file:
             for line in file:
                 original_line = line
                 line = line.strip()
-                if read_dataset:
-                    for tok in line.split():
-                        if data_count < ngrid_pts:
-                            # This complicated procedure is necessary because
-                            # VASP outputs x as the fastest index, followed by y
-                            # then z.
-                            no_x = data_count // dim[0]
-                            dataset[data_count % dim[0], no_x % dim[1], no_x // dim[1]] = float(tok)
-                            data_count += 1
-                    if data_count >= ngrid_pts:
-                        read_dataset = False
-                        data_count = 0
-                        all_dataset.append(dataset)
-
-                elif not poscar_read:
+                if not poscar_read:
                     if line != "" or len(poscar_string) == 0:
                         poscar_string.append(line)  # type:ignore[arg-type]
                     elif line == "":
                         poscar = Poscar.from_str("\n".join(poscar_string))
                         poscar_read = True
 
-                elif not dim:
-                    dim = [int(i) for i in line.split()]
-                    ngrid_pts = dim[0] * dim[1] * dim[2]
-                    dimline = line  # type:ignore[assignment]
-                    read_dataset = True
-                    dataset = np.zeros(dim)
-
-                elif line == dimline:
+                elif not dim or line == dimline:
                     # when line == dimline, expect volumetric data to follow
-                    # so set read_dataset to True
-                    read_dataset = True
-                    dataset = np.zeros(dim)
+                    if total_only and all_dataset:
+                        break
+                    if not dim:
+                        dim = [int(i) for i in line.split()]
+                        dimline = line  # type:ignore[assignment]
+                    all_dataset.append(VolumetricData._parse_grid(file, dim))
 
                 else:
                     # store any extra lines that were not part of the
@@ -3854,6 +4749,75 @@ class VolumetricData(BaseVolumetricData):
                 data_aug = {"total": all_dataset_aug.get(0)}
             return poscar, data, data_aug  # type: ignore[return-value]
 
+    @staticmethod
+    def _parse_grid(file: TextIO, dim: list[int], chunk_lines: int = 100_000) -> NDArray:
+        """Parse one block of volumetric data following a grid dimension line.
+
+        The numeric block is read in chunks of lines, each of which is converted
+        with a single vectorized parse, instead of token by token.
+
+        Args:
+            file (TextIO): Open file positioned at the start of the block.
+            dim (list[int]): Grid dimensions.
+            chunk_lines (int): Number of lines converted at once, which bounds
+                the memory used on top of the output array.
+
+        Returns:
+            NDArray: Grid data of shape dim.
+        """
+        ngrid_pts = dim[0] * dim[1] * dim[2]
+        values = np.empty(ngrid_pts)
+
+        # VASP writes a fixed number of values per line, so the number of
+        # lines in the block is known from the first one.
+        first_line = next(file, "")
+        n_lines = -(-ngrid_pts // max(1, len(first_line.split())))
+        lines = itertools.chain([first_line], itertools.islice(file, n_lines - 1))
+
+        count = 0
+        while count < ngrid_pts:
+            chunk = list(itertools.islice(lines, chunk_lines))
+            if not chunk:
+                # Fall back to reading line by line if the lines are irregular
+                chunk = [next(file, "")]
+            if not chunk[0]:
+                raise ValueError(f"Unexpected end of file while reading volumetric data with {dim=}.")
+            parsed = np.fromstring(" ".join(chunk), sep=" ")
+            n_parsed = min(len(parsed), ngrid_pts - count)
+            values[count : count + n_parsed] = parsed[:n_parsed]
+            count += n_parsed
+
+        # VASP outputs x as the fastest index, followed by y then z.
+        return values.reshape(dim, order="F")
+
+    @classmethod
+    def _from_cache(cls, filename: PathLike, cache_file: PathLike, total_only: bool = False) -> Self | None:
+        """Load from an HDF5 cache written by _write_cache, with the volumetric
+        data memory-mapped. None is returned if the cache does not exist, is
+        out of date with respect to filename or lacks the requested blocks.
+        With total_only, only the total data are returned even if the cache
+        holds all blocks.
+        """
+        if h5py is None or not os.path.isfile(cache_file):
+            return None
+        with h5py.File(cache_file, mode="r") as file:
+            if file.attrs.get("source_mtime") != os.path.getmtime(filename):
+                return None
+            if not total_only and file.attrs.get("total_only", True):
+                return None
+        cached = cls.from_hdf5(cache_file, mmap=True)
+        if total_only and set(cached.data) != {"total"}:
+            data_aug = {"total": cached.data_aug["total"]} if "total" in cached.data_aug else None
+            return cls(cached.structure, {"total": cached.data["total"]}, data_aug=data_aug)
+        return cached
+
+    def _write_cache(self, filename: PathLike, cache_file: PathLike, total_only: bool = False) -> None:
+        """Write the data to an HDF5 cache of filename, see _from_cache."""
+        self.to_hdf5(cache_file)
+        with h5py.File(cache_file, mode="a") as file:
+            file.attrs["source_mtime"] = os.path.getmtime(filename)
+            file.attrs["total_only"] = total_only
+
     def write_file(
         self,
         file_name: PathLike,
@@ -3955,17 +4919,37 @@ class Locpot(VolumetricData):
         super().__init__(struct, data, **kwargs)
 
     @classmethod
-    def from_file(cls, filename: PathLike, **kwargs) -> Self:
+    def from_file(
+        cls,
+        filename: PathLike,
+        total_only: bool = False,
+        cache_file: PathLike | None = None,
+        **kwargs,
+    ) -> Self:
         """Read a LOCPOT file.
 
         Args:
             filename (PathLike): Path to LOCPOT file.
+            total_only (bool): Whether to only read the total potential.
+            cache_file (PathLike): Path to an HDF5 cache of the file (requires
+                h5py). If the cache is up to date, the data are memory-mapped
+                from it instead of parsing filename; otherwise it is written
+                after parsing. The cache is not used if kwargs are given.
+                Defaults to None, i.e. no cache.
+            **kwargs: Passed to the Locpot constructor.
 
         Returns:
             Locpot
         """
-        poscar, data, _data_aug = VolumetricData.parse_file(filename)
-        return cls(poscar, data, **kwargs)
+        # The cache holds no constructor kwargs, so it is only used without them
+        use_cache = cache_file is not None and not kwargs
+        if use_cache and (locpot := cls._from_cache(filename, cache_file, total_only)) is not None:  # type:ignore[arg-type]
+            return locpot
+        poscar, data, _data_aug = VolumetricData.parse_file(filename, total_only=total_only)
+        locpot = cls(poscar, data, **kwargs)
+        if use_cache:
+            locpot._write_cache(filename, cache_file, total_only)  # type:ignore[arg-type]
+        return locpot
 
 
 class Chgcar(VolumetricData):
@@ -4000,17 +4984,29 @@ class Chgcar(VolumetricData):
         self._distance_matrix: dict = {}
 
     @classmethod
-    def from_file(cls, filename: str) -> Self:
+    def from_file(cls, filename: str, total_only: bool = False, cache_file: PathLike | None = None) -> Self:
         """Read a CHGCAR file.
 
         Args:
             filename (str): Path to CHGCAR file.
+            total_only (bool): Whether to only read the total charge density
+                and its augmentation occupancies, skipping the magnetization
+                blocks. Defaults to False.
+            cache_file (PathLike): Path to an HDF5 cache of the file (requires
+                h5py). If the cache is up to date, the data are memory-mapped
+                from it instead of parsing filename; otherwise it is written
+                after parsing. Defaults to None, i.e. no cache.
 
         Returns:
             Chgcar
         """
-        poscar, data, data_aug = VolumetricData.parse_file(filename)
-        return cls(poscar, data, data_aug=data_aug)  # type:ignore[arg-type]
+        if cache_file is not None and (chgcar := cls._from_cache(filename, cache_file, total_only)) is not None:
+            return chgcar
+        poscar, data, data_aug = VolumetricData.parse_file(filename, total_only=total_only)
+        chgcar = cls(poscar, data, data_aug=data_aug)  # type:ignore[arg-type]
+        if cache_file is not None:
+            chgcar._write_cache(filename, cache_file, total_only)
+        return chgcar
 
     @property
     def net_magnetization(self) -> float | None:
@@ -4055,18 +5051,28 @@ class Elfcar(VolumetricData):
         self.data = data
 
     @classmethod
-    def from_file(cls, filename: str) -> Self:
+    def from_file(cls, filename: str, total_only: bool = False, cache_file: PathLike | None = None) -> Self:
         """
         Read a ELFCAR file.
 
         Args:
             filename: Filename
+            total_only (bool): Whether to only read the first (spin up) block.
+            cache_file (PathLike): Path to an HDF5 cache of the file (requires
+                h5py). If the cache is up to date, the data are memory-mapped
+                from it instead of parsing filename; otherwise it is written
+                after parsing. Defaults to None, i.e. no cache.
 
         Returns:
             Elfcar
         """
-        poscar, data, _data_aug = VolumetricData.parse_file(filename)
-        return cls(poscar, data)
+        if cache_file is not None and (elfcar := cls._from_cache(filename, cache_file, total_only)) is not None:
+            return elfcar
+        poscar, data, _data_aug = VolumetricData.parse_file(filename, total_only=total_only)
+        elfcar = cls(poscar, data)
+        if cache_file is not None:
+            elfcar._write_cache(filename, cache_file, total_only)
+        return elfcar
 
     def get_alpha(self) -> VolumetricData:
         """Get the parameter alpha where ELF = 1/(1 + alpha^2)."""
@@ -4648,11 +5654,102 @@ def get_band_structure_from_vasp_multiple_branches(
     raise FileNotFoundError(f"failed to find any vasprun.xml in selected {dir_name=}")
 
 
+class XdatcarFrames(Sequence):
+    """Lazily-materialized sequence of the structures of an XDATCAR, backed by
+    the byte offsets of the coordinates of each frame. The coordinates of a
+    frame are parsed from the file only when it is accessed, and a Structure
+    is only created for frames that are indexed or iterated over. Used by
+    Xdatcar with lazy=True.
+    """
+
+    def __init__(
+        self,
+        filename: PathLike,
+        offsets: list[tuple[int, int]],
+        lattices: NDArray[np.float64],
+        species: list[Element | Species],
+    ) -> None:
+        """
+        Args:
+            filename (PathLike): Path to XDATCAR.
+            offsets (list[tuple[int, int]]): (start, end) byte offsets of the
+                block following the "Direct configuration=" line of each frame.
+            lattices (NDArray): Lattice matrices of the frames, shape (M, 3, 3).
+            species (list[Element | Species]): Species of the sites.
+        """
+        self.filename = filename
+        self.offsets = offsets
+        self.lattices = lattices
+        self.species = species
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @overload
+    def __getitem__(self, idx: int) -> Structure: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> XdatcarFrames: ...
+
+    def __getitem__(self, idx: int | slice) -> Structure | XdatcarFrames:
+        if isinstance(idx, slice):
+            return type(self)(self.filename, self.offsets[idx], self.lattices[idx], self.species)
+        with zopen(self.filename, mode="rb") as file:
+            return self._get_structure(self.lattices[idx], self._load(file, self.offsets[idx]))
+
+    def __iter__(self) -> Iterator[Structure]:
+        # Read the frames in order through a single file handle, which is
+        # important for compressed files that can only be seeked forward.
+        with zopen(self.filename, mode="rb") as file:
+            for lattice, offsets in zip(self.lattices, self.offsets, strict=True):
+                yield self._get_structure(lattice, self._load(file, offsets))
+
+    def _get_structure(self, lattice: NDArray[np.float64], frac_coords: NDArray[np.float64]) -> Structure:
+        return Structure(Lattice(lattice), self.species, frac_coords)
+
+    def _load(self, file, offsets: tuple[int, int]) -> NDArray[np.float64]:
+        start, end = offsets
+        file.seek(start)
+        n_sites = len(self.species)
+        lines = file.read(end - start).split(b"\n", n_sites)[:n_sites]
+        # Coordinates may be followed by the species of the site
+        tokens = np.array(b" ".join(lines).split()).reshape(n_sites, -1)
+        return tokens[:, :3].astype(np.float64)
+
+    def get_frac_coords(self, filename: PathLike | None = None) -> NDArray[np.float64]:
+        """Get the fractional coordinates of all frames, without creating any
+        Structure.
+
+        Args:
+            filename (PathLike): If given, the coordinates are written to this
+                .npy file, and returned as a read-only np.memmap of it, so that
+                they do not need to fit in memory. The file can be loaded
+                again later with np.load(filename, mmap_mode="r").
+
+        Returns:
+            NDArray: Fractional coordinates, shape (M, N, 3) for M frames of N sites.
+        """
+        shape = (len(self), len(self.species), 3)
+        if filename is None:
+            frac_coords = np.empty(shape)
+        else:
+            frac_coords = np.lib.format.open_memmap(filename, mode="w+", dtype=np.float64, shape=shape)
+        with zopen(self.filename, mode="rb") as file:
+            for idx, offsets in enumerate(self.offsets):
+                frac_coords[idx] = self._load(file, offsets)
+        if filename is None:
+            return frac_coords
+        frac_coords.flush()
+        del frac_coords
+        return np.load(filename, mmap_mode="r")
+
+
 class Xdatcar:
     """XDATCAR parser. Only tested with VASP 5.x files.
 
     Attributes:
-        structures (list[Structure]): Structures parsed from XDATCAR.
+        structures (list[Structure] | XdatcarFrames): Structures parsed from XDATCAR.
+            Parsed on demand if lazy=True.
         comment (str): Optional comment.
 
     Authors: Ram Balachandran
@@ -4664,6 +5761,7 @@ class Xdatcar:
         ionicstep_start: int = 1,
         ionicstep_end: int | None = None,
         comment: str | None = None,
+        lazy: bool = False,
     ) -> None:
         """
         Init a Xdatcar.
@@ -4673,6 +5771,13 @@ class Xdatcar:
             ionicstep_start (int): Starting index of ionic step.
             ionicstep_end (int): Ending index of ionic step.
             comment (str): Optional comment attached to this set of structures.
+            lazy (bool): Whether to only record the byte offsets of each frame in
+                a first scan of the file and parse the structures when they are
+                accessed, see XdatcarFrames. This is much faster and lighter on
+                memory for long MD runs, in particular when only the coordinates
+                are needed (see get_frac_coords). Requires the VASP 5+ format
+                with "Direct configuration=" lines, files without them are read
+                as if lazy=False. Defaults to False.
         """
         preamble = None
         coords_str: list = []
@@ -4686,6 +5791,27 @@ class Xdatcar:
         if ionicstep_end is not None and ionicstep_end < 1:
             raise ValueError("End ionic step cannot be less than 1")
 
+        if lazy:
+            preamble, n_sites, offsets, extra_lines = _get_xdatcar_frame_offsets(filename)
+            if offsets:
+                frames = slice(ionicstep_start - 1, None if ionicstep_end is None else ionicstep_end - 1)
+                with zopen(filename, mode="rb") as file:
+                    file.seek(offsets[0][0])
+                    coords_str = file.read(offsets[0][1] - offsets[0][0]).decode("utf-8").split("\n")[:n_sites]
+                structure = Poscar.from_str("\n".join([*preamble, "Direct", *coords_str])).structure
+                lattices = np.empty((len(offsets), 3, 3))
+                lattices[0] = structure.lattice.matrix
+                for idx in range(1, len(offsets)):
+                    lines = extra_lines.get(idx, [])
+                    # A variable cell XDATCAR repeats the preamble before every frame
+                    lattices[idx] = self._parse_lattice(lines[1:5]) if len(lines) >= 5 else lattices[idx - 1]
+
+                self.structures: list[Structure] | XdatcarFrames = XdatcarFrames(
+                    filename, offsets[frames], lattices[frames], structure.species
+                )
+                self.comment = comment or self.structures[0].formula
+                return
+
         file_len = sum(1 for _ in zopen(filename, mode="rt", encoding="utf-8"))
         ionicstep_cnt = 1
         ionicstep_start = ionicstep_start or 0
@@ -4746,6 +5872,16 @@ class Xdatcar:
     def __len__(self) -> int:
         return len(self.structures)
 
+    @staticmethod
+    def _parse_lattice(lines: list[str]) -> NDArray[np.float64]:
+        """Parse the scale factor and lattice vectors lines of a preamble, as in Poscar.from_str."""
+        scale = float(lines[0])
+        lattice = np.array([line.split()[:3] for line in lines[1:4]], dtype=np.float64)
+        if scale < 0:
+            # A negative scale factor is the volume of the cell
+            return lattice * (-scale / abs(np.linalg.det(lattice))) ** (1 / 3)
+        return lattice * scale
+
     def __iter__(self) -> Iterator[Structure]:
         """Iterator of Xdatcar, yielding a pymatgen Structure."""
         for idx in range(len(self)):
@@ -4798,7 +5934,7 @@ class Xdatcar:
         """
         preamble = None
         coords_str: list[str] = []
-        structures = self.structures
+        structures = list(self.structures)
         preamble_done = False
         if ionicstep_start < 1:
             raise ValueError("Start ionic step cannot be less than 1")
@@ -307,7 +307,8 @@ class EnumerateStructureTransformation(AbstractTransformation):
                 (Structure, energy) tuple.
             timeout (float): timeout in minutes to pass to EnumlibAdaptor.
             n_jobs (int): Number of parallel jobs used to compute energy criteria. This is used only when the Ewald
-                or m3gnet or callable sort_criteria is used. Default is -1, which uses all available CPUs.
+                or m3gnet or callable sort_criteria is used. Ewald energies are parallelized over the distinct
+                supercells of the orderings. Default is -1, which uses all available CPUs.
         """
         self.symm_prec = symm_prec
         self.min_cell_size = min_cell_size
@@ -403,7 +404,6 @@ class EnumerateStructureTransformation(AbstractTransformation):
 
         original_latt = structure.lattice
         inv_latt = np.linalg.inv(original_latt.matrix)
-        ewald_matrices = {}
         m3gnet_model: Relaxer | M3GNetCalculator | None = None
 
         if not callable(self.sort_criteria) and self.sort_criteria.startswith("m3gnet"):
@@ -425,18 +425,6 @@ class EnumerateStructureTransformation(AbstractTransformation):
                     "energy": energy,
                     "structure": struct,
                 }
-            if contains_oxidation_state and self.sort_criteria == "ewald":
-                new_latt = struct.lattice
-                transformation = np.dot(new_latt.matrix, inv_latt)
-                transformation = tuple(tuple(round(cell) for cell in row) for row in transformation)
-                if transformation not in ewald_matrices:
-                    s_supercell = structure * transformation
-                    ewald = EwaldSummation(s_supercell)
-                    ewald_matrices[transformation] = ewald
-                else:
-                    ewald = ewald_matrices[transformation]
-                energy = ewald.compute_sub_structure(struct)
-                return {"num_sites": len(struct), "energy": energy, "structure": struct}
             if self.sort_criteria.startswith("m3gnet"):
                 if self.sort_criteria == "m3gnet_relax":
                     relax_results = m3gnet_model.relax(struct)
@@ -455,7 +443,26 @@ class EnumerateStructureTransformation(AbstractTransformation):
 
             return {"num_sites": len(struct), "structure": struct}
 
-        all_structures = Parallel(n_jobs=self.n_jobs)(delayed(_get_stats)(struct) for struct in structures)
+        if not callable(self.sort_criteria) and contains_oxidation_state and self.sort_criteria == "ewald":
+            # Rank the orderings in the same supercell against a single Ewald matrix
+            supercell_orderings: dict[tuple, list[int]] = {}
+            for idx, struct in enumerate(structures):
+                transformation = np.dot(struct.lattice.matrix, inv_latt)
+                transformation = tuple(tuple(round(cell) for cell in row) for row in transformation)
+                supercell_orderings.setdefault(transformation, []).append(idx)
+            supercell_energies = Parallel(n_jobs=self.n_jobs if len(supercell_orderings) > 1 else 1)(
+                delayed(_get_sub_structure_ewald_energies)(structure * transformation, [structures[i] for i in indices])
+                for transformation, indices in supercell_orderings.items()
+            )
+            energies = np.zeros(len(structures))
+            for indices, supercell_energy in zip(supercell_orderings.values(), supercell_energies, strict=True):
+                energies[indices] = supercell_energy
+            all_structures = [
+                {"num_sites": len(struct), "energy": energy, "structure": struct}
+                for struct, energy in zip(structures, energies, strict=True)
+            ]
+        else:
+            all_structures = Parallel(n_jobs=self.n_jobs)(delayed(_get_stats)(struct) for struct in structures)
 
         def sort_func(struct):
             return (
@@ -901,6 +908,20 @@ class MagOrderingTransformation(AbstractTransformation):
         return True
 
 
+def _get_sub_structure_ewald_energies(supercell: Structure, sub_structures: list[Structure]) -> np.ndarray:
+    """Get the Ewald energies of orderings of a disordered supercell. Must not be
+    in the class so that it can be pickled.
+
+    Args:
+        supercell (Structure): Supercell of the disordered structure.
+        sub_structures (list[Structure]): Orderings of the supercell.
+
+    Returns:
+        np.ndarray: Ewald energy of each ordering.
+    """
+    return EwaldSummation(supercell).compute_sub_structures(sub_structures)
+
+
 def find_codopant(
     target: Species,
     oxidation_state: float,
@@ -82,6 +82,24 @@ class TestRemoveDuplicatesFilter:
         transmuter.apply_filter(dup_filter)
         assert len(transmuter.transformed_structures) == 11
 
+    def test_filter_index(self):
+        structures = [struct.copy() for struct in self._struct_list[:8]]
+        structures += [struct * (1, 1, 2) for struct in structures[:4]]
+        for struct in structures[-2:]:
+            struct.perturb(0.01)
+
+        # must agree with a pairwise fit against all previously accepted structures
+        dup_filter = RemoveDuplicatesFilter()
+        accepted: list[Structure] = []
+        for struct in structures:
+            is_new = not any(self._sm.fit(other, struct) for other in accepted)
+            assert dup_filter.test(struct) == is_new
+            if is_new:
+                accepted.append(struct)
+        # supercells are duplicates of their parent structures
+        assert len(accepted) <= 8
+        assert sum(map(len, dup_filter.structure_list.values())) == len(accepted)
+
     def test_as_from_dict(self):
         fil = RemoveDuplicatesFilter()
         dct = fil.as_dict()
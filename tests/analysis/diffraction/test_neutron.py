@@ -74,6 +74,15 @@ class TestNDCalculator(MatSciTest):
         assert pattern.x[2] == approx(44.39599754)
         assert pattern.y[2] == approx(39.471514740)
 
+    def test_get_patterns(self):
+        structures = [self.get_structure("CsCl"), self.get_structure("Graphite")]
+        c = NDCalculator(wavelength=1.54184, debye_waller_factors={"C": 1})
+        patterns = c.get_patterns(structures, two_theta_range=(0, 90))
+        for struct, pattern in zip(structures, patterns, strict=True):
+            expected = c.get_pattern(struct, two_theta_range=(0, 90))
+            assert pattern.x == approx(expected.x)
+            assert pattern.y == approx(expected.y)
+
     def test_get_plot(self):
         struct = self.get_structure("Graphite")
         c = NDCalculator(wavelength=1.54184, debye_waller_factors={"C": 1})
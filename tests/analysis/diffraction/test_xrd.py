@@ -87,3 +87,26 @@ class TestXRDCalculator(MatSciTest):
         assert xrd.x[0] == approx(40.294828554672264)
         assert xrd.y[0] == approx(2377745.2296686019)
         assert xrd.d_hkls[0] == approx(2.2382050944897789)
+
+    def test_get_patterns(self):
+        structures = [self.get_structure("CsCl"), self.get_structure("LiFePO4")]
+        xrd_calc = XRDCalculator()
+        for n_jobs in (1, 2):
+            patterns = xrd_calc.get_patterns(structures, n_jobs=n_jobs)
+            assert len(patterns) == len(structures)
+            for struct, pattern in zip(structures, patterns, strict=True):
+                expected = xrd_calc.get_pattern(struct)
+                assert pattern.x == approx(expected.x)
+                assert pattern.y == approx(expected.y)
+                assert pattern.hkls == expected.hkls
+
+    def test_get_pattern_batched(self):
+        # results must not depend on the number of terms evaluated per batch
+        struct = self.get_structure("LiFePO4")
+        xrd_calc = XRDCalculator(debye_waller_factors={"O": 0.5})
+        expected = xrd_calc.get_pattern(struct, scaled=False)
+        xrd_calc.MAX_BATCH_TERMS = 7
+        xrd = xrd_calc.get_pattern(struct, scaled=False)
+        assert xrd.x == approx(expected.x)
+        assert xrd.y == approx(expected.y)
+        assert xrd.d_hkls == approx(expected.d_hkls)
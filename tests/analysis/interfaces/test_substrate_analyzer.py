@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from numpy.testing import assert_allclose
+from pytest import approx
 
 from pymatgen.analysis.elasticity.elastic import ElasticTensor
 from pymatgen.analysis.interfaces.substrate_analyzer import SubstrateAnalyzer
@@ -58,3 +59,19 @@ def test_generate_surface_vectors():
         [[-3.766937, -1.928326, -6.328967], [3.766937, -12.307154, 0.0]],
         atol=1e-6,
     )
+
+
+def test_calculate_substrates():
+    analyzer = SubstrateAnalyzer()
+    all_matches = analyzer.calculate_substrates(film, [substrate, film], lowest=True, n_jobs=2)
+    assert len(all_matches) == 2
+
+    # identical to matching each substrate separately
+    for sub, matches in zip([substrate, film], all_matches, strict=True):
+        expected = list(analyzer.calculate(film, sub, lowest=True))
+        assert len(matches) == len(expected) > 0
+        for match, exp_match in zip(matches, expected, strict=True):
+            assert (match.film_miller, match.substrate_miller) == (exp_match.film_miller, exp_match.substrate_miller)
+            assert_allclose(match.film_sl_vectors, exp_match.film_sl_vectors)
+            assert_allclose(match.substrate_sl_vectors, exp_match.substrate_sl_vectors)
+            assert match.von_mises_strain == approx(exp_match.von_mises_strain)
@@ -9,7 +9,9 @@ from pymatgen.analysis.interfaces.zsl import (
     fast_norm,
     get_factors,
     is_same_vectors,
+    is_same_vectors_batch,
     reduce_vectors,
+    reduce_vectors_batch,
     vec_area,
 )
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
@@ -71,3 +73,25 @@ class TestZSLGen(MatSciTest):
         for match in matches:
             assert match is not None
             assert isinstance(match.match_area, float)
+
+    def test_batch(self):
+        # super lattices of the film with ties in the reduction (hexagonal)
+        hexagonal = np.array([[1, 0, 0], [-0.5, 3**0.5 / 2, 0]])
+        for vectors in (self.film.lattice.matrix[:2], self.substrate.lattice.matrix[:2], hexagonal):
+            transformations = np.array(
+                [[[ii, jj], [kk, 4]] for ii in range(1, 4) for jj in range(-3, 4) for kk in (0, 2)]
+            )
+            super_lattices = np.dot(transformations, vectors)
+            reduced = reduce_vectors_batch(super_lattices[:, 0], super_lattices[:, 1])
+            assert reduced.shape == (len(transformations), 2, 3)
+            assert_array_equal(reduced, [reduce_vectors(*vecs) for vecs in super_lattices])
+
+            strained = reduced[::-1] * [[[1.02], [0.99]]]
+            for bidirectional in (False, True):
+                kwargs = {"bidirectional": bidirectional, "max_length_tol": 0.03, "max_angle_tol": 0.01}
+                is_same = is_same_vectors_batch(reduced, strained, **kwargs)
+                assert is_same.shape == (len(reduced), len(strained))
+                assert is_same.any()
+                assert_array_equal(
+                    is_same, [[is_same_vectors(vecs1, vecs2, **kwargs) for vecs2 in strained] for vecs1 in reduced]
+                )
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 from pytest import approx
 
-from pymatgen.analysis.ewald import EwaldMinimizer, EwaldSummation
+from pymatgen.analysis.ewald import EwaldMinimizer, EwaldSummation, IncrementalEwald
 from pymatgen.core.structure import Structure
 from pymatgen.util.testing import VASP_IN_DIR
 
@@ -77,6 +77,94 @@ class TestEwaldSummation:
         assert dct["recip_space_cut"] == ham._gmax
         assert ham.as_dict() == EwaldSummation.from_dict(dct).as_dict()
 
+    def test_potential_matrix(self):
+        ham = EwaldSummation(self.struct)
+        charges = np.array(ham._oxi_states)
+        potential = ham.potential_matrix
+        assert potential.shape == (len(self.struct), len(self.struct))
+        assert np.allclose(potential * charges[:, None] * charges[None, :], ham.total_energy_matrix)
+
+        # batched sums over small chunks give the same matrices and forces
+        ham_chunked = EwaldSummation(self.struct, compute_forces=True)
+        ham_chunked.CHUNK_SIZE = 7
+        ham = EwaldSummation(self.struct, compute_forces=True)
+        assert np.allclose(ham_chunked.total_energy_matrix, ham.total_energy_matrix)
+        assert np.allclose(ham_chunked.forces, ham.forces)
+
+    def test_compute_sub_structures(self):
+        ham = EwaldSummation(self.struct)
+        assert ham.compute_sub_structure(self.struct) == approx(np.sum(ham.total_energy_matrix))
+
+        removed = ([0, 4, 8, 12], [1, 5, 9, 13, 17], [2, 6])
+        sub_structs = []
+        for indices in removed:
+            sub_struct = self.struct.copy()
+            sub_struct.remove_sites(indices)
+            # sites are matched to the parent modulo lattice vectors
+            sub_struct.translate_sites(range(len(sub_struct)), [1, -1, 0], to_unit_cell=False)
+            sub_structs.append(sub_struct)
+
+        energies = ham.compute_sub_structures(sub_structs)
+        assert energies.shape == (3,)
+        for indices, sub_struct, energy in zip(removed, sub_structs, energies, strict=True):
+            assert ham.compute_sub_structure(sub_struct) == approx(energy)
+            mask = np.ones(len(self.struct), dtype=bool)
+            mask[indices] = False
+            assert energy == approx(np.sum(ham.total_energy_matrix[mask][:, mask]))
+
+        sub_struct = self.struct.copy()
+        sub_struct.translate_sites([0], [0.1, 0, 0])
+        with pytest.raises(ValueError, match="Missing sites"):
+            ham.compute_sub_structure(sub_struct)
+
+
+class TestIncrementalEwald:
+    def setup_method(self):
+        self.struct = Structure.from_file(f"{VASP_IN_DIR}/POSCAR")
+        self.struct.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+        self.ewald = EwaldSummation(self.struct)
+
+    def test_swaps(self):
+        engine = IncrementalEwald(self.ewald)
+        assert engine.energy == approx(self.ewald.total_energy)
+
+        rng = np.random.default_rng(0)
+        indices1, indices2 = rng.integers(0, len(self.struct), (2, 200))
+        changes = engine.get_swap_energy_changes(indices1, indices2)
+        assert changes.shape == (200,)
+        for idx1, idx2, change in zip(indices1, indices2, changes, strict=True):
+            assert engine.get_swap_energy_changes(idx1, idx2) == approx(change)
+        for idx1, idx2 in zip(indices1, indices2, strict=True):
+            energy = engine.energy
+            change = engine.get_swap_energy_changes(idx1, idx2)
+            assert engine.swap(idx1, idx2) == approx(energy + change)
+        assert engine.energy == approx(engine.get_energy(engine.charges))
+
+        # same as the Ewald sum of the swapped structure
+        species = {1: "Li+", 2: "Fe2+", 5: "P5+", -2: "O2-"}
+        swapped = Structure(self.struct.lattice, [species[round(q)] for q in engine.charges], self.struct.frac_coords)
+        assert engine.energy == approx(EwaldSummation(swapped).total_energy)
+
+    def test_set_charges(self):
+        charges = np.array(self.ewald._oxi_states)
+        engine = IncrementalEwald(self.ewald, charges=np.zeros(len(self.struct)))
+        assert engine.energy == approx(0)
+
+        # charged cells include the charged-cell energy
+        change = engine.get_energy_change([0, 1, 2], charges[:3])
+        assert engine.set_charges([0, 1, 2], charges[:3]) == approx(change)
+        assert engine.energy == approx(engine.get_energy(engine.charges))
+        assert engine.set_charges(range(len(charges)), charges) == approx(self.ewald.total_energy)
+        assert np.allclose(engine.site_potentials, self.ewald.potential_matrix @ charges)
+
+        energies = engine.get_energies([charges, np.zeros(len(charges)), engine.charges])
+        assert energies == approx([self.ewald.total_energy, 0, engine.energy])
+
+        with pytest.raises(ValueError, match="Expected 24 charges"):
+            IncrementalEwald(self.ewald, charges=[1, 2])
+        with pytest.raises(ValueError, match="read-only"):
+            engine.charges[0] = 1
+
 
 class TestEwaldMinimizer:
     def test_init(self):
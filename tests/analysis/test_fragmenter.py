@@ -4,7 +4,7 @@ import platform
 
 import pytest
 
-from pymatgen.analysis.fragmenter import Fragmenter
+from pymatgen.analysis.fragmenter import Fragmenter, fragment_molecules
 from pymatgen.analysis.graphs import MoleculeGraph
 from pymatgen.analysis.local_env import OpenBabelNN
 from pymatgen.core.structure import Molecule
@@ -107,6 +107,15 @@ class TestFragmentMolecule(MatSciTest):
         fragmenter = Fragmenter(molecule=self.tfsi, edges=self.tfsi_edges, depth=0)
         assert fragmenter.total_unique_fragments == 156
 
+    def test_fragment_molecules(self):
+        fragmenters = fragment_molecules(
+            [self.pc_frag1, self.tfsi], edges=[self.pc_frag1_edges, self.tfsi_edges], depth=0, n_jobs=2
+        )
+        assert [fragmenter.total_unique_fragments for fragmenter in fragmenters] == [12, 156]
+
+        with pytest.raises(ValueError, match="Got 1 edge lists for 2 molecules"):
+            fragment_molecules([self.pc_frag1, self.tfsi], edges=[self.pc_frag1_edges])
+
     def test_babel_tfsi(self):
         pytest.importorskip("openbabel")
         fragmenter = Fragmenter(molecule=self.tfsi, depth=0)
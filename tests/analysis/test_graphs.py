@@ -4,6 +4,7 @@ import copy
 import re
 import warnings
 from glob import glob
+from itertools import combinations
 from shutil import which
 
 import networkx as nx
@@ -12,7 +13,13 @@ import pytest
 from monty.serialization import loadfn
 from pytest import approx
 
-from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError, PeriodicSite, StructureGraph
+from pymatgen.analysis.graphs import (
+    MoleculeGraph,
+    MolGraphSplitError,
+    PeriodicSite,
+    StructureGraph,
+    _get_connected_node_sets,
+)
 from pymatgen.analysis.local_env import (
     CovalentBondNN,
     CutOffDictNN,
@@ -812,6 +819,13 @@ class TestMoleculeGraph:
                     atom = split_mg.molecule[j]
                     assert species[j] == str(atom.specie)
 
+    def test_get_connected_node_sets(self):
+        edges = {(edge[0], edge[1]): None for edge in self.pc_edges}
+        graph = MoleculeGraph.from_edges(self.pc, edges).graph.to_undirected()
+        for size, node_sets in enumerate(_get_connected_node_sets(graph, len(self.pc) - 1), start=1):
+            expected = [nodes for nodes in combinations(graph, size) if nx.is_connected(graph.subgraph(nodes))]
+            assert node_sets == expected
+
     def test_build_unique_fragments(self):
         edges = {(edge[0], edge[1]): None for edge in self.pc_edges}
         mol_graph = MoleculeGraph.from_edges(self.pc, edges)
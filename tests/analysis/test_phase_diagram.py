@@ -509,6 +509,35 @@ class TestPhaseDiagram(MatSciTest):
             h_e = self.pd.get_hull_energy_per_atom(entry.composition)
             assert h_e == approx(entry.energy_per_atom)
 
+    def test_get_hull_energy_per_atom_batch(self):
+        comps = [entry.composition for entry in self.pd.all_entries]
+        hull_energies, facets, amounts = self.pd.get_hull_energy_per_atom_batch(comps, return_decomp=True, batch_size=7)
+        assert facets.shape == amounts.shape == (len(comps), self.pd.dim)
+        for comp, hull_energy, facet, amts in zip(comps, hull_energies, facets, amounts, strict=True):
+            decomp, expected = self.pd.get_decomp_and_hull_energy_per_atom(comp)
+            assert hull_energy == approx(expected)
+            assert {self.pd.qhull_entries[idx]: amt for idx, amt in zip(facet, amts, strict=True) if amt} == approx(
+                decomp
+            )
+
+        # Array input in the element order of the phase diagram
+        amounts = [[comp[el] for el in self.pd.elements] for comp in comps]
+        assert_allclose(self.pd.get_hull_energy_per_atom_batch(amounts), hull_energies)
+
+        with pytest.raises(ValueError, match="has elements not in the phase diagram"):
+            self.pd.get_hull_energy_per_atom_batch([Composition("U")])
+
+    def test_get_e_above_hull_batch(self):
+        entries = self.pd.all_entries
+        e_above_hull = self.pd.get_e_above_hull_batch(
+            [entry.composition for entry in entries], [entry.energy_per_atom for entry in entries]
+        )
+        assert_allclose(e_above_hull, [self.pd.get_e_above_hull(entry) for entry in entries], atol=1e-10)
+
+        # Energies below the hull are not rejected
+        e_above_hull = self.pd.get_e_above_hull_batch([Composition("Li2O")], [-10])
+        assert e_above_hull[0] < 0
+
     def test_1d_pd(self):
         entry = PDEntry("H", 0)
         pd = PhaseDiagram([entry])
@@ -649,6 +678,40 @@ class TestPhaseDiagram(MatSciTest):
         assert pd.elements == self.pd.elements
         assert {*pd.as_dict()} == {*self.pd.as_dict()}
 
+    def test_hdf5(self):
+        self.pd.to_hdf5(f"{self.tmp_path}/pd.h5")
+        pd = PhaseDiagram.from_hdf5(f"{self.tmp_path}/pd.h5")
+        assert isinstance(pd.qhull_data, np.memmap)
+        assert_allclose(pd.qhull_data, self.pd.qhull_data)
+        assert pd.elements == self.pd.elements
+        assert pd.el_refs == self.pd.el_refs
+
+        # entries are only decoded when accessed
+        for entry in self.pd.all_entries:
+            assert pd.get_e_above_hull(entry) == approx(self.pd.get_e_above_hull(entry), abs=1e-12)
+        assert len(pd.all_entries._cache) < len(pd.all_entries)
+        assert pd.stable_entries == self.pd.stable_entries
+        assert pd.get_decomposition(Composition("Li3FeO4")) == approx(self.pd.get_decomposition(Composition("Li3FeO4")))
+        assert list(pd.all_entries) == self.pd.all_entries
+        assert pd.unstable_entries == self.pd.unstable_entries
+        assert PhaseDiagram.from_dict(pd.as_dict()).as_dict() == pd.as_dict()
+        assert set(vars(PhaseDiagram.from_hdf5(f"{self.tmp_path}/pd.h5"))) == set(vars(PhaseDiagram(self.entries)))
+
+        # entries of phase diagrams from from_dict are equal but not identical
+        PhaseDiagram.from_dict(self.pd.as_dict()).to_hdf5(f"{self.tmp_path}/pd_from_dict.h5")
+        pd = PhaseDiagram.from_hdf5(f"{self.tmp_path}/pd_from_dict.h5")
+        assert list(pd.qhull_entries) == list(self.pd.qhull_entries)
+        assert pd.el_refs == self.pd.el_refs
+        assert set(pd.stable_entries) == set(self.pd.stable_entries)
+
+        pd = PhaseDiagram.from_hdf5(f"{self.tmp_path}/pd.h5", mmap=False)
+        assert not isinstance(pd.qhull_data, np.memmap)
+        comps = [entry.composition for entry in self.entries]
+        assert_allclose(pd.get_hull_energy_per_atom_batch(comps), self.pd.get_hull_energy_per_atom_batch(comps))
+
+        with pytest.raises(TypeError, match="not supported for PatchedPhaseDiagram"):
+            PatchedPhaseDiagram(self.entries).to_hdf5(f"{self.tmp_path}/ppd.h5")
+
     def test_el_refs(self):
         # Create an imitation of pre_computed phase diagram with el_refs keys being
         # tuple[str, PDEntry] instead of tuple[Element, PDEntry].
@@ -838,6 +901,38 @@ class TestPatchedPhaseDiagram:
         with pytest.raises(ValueError, match="No suitable PhaseDiagrams found for PDEntry"):
             self.ppd.get_pd_for_entry(self.no_patch_entry)
 
+    def test_parallel(self):
+        ppd = PatchedPhaseDiagram(entries=self.entries, n_jobs=2)
+        assert list(ppd.pds) == list(self.ppd.pds)
+        assert ppd.stable_entries == self.ppd.stable_entries
+        all_entry_ids = {id(entry) for entry in ppd.all_entries}
+        for space, pd in ppd.pds.items():
+            assert_allclose(pd.facets, self.ppd[space].facets)
+            # patches share the entry objects of the PatchedPhaseDiagram
+            assert {id(entry) for entry in pd.all_entries} <= all_entry_ids
+
+    def test_get_hull_energy_per_atom_batch(self):
+        comps = [entry.composition for entry in self.ppd.all_entries if entry != self.no_patch_entry]
+        hull_energies, facets, amounts = self.ppd.get_hull_energy_per_atom_batch(comps, return_decomp=True)
+        assert facets.shape == amounts.shape == (len(comps), 4)
+        for comp, hull_energy, facet, amts in zip(comps, hull_energies, facets, amounts, strict=True):
+            assert hull_energy == approx(self.ppd.get_hull_energy_per_atom(comp))
+            assert hull_energy == approx(self.pd.get_hull_energy_per_atom(comp))
+            decomp = {self.ppd.qhull_entries[idx]: amt for idx, amt in zip(facet, amts, strict=True) if amt}
+            assert decomp == approx(self.ppd.get_decomposition(comp))
+
+        # compositions spanning several patches are not supported
+        for comp in [Composition("He"), self.novel_comps[0]]:
+            with pytest.raises(ValueError, match="No suitable PhaseDiagrams found for"):
+                self.ppd.get_hull_energy_per_atom_batch([Composition("CH4"), comp])
+
+    def test_get_e_above_hull_batch(self):
+        entries = [entry for entry in self.ppd.all_entries if entry != self.no_patch_entry]
+        e_above_hull = self.ppd.get_e_above_hull_batch(
+            [entry.composition for entry in entries], [entry.energy_per_atom for entry in entries]
+        )
+        assert_allclose(e_above_hull, [self.pd.get_e_above_hull(entry) for entry in entries], atol=1e-10)
+
     def test_raises_on_missing_terminal_entries(self):
         entry = PDEntry("FeO", -1.23)
         with pytest.raises(ValueError, match=r"Missing terminal entries for elements \['Fe', 'O'\]"):
@@ -873,6 +968,35 @@ class TestPatchedPhaseDiagram:
         assert self.ppd[unlikely_chem_space] == self.pd
         del self.ppd[unlikely_chem_space]  # test __delitem__() and restore original state
 
+    def test_pds_changed_directly(self):
+        ppd = PatchedPhaseDiagram(entries=self.entries)
+        entry = next(entry for entry in ppd.all_entries if len(entry.elements) > 1)
+        space = frozenset(entry.elements)
+        pd = ppd.get_pd_for_entry(entry)
+
+        # Lookups follow patches removed from or added to pds without __delitem__/__setitem__
+        for patch_space in [patch_space for patch_space in ppd.pds if space <= patch_space]:
+            del ppd.pds[patch_space]
+        with pytest.raises(ValueError, match="No suitable PhaseDiagrams found for PDEntry"):
+            ppd.get_pd_for_entry(entry)
+        ppd.pds[space] = pd
+        assert ppd.get_pd_for_entry(entry) is pd
+
+        # The index is only rebuilt after a change, also one made through other dict methods
+        patch_lookup = ppd._patch_lookup
+        assert ppd.get_pd_for_entry(entry) is pd
+        assert ppd._patch_lookup is patch_lookup
+        ppd.pds.pop(space)
+        with pytest.raises(ValueError, match="No suitable PhaseDiagrams found for PDEntry"):
+            ppd.get_pd_for_entry(entry)
+        ppd.pds.update({space: pd})
+        assert ppd.get_pd_for_entry(entry) is pd
+
+        # or after pds is replaced
+        ppd.pds = {}
+        with pytest.raises(ValueError, match="No suitable PhaseDiagrams found for PDEntry"):
+            ppd.get_pd_for_entry(entry)
+
     def test_remove_redundant_spaces(self):
         spaces = tuple(frozenset(entry.elements) for entry in self.ppd.qhull_entries)
         # NOTE this is 5 not 4 as "He" is a non redundant space that gets dropped for other reasons
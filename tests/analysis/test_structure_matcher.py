@@ -560,6 +560,25 @@ class TestStructureMatcher(MatSciTest):
         out = sm.group_structures(self.struct_list, anonymous=True)
         assert list(map(len, out)) == [4, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1]
 
+    def test_group_structures_parallel(self):
+        sm = StructureMatcher()
+        serial = sm.group_structures(self.struct_list)
+        parallel = sm.group_structures(self.struct_list, n_jobs=2)
+        assert [[id(s) for s in group] for group in parallel] == [[id(s) for s in group] for group in serial]
+
+    def test_get_lattice_invariants(self):
+        sm = StructureMatcher()
+        struct = sm._get_reduced_structure(self.struct_list[0])
+        lengths, minima = sm._get_lattice_invariants(struct)
+        assert np.all(np.diff(lengths) >= 0)
+        assert np.all(minima <= lengths + 1e-8)
+        assert minima[0] == approx(lengths[0])
+        # the invariants of a matching structure must not prune the pair
+        other = sm._get_reduced_structure(self.struct_list[1])
+        other_lengths, _ = sm._get_lattice_invariants(other)
+        assert sm.fit(struct, other)
+        assert np.all(minima <= (1 + sm.ltol) * other_lengths)
+
     def test_mix(self):
         structures = list(map(self.get_structure, ["Li2O", "Li2O2", "LiFePO4"]))
         structures += [Structure.from_file(f"{VASP_IN_DIR}/{fname}") for fname in ["POSCAR_Li2O", "POSCAR_LiFePO4"]]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import os
+import shutil
+
 from pytest import approx
 
 from pymatgen.apps.borg.hive import VaspToComputedEntryDrone
 from pymatgen.apps.borg.queen import BorgQueen
+from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatgen.util.testing import TEST_FILES_DIR
 
 __author__ = "Shyue Ping Ong"
@@ -27,3 +31,32 @@ class TestBorgQueen:
         queen = BorgQueen(drone)
         queen.load_data(f"{TEST_DIR}/assimilated.json")
         assert len(queen.get_data()) == 1
+
+    def test_incremental_assimilate(self, tmp_path):
+        for name in ("calc1", "calc2"):
+            os.makedirs(f"{tmp_path}/root/{name}")
+            shutil.copy(f"{TEST_DIR}/vasprun.xml.xe.gz", f"{tmp_path}/root/{name}")
+        manifest = f"{tmp_path}/manifest.jsonl.gz"
+        filename = f"{tmp_path}/assimilated.jsonl"
+
+        queen = BorgQueen(VaspToComputedEntryDrone(), number_of_drones=2)
+        assert queen.incremental_assimilate(f"{tmp_path}/root", manifest, filename, chunksize=2) == 2
+        # Nothing changed
+        assert queen.incremental_assimilate(f"{tmp_path}/root", manifest, filename) == 0
+        assert queen.get_data() == []
+
+        # Only the modified path is assimilated again
+        shutil.copy(f"{TEST_DIR}/assimilated.json", f"{tmp_path}/root/calc2")
+        queen = BorgQueen(VaspToComputedEntryDrone())
+        assert queen.incremental_assimilate(f"{tmp_path}/root", manifest) == 1
+        assert len(queen.get_data()) == 1
+
+        # Changing the drone settings invalidates the manifest
+        queen = BorgQueen(VaspToComputedEntryDrone(inc_structure=True))
+        assert queen.incremental_assimilate(f"{tmp_path}/root", manifest, filename) == 2
+
+        queen.load_data(filename)
+        data = queen.get_data()
+        assert len(data) == 2
+        assert all(isinstance(entry, ComputedStructureEntry) for entry in data)
+        assert data[0].energy == approx(0.5559329, 1e-6)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from shutil import which
+import itertools
+from shutil import copyfile, which
 
 import numpy as np
 import pytest
 from pytest import approx
 
-from pymatgen.command_line.enumlib_caller import EnumError, EnumlibAdaptor
-from pymatgen.core import Element, Structure
+from pymatgen.analysis.structure_matcher import StructureMatcher
+from pymatgen.command_line.enumlib_caller import EnumError, EnumlibAdaptor, read_struct_enum_out
+from pymatgen.core import Element, Lattice, Structure
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.transformations.site_transformations import RemoveSitesTransformation
 from pymatgen.transformations.standard_transformations import SubstitutionTransformation
@@ -126,3 +128,82 @@ class TestEnumlibAdaptor(MatSciTest):
 
         with pytest.raises(TimeoutError, match="Enumeration took more than timeout 0.05 minutes"):
             adaptor.run()
+
+
+def test_read_struct_enum_out():
+    # Half-filled simple cubic lattice with orderings along [001], [011] and [111]
+    # and a checkerboard ordering in a 4-site supercell
+    filename = f"{ENUMLIB_TEST_FILES_DIR}/struct_enum.out"
+    structures = list(read_struct_enum_out(filename, ["Fe", "X"]))
+    assert [struct.volume for struct in structures] == approx([2000, 2000, 2000, 4000])
+    assert [struct.lattice.abc for struct in structures] == approx(
+        [(10, 10, 20), (10, 200**0.5, 200**0.5), (200**0.5,) * 3, (10, 20, 20)]
+    )
+    parities = ([0, 0, 1], [0, -1, 1], [1, 1, 1], [0, 1, 1])
+    for struct, parity in zip(structures, parities, strict=True):
+        assert struct.composition.get_atomic_fraction(Element("Fe")) == approx(0.5)
+        # sites are grouped by label
+        assert [site.species_string for site in struct] == ["Fe"] * (len(struct) // 2) + ["X0+"] * (len(struct) // 2)
+        for site in struct:
+            is_even = round(np.dot(site.coords / 10, parity)) % 2 == 0
+            assert is_even == (site.species_string == "Fe")
+
+    parallel_structures = list(read_struct_enum_out(filename, ["Fe", "X"], n_jobs=2, chunk_size=1))
+    assert parallel_structures == structures
+
+
+def test_read_struct_enum_out_multilattice():
+    # CsCl parent with a d-vector for each sublattice. Labelings index the
+    # sites by d-vector first, then by supercell coset
+    filename = f"{ENUMLIB_TEST_FILES_DIR}/struct_enum_multilattice.out"
+    structures = list(read_struct_enum_out(filename, ["Cs", "Cl"]))
+
+    cscl = Structure(Lattice.cubic(4), ["Cs", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    layered = Structure(
+        Lattice.tetragonal(4, 8),
+        ["Cs", "Cs", "Cl", "Cl"],
+        [[0, 0, 0], [0.5, 0.5, 0.25], [0, 0, 0.5], [0.5, 0.5, 0.75]],
+    )
+    # Labels alternate with the parity of the parent lattice point on the
+    # first sublattice, and the other way around on the second
+    species, coords = [], []
+    for point in itertools.product(range(2), repeat=3):
+        is_even = sum(point) % 2 == 0
+        species += ["Cs", "Cl"] if is_even else ["Cl", "Cs"]
+        coords += [np.array(point) / 2, (np.array(point) + 0.5) / 2]
+    alternating = Structure(Lattice.cubic(8), species, coords)
+
+    matcher = StructureMatcher()
+    for struct, expected in zip(structures, [cscl, cscl, layered, alternating], strict=True):
+        assert matcher.fit(struct, expected)
+
+    # The LLL-reduced superlattices are a change of basis of the columns of the HNFs
+    hnfs = [np.eye(3), np.diag([1, 1, 2]), np.diag([1, 1, 2]), [[1, 0, 0], [0, 1, 0], [1, 1, 2]]]
+    for struct, hnf in zip(structures, hnfs, strict=True):
+        basis_change = struct.lattice.matrix @ np.linalg.inv(np.transpose(hnf) @ cscl.lattice.matrix)
+        assert basis_change == approx(np.round(basis_change))
+        assert abs(np.linalg.det(basis_change)) == approx(1)
+
+    parallel_structures = list(read_struct_enum_out(filename, ["Cs", "Cl"], n_jobs=2, chunk_size=1))
+    assert parallel_structures == structures
+
+
+@pytest.mark.skipif(not MAKESTR_CMD, reason="makestr not present.")
+@pytest.mark.parametrize("filename", ["struct_enum.out", "struct_enum_multilattice.out"])
+def test_read_struct_enum_out_makestr(filename, tmp_path, monkeypatch):
+    copyfile(f"{ENUMLIB_TEST_FILES_DIR}/{filename}", tmp_path / "struct_enum.out")
+    monkeypatch.chdir(tmp_path)
+    species = ["Cs", "Cl"]
+    structures = list(read_struct_enum_out("struct_enum.out", species))
+
+    adaptor = EnumlibAdaptor(Structure(Lattice.cubic(4), ["Cs"], [[0, 0, 0]]))
+    adaptor.index_species = species
+    makestr_structures = adaptor._run_makestr(len(structures))
+    assert len(makestr_structures) == len(structures)
+
+    matcher = StructureMatcher()
+    for struct, makestr_struct in zip(structures, makestr_structures, strict=True):
+        assert matcher.fit(struct, makestr_struct)
+        basis_change = struct.lattice.matrix @ np.linalg.inv(makestr_struct.lattice.matrix)
+        assert basis_change == approx(np.round(basis_change))
+        assert abs(np.linalg.det(basis_change)) == approx(1)
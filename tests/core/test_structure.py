@@ -4,6 +4,8 @@ import itertools
 import json
 import math
 import os
+import pickle
+from copy import deepcopy
 from fractions import Fraction
 from pathlib import Path
 from shutil import which
@@ -33,6 +35,7 @@ from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.io.cif import CifParser
 from pymatgen.io.vasp.inputs import Poscar
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+from pymatgen.util.coord import lattice_points_in_supercell
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, MatSciTest
 
 try:
@@ -353,6 +356,9 @@ class TestIStructure(MatSciTest):
         assert new_struct.properties["another_prop"] == "test"
         assert new_struct.properties["test_property"] == "test"
 
+        assert self.labeled_structure.copy().labels == ["Si1", "Si2"]
+        assert self.struct.copy().labels == ["Si", "Si"]
+
         coords = [[0, 0, 0], [0.0, 0, 1e-07]]
 
         struct = IStructure(
@@ -1181,6 +1187,70 @@ class TestStructure(MatSciTest):
         li_si.relabel_sites()  # check no-op for unique labels
         assert li_si.labels == ["Li_1", "Si_1"]
 
+    def test_neighbor_list_cache(self):
+        struct = self.struct * (2, 2, 2)
+
+        def assert_neighbor_list_equal(struct, r):
+            # Compare with a copy without cache, up to the order of neighbors
+            neighbor_list = struct.get_neighbor_list(r)
+            expected = struct.copy().get_neighbor_list(r)
+            order, expected_order = (np.lexsort((*nl[2].T, nl[1], nl[0])) for nl in (neighbor_list, expected))
+            for arr, expected_arr in zip(neighbor_list, expected, strict=True):
+                assert_allclose(arr[order], expected_arr[expected_order])
+
+        assert_neighbor_list_equal(struct, 4)
+        # Smaller cutoffs reuse the cached neighbor list
+        assert_neighbor_list_equal(struct, 3)
+        assert_neighbor_list_equal(struct, 2.4)
+        assert len(struct.get_neighbor_list(0.5)[0]) == 0
+        assert struct._neighbor_list_cache["r"] == 4
+        neighbors = struct.get_neighbors(struct[3], 3)
+        assert len(neighbors) == len(struct.get_all_neighbors(3)[3])
+        assert struct._neighbor_list_cache["r"] == 4
+
+        # Modifying the structure invalidates the cache
+        struct.translate_sites([0], [0.1, 0, 0])
+        assert_neighbor_list_equal(struct, 3)
+        struct.apply_strain(0.05)
+        assert_neighbor_list_equal(struct, 3)
+        struct[1].a = 0.3
+        assert_neighbor_list_equal(struct, 3)
+        struct.append("Si", [0.5, 0.5, 0.5])
+        assert_neighbor_list_equal(struct, 3)
+        struct.remove_sites([0, 4])
+        assert_neighbor_list_equal(struct, 3)
+        assert struct._neighbor_list_cache["r"] == 3
+
+        # So do in-place edits of coordinate arrays and changes of pbc
+        struct[0].frac_coords[:] = struct[1].frac_coords + 0.01
+        assert_neighbor_list_equal(struct, 3)
+        struct.lattice.pbc = (False, False, False)
+        assert_neighbor_list_equal(struct, 3)
+
+        # Sites that do not belong to the structure do not use the cache
+        struct = self.struct * (2, 2, 2)
+        n_neighbors = len(struct.get_neighbor_list(3, sites=[self.struct[0]])[0])
+        assert not hasattr(struct, "_neighbor_list_cache")
+        assert n_neighbors == len(struct.get_neighbors(struct[0], 3))
+
+        # Queries for some sites never compute the neighbor list of all sites,
+        # they only use a valid cache that covers r
+        assert not hasattr(struct, "_neighbor_list_cache")
+        struct.get_neighbor_list(3)
+        cache = struct._neighbor_list_cache
+        assert len(struct.get_neighbors(struct[0], 4)) == len(struct.copy().get_neighbors(struct[0], 4))
+        assert len(struct.get_neighbors(struct[0], 2.4)) == len(struct.copy().get_neighbors(struct[0], 2.4))
+        struct.translate_sites([0], [0.1, 0, 0])
+        assert len(struct.get_neighbors(struct[0], 2.4)) == len(struct.copy().get_neighbors(struct[0], 2.4))
+        assert struct._neighbor_list_cache is cache
+
+        # The cache is not pickled or deep copied
+        size = len(pickle.dumps(struct))
+        struct.get_neighbor_list(4)
+        assert len(pickle.dumps(struct)) == size
+        assert not hasattr(pickle.loads(pickle.dumps(struct)), "_neighbor_list_cache")
+        assert not hasattr(deepcopy(struct), "_neighbor_list_cache")
+
     def test_append_insert_remove_replace_substitute(self):
         struct = self.struct
         struct.insert(1, "O", [0.5, 0.5, 0.5])
@@ -1578,6 +1648,38 @@ class TestStructure(MatSciTest):
         struct.make_supercell([1, 1, 2])
         assert set(struct.labels) == {"Si1", "Si2"}
 
+    def test_mul_site_order(self):
+        struct = Structure(
+            self.struct.lattice,
+            ["Si", {"Ge": 0.5, "Sn": 0.5}],
+            [[-0.1, 0, 0], [0.75, 0.5, 1.75]],
+            site_properties={"magmom": [1, -1]},
+            labels=["A", "B"],
+        )
+        scaling_matrix = [[1, 1, 0], [0, 2, 0], [0, 0, 1]]
+        supercell = struct * scaling_matrix
+
+        # images of each site are contiguous and wrapped into the new cell
+        frac_lattice = lattice_points_in_supercell(scaling_matrix)
+        cart_lattice = supercell.lattice.get_cartesian_coords(frac_lattice)
+        cart_coords = [site.coords + vec for site in struct for vec in cart_lattice]
+        frac_coords = np.mod(supercell.lattice.get_fractional_coords(cart_coords), 1)
+        assert_allclose(supercell.frac_coords, frac_coords, atol=1e-12)
+        assert supercell.labels == ["A"] * 2 + ["B"] * 2
+        assert supercell.site_properties == {"magmom": [1, 1, -1, -1]}
+        assert supercell.species_and_occu == [struct[0].species] * 2 + [struct[1].species] * 2
+        assert np.all((supercell.frac_coords >= 0) & (supercell.frac_coords < 1))
+
+        # sites do not share coordinate storage with the inputs
+        coords = np.array(struct.frac_coords)
+        new_struct = Structure(struct.lattice, struct.species_and_occu, coords)
+        new_struct[0].a = 0.3
+        assert coords[0, 0] == approx(-0.1)
+        assert new_struct[1].a == approx(0.75)
+
+        with pytest.raises(ValueError, match="Species occupancies sum to more than 1"):
+            Structure(struct.lattice, [{"Ge": 0.6, "Sn": 0.6}], [[0, 0, 0]])
+
     def test_disordered_supercell_primitive_cell(self):
         lattice = Lattice.cubic(2)
         coords = [[0.5, 0.5, 0.5]]
@@ -2166,6 +2268,12 @@ class TestIMolecule(MatSciTest):
         mol["C"] = "C0.25Si0.5"
         assert mol.formula == "Si0.625 C0.0625 F4"
 
+    def test_init_from_dicts(self):
+        # e.g. node attributes of a MoleculeGraph, keyed by site index
+        species = dict(enumerate(["C", "H", "H", "H", "H"]))
+        mol = Molecule(species, dict(enumerate(self.coords)))
+        assert mol == self.mol
+
     def test_bad_molecule(self):
         coords = [
             [0, 0, 0],
@@ -863,6 +863,27 @@ class TestMillerIndexFinder(MatSciTest):
         # termination for each distinct Miller _index
         assert len(miller_list) == len(all_miller_list)
 
+    def test_generate_all_slabs_parallel(self):
+        kwargs = {"bonds": {("Co", "O"): 3}, "max_broken_bonds": 2, "repair": True}
+        slabs = generate_all_slabs(self.LiCoO2, 1, 10, 10, **kwargs)
+        slabs_parallel = generate_all_slabs(self.LiCoO2, 1, 10, 10, n_jobs=2, **kwargs)
+
+        # same Slabs in the same order as the serial generation
+        assert len(slabs_parallel) == len(slabs) > 1
+        for slab, slab_parallel in zip(slabs, slabs_parallel, strict=True):
+            assert slab_parallel.miller_index == slab.miller_index
+            assert slab_parallel.shift == approx(slab.shift)
+            assert slab_parallel.energy == slab.energy
+            assert slab_parallel == slab
+        assert "bulk_wyckoff" in self.LiCoO2.site_properties
+
+        # the reduced oriented unit cells are cached but not shared across Slabs
+        slab_gen = SlabGenerator(self.LiCoO2, (0, 0, 1), 10, 10)
+        slab1, slab2 = slab_gen.get_slab(shift=0.1), slab_gen.get_slab(shift=0.2)
+        assert len(slab_gen._reduced_ouc_cache) == 1
+        assert slab1.oriented_unit_cell == slab2.oriented_unit_cell
+        assert slab1.oriented_unit_cell is not slab2.oriented_unit_cell
+
     def test_miller_index_from_sites(self):
         """Test surface miller index convenience function."""
         # test on a cubic system
@@ -106,6 +106,18 @@ class TestTrajectory(MatSciTest):
         assert len(sliced_traj) == len(sliced_traj_from_mols), f"{len(sliced_traj)=} != {len(sliced_traj_from_mols)=}"
         assert all(sliced_traj[i] == sliced_traj_from_mols[i] for i in range(len(sliced_traj)))
 
+    def test_slice_memmap(self):
+        coords = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_traj", lazy=True).structures.get_frac_coords(
+            f"{self.tmp_path}/coords.npy"
+        )
+        traj = Trajectory(self.traj.species, coords, lattice=self.traj.lattice)
+
+        # Striding does not copy the coordinates
+        sliced_traj = traj[10::-3]
+        assert np.shares_memory(sliced_traj.coords, coords)
+        assert len(sliced_traj) == 4
+        assert all(sliced_traj[idx] == self.structures[10 - 3 * idx] for idx in range(len(sliced_traj)))
+
     def test_list_slice(self):
         sliced_traj = self.traj[[10, 30, 70]]
         sliced_traj_from_structs = Trajectory.from_structures([self.structures[i] for i in [10, 30, 70]])
@@ -478,6 +490,67 @@ class TestTrajectory(MatSciTest):
         written_traj = Trajectory.from_file(f"{self.tmp_path}/traj_test_XDATCAR")
         self._check_traj_equality(self.traj, written_traj)
 
+    def test_hdf5(self):
+        filename = f"{self.tmp_path}/traj.h5"
+        forces = np.full((len(self.traj.species), 3), 0.5)
+        traj = Trajectory(
+            self.traj.species,
+            self.traj.coords[:60],
+            lattice=self.traj.lattice,
+            site_properties={"magmom": [1.0] * len(self.traj.species)},
+            frame_properties=[{"energy": -float(idx), "forces": forces, "tag": "md"} for idx in range(60)],
+            time_step=2,
+        )
+        traj[:40].to_hdf5(filename, chunk_size=16)
+        # Append the remaining frames, as during a simulation
+        traj[40:].to_hdf5(filename, append=True, chunk_size=16)
+
+        h5_traj = Trajectory.from_file(filename)
+        assert h5_traj.species == traj.species
+        assert h5_traj.time_step == 2
+        assert h5_traj.constant_lattice
+        assert h5_traj.site_properties == traj.site_properties
+        assert_allclose(h5_traj.coords, traj.coords)
+        assert_allclose(h5_traj.lattice, traj.lattice)
+        assert [props["energy"] for props in h5_traj.frame_properties] == list(range(0, -60, -1))
+        assert h5_traj.frame_properties[1]["tag"] == "md"
+        assert_allclose(h5_traj.frame_properties[1]["forces"], forces)
+        # Scalars come back as the types they were saved as
+        assert type(h5_traj.frame_properties[1]["energy"]) is float
+
+        # from_file passes constant_lattice and kwargs on, as for other formats
+        h5_traj = Trajectory.from_file(filename, constant_lattice=False, time_step=4)
+        assert not h5_traj.constant_lattice
+        assert_allclose(h5_traj.lattice, [traj.lattice] * 60)
+        assert h5_traj.time_step == 4
+
+        # Partial reads
+        for frames in (slice(10, 50, 7), slice(55, 3, -4), slice(-5, None)):
+            h5_traj = Trajectory.from_hdf5(filename, frames=frames)
+            assert_allclose(h5_traj.coords, traj.coords[frames])
+            assert [props["energy"] for props in h5_traj.frame_properties] == list(range(0, -60, -1))[frames]
+
+        # A changing lattice is stored for every frame
+        lattice = Lattice.cubic(5).matrix
+        Trajectory(traj.species, traj.coords[:2], lattice=lattice, time_step=2).to_hdf5(filename)
+        Trajectory(traj.species, traj.coords[:3], lattice=2 * lattice, time_step=2).to_hdf5(filename, append=True)
+        h5_traj = Trajectory.from_hdf5(filename, frames=slice(1, None))
+        assert not h5_traj.constant_lattice
+        assert_allclose(h5_traj.lattice, [lattice] + [2 * lattice] * 3)
+        h5_traj = Trajectory.from_hdf5(filename, frames=slice(1, None), constant_lattice=True)
+        assert h5_traj.constant_lattice
+        assert_allclose(h5_traj.lattice, lattice)
+
+        with pytest.raises(ValueError, match="Cannot append to .* attributes do not match"):
+            Trajectory(traj.species, traj.coords[:2], lattice=lattice).to_hdf5(filename, append=True)
+
+        # Molecule-based trajectory
+        self.traj_mols.to_hdf5(filename)
+        h5_traj = Trajectory.from_hdf5(filename)
+        assert h5_traj.lattice is None
+        assert h5_traj.charge == self.traj_mols.charge
+        assert list(h5_traj) == list(self.traj_mols)
+
     def test_from_file(self):
         try:
             traj = Trajectory.from_file(f"{TEST_DIR}/LiMnO2_chgnet_relax.traj")
@@ -12,7 +12,7 @@ from pytest import approx
 
 from pymatgen.core import Element, Structure
 from pymatgen.electronic_structure.core import Orbital, OrbitalType, Spin
-from pymatgen.electronic_structure.dos import DOS, CompleteDos, Dos, FermiDos, LobsterCompleteDos
+from pymatgen.electronic_structure.dos import DOS, CompleteDos, Dos, DosFingerprintStore, FermiDos, LobsterCompleteDos
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/electronic_structure/dos"
@@ -56,6 +56,35 @@ class TestDos:
         assert isinstance(dos_dict["densities"]["1"][0], float)
         assert not isinstance(dos_dict["densities"]["1"][0], np.float64)
 
+    def test_pdos_projections(self):
+        spd_dos = self.dos.get_spd_dos()
+        el_dos = self.dos.get_element_dos()
+        total = sum(dos.densities[Spin.up].sum() for dos in spd_dos.values())
+        assert sum(dos.densities[Spin.up].sum() for dos in el_dos.values()) == approx(total)
+        assert sum(self.dos.get_site_dos(site).densities[Spin.up].sum() for site in self.dos.structure) == approx(total)
+
+        # Same as summing the dict view
+        fe_d_dos = self.dos.get_element_spd_dos("Fe")[OrbitalType.d]
+        expected = sum(
+            dens[Spin.down]
+            for site, site_pdos in self.dos.pdos.items()
+            if site.specie == Element.Fe
+            for orb, dens in site_pdos.items()
+            if orb.orbital_type == OrbitalType.d
+        )
+        assert_allclose(fe_d_dos.densities[Spin.down], expected)
+
+        # The dict view shares memory with the projections
+        site = self.dos.structure[4]
+        self.dos.pdos[site][Orbital.dxy][Spin.up] *= 2
+        dxy_dos = self.dos.get_site_orbital_dos(site, Orbital.dxy).densities[Spin.up]
+        assert self.dos.get_site_t2g_eg_resolved_dos(site)["t2g"].densities[Spin.up].sum() == approx(
+            22.9104 + dxy_dos.sum() / 2
+        )
+
+        with pytest.raises(KeyError):
+            self.dos.get_band_center(OrbitalType.f)
+
 
 class TestFermiDos:
     def setup_method(self):
@@ -379,6 +408,55 @@ class TestSpinPolarization:
         assert dos.spin_polarization == approx(0.6460514663341762)
 
 
+class TestDosFingerprintStore(MatSciTest):
+    def setup_method(self):
+        with open(f"{TEST_DIR}/complete_dos.json", "rb") as file:
+            dos = CompleteDos.from_dict(orjson.loads(file.read()))
+        rng = np.random.default_rng(0)
+        self.doses = []
+        for _ in range(12):
+            densities = {spin: dens * rng.random(len(dens)) for spin, dens in dos.densities.items()}
+            self.doses.append(CompleteDos(dos.structure, Dos(dos.efermi, dos.energies, densities), dos.pdos))
+        self.fp_kwargs = {"fp_type": "tdos", "min_e": -10, "max_e": 10, "n_bins": 64}
+        self.fps = [dos.get_dos_fp(**self.fp_kwargs) for dos in self.doses]
+        self.store = DosFingerprintStore.from_doses(
+            self.doses, keys=[f"mp-{idx}" for idx in range(12)], **self.fp_kwargs
+        )
+
+    def test_similarities(self):
+        assert self.store.densities.shape == (12, 64)
+        assert self.store.densities.dtype == np.float32
+        assert len(DosFingerprintStore.from_fingerprints(self.fps)) == 12
+
+        for metric, normalize in (("tanimoto", False), ("cosine-sim", True)):
+            expected = [
+                [CompleteDos.get_dos_fp_similarity(fp1, fp2, metric=metric, normalize=normalize) for fp2 in self.fps]
+                for fp1 in self.fps[:3]
+            ]
+            sims = self.store.get_similarities(self.doses[:3], metric=metric, normalize=normalize, chunk_size=5)
+            assert_allclose(sims, expected, rtol=1e-5)
+
+            most_similar = self.store.get_most_similar(
+                self.fps[:3], k=4, metric=metric, normalize=normalize, chunk_size=5
+            )
+            for sims_row, top in zip(expected, most_similar, strict=True):
+                assert [key for key, _sim in top] == [f"mp-{idx}" for idx in np.argsort(sims_row)[::-1][:4]]
+                assert [sim for _key, sim in top] == approx(sorted(sims_row, reverse=True)[:4], rel=1e-5)
+
+        with pytest.raises(ValueError, match="Invalid metric='wasserstein'"):
+            self.store.get_similarities(self.fps[0], metric="wasserstein")
+        with pytest.raises(ValueError, match="Query fingerprints have 256 bins, expected 64"):
+            self.store.get_similarities(self.doses[0].get_dos_fp(fp_type="tdos"))
+
+    def test_hdf5(self):
+        self.store.to_hdf5(f"{self.tmp_path}/fps.h5")
+        store = DosFingerprintStore.from_hdf5(f"{self.tmp_path}/fps.h5")
+        assert isinstance(store.densities, np.memmap)
+        assert store.keys == self.store.keys
+        assert store.fp_kwargs == self.fp_kwargs
+        assert store.get_most_similar(self.doses[5], k=1)[0][0][0] == "mp-5"
+
+
 class TestLobsterCompleteDos:
     def setup_method(self):
         with open(f"{TEST_DIR}/LobsterCompleteDos_spin.json", "rb") as file:
@@ -4,10 +4,12 @@ import copy
 import json
 import math
 import os
+import pickle
 import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
 from monty.json import MontyDecoder
@@ -598,22 +600,39 @@ class TestMaterialsProjectCompatibility:
         # TODO: get DeprecationWarning: This process (pid=xxxx) is multi-threaded,
         # use of fork() may lead to deadlocks in the child.
         # pid = os.fork()
-        with pytest.raises(
-            ValueError,
-            match="Parallel processing is not possible with for 'inplace=True'",
-        ):
-            entries = self.compat.process_entries(
-                [self.entry1, self.entry2, self.entry3, self.entry4],
-                inplace=True,
-                n_workers=2,
-            )
-
         entries = self.compat.process_entries(
             [self.entry1, self.entry2, self.entry3, self.entry4],
             inplace=False,
             n_workers=2,
         )
         assert len(entries) == 2
+        assert entries[0] is not self.entry1
+
+        serial_entries = self.compat.process_entries(
+            copy.deepcopy([self.entry1, self.entry2, self.entry3, self.entry4]),
+        )
+        entries = self.compat.process_entries(
+            [self.entry1, self.entry2, self.entry3, self.entry4],
+            inplace=True,
+            n_workers=2,
+        )
+        assert entries == [self.entry1, self.entry2]
+        assert entries[0] is self.entry1
+        assert [entry.energy for entry in entries] == approx([entry.energy for entry in serial_entries])
+
+        # Incompatible entries are cleaned like in serial processing
+        for entry in (self.entry1, self.entry2, self.entry3, self.entry4):
+            entry.energy_adjustments = [ConstantEnergyAdjustment(-1)]
+        serial_entries = copy.deepcopy([self.entry1, self.entry2, self.entry3, self.entry4])
+        self.compat.process_entries(serial_entries)
+        self.compat.process_entries([self.entry1, self.entry2, self.entry3, self.entry4], n_workers=2)
+        for entry, serial_entry in zip(
+            [self.entry1, self.entry2, self.entry3, self.entry4], serial_entries, strict=True
+        ):
+            assert [(adj.name, adj.value) for adj in entry.energy_adjustments] == [
+                (adj.name, adj.value) for adj in serial_entry.energy_adjustments
+            ]
+        assert self.entry3.energy_adjustments == []
 
     def test_msonable(self):
         compat_dict = self.compat.as_dict()
@@ -849,6 +868,23 @@ class TestMaterialsProjectCompatibility2020:
         e3 = self.compat.process_entry(entry_multi_anion)
         assert e3.correction == approx(-0.361 * 4 + -0.614 * 4)
 
+        # guesses are cached per composition, but each entry gets its own dict
+        entry_oxi2 = copy.deepcopy(entry_oxi)
+        del entry_oxi2.data["oxidation_states"]
+        with mock.patch.object(Composition, "oxi_state_guesses") as oxi_state_guesses:
+            e4 = self.compat.process_entry(entry_oxi2)
+        oxi_state_guesses.assert_not_called()
+        assert e4.correction == approx(e2.correction)
+        assert e4.data["oxidation_states"] == e2.data["oxidation_states"]
+        assert e4.data["oxidation_states"] is not e2.data["oxidation_states"]
+
+        # the cache is not pickled, e.g. for the workers of process_entries, as
+        # cached_class instances are pickled by their constructor arguments
+        assert self.compat._oxi_state_cache
+        size = len(pickle.dumps(self.compat))
+        self.compat._oxi_state_cache.clear()
+        assert len(pickle.dumps(self.compat)) == size
+
     def test_correction_values(self):
         # test_corrections
         assert self.compat.process_entry(self.entry1).correction == approx(-2.256 * 2 - 0.687 * 3)
@@ -2246,15 +2282,13 @@ class TestMaterialsProjectAqueousCompatibility:
             o2_energy=-10, h2o_energy=-20, h2o_adjustments=-0.5, solid_compat=None
         )
 
-        with pytest.raises(
-            ValueError,
-            match="Parallel processing is not possible with for 'inplace=True'",
-        ):
-            entries = compat.process_entries(entry_list, inplace=True, n_workers=2)
-
         entries = compat.process_entries(entry_list, inplace=False, n_workers=2, on_error="raise")
         assert len(entries) == 2
 
+        entries = compat.process_entries(entry_list, inplace=True, n_workers=2, on_error="raise")
+        assert entries == entry_list
+        assert hydrate_entry.correction != 0
+
 
 class TestAqueousCorrection:
     def setup_method(self):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import warnings
 from io import StringIO
 
 import numpy as np
@@ -9,8 +10,9 @@ from pytest import approx
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Composition, DummySpecies, Element, Lattice, Species, Structure, SymmOp
 from pymatgen.electronic_structure.core import Magmom
-from pymatgen.io.cif import CifBlock, CifParser, CifWriter
+from pymatgen.io.cif import CifBlock, CifFile, CifParser, CifWriter, _find_pbc_matches
 from pymatgen.symmetry.structure import SymmetrizedStructure
+from pymatgen.util.coord import find_in_coord_list_pbc
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, MatSciTest
 
 MCIF_TEST_DIR = f"{TEST_FILES_DIR}/io/cif/mcif"
@@ -404,6 +406,88 @@ class TestCifIO(MatSciTest):
         for struct in parser.parse_structures():
             assert struct.formula == "Mo8 P4 H120 C120 I8 O8"
 
+    def test_iter_structures(self):
+        filepath = f"{TEST_FILES_DIR}/cif/MultiStructure.cif"
+        structures = CifParser(filepath).parse_structures(primitive=False)
+        assert list(CifParser.iter_structures(filepath)) == structures
+        assert list(CifParser.iter_structures(filepath, n_jobs=2)) == structures
+
+        # blocks can be read from an open file, and filtered on header fields
+        with open(filepath, encoding="utf-8") as file:
+            blocks = list(CifFile.iter_blocks(file))
+        assert [block.header for block in blocks] == ["72545-ICSD", "56291-ICSD"]
+        filtered = CifParser.iter_structures(filepath, block_filter=lambda block: block.header == "56291-ICSD")
+        assert list(filtered) == structures[1:]
+        filtered = CifParser.iter_structures(
+            filepath, block_filter=lambda block: "Na" in block["_chemical_formula_sum"]
+        )
+        assert list(filtered) == []
+
+        # powder diffraction blocks are skipped as in CifFile.from_str
+        filepath = f"{TEST_FILES_DIR}/cif/PF_sd_1002871.cif"
+        assert [block.header for block in CifFile.iter_blocks(filepath)] == list(CifFile.from_file(filepath).data)
+
+        with pytest.raises(ValueError, match="No structure parsed for section"):
+            list(CifParser.iter_structures(StringIO("data_empty\n_cell_length_a 1\n"), on_error="raise"))
+
+        # warnings raised in the worker processes are re-emitted as in serial
+        cif_str = "\n".join(
+            [
+                "data_Po",
+                *(f"_cell_length_{axis} 3.35" for axis in "abc"),
+                *(f"_cell_angle_{angle} 90" for angle in ("alpha", "beta", "gamma")),
+                "loop_",
+                "_atom_site_label",
+                "_atom_site_type_symbol",
+                *(f"_atom_site_fract_{axis}" for axis in "xyz"),
+                "Po1 Po 0 0 0",
+                "",
+            ]
+        )
+        caught_warnings = []
+        for n_jobs in (1, 2):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                assert len(list(CifParser.iter_structures(StringIO(cif_str), n_jobs=n_jobs))) == 1
+            caught_warnings.append([(str(warning.message), warning.category) for warning in caught])
+        assert ("No _symmetry_equiv_pos_as_xyz type key found. Defaulting to P1.", UserWarning) in caught_warnings[0]
+        assert caught_warnings[1] == caught_warnings[0]
+
+    def test_symmetry_expansion(self):
+        # Disordered site split across the periodic boundary, within site_tolerance
+        cif_str = """data_NaKCl
+_symmetry_space_group_name_H-M 'F m -3 m'
+_cell_length_a 5.6
+_cell_length_b 5.6
+_cell_length_c 5.6
+_cell_angle_alpha 90
+_cell_angle_beta 90
+_cell_angle_gamma 90
+loop_
+ _atom_site_label
+ _atom_site_type_symbol
+ _atom_site_fract_x
+ _atom_site_fract_y
+ _atom_site_fract_z
+ _atom_site_occupancy
+  Na1 Na 0.00000 0.00000 0.00000 0.5
+  K1 K 0.00001 0.99999 0.00000 0.5
+  Cl1 Cl 0.50000 0.50000 0.50000 1
+"""
+        struct = CifParser.from_str(cif_str).parse_structures(primitive=False)[0]
+        assert len(struct) == 8
+        assert struct.composition.reduced_formula == "KNaCl2"
+        assert struct.labels == ["K1"] * 4 + ["Cl1"] * 4
+
+        rng = np.random.default_rng(0)
+        coords = np.round(rng.random((200, 3)), 1) + rng.normal(scale=1e-5, size=(200, 3))
+        targets = np.round(rng.random((100, 3)), 1)
+        i, j = _find_pbc_matches(coords, targets, 1e-4)
+        expected = [
+            (idx, jdx) for idx, coord in enumerate(coords) for jdx in find_in_coord_list_pbc(targets, coord, 1e-4)
+        ]
+        assert list(zip(i, j, strict=True)) == expected
+
     def test_parse_symbol(self):
         """
         Test the _parse_symbol function with several potentially
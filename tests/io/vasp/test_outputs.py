@@ -7,6 +7,7 @@ import os
 import xml
 from pathlib import Path
 from shutil import copyfile, copyfileobj
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -39,9 +40,11 @@ from pymatgen.io.vasp.outputs import (
     Vaspout,
     VaspParseError,
     Vasprun,
+    VasprunIonicSteps,
     Wavecar,
     Waveder,
     Xdatcar,
+    XdatcarFrames,
     get_band_structure_from_vasp_multiple_branches,
 )
 from pymatgen.io.wannier90 import Unk
@@ -90,6 +93,36 @@ class TestVasprun(MatSciTest):
         assert vasp_run.md_n_steps == 10
         assert vasp_run.converged_ionic
 
+    def test_lazy_ionic_steps(self):
+        filepath = f"{VASP_OUT_DIR}/vasprun.md.xml.gz"
+        vasp_run = Vasprun(filepath, parse_potcar_file=False)
+        lazy_run = Vasprun(filepath, parse_potcar_file=False, lazy_ionic_steps=True)
+        assert isinstance(lazy_run.ionic_steps, VasprunIonicSteps)
+        assert len(lazy_run.ionic_steps) == lazy_run.nionic_steps == 10
+        assert lazy_run.final_energy == approx(vasp_run.final_energy)
+        assert lazy_run.final_structure == vasp_run.final_structure
+        assert lazy_run.efermi == approx(vasp_run.efermi)
+        assert lazy_run.structures == vasp_run.structures
+        assert lazy_run.ionic_steps[3]["e_fr_energy"] == approx(vasp_run.ionic_steps[3]["e_fr_energy"])
+        assert_allclose(lazy_run.ionic_steps[-2]["forces"], vasp_run.ionic_steps[-2]["forces"])
+
+        steps = lazy_run.ionic_steps[1::3]
+        assert isinstance(steps, VasprunIonicSteps)
+        assert [step["e_0_energy"] for step in steps] == approx(
+            [step["e_0_energy"] for step in vasp_run.ionic_steps[1::3]]
+        )
+
+        # Unrequested blocks of the final step are skipped
+        lazy_run = Vasprun(f"{VASP_OUT_DIR}/vasprun.xml.gz", parse_dos=False, parse_eigen=False, lazy_ionic_steps=True)
+        assert lazy_run.eigenvalues is None
+        assert not hasattr(lazy_run, "tdos")
+        assert lazy_run.nionic_steps == 29
+        assert lazy_run.final_energy == approx(-269.38319884, abs=1e-7)
+
+        skip_run = Vasprun(filepath, ionic_step_skip=3, ionic_step_offset=1, lazy_ionic_steps=True)
+        assert len(skip_run.ionic_steps) == 3
+        assert skip_run.nionic_steps == 10
+
     def test_vasprun_ediffg_set_to_0(self):
         # Test for case where EDIFFG is set to 0. This should pass if all ionic steps
         # complete and are electronically converged.
@@ -1031,6 +1064,12 @@ class TestOutcar:
         assert outcar.data["dipol_quadrupol_correction"] == approx(0.03565)
         assert outcar.final_energy == approx(-797.46294064)
 
+        # The final correction is searched from the end, without reading the file forward
+        outcar = Outcar(filepath)
+        with patch("pymatgen.io.vasp.outputs.zopen", side_effect=AssertionError("read forward")):
+            outcar.read_corrections()
+        assert outcar.data["dipol_quadrupol_correction"] == approx(0.03565)
+
     def test_freq_dielectric(self):
         filepath = f"{VASP_OUT_DIR}/OUTCAR.LOPTICS"
         outcar = Outcar(filepath)
@@ -1434,7 +1473,7 @@ class TestOutcar:
         assert outcar.final_energy_wo_entrp == approx(-15.83863167)
         assert outcar.final_fr_energy == approx(-15.92115453)
 
-    def test_read_table_pattern(self):
+    def test_read_table_pattern(self, tmp_path):
         outcar = Outcar(f"{VASP_OUT_DIR}/OUTCAR.gz")
 
         header_pattern = r"\(the norm of the test charge is\s+[\.\-\d]+\)"
@@ -1461,6 +1500,28 @@ class TestOutcar:
         ]
         assert pots == ref_first
 
+        # Only keeping the text around the anchors finds the same tables
+        anchors = ("the norm of the test charge is",)
+        pots = outcar.read_table_pattern(header_pattern, table_pattern, footer_pattern, anchors=anchors)
+        assert pots == ref_last
+        pots = outcar.read_table_pattern(
+            header_pattern, table_pattern, footer_pattern, last_one_only=False, anchors=anchors
+        )
+        assert pots[0] == ref_first
+        assert pots[-1] == ref_last
+
+        # A table whose header matches before and without the anchor is only
+        # found without anchors
+        filepath = tmp_path / "OUTCAR"
+        with zopen(f"{VASP_OUT_DIR}/OUTCAR.gz", mode="rt", encoding="utf-8") as file:
+            text = file.read()
+        tables = ["HEADER plain\n   1  1.0\n FOOTER\n", "HEADER ANCHOR\n   2  2.0\n FOOTER\n"]
+        filepath.write_text(text + tables[0] + " text\n" * 4 + tables[1], encoding="utf-8")
+        outcar = Outcar(filepath)
+        patterns = (r"HEADER[^\n]*", r"\s+(\d+)\s+([\d.]+)", r"\s+FOOTER")
+        assert outcar.read_table_pattern(*patterns, last_one_only=False) == [[["1", "1.0"]], [["2", "2.0"]]]
+        assert outcar.read_table_pattern(*patterns, last_one_only=False, anchors=("ANCHOR",)) == [[["2", "2.0"]]]
+
         with pytest.raises(
             ValueError,
             match="last_one_only and first_one_only options are incompatible",
@@ -1473,6 +1534,32 @@ class TestOutcar:
                 first_one_only=True,
             )
 
+    def test_read_sections(self, tmp_path):
+        filepath = tmp_path / "OUTCAR.gz"
+        copyfile(f"{VASP_OUT_DIR}/OUTCAR.lepsilon.gz", filepath)
+        ref = Outcar(filepath)
+        ref_pots = ref.read_avg_core_poten()
+        ref_eigs = ref.read_core_state_eigen()
+        ref.read_piezo_tensor()
+
+        for index in (False, True, True):
+            outcar = Outcar(filepath)
+            results = outcar.read_sections(["piezo_tensor", "avg_core_poten", "core_state_eigen"], index=index)
+            assert results["avg_core_poten"] == ref_pots
+            assert results["core_state_eigen"] == ref_eigs
+            assert outcar.data["piezo_tensor"] == ref.data["piezo_tensor"]
+            assert os.path.isfile(f"{filepath}.sections.json") == index
+
+        # Absent sections fail the same way as their readers on the whole file
+        with pytest.raises(IndexError):
+            ref.read_elastic_tensor()
+        with pytest.raises(IndexError):
+            outcar.read_sections(["piezo_tensor", "elastic_tensor"], index=True)
+        assert outcar.read_avg_core_poten() == ref_pots
+
+        with pytest.raises(ValueError, match="Unknown OUTCAR sections"):
+            outcar.read_sections(["lepsilon", "magnetization"])
+
 
 class TestBSVasprun(MatSciTest):
     def test_get_band_structure(self):
@@ -1591,6 +1678,20 @@ class TestLocpot(MatSciTest):
         l2 = Locpot(poscar=poscar, data=data, data_aug=None)
         assert l2.data_aug == {}
 
+    @pytest.mark.skipif(h5py is None, reason="h5py required for HDF5 support.")
+    def test_from_file_cache(self):
+        filepath = f"{VASP_OUT_DIR}/LOCPOT.gz"
+        cache_file = f"{self.tmp_path}/LOCPOT.hdf5"
+        # constructor kwargs bypass the cache
+        distance_matrix = {"dummy": 1}
+        locpot = Locpot.from_file(filepath, cache_file=cache_file, distance_matrix=distance_matrix)
+        assert locpot._distance_matrix is distance_matrix
+        assert not os.path.isfile(cache_file)
+
+        locpot = Locpot.from_file(filepath, cache_file=cache_file)
+        assert os.path.isfile(cache_file)
+        assert_allclose(Locpot.from_file(filepath, cache_file=cache_file).data["total"], locpot.data["total"])
+
     def test_vasp_6x_style(self):
         filepath = f"{VASP_OUT_DIR}/LOCPOT.vasp642.gz"
         locpot = Locpot.from_file(filepath)
@@ -1693,6 +1794,41 @@ class TestChgcar(MatSciTest):
         chgcar2 = Chgcar.from_hdf5(out_path)
         assert_allclose(chgcar2.data["total"], chgcar.data["total"])
 
+    @pytest.mark.skipif(h5py is None, reason="h5py required for HDF5 support.")
+    def test_from_file_cache(self):
+        filepath = f"{VASP_OUT_DIR}/CHGCAR.spin.gz"
+        cache_file = f"{self.tmp_path}/CHGCAR.spin.hdf5"
+        chgcar = Chgcar.from_file(filepath, cache_file=cache_file)
+        with h5py.File(cache_file, mode="r") as file:
+            assert set(file["vdata"]) == {"total", "diff"}
+            assert not file.attrs["total_only"]
+
+        cached = Chgcar.from_file(filepath, cache_file=cache_file)
+        for key, data in chgcar.data.items():
+            assert_allclose(cached.data[key], data)
+        assert cached.data_aug == chgcar.data_aug
+        # memory-mapped data are copy-on-write
+        cached.data["total"][0, 0, 0] = 0
+        assert_allclose(Chgcar.from_file(filepath, cache_file=cache_file).data["total"], chgcar.data["total"])
+
+        # a full cache serves total-only reads with the total density only
+        total = Chgcar.from_file(filepath, total_only=True, cache_file=cache_file)
+        assert set(total.data) == {"total"}
+        assert set(total.data_aug) == {"total"}
+        assert not total.is_spin_polarized
+
+        # a cache of the total density only is not used for a full read
+        cache_file = f"{self.tmp_path}/CHGCAR.total.hdf5"
+        assert set(Chgcar.from_file(filepath, total_only=True, cache_file=cache_file).data) == {"total"}
+        assert set(Chgcar.from_file(filepath, cache_file=cache_file).data) == {"total", "diff"}
+
+    def test_total_only(self):
+        chgcar = Chgcar.from_file(f"{VASP_OUT_DIR}/CHGCAR.spin.gz", total_only=True)
+        assert set(chgcar.data) == {"total"}
+        assert not chgcar.is_spin_polarized
+        assert_allclose(chgcar.data["total"], self.chgcar_spin.data["total"])
+        assert chgcar.data_aug["total"] == self.chgcar_spin.data_aug["total"]
+
     def test_spin_data(self):
         for v in self.chgcar_spin.spin_data.values():
             assert v.shape == (48, 48, 48)
@@ -1916,6 +2052,31 @@ class TestXdatcar:
 
         assert all(len(structure.composition) == 1 for structure in xdatcar.structures)
 
+    def test_lazy(self, tmp_path):
+        for filename in ("XDATCAR_5", "XDATCAR_6", "XDATCAR_monatomic.gz"):
+            xdatcar = Xdatcar(f"{VASP_OUT_DIR}/{filename}")
+            lazy_xdatcar = Xdatcar(f"{VASP_OUT_DIR}/{filename}", lazy=True)
+            assert isinstance(lazy_xdatcar.structures, XdatcarFrames)
+            assert list(lazy_xdatcar.structures) == xdatcar.structures
+            assert lazy_xdatcar.get_str() == xdatcar.get_str()
+
+            frames = lazy_xdatcar[1:3]
+            assert isinstance(frames, XdatcarFrames)
+            assert [frames[1], frames[0]] == xdatcar.structures[2:0:-1]
+
+            coords = frames.get_frac_coords(tmp_path / "coords.npy")
+            assert isinstance(coords, np.memmap)
+            assert_allclose(coords, [struct.frac_coords for struct in xdatcar.structures[1:3]])
+
+        # Lattices of a variable cell XDATCAR
+        lazy_xdatcar = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_6", ionicstep_start=2, ionicstep_end=4, lazy=True)
+        assert len(lazy_xdatcar) == 2
+        assert lazy_xdatcar[0].lattice != lazy_xdatcar[1].lattice
+        assert list(lazy_xdatcar) == Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_6").structures[1:3]
+
+        # Files without "Direct configuration=" lines are not indexed
+        assert isinstance(Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_4", lazy=True).structures, list)
+
     def test_bad_format(self):
         # ensure XDATCAR can be read even when formatting is poor
         xdatcar = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR.bad_fmt.gz")